@@ -0,0 +1,202 @@
+"""Post-ingest worker — drains the ingest_jobs queue (migration 030).
+
+The ingest endpoints write triples and swap the tenant_runs pointer
+synchronously, then enqueue the downstream stages (domain summary, conflict
+detection, ingest_log, seed manifest) as one ingest_jobs row per batch /
+stream. This module executes those rows:
+
+  - execute_job() is the ONE job body. The worker loop calls it for claimed
+    jobs; ?sync=true ingests call it in-request on a row inserted already
+    claimed. Same codepath either way — sync is not a separate implementation.
+  - IngestWorker claims with SELECT ... FOR UPDATE SKIP LOCKED, so any number
+    of workers (threads in the API process, or standalone processes) share
+    the queue without double-running a job or blocking on each other.
+  - Needs nothing but Postgres: no broker, no Redis. Standalone:
+        python -m backend.api.ingest_worker [--once]
+
+Errors: a failing job is recorded (last_error) and requeued until
+INGEST_JOB_MAX_ATTEMPTS, then left 'failed' — visible on
+GET /api/dcl/ingest-triples/status/{run_id}, never swallowed (A1). A worker
+that dies mid-job leaves a 'running' row whose lease (INGEST_JOB_LEASE_S)
+expires and is reclaimed. Every stage is idempotent per (coords, run).
+"""
+
+import argparse
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import Callable, Optional
+
+from backend.core.constants import (
+    INGEST_JOB_LEASE_S,
+    INGEST_JOB_MAX_ATTEMPTS,
+    INGEST_JOB_POLL_S,
+    INGEST_MAINTENANCE_INTERVAL_S,
+)
+from backend.db.ingest_job_store import IngestJobStore
+from backend.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+def _post_ingest(payload: dict) -> dict:
+    from backend.api.routes.ingest_triples import run_post_ingest
+    return run_post_ingest(payload)
+
+
+JOB_HANDLERS: dict[str, Callable[[dict], dict]] = {
+    "post_ingest": _post_ingest,
+}
+
+
+def new_worker_id(prefix: str = "worker") -> str:
+    """host:pid:suffix — identifies which process holds a running job."""
+    return f"{prefix}:{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def execute_job(store: IngestJobStore, job_id: int, job_type: str, payload: dict) -> dict:
+    """Run one claimed job and record the outcome. Returns the handler result;
+    re-raises the handler's exception after recording it."""
+    handler = JOB_HANDLERS.get(job_type)
+    if handler is None:
+        error = f"No handler for ingest job type '{job_type}' (add to JOB_HANDLERS)"
+        store.fail(job_id, error, max_attempts=0)
+        raise ValueError(error)
+    try:
+        result = handler(payload)
+    except Exception as e:
+        status = store.fail(job_id, f"{type(e).__name__}: {e}", INGEST_JOB_MAX_ATTEMPTS)
+        logger.error(
+            "[ingest-worker] job %s (%s) failed → %s: %s", job_id, job_type, status, e,
+        )
+        raise
+    store.complete(job_id, result)
+    return result
+
+
+class IngestWorker:
+    """Polling consumer of ingest_jobs. run_once() is the unit of work; the
+    thread loop just repeats it, sleeping INGEST_JOB_POLL_S when idle."""
+
+    def __init__(self, worker_id: Optional[str] = None, store: Optional[IngestJobStore] = None):
+        self.worker_id = worker_id or new_worker_id()
+        self._store = store or IngestJobStore()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_maintenance = 0.0
+
+    def run_once(self) -> Optional[dict]:
+        """Claim and execute one job. Returns the claimed job (status as
+        claimed), or None when nothing is claimable. Job failures are
+        recorded, not raised — one bad job must not stop the loop."""
+        job = self._store.claim(self.worker_id, INGEST_JOB_LEASE_S)
+        if job is None:
+            return None
+        try:
+            execute_job(self._store, job["job_id"], job["job_type"], job["payload"])
+        except Exception:
+            pass  # recorded on the row by execute_job
+        return job
+
+    def drain(self, max_jobs: Optional[int] = None) -> int:
+        """Run jobs until the queue is empty (or max_jobs). Returns the count."""
+        ran = 0
+        while max_jobs is None or ran < max_jobs:
+            if self.run_once() is None:
+                break
+            ran += 1
+        return ran
+
+    def maintain(self) -> None:
+        """Store upkeep between jobs, at most once per
+        INGEST_MAINTENANCE_INTERVAL_S: pre-create the next months'
+        semantic_triples history partitions (migration 033) and prune
+        triple_rollups / run_group_digests groups debited to zero
+        (migrations 034 / 036)."""
+        now = time.monotonic()
+        if now - self._last_maintenance < INGEST_MAINTENANCE_INTERVAL_S:
+            return
+        self._last_maintenance = now
+        from backend.db.triple_store import TripleStore
+        try:
+            TripleStore().ensure_history_partitions()
+        except Exception as e:
+            logger.error("[ingest-worker] history partition maintenance failed: %s", e)
+        try:
+            TripleStore().prune_rollups()
+        except Exception as e:
+            logger.error("[ingest-worker] rollup prune failed: %s", e)
+
+    def _loop(self) -> None:
+        logger.info("[ingest-worker] %s started (poll=%ss)", self.worker_id, INGEST_JOB_POLL_S)
+        while not self._stop.is_set():
+            try:
+                if self.run_once() is not None:
+                    continue
+            except Exception as e:
+                # Claim failed (DB unreachable) — back off one poll interval.
+                logger.warning("[ingest-worker] claim error: %s", e)
+            self.maintain()
+            self._stop.wait(INGEST_JOB_POLL_S)
+        logger.info("[ingest-worker] %s stopped", self.worker_id)
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._loop, name="ingest-worker", daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+
+_worker: Optional[IngestWorker] = None
+
+
+def start_worker() -> None:
+    """Start the in-process worker (lifespan). DCL_INGEST_WORKER_ENABLED=false
+    disables it — e.g. when standalone worker processes drain the queue."""
+    global _worker
+    if os.getenv("DCL_INGEST_WORKER_ENABLED", "true").lower() in ("false", "0"):
+        logger.info("[ingest-worker] DCL_INGEST_WORKER_ENABLED=false — in-process worker NOT started")
+        return
+    _worker = IngestWorker()
+    _worker.start()
+
+
+def stop_worker() -> None:
+    global _worker
+    if _worker is not None:
+        _worker.stop()
+        _worker = None
+
+
+def main() -> None:
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description="Drain the DCL post-ingest job queue.")
+    parser.add_argument("--once", action="store_true",
+                        help="drain what is queued now, then exit")
+    args = parser.parse_args()
+
+    worker = IngestWorker()
+    if args.once:
+        print(f"{worker.drain()} job(s) run")
+        return
+    worker.start()
+    try:
+        while worker._thread is not None and worker._thread.is_alive():
+            worker._thread.join(1.0)
+    except KeyboardInterrupt:
+        worker.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -82,6 +82,7 @@ from backend.api.routes.mcp_audit_read import router as mcp_audit_read_router
 from backend.api.routes.traces import router as traces_router
 from backend.api.routes.exports import router as exports_router
 from backend.api.routes.proposals import router as proposals_router
+from backend.api.routes.statements import router as statements_router
 
 logger = get_logger(__name__)
 
@@ -311,6 +312,10 @@ async def lifespan(app: FastAPI):
     logger.info("=== DCL Monitor Scheduler Starting ===")
     _start_scheduler()
 
+    # ---- Post-ingest worker (migration 030): drains ingest_jobs ----
+    from backend.api.ingest_worker import start_worker, stop_worker
+    start_worker()
+
     # Set up readiness event and launch background warmup
     _startup_ready = asyncio.Event()
     _startup_phase = "warming"
@@ -329,6 +334,7 @@ async def lifespan(app: FastAPI):
             pass
 
     _stop_scheduler()
+    stop_worker()
 
     # Flush ALL pending debounced writes before closing pools.
     try:
@@ -519,6 +525,8 @@ app.include_router(mcp_audit_read_router)
 app.include_router(traces_router)
 # Gate 2C: standards-track exports (Turtle / JSON-LD / MetricFlow YAML). Read-only.
 app.include_router(exports_router)
+# Multi-period financial statement bundle (TripleQueryResolver.get_statements). Read-only.
+app.include_router(statements_router)
 # Demo pipeline monitor — read-only metrics endpoint. Additive and isolated.
 app.include_router(monitor_router)
 # Gate 3A: Change proposal HITL queue + canonical apply-on-approve.
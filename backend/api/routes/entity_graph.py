@@ -7,7 +7,12 @@ graph_traversal.py (/api/dcl/resolve, /graph/stats, /graph/path).
   POST /api/dcl/ingest-edges            — declared relationships in (provenance
                                           + identity enforced; constraint
                                           violations -> conflict register)
-  GET  /api/dcl/graph/neighbors         — one node's edges (type filter, as-of)
+  GET  /api/dcl/graph/neighbors         — one node's edges (type filter, as-of);
+                                          depth > 1 = multi-hop BFS over the
+                                          cached adjacency snapshot
+  GET  /api/dcl/graph/paths             — k shortest typed paths between two
+                                          nodes (hop limit, type allow-list,
+                                          as-of)
   GET  /api/dcl/graph/subgraph          — the enterprise's nodes+edges (hero)
   GET  /api/dcl/graph/inspector         — one node: values + relationships (hero)
   GET  /api/dcl/graph/edge-types        — built-in + tenant types
@@ -16,11 +21,12 @@ graph_traversal.py (/api/dcl/resolve, /graph/stats, /graph/path).
   PUT  /api/dcl/concepts/hierarchy      — tenant parent link
 
 Reads hard-require tenant_id (the R3 read-surface convention). Node values on
-subgraph/inspector are joined from semantic_triples by ONE deterministic rule:
-a node (type, key) carries the active triples whose property == key and whose
-concept ends in ".by_<type>" (the records-path/SE breakdown shapes); the
-org_unit root carries the headline trio (workforce.headcount.total,
-revenue.total, arr.ending), latest period each.
+subgraph/inspector are joined from semantic_triples by ONE deterministic rule
+(EdgeStore.node_values, one set-based query per node type): a node (type, key)
+carries the active triples whose property == key and whose concept ends in
+".by_<type>" (the records-path/SE breakdown shapes); the org_unit root carries
+the headline trio (workforce.headcount.total, revenue.total, arr.ending),
+latest period each.
 """
 from __future__ import annotations
 
@@ -30,6 +36,11 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, ConfigDict, Field
 
 from backend.api.routes.ingest_triples import _validate_uuid
+from backend.core.constants import (
+    GRAPH_PATHS_MAX_K,
+    GRAPH_TRAVERSAL_MAX_DEPTH,
+    GRAPH_TRAVERSAL_MAX_NODES,
+)
 from backend.core.db import get_connection
 from backend.db.triple_store import TripleStore
 from backend.db.edge_store import (
@@ -185,6 +196,7 @@ class DeriveEdgesRequest(BaseModel):
     tenant_id: str
     entity_id: str
     dcl_ingest_id: str = Field(..., alias="run_id")
+    incremental: bool = False
 
 
 @router.post("/api/dcl/graph/derive", status_code=201)
@@ -196,7 +208,8 @@ def derive_graph_edges(req: DeriveEdgesRequest):
     pair required (I2 — 422 on missing); one dcl_ingest_id stamps the batch (I1).
     A department with a comp_band median but no resolvable market median fails
     loud (A1 — 422 EDGE_DERIVATION), never a silent skip. Returns counts + edges.
-    (No UI — that is Stage 4.)"""
+    incremental=true re-derives only the rules the run's concepts feed and
+    re-asserts just the edges that changed. (No UI — that is Stage 4.)"""
     _validate_uuid(req.tenant_id, "tenant_id")
     _validate_uuid(req.dcl_ingest_id, "dcl_ingest_id")
     if not req.entity_id or not req.entity_id.strip():
@@ -206,7 +219,9 @@ def derive_graph_edges(req: DeriveEdgesRequest):
                     "message": "entity_id is required for edge derivation (I2)."},
         )
     try:
-        result = derive_edges(req.tenant_id, req.entity_id, req.dcl_ingest_id)
+        result = derive_edges(
+            req.tenant_id, req.entity_id, req.dcl_ingest_id, incremental=req.incremental,
+        )
     except EdgeDerivationError as e:
         raise HTTPException(status_code=422, detail={"error": "EDGE_DERIVATION", "message": str(e)})
     except (EdgeIdentityError, EdgeContractError) as e:
@@ -214,42 +229,6 @@ def derive_graph_edges(req: DeriveEdgesRequest):
     return result
 
 
-# ---------------------------------------------------------------------------
-# Node values (inspector/subgraph) — one deterministic join rule
-# ---------------------------------------------------------------------------
-
-_ORG_HEADLINE_CONCEPTS = ("workforce.headcount.total", "revenue.total", "arr.ending")
-
-
-def _node_values(tenant_id: str, entity_id: str, node_type: str, node_key: str) -> dict[str, dict]:
-    """Active triples for one node. Rule: property == node_key AND concept ends
-    in '.by_<node_type>' (covers both records-path 'headcount.by_department'
-    and SE families); org_unit nodes get the headline trio. Latest period per
-    concept wins (lexicographic period sort — periods are 'YYYY-Qn')."""
-    out: dict[str, dict] = {}
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            if node_type == "org_unit":
-                cur.execute(
-                    "SELECT concept, property, value, period FROM semantic_triples "
-                    "WHERE tenant_id = %s AND entity_id = %s AND is_active = true "
-                    "AND concept = ANY(%s) ORDER BY concept, period",
-                    [tenant_id, entity_id, list(_ORG_HEADLINE_CONCEPTS)],
-                )
-            else:
-                cur.execute(
-                    "SELECT concept, property, value, period FROM semantic_triples "
-                    "WHERE tenant_id = %s AND entity_id = %s AND is_active = true "
-                    "AND property = %s AND concept LIKE %s ORDER BY concept, period",
-                    [tenant_id, entity_id, node_key, f"%.by_{node_type}"],
-                )
-            for concept, prop, value, period in cur.fetchall():
-                cur_best = out.get(concept)
-                if cur_best is None or (period or "") >= (cur_best.get("period") or ""):
-                    out[concept] = {"value": value, "property": prop, "period": period}
-    return out
-
-
 # ---------------------------------------------------------------------------
 # Traversal reads
 # ---------------------------------------------------------------------------
@@ -264,10 +243,40 @@ def graph_neighbors(
     direction: str = Query("both", pattern="^(out|in|both)$"),
     as_of: Optional[str] = Query(None, description="ISO timestamp — knowledge-time as-of read"),
     limit: int = Query(500, ge=1, le=5000),
+    depth: int = Query(1, ge=1, le=GRAPH_TRAVERSAL_MAX_DEPTH, description="Hops to traverse (BFS)"),
+    edge_types: Optional[str] = Query(None, description="Comma-separated edge-type filter (multi-hop)"),
+    max_nodes: int = Query(500, ge=1, le=GRAPH_TRAVERSAL_MAX_NODES, description="Node cap for multi-hop reads"),
 ):
     """Edges touching one node + the neighbor node list, with type/direction
-    filters and bi-temporal as-of support."""
+    filters and bi-temporal as-of support.
+
+    depth > 1 (or an edge_types list) is a breadth-first traversal: every node
+    within `depth` hops with its hop distance, and the edges that reached
+    them, capped at max_nodes (truncated=true when the cap cut the search).
+    One read of the entity's edge set regardless of depth."""
     _validate_uuid(tenant_id, "tenant_id")
+    if depth > 1 or edge_types:
+        types = [t.strip() for t in (edge_types or "").split(",") if t.strip()]
+        if edge_type:
+            types.append(edge_type)
+        try:
+            result = get_edge_store().traverse(
+                tenant_id, entity_id, node_type, node_key,
+                depth=depth, edge_types=types or None, direction=direction,
+                max_nodes=max_nodes, as_of=as_of,
+            )
+        except EdgeIdentityError as e:
+            raise HTTPException(status_code=422, detail={"error": "IDENTITY_REQUIRED", "message": str(e)})
+        except EdgeContractError as e:
+            raise HTTPException(status_code=422, detail={"error": "EDGE_CONTRACT", "message": str(e)})
+        return {
+            "tenant_id": tenant_id, "entity_id": entity_id,
+            "node": {"node_type": node_type, "node_key": node_key},
+            "as_of": as_of, "depth": depth, "edge_count": len(result["edges"]),
+            "edges": result["edges"], "neighbors": result["nodes"][1:],
+            "truncated": result["truncated"],
+        }
+
     try:
         edges = get_edge_store().get_neighbors(
             tenant_id, entity_id, node_type, node_key,
@@ -291,6 +300,44 @@ def graph_neighbors(
     }
 
 
+@router.get("/api/dcl/graph/paths")
+def graph_paths(
+    tenant_id: str,
+    entity_id: str,
+    src_type: str,
+    src_key: str,
+    dst_type: str,
+    dst_key: str,
+    k: int = Query(3, ge=1, le=GRAPH_PATHS_MAX_K, description="Paths to return"),
+    max_hops: int = Query(4, ge=1, le=GRAPH_TRAVERSAL_MAX_DEPTH),
+    edge_types: Optional[str] = Query(None, description="Comma-separated edge-type allow-list"),
+    direction: str = Query("both", pattern="^(out|in|both)$"),
+    as_of: Optional[str] = Query(None, description="ISO timestamp — knowledge-time as-of read"),
+):
+    """How two nodes are connected: the k shortest loopless typed paths from
+    (src_type, src_key) to (dst_type, dst_key), at most max_hops edges each,
+    fewest hops first. Each path lists its nodes and its edges (with the
+    direction each was walked). An empty list means not connected within the
+    bounds — not an error."""
+    _validate_uuid(tenant_id, "tenant_id")
+    types = [t.strip() for t in edge_types.split(",") if t.strip()] if edge_types else None
+    try:
+        paths = get_edge_store().find_paths(
+            tenant_id, entity_id, (src_type, src_key), (dst_type, dst_key),
+            k=k, max_hops=max_hops, edge_types=types, direction=direction, as_of=as_of,
+        )
+    except EdgeIdentityError as e:
+        raise HTTPException(status_code=422, detail={"error": "IDENTITY_REQUIRED", "message": str(e)})
+    except EdgeContractError as e:
+        raise HTTPException(status_code=422, detail={"error": "EDGE_CONTRACT", "message": str(e)})
+    return {
+        "tenant_id": tenant_id, "entity_id": entity_id, "as_of": as_of,
+        "src": {"node_type": src_type, "node_key": src_key},
+        "dst": {"node_type": dst_type, "node_key": dst_key},
+        "path_count": len(paths), "paths": paths,
+    }
+
+
 @router.get("/api/dcl/graph/subgraph")
 def graph_subgraph(
     entity_id: str,
@@ -315,10 +362,16 @@ def graph_subgraph(
         raise HTTPException(status_code=422, detail={"error": "IDENTITY_REQUIRED", "message": str(e)})
 
     nodes = sub["nodes"]
+    values = (
+        get_edge_store().node_values(
+            tenant_id, entity_id, [(n["node_type"], n["node_key"]) for n in nodes],
+        )
+        if include_values else {}
+    )
     for n in nodes:
         n["label"] = n["node_key"] if n["node_type"] != "org_unit" else entity_id
         if include_values:
-            n["values"] = _node_values(tenant_id, entity_id, n["node_type"], n["node_key"])
+            n["values"] = values[(n["node_type"], n["node_key"])]
 
     by_type: dict[str, int] = {}
     for e in sub["edges"]:
@@ -349,7 +402,9 @@ def graph_inspector(
     except EdgeIdentityError as e:
         raise HTTPException(status_code=422, detail={"error": "IDENTITY_REQUIRED", "message": str(e)})
 
-    values = _node_values(tenant_id, entity_id, node_type, node_key)
+    values = get_edge_store().node_values(
+        tenant_id, entity_id, [(node_type, node_key)],
+    )[(node_type, node_key)]
     domains = sorted({c.split(".")[0] for c in values}) if values else []
     relationships = [
         {
@@ -5,6 +5,10 @@
                                       @context (application/ld+json)
   GET /api/dcl/export/metrics.yaml  — the metric catalog as MetricFlow-spec
                                       multi-document YAML (application/x-yaml)
+  GET /api/dcl/export/run.parquet   — the current run snapshot's triples as
+                                      Parquet (application/vnd.apache.parquet)
+  GET /api/dcl/export/run.arrows    — the same rows as an Arrow IPC stream
+                                      (application/vnd.apache.arrow.stream)
 
 Contract (campaign-pinned):
   - tenant_id REQUIRED on all three — missing 422 (FastAPI), malformed 422
@@ -18,6 +22,14 @@ Contract (campaign-pinned):
   - every response is a downloadable attachment;
   - assembled fresh per request — no caching layers.
 
+Run snapshot exports (columnar, for bulk consumers — NLQ, Convergence,
+notebooks — instead of paging JSON): same tenant_id / entity_id contract,
+plus an optional dcl_ingest_id (422 if malformed) selecting one ingest run
+instead of the current pointers. The existence check runs before streaming,
+so an empty scope is a 404, never an empty file; the body itself is streamed
+batch by batch from a server-side cursor (backend/engine/arrow_export.py —
+column contract there). Without pyarrow installed both answer 503.
+
 The retained JSON export (/api/dcl/semantic-export) is a separate, untouched
 surface — these routes only read the same loaded catalog object.
 """
@@ -26,8 +38,10 @@ import uuid
 from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import StreamingResponse
 
 from backend.api.semantic_export import PUBLISHED_METRICS
+from backend.engine import arrow_export
 from backend.engine.metricflow_export import build_metricflow_yaml
 from backend.engine.rdf_export import (
     GraphExportEmpty,
@@ -109,3 +123,66 @@ def export_metrics_yaml(tenant_id: str, entity_id: Optional[str] = None):
         )
     body = build_metricflow_yaml(PUBLISHED_METRICS)
     return _attachment(body, "application/x-yaml", "metrics.yaml")
+
+
+def _run_batches_or_404(tenant_id: str, entity_id: Optional[str],
+                        dcl_ingest_id: Optional[str]):
+    _require_tenant_uuid_422(tenant_id)
+    if dcl_ingest_id is not None:
+        try:
+            uuid.UUID(str(dcl_ingest_id))
+        except (ValueError, AttributeError, TypeError):
+            raise HTTPException(
+                status_code=422,
+                detail={
+                    "error": "DCL_INGEST_ID_INVALID",
+                    "message": f"dcl_ingest_id must be a valid UUID. Got: {dcl_ingest_id!r}",
+                },
+            )
+    if not arrow_export.ARROW_AVAILABLE:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "EXPORT_UNAVAILABLE",
+                "message": "Columnar export needs pyarrow, which is not installed on this worker.",
+            },
+        )
+    try:
+        arrow_export.check_run_exists(tenant_id, entity_id, dcl_ingest_id)
+    except arrow_export.RunExportEmpty as exc:
+        raise HTTPException(
+            status_code=404,
+            detail={"error": "NO_RUN_FOR_TENANT", "message": str(exc)},
+        )
+    return arrow_export.iter_record_batches(tenant_id, entity_id, dcl_ingest_id)
+
+
+def _streamed_attachment(chunks, media_type: str, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/api/dcl/export/run.parquet")
+def export_run_parquet(tenant_id: str, entity_id: Optional[str] = None,
+                       dcl_ingest_id: Optional[str] = None):
+    """The run snapshot as Parquet — one row group per cursor batch,
+    dictionary-encoded text columns, the JSONB value split into value_num /
+    value_str. Streamed; worker memory is bounded by EXPORT_BATCH_ROWS."""
+    batches = _run_batches_or_404(tenant_id, entity_id, dcl_ingest_id)
+    return _streamed_attachment(
+        arrow_export.stream_parquet(batches), "application/vnd.apache.parquet", "run.parquet",
+    )
+
+
+@router.get("/api/dcl/export/run.arrows")
+def export_run_arrow_stream(tenant_id: str, entity_id: Optional[str] = None,
+                            dcl_ingest_id: Optional[str] = None):
+    """The same rows as an Arrow IPC stream (pyarrow.ipc.open_stream /
+    arrow-js tableFromIPC read it incrementally)."""
+    batches = _run_batches_or_404(tenant_id, entity_id, dcl_ingest_id)
+    return _streamed_attachment(
+        arrow_export.stream_ipc(batches), "application/vnd.apache.arrow.stream", "run.arrows",
+    )
@@ -83,6 +83,10 @@ class IngestRecordsResponse(BaseModel):
     # edges, the deprecated pipe path's old job).
     mappings_written: int = 0
     concept_summary: dict
+    # Post-ingest job of the shared triples path (migration 030) — see
+    # IngestResponse; concept_summary is empty while it is "queued".
+    post_ingest_job_id: Optional[int] = None
+    post_ingest_status: Literal["queued", "done"] = "done"
     # method -> count across all resolved records (exact/alias/pattern/fuzzy/
     # hitl_pending/discovery/rejected). Empty when no pipe declared an identity.
     resolution_summary: dict
@@ -107,11 +111,13 @@ def ingest_records(
     req: IngestRecordsRequest,
     replace: bool = Query(False),
     append: bool = Query(False),
+    sync: Optional[bool] = Query(None),
 ):
     """Map -> resolve -> convert raw records inbound, then persist via the shared
     triple path. Idempotent on dcl_ingest_id (?replace=true re-runs cleanly:
     triples replaced, canonicals deduped by normalized value, HITL rows deduped
-    by pair+status)."""
+    by pair+status). ?sync=true runs the post-ingest job before responding,
+    exactly as on /api/dcl/ingest-triples."""
     _validate_uuid(req.tenant_id, "tenant_id")
     _validate_uuid(req.dcl_ingest_id, "dcl_ingest_id")
     if not req.entity_id or not req.entity_id.strip():
@@ -187,7 +193,9 @@ def ingest_records(
         run_mode=req.run_mode,
         triples=conv.payloads,
     )
-    ingest_resp: IngestResponse = ingest_triples(envelope, replace=replace, append=append)
+    ingest_resp: IngestResponse = ingest_triples(
+        envelope, replace=replace, append=append, sync=sync,
+    )
 
     # --- Persist the field->concept classifications this ingest learned so the
     # semantic graph (rebuilt at startup and by /api/dcl/run -> build_graph_snapshot)
@@ -238,6 +246,8 @@ def ingest_records(
         triples_written=ingest_resp.triples_written,
         mappings_written=mappings_written,
         concept_summary=ingest_resp.concept_summary,
+        post_ingest_job_id=ingest_resp.post_ingest_job_id,
+        post_ingest_status=ingest_resp.post_ingest_status,
         resolution_summary=conv.resolution_summary,
         hitl_queue_ids=conv.hitl_queue_ids,
         warnings=conv.warnings,
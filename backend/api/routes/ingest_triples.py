@@ -2,26 +2,36 @@
 Semantic triple ingest endpoint.
 
 POST   /api/dcl/ingest-triples         — batch ingest triples
+POST   /api/dcl/ingest-triples/stream  — NDJSON streaming ingest (one run)
+GET    /api/dcl/ingest-triples/status/{run_id} — post-ingest job status
 GET    /api/dcl/ingest-status/{run_id}  — run status
 GET    /api/dcl/ingest-status           — list all runs
 GET    /api/dcl/ingest-log              — ingest activity log
 DELETE /api/dcl/purge-inactive          — hard-delete deactivated triples
 """
 
+import itertools
 import json
 import os
+import re
 import time
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel, ConfigDict, Field
-from typing import Literal, Optional
+
+import anyio
+from fastapi import APIRouter, HTTPException, Query, Request
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from starlette.concurrency import run_in_threadpool
+from typing import Iterable, Iterator, Literal, Optional
 
 from backend.aam.ingress import normalize_source_id
-from backend.core.db import get_connection
+from backend.core import read_cache
+from backend.core.constants import INGEST_SHARD_WRITES, INGEST_SYNC_DEFAULT
+from backend.core.db import get_connection, stream_rows
+from backend.db.ingest_job_store import IngestJobStore
 from backend.db.normalization_policy_store import NormalizationPolicyStore
-from backend.db.triple_store import TripleStore
+from backend.db.triple_store import TripleStore, delete_triples_tx
 from backend.engine.persona_view import get_persona_domain_mapping
 from backend.registry.concept_registry import ConceptRegistry
 from backend.resolver import value_normalizer
@@ -34,6 +44,7 @@ router = APIRouter(tags=["Triple Ingest"])
 _triple_store = TripleStore()
 _concept_registry = ConceptRegistry()
 _normalization_policy_store = NormalizationPolicyStore()
+_ingest_jobs = IngestJobStore()
 
 # Union of every domain prefix mapped to a persona, built at import time.
 # Farm-emitted triples whose concept prefix is absent from this set are
@@ -103,6 +114,11 @@ class IngestResponse(BaseModel):
     triples_written: int
     expansion_factor: float
     conflicts_detected: int = 0
+    # Post-ingest job (ingest_jobs, migration 030). "queued": concept_summary
+    # and conflicts_detected are empty here — read them from
+    # GET /api/dcl/ingest-triples/status/{run_id} once the job is done.
+    post_ingest_job_id: Optional[int] = None
+    post_ingest_status: Literal["queued", "done"] = "done"
 
 
 # ---------------------------------------------------------------------------
@@ -127,8 +143,35 @@ _VALID_TIERS = {"exact", "high", "medium", "low"}
 _VALID_RESOLUTION_METHODS = {"deterministic", "fuzzy", "manual", None}
 
 
-def _validate_triple(t: TriplePayload, index: int) -> None:
-    """Validate a single triple. Raises HTTPException on failure."""
+def _concept_verdicts(concepts: Iterable[str]) -> dict[str, Optional[str]]:
+    """Validate a payload's concepts as a SET: each distinct concept is checked
+    once against the registry and the persona domain map. Returns
+    concept -> None (valid) or the error code (INVALID_CONCEPT /
+    UNMAPPED_DOMAIN) every row carrying that concept fails with. A 1K batch
+    holds a few dozen distinct concepts, so per-row concept validation becomes
+    one dict lookup."""
+    distinct = {c for c in concepts if c and c.strip()}
+    valid = _concept_registry.valid_concepts(distinct)
+    verdicts: dict[str, Optional[str]] = {}
+    for c in distinct:
+        if c not in valid:
+            verdicts[c] = "INVALID_CONCEPT"
+        elif c.split(".", 1)[0] not in _MAPPED_DOMAIN_PREFIXES:
+            verdicts[c] = "UNMAPPED_DOMAIN"
+        else:
+            verdicts[c] = None
+    return verdicts
+
+
+def _validate_triple(
+    t: TriplePayload, index: int, verdicts: dict[str, Optional[str]],
+) -> None:
+    """Validate a single triple. Raises HTTPException on failure.
+
+    `verdicts` is the concept verdict map from _concept_verdicts; a concept
+    not yet in it (streaming ingest, which sees rows one at a time) is
+    validated once and added.
+    """
     if not t.entity_id or not t.entity_id.strip():
         raise HTTPException(
             status_code=400,
@@ -147,7 +190,11 @@ def _validate_triple(t: TriplePayload, index: int) -> None:
             },
         )
 
-    if not _concept_registry.is_valid_concept(t.concept):
+    if t.concept not in verdicts:
+        verdicts.update(_concept_verdicts([t.concept]))
+    verdict = verdicts[t.concept]
+
+    if verdict == "INVALID_CONCEPT":
         raise HTTPException(
             status_code=400,
             detail={
@@ -158,8 +205,8 @@ def _validate_triple(t: TriplePayload, index: int) -> None:
             },
         )
 
-    domain_prefix = t.concept.split(".", 1)[0]
-    if domain_prefix not in _MAPPED_DOMAIN_PREFIXES:
+    if verdict == "UNMAPPED_DOMAIN":
+        domain_prefix = t.concept.split(".", 1)[0]
         raise HTTPException(
             status_code=422,
             detail={
@@ -286,6 +333,405 @@ def _validate_triple(t: TriplePayload, index: int) -> None:
         )
 
 
+# ---------------------------------------------------------------------------
+# Write-path helpers — shared by the batch endpoint and the NDJSON stream
+# ---------------------------------------------------------------------------
+
+def _check_blocked_entities(entity_ids) -> None:
+    """ME entity_id boundary guard — DCL is SE-only."""
+    if not _BLOCKED_ENTITY_IDS:
+        return
+    blocked_found = {
+        eid for eid in entity_ids if eid.lower() in _BLOCKED_ENTITY_IDS
+    }
+    if blocked_found:
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "error": "ME_ENTITY_REJECTED",
+                "message": (
+                    f"DCL rejected entity_ids {sorted(blocked_found)} — "
+                    f"ME data routes to Convergence (port 8010), not DCL (port 8004). "
+                    f"Check Farm routing config or Console pipeline orchestrator."
+                ),
+                "blocked_entity_ids": sorted(blocked_found),
+            },
+        )
+
+
+def _check_run_idempotency(dcl_ingest_id: str, replace: bool, append: bool) -> bool:
+    """409 when the run already has triples and neither replace nor append
+    was requested. Returns whether the run already exists."""
+    run_exists = _triple_store.run_exists(dcl_ingest_id)
+    if run_exists and not replace and not append:
+        raise HTTPException(
+            status_code=409,
+            detail={
+                "error": "RUN_ALREADY_EXISTS",
+                "message": f"dcl_ingest_id {dcl_ingest_id} already has triples in the store. "
+                           "Use ?replace=true to deactivate old triples and re-ingest, "
+                           "or ?append=true to add more triples to this run.",
+                "dcl_ingest_id": dcl_ingest_id,
+            },
+        )
+    return run_exists
+
+
+def _is_structural_marker(t: TriplePayload) -> bool:
+    """Structural namespace markers ({ns}._meta / namespace_type, emitted by
+    ledger_records_aggregator) are NOT time-series metrics: the value is a
+    non-numeric catalog string and the period is the "_meta" SENTINEL by
+    protocol, not a time period. There is nothing to scale or convert, and
+    the sentinel must not be forced through the period parser (which fails
+    loud on it — correctly, for real metrics). Markers pass through
+    untouched so the sentinel/concept the domain queries key on is
+    preserved; metadata stays None. Real metrics still get strict
+    unit/currency/period normalization."""
+    return (t.concept or "").endswith("._meta")
+
+
+def _normalization_failed(t: TriplePayload, index: int, e: ValueError) -> HTTPException:
+    """Fail loud (A1): an unknown unit-scale, an unparseable period, or a
+    missing FX rate is a refusal to write a value we cannot place in the
+    tenant canonical — surfaced as 422 with the readable message naming the
+    offending unit/period/currency."""
+    return HTTPException(
+        status_code=422,
+        detail={
+            "error": "NORMALIZATION_FAILED",
+            "message": (
+                f"Triple #{index} (entity_id={t.entity_id!r} "
+                f"concept={t.concept!r} property={t.property!r}): {e}"
+            ),
+            "triple_index": index,
+        },
+    )
+
+
+def _apply_normalized(t: TriplePayload, result: dict) -> Optional[dict]:
+    t.value = result["value"]
+    t.unit = result["unit"]
+    t.currency = result["currency"]
+    t.period = result["period"]
+    return result["metadata"]
+
+
+def _normalize_triples(triples: list[TriplePayload], policy: dict) -> list[Optional[dict]]:
+    """Normalize a whole batch in place to the tenant canonical; returns each
+    triple's normalization_metadata (None for no-op rows and markers).
+
+    source_system is normalized through the canonical normalize_source_id
+    (root-fixes dcl_deferred_work.md#80: aggregators stamp raw "NetSuite",
+    the per-record path stamps "netsuite" — now uniformly canonical at the
+    one write boundary, so both spellings collapse to one source).
+
+    Values go through value_normalizer.normalize_batch: a batch holds only a
+    handful of distinct (unit, currency, period) combinations, each resolved
+    once; results are identical to per-row normalize().
+    """
+    metric_idx: list[int] = []
+    for i, t in enumerate(triples):
+        t.source_system = normalize_source_id(t.source_system)
+        if not _is_structural_marker(t):
+            metric_idx.append(i)
+    try:
+        results = value_normalizer.normalize_batch(
+            [
+                {"value": triples[i].value, "unit": triples[i].unit,
+                 "currency": triples[i].currency, "period": triples[i].period}
+                for i in metric_idx
+            ],
+            policy=policy,
+        )
+    except value_normalizer.BatchNormalizationError as e:
+        index = metric_idx[e.index]
+        raise _normalization_failed(triples[index], index, e)
+
+    metas: list[Optional[dict]] = [None] * len(triples)
+    for i, result in zip(metric_idx, results):
+        metas[i] = _apply_normalized(triples[i], result)
+    return metas
+
+
+def _normalize_triple(
+    t: TriplePayload, index: int, normalizer: value_normalizer.BatchNormalizer,
+) -> Optional[dict]:
+    """Single-row form of _normalize_triples for the streaming ingest, which
+    sees triples one at a time. The per-stream BatchNormalizer memoizes
+    (unit, currency, period) resolution across the whole stream."""
+    t.source_system = normalize_source_id(t.source_system)
+    if _is_structural_marker(t):
+        return None
+    try:
+        result = normalizer.normalize(
+            value=t.value, unit=t.unit, currency=t.currency, period=t.period,
+        )
+    except ValueError as e:
+        raise _normalization_failed(t, index, e)
+    return _apply_normalized(t, result)
+
+
+def _build_row(
+    t: TriplePayload,
+    *,
+    tenant_id: str,
+    dcl_ingest_id: str,
+    source_run_tag: Optional[str],
+    normalization_metadata: Optional[dict],
+) -> dict:
+    """Store row for one validated, normalized triple."""
+    return {
+        "tenant_id": tenant_id,
+        "entity_id": t.entity_id,
+        "concept": t.concept,
+        "property": t.property,
+        "value": t.value,
+        "period": t.period,
+        "currency": t.currency,
+        "unit": t.unit,
+        "source_system": t.source_system,
+        "source_table": t.source_table,
+        "source_field": t.source_field,
+        "pipe_id": t.pipe_id,
+        "run_id": dcl_ingest_id,  # DB column
+        "source_run_tag": source_run_tag,
+        "confidence_score": t.confidence_score,
+        "confidence_tier": t.confidence_tier,
+        "canonical_id": t.canonical_id,
+        "resolution_method": t.resolution_method,
+        "resolution_confidence": t.resolution_confidence,
+        "fabric_plane": t.fabric_plane,
+        "fabric_product": t.fabric_product,
+        "normalization_metadata": normalization_metadata,
+    }
+
+
+def _db_write_error(
+    db_err: Exception,
+    *,
+    dcl_ingest_id: str,
+    tenant_id: str,
+    triples_attempted: int,
+    duration_ms: int,
+) -> HTTPException:
+    """Map a failed triple write to the ingest's 504/503 contract."""
+    logger.error(
+        f"[ingest-triples] DB write failed after {duration_ms}ms for "
+        f"dcl_ingest_id={dcl_ingest_id}, tenant_id={tenant_id}, "
+        f"triples_attempted={triples_attempted}: {db_err}",
+        exc_info=True,
+    )
+    err_str = str(db_err)
+    if "statement timeout" in err_str or "canceling statement" in err_str:
+        return HTTPException(
+            status_code=504,
+            detail={
+                "error": "INGEST_STATEMENT_TIMEOUT",
+                "message": (
+                    f"Triple INSERT timed out after {duration_ms}ms "
+                    f"({triples_attempted} triples). The database statement "
+                    f"timeout was exceeded — the batch may be too large for "
+                    f"current Supabase PG capacity."
+                ),
+                "triples_attempted": triples_attempted,
+                "duration_ms": duration_ms,
+            },
+        )
+    return HTTPException(
+        status_code=503,
+        detail={
+            "error": "INGEST_DB_ERROR",
+            "message": f"Database write failed: {err_str[:300]}",
+            "triples_attempted": triples_attempted,
+            "duration_ms": duration_ms,
+        },
+    )
+
+
+def _check_snapshot_name(
+    snapshot_name: Optional[str], entity_id: str, dcl_ingest_id: str,
+) -> None:
+    """Persistence-boundary enforcement (dcl_deferred_work.md#36).
+
+    snapshot_name must be either None (AAM relay path — read-side derives,
+    dcl#38 contract) or canonical I5 form `{entity_id}-{4hex}`. Non-None
+    non-canonical names (raw UUIDs, "cloudedge-*", "cloud-spend-*",
+    "cco_summary", etc.) are rejected — no writer can persist a
+    non-canonical name regardless of which Farm path produced the call.
+    """
+    if snapshot_name is None or snapshot_name == "":
+        return
+    canon_pattern = re.compile(
+        r"^" + re.escape(entity_id) + r"-[0-9a-f]{4}$", re.IGNORECASE,
+    )
+    if canon_pattern.match(snapshot_name):
+        return
+    canonical = f"{entity_id}-{str(dcl_ingest_id).replace('-', '')[:4]}"
+    raise HTTPException(
+        status_code=422,
+        detail={
+            "error": "NONCANONICAL_SNAPSHOT_NAME",
+            "message": (
+                f"snapshot_name {snapshot_name!r} rejected — "
+                f"does not match I5 form '<entity_id>-<4hex>' "
+                f"for entity_id={entity_id!r}. "
+                f"Canonical would be {canonical!r}. "
+                f"Caller must normalize via farm.services.identity."
+                f"normalize_run_name() before push, or omit "
+                f"snapshot_name to let the read path derive."
+            ),
+            "supplied": snapshot_name,
+            "expected_canonical": canonical,
+            "entity_id": entity_id,
+        },
+    )
+
+
+def _finalize_ingest(
+    *,
+    tenant_id: str,
+    dcl_ingest_id: str,
+    resolved_entity_id: str,
+    snapshot_name: Optional[str],
+    append: bool,
+    batch_coords: list[tuple],
+    entity_ids: list[str],
+    source_systems: list[str],
+    triples_received: int,
+    count: int,
+    duration_ms: int,
+    farm_run_id: Optional[str],
+    sync: Optional[bool],
+) -> tuple[dict, int, int, str]:
+    """Post-write steps, run once per request (batch) or once per stream.
+
+    The pointer swap stays on the request path — a 201 means the run is the
+    entity's current run. Everything downstream of it (domain summary,
+    conflict detection, ingest_log, seed manifest) is ONE post_ingest job in
+    ingest_jobs (migration 030): enqueued for the ingest worker by default,
+    or executed in-request through the same job body when sync is true.
+    Returns (concept_summary, conflicts_touched, job_id, job_status);
+    summary/conflicts are empty until the job has run.
+    """
+    # Atomic pointer swap + deactivation — single transaction.
+    # Entity-scoped: only deactivates the previous run for THIS entity.
+    # Not set for append=true (multi-batch ingest of the same run_id keeps
+    # whatever pointer was set by the initial replace ingest).
+    if not append:
+        previous_run_id, deactivated = _triple_store.swap_and_deactivate(
+            tenant_id, dcl_ingest_id,
+            entity_id=resolved_entity_id,
+            snapshot_name=snapshot_name,
+        )
+        logger.info(
+            f"[ingest-triples] tenant_runs updated: tenant_id={tenant_id} "
+            f"entity_id={resolved_entity_id} "
+            f"→ current_run_id={dcl_ingest_id} (previous={previous_run_id}, "
+            f"deactivated={deactivated})"
+        )
+
+    payload = {
+        "tenant_id": tenant_id,
+        "dcl_ingest_id": dcl_ingest_id,
+        "entity_id": resolved_entity_id,
+        "batch_coords": [list(c) for c in batch_coords],
+        "entity_ids": entity_ids,
+        "source_systems": source_systems,
+        "triples_received": triples_received,
+        "count": count,
+        "duration_ms": duration_ms,
+        "farm_run_id": farm_run_id,
+    }
+    if sync is None:
+        sync = INGEST_SYNC_DEFAULT
+    if not sync:
+        job_id = _ingest_jobs.enqueue(
+            tenant_id, dcl_ingest_id, "post_ingest", payload,
+            entity_id=resolved_entity_id,
+        )
+        logger.info(
+            f"[ingest-triples] Ingested {count} triples for dcl_ingest_id={dcl_ingest_id}, "
+            f"tenant_id={tenant_id}, duration={duration_ms}ms; "
+            f"post-ingest job {job_id} queued"
+        )
+        return {}, 0, job_id, "queued"
+
+    # Read-your-writes: the job row is inserted already claimed so no worker
+    # races this request for it. Failures propagate (A1) — conflict detection
+    # runs on data this request just wrote — and stay on the row for retry.
+    from backend.api.ingest_worker import execute_job, new_worker_id
+    job_id = _ingest_jobs.enqueue(
+        tenant_id, dcl_ingest_id, "post_ingest", payload,
+        entity_id=resolved_entity_id, worker_id=new_worker_id("sync"),
+    )
+    result = execute_job(_ingest_jobs, job_id, "post_ingest", payload)
+    return result["concept_summary"], result["conflicts_detected"], job_id, "done"
+
+
+def run_post_ingest(payload: dict) -> dict:
+    """post_ingest job body (backend/api/ingest_worker.py): domain summary,
+    conflict detection, ingest_log, seed manifest for one batch / stream.
+    Returns the job result stored on the ingest_jobs row."""
+    tenant_id = payload["tenant_id"]
+    dcl_ingest_id = payload["dcl_ingest_id"]
+    entity_ids = payload["entity_ids"]
+    count = payload["count"]
+
+    concept_summary = _triple_store.count_by_domain(tenant_id, run_id=dcl_ingest_id)
+
+    # Conflict detection (Gate 1A): every batch re-detects this run's rows AT
+    # THIS BATCH'S COORDINATES and upserts the Conflict Register — idempotent
+    # per (coords, run); per-batch cost scales with the batch, not the
+    # accumulated run (B18). Detection failures propagate: the job is marked
+    # failed with the error (and ?sync=true callers get it as the response) —
+    # never a silent background nicety (A1).
+    from backend.engine.conflict_detection import detect_and_register
+    conflict_result = detect_and_register(
+        tenant_id, payload["entity_id"], dcl_ingest_id,
+        coords=[tuple(c) for c in payload["batch_coords"]],
+    )
+    conflicts_touched = len(conflict_result["conflicts"])
+
+    logger.info(
+        f"[ingest-triples] Post-ingest for dcl_ingest_id={dcl_ingest_id}, "
+        f"tenant_id={tenant_id}: {count} triples, concepts={concept_summary}, "
+        f"conflicts={conflicts_touched} ({conflict_result['detected_new']} new)"
+    )
+
+    # Bloat-watch moved off the hot path. See GET /api/dcl/admin/triple-count
+    # (this file) — operator/cron polls it; ingest latency is no longer gated
+    # by a full-table COUNT(*).
+
+    # Record to ingest_log — observability only, never fails the ingest
+    _record_ingest_log(
+        run_id=dcl_ingest_id,
+        tenant_id=tenant_id,
+        entity_id=entity_ids[0] if len(entity_ids) == 1 else None,
+        source_systems=payload["source_systems"],
+        triples_received=payload["triples_received"],
+        triples_written=count,
+        duration_ms=payload["duration_ms"],
+    )
+
+    # Update seed_manifest.json so tests point at the live run.
+    # Triggers on every successful batch ingest (replace + append) so that
+    # multi-batch pushes do not leave the manifest at the post-batch-0
+    # concept count. Idempotent: the function gates against regression.
+    _update_seed_manifest(
+        tenant_id,
+        dcl_ingest_id,
+        count,
+        concept_summary,
+        entity_ids=entity_ids,
+        farm_run_id=payload["farm_run_id"],
+    )
+    return {
+        "concept_summary": concept_summary,
+        "conflicts_detected": conflicts_touched,
+        "conflicts_new": conflict_result["detected_new"],
+    }
+
+
 # ---------------------------------------------------------------------------
 # Endpoints
 # ---------------------------------------------------------------------------
@@ -295,6 +741,7 @@ def ingest_triples(
     req: IngestRequest,
     replace: bool = Query(False),
     append: bool = Query(False),
+    sync: Optional[bool] = Query(None),
 ):
     """
     Batch ingest semantic triples.
@@ -305,6 +752,13 @@ def ingest_triples(
     - With ?append=true: skips idempotency check, adds triples to existing run.
       Use this for multi-batch ingestion where the caller sends the same run_id
       across multiple requests (e.g. Farm pushing 18K triples in 1K batches).
+      Large runs can instead be pushed as ONE request through the NDJSON
+      stream variant, POST /api/dcl/ingest-triples/stream.
+    - Domain summary, conflict detection, ingest_log and the seed manifest run
+      as a queued post-ingest job (post_ingest_status="queued"; poll
+      GET /api/dcl/ingest-triples/status/{run_id}). With ?sync=true they run
+      before the response, which then carries concept_summary and
+      conflicts_detected (read-your-writes).
     """
     _validate_uuid(req.tenant_id, "tenant_id")
     _validate_uuid(req.dcl_ingest_id, "dcl_ingest_id")
@@ -318,43 +772,16 @@ def ingest_triples(
             },
         )
 
-    # Validate every triple BEFORE any DB writes (batch atomicity)
+    # Validate every triple BEFORE any DB writes (batch atomicity). Concepts
+    # are checked once per distinct concept; errors still name the row.
+    verdicts = _concept_verdicts(t.concept for t in req.triples)
     for i, t in enumerate(req.triples):
-        _validate_triple(t, i)
+        _validate_triple(t, i, verdicts)
 
-    # ME entity_id boundary guard — DCL is SE-only.
-    if _BLOCKED_ENTITY_IDS:
-        blocked_found = {
-            t.entity_id for t in req.triples
-            if t.entity_id.lower() in _BLOCKED_ENTITY_IDS
-        }
-        if blocked_found:
-            raise HTTPException(
-                status_code=422,
-                detail={
-                    "error": "ME_ENTITY_REJECTED",
-                    "message": (
-                        f"DCL rejected entity_ids {sorted(blocked_found)} — "
-                        f"ME data routes to Convergence (port 8010), not DCL (port 8004). "
-                        f"Check Farm routing config or Console pipeline orchestrator."
-                    ),
-                    "blocked_entity_ids": sorted(blocked_found),
-                },
-            )
+    _check_blocked_entities({t.entity_id for t in req.triples})
 
     # Idempotency check — skipped when append=true (multi-batch ingestion)
-    run_exists = _triple_store.run_exists(req.dcl_ingest_id)
-    if run_exists and not replace and not append:
-        raise HTTPException(
-            status_code=409,
-            detail={
-                "error": "RUN_ALREADY_EXISTS",
-                "message": f"dcl_ingest_id {req.dcl_ingest_id} already has triples in the store. "
-                           "Use ?replace=true to deactivate old triples and re-ingest, "
-                           "or ?append=true to add more triples to this run.",
-                "dcl_ingest_id": req.dcl_ingest_id,
-            },
-        )
+    run_exists = _check_run_idempotency(req.dcl_ingest_id, replace, append)
 
     # When replace=true, all existing triples for this tenant are atomically
     # deleted and replaced with the new batch inside a single transaction.
@@ -372,54 +799,11 @@ def ingest_triples(
     # source path BEFORE conflict detection so a cross-source gap is the REAL
     # gap, never an artifact of unit/currency/format skew. Aggregators and
     # converters are NOT edited for value logic — normalization is centralized
-    # here. Policy is loaded ONCE per ingest; per-triple work is O(1) and skips
-    # fast when nothing needs converting (metadata stays None).
-    #
-    # source_system is normalized through the canonical normalize_source_id
-    # (root-fixes dcl_deferred_work.md#80: aggregators stamp raw "NetSuite",
-    # the per-record path stamps "netsuite" — now uniformly canonical at the
-    # one write boundary, so both spellings collapse to one source).
+    # here. Policy is loaded ONCE per ingest and each distinct (unit, currency,
+    # period) is resolved ONCE per batch; per-triple work is the arithmetic
+    # only, and metadata stays None when nothing needs converting.
     norm_policy = _normalization_policy_store.load_policy(str(req.tenant_id))
-    normalization_metas: list[Optional[dict]] = [None] * len(req.triples)
-    for i, t in enumerate(req.triples):
-        t.source_system = normalize_source_id(t.source_system)
-        # Structural namespace markers ({ns}._meta / namespace_type, emitted by
-        # ledger_records_aggregator) are NOT time-series metrics: the value is a
-        # non-numeric catalog string and the period is the "_meta" SENTINEL by
-        # protocol, not a time period. There is nothing to scale or convert, and
-        # the sentinel must not be forced through the period parser (which fails
-        # loud on it — correctly, for real metrics). Pass markers through
-        # untouched so the sentinel/concept the domain queries key on is
-        # preserved; metadata stays None. Real metrics still get strict
-        # unit/currency/period normalization below.
-        if (t.concept or "").endswith("._meta"):
-            continue
-        try:
-            result = value_normalizer.normalize(
-                value=t.value, unit=t.unit, currency=t.currency,
-                period=t.period, policy=norm_policy,
-            )
-        except ValueError as e:
-            # Fail loud (A1): an unknown unit-scale, an unparseable period, or
-            # a missing FX rate is a refusal to write a value we cannot place
-            # in the tenant canonical — surfaced as 422 with the readable
-            # message naming the offending unit/period/currency.
-            raise HTTPException(
-                status_code=422,
-                detail={
-                    "error": "NORMALIZATION_FAILED",
-                    "message": (
-                        f"Triple #{i} (entity_id={t.entity_id!r} "
-                        f"concept={t.concept!r} property={t.property!r}): {e}"
-                    ),
-                    "triple_index": i,
-                },
-            )
-        t.value = result["value"]
-        t.unit = result["unit"]
-        t.currency = result["currency"]
-        t.period = result["period"]
-        normalization_metas[i] = result["metadata"]
+    normalization_metas = _normalize_triples(req.triples, norm_policy)
 
     # Prod-mode AI: LLM concept validation + RAG lesson storage. Shared with
     # /api/dcl/run AAM-mode block via _apply_prod_mode_ai. Missing keys → 503.
@@ -481,32 +865,16 @@ def ingest_triples(
     # Build triple dicts for insertion. value/unit/currency/period are already
     # the tenant-canonical values from the normalization chokepoint above;
     # normalization_metadata carries the raw original (or None for no-op rows).
-    rows = []
-    for i, t in enumerate(req.triples):
-        rows.append({
-            "tenant_id": req.tenant_id,
-            "entity_id": t.entity_id,
-            "concept": t.concept,
-            "property": t.property,
-            "value": t.value,
-            "period": t.period,
-            "currency": t.currency,
-            "unit": t.unit,
-            "source_system": t.source_system,
-            "source_table": t.source_table,
-            "source_field": t.source_field,
-            "pipe_id": t.pipe_id,
-            "run_id": req.dcl_ingest_id,  # DB column
-            "source_run_tag": req.source_run_tag,
-            "confidence_score": t.confidence_score,
-            "confidence_tier": t.confidence_tier,
-            "canonical_id": t.canonical_id,
-            "resolution_method": t.resolution_method,
-            "resolution_confidence": t.resolution_confidence,
-            "fabric_plane": t.fabric_plane,
-            "fabric_product": t.fabric_product,
-            "normalization_metadata": normalization_metas[i],
-        })
+    rows = [
+        _build_row(
+            t,
+            tenant_id=req.tenant_id,
+            dcl_ingest_id=req.dcl_ingest_id,
+            source_run_tag=req.source_run_tag,
+            normalization_metadata=normalization_metas[i],
+        )
+        for i, t in enumerate(req.triples)
+    ]
 
     # --- Instrumentation: capture timing around the write ---
     triples_received = len(rows)
@@ -515,42 +883,23 @@ def ingest_triples(
 
     start_ts = time.monotonic()
     try:
-        if replace:
+        if INGEST_SHARD_WRITES and len(entity_ids) > 1:
+            # Opt-in: per-entity shards on parallel connections, two-phase
+            # commit keeps the batch atomic (migration 032).
+            count = _triple_store.write_entity_shards(
+                str(req.tenant_id), rows, replace=replace,
+            )
+        elif replace:
             count = _triple_store.replace_tenant_triples(str(req.tenant_id), rows)
         else:
             count = _triple_store.insert_triples(rows)
     except Exception as db_err:
-        duration_ms = int((time.monotonic() - start_ts) * 1000)
-        logger.error(
-            f"[ingest-triples] DB write failed after {duration_ms}ms for "
-            f"dcl_ingest_id={req.dcl_ingest_id}, tenant_id={req.tenant_id}, "
-            f"triples_attempted={triples_received}: {db_err}",
-            exc_info=True,
-        )
-        err_str = str(db_err)
-        if "statement timeout" in err_str or "canceling statement" in err_str:
-            raise HTTPException(
-                status_code=504,
-                detail={
-                    "error": "INGEST_STATEMENT_TIMEOUT",
-                    "message": (
-                        f"Triple INSERT timed out after {duration_ms}ms "
-                        f"({triples_received} triples). The database statement "
-                        f"timeout was exceeded — the batch may be too large for "
-                        f"current Supabase PG capacity."
-                    ),
-                    "triples_attempted": triples_received,
-                    "duration_ms": duration_ms,
-                },
-            )
-        raise HTTPException(
-            status_code=503,
-            detail={
-                "error": "INGEST_DB_ERROR",
-                "message": f"Database write failed: {err_str[:300]}",
-                "triples_attempted": triples_received,
-                "duration_ms": duration_ms,
-            },
+        raise _db_write_error(
+            db_err,
+            dcl_ingest_id=req.dcl_ingest_id,
+            tenant_id=req.tenant_id,
+            triples_attempted=triples_received,
+            duration_ms=int((time.monotonic() - start_ts) * 1000),
         )
     duration_ms = int((time.monotonic() - start_ts) * 1000)
 
@@ -570,110 +919,24 @@ def ingest_triples(
             },
         )
 
-    # Persistence-boundary enforcement (dcl_deferred_work.md#36).
-    # snapshot_name must be either None (AAM relay path — read-side derives,
-    # dcl#38 contract) or canonical I5 form `{entity_id}-{4hex}`. Non-None
-    # non-canonical names (raw UUIDs, "cloudedge-*", "cloud-spend-*",
-    # "cco_summary", etc.) are rejected — no writer can persist a
-    # non-canonical name regardless of which Farm path produced the call.
-    if req.snapshot_name is not None and req.snapshot_name != "":
-        import re as _re_check
-        _canon_pattern = _re_check.compile(
-            r"^" + _re_check.escape(resolved_entity_id) + r"-[0-9a-f]{4}$",
-            _re_check.IGNORECASE,
-        )
-        if not _canon_pattern.match(req.snapshot_name):
-            _canonical = (
-                f"{resolved_entity_id}-"
-                f"{str(req.dcl_ingest_id).replace('-', '')[:4]}"
-            )
-            raise HTTPException(
-                status_code=422,
-                detail={
-                    "error": "NONCANONICAL_SNAPSHOT_NAME",
-                    "message": (
-                        f"snapshot_name {req.snapshot_name!r} rejected — "
-                        f"does not match I5 form '<entity_id>-<4hex>' "
-                        f"for entity_id={resolved_entity_id!r}. "
-                        f"Canonical would be {_canonical!r}. "
-                        f"Caller must normalize via farm.services.identity."
-                        f"normalize_run_name() before push, or omit "
-                        f"snapshot_name to let the read path derive."
-                    ),
-                    "supplied": req.snapshot_name,
-                    "expected_canonical": _canonical,
-                    "entity_id": resolved_entity_id,
-                },
-            )
-
-    # Atomic pointer swap + deactivation — single transaction.
-    # Entity-scoped: only deactivates the previous run for THIS entity.
-    # Not set for append=true (multi-batch ingest of the same run_id keeps
-    # whatever pointer was set by the initial replace ingest).
-    if not append:
-        previous_run_id, deactivated = _triple_store.swap_and_deactivate(
-            str(req.tenant_id), str(req.dcl_ingest_id),
-            entity_id=resolved_entity_id,
-            snapshot_name=req.snapshot_name,
-        )
-        logger.info(
-            f"[ingest-triples] tenant_runs updated: tenant_id={req.tenant_id} "
-            f"entity_id={resolved_entity_id} "
-            f"→ current_run_id={req.dcl_ingest_id} (previous={previous_run_id}, "
-            f"deactivated={deactivated})"
-        )
-
-    concept_summary = _triple_store.count_by_domain(req.tenant_id, run_id=req.dcl_ingest_id)
-
-    # Conflict detection (Gate 1A): every batch re-detects this run's rows AT
-    # THIS BATCH'S COORDINATES and upserts the Conflict Register — idempotent
-    # per (coords, run); per-batch cost scales with the batch, not the
-    # accumulated run (B18). Detection failures propagate: it runs on data
-    # this request just wrote, so an error here is an error in the ingest
-    # contract, not a background nicety (A1).
-    from backend.engine.conflict_detection import detect_and_register
-    batch_coords = sorted({
-        (r["concept"], r["property"], r["period"] or "") for r in rows
-    })
-    conflict_result = detect_and_register(
-        str(req.tenant_id), resolved_entity_id, str(req.dcl_ingest_id),
-        coords=batch_coords,
-    )
-    conflicts_touched = len(conflict_result["conflicts"])
-
-    logger.info(
-        f"[ingest-triples] Ingested {count} triples for dcl_ingest_id={req.dcl_ingest_id}, "
-        f"tenant_id={req.tenant_id}, concepts={concept_summary}, "
-        f"conflicts={conflicts_touched} ({conflict_result['detected_new']} new), "
-        f"duration={duration_ms}ms"
-    )
-
-    # Bloat-watch moved off the hot path. See GET /api/dcl/admin/triple-count
-    # (this file) — operator/cron polls it; ingest latency is no longer gated
-    # by a full-table COUNT(*).
-
-    # Record to ingest_log — observability only, never fails the ingest
-    _record_ingest_log(
-        run_id=req.dcl_ingest_id,
-        tenant_id=req.tenant_id,
-        entity_id=entity_ids[0] if len(entity_ids) == 1 else None,
+    _check_snapshot_name(req.snapshot_name, resolved_entity_id, req.dcl_ingest_id)
+
+    concept_summary, conflicts_touched, job_id, job_status = _finalize_ingest(
+        tenant_id=str(req.tenant_id),
+        dcl_ingest_id=str(req.dcl_ingest_id),
+        resolved_entity_id=resolved_entity_id,
+        snapshot_name=req.snapshot_name,
+        append=append,
+        batch_coords=sorted({
+            (r["concept"], r["property"], r["period"] or "") for r in rows
+        }),
+        entity_ids=entity_ids,
         source_systems=source_systems,
         triples_received=triples_received,
-        triples_written=count,
+        count=count,
         duration_ms=duration_ms,
-    )
-
-    # Update seed_manifest.json so tests point at the live run.
-    # Triggers on every successful batch ingest (replace + append) so that
-    # multi-batch pushes do not leave the manifest at the post-batch-0
-    # concept count. Idempotent: the function gates against regression.
-    _update_seed_manifest(
-        req.tenant_id,
-        req.dcl_ingest_id,
-        count,
-        concept_summary,
-        entity_ids=entity_ids,
         farm_run_id=req.source_farm_manifest_id,
+        sync=sync,
     )
 
     # Determine batch-level entity_id: explicit request field takes priority,
@@ -696,9 +959,312 @@ def ingest_triples(
         triples_written=count,
         expansion_factor=expansion,
         conflicts_detected=conflicts_touched,
+        post_ingest_job_id=job_id,
+        post_ingest_status=job_status,
     )
 
 
+# ---------------------------------------------------------------------------
+# NDJSON streaming ingest
+# ---------------------------------------------------------------------------
+
+class IngestStreamHeader(BaseModel):
+    """First NDJSON line of a streamed ingest — the IngestRequest envelope
+    without `triples`. Every following line is one TriplePayload.
+
+    entity_id is required: a stream is one run for one entity, so the
+    replace-scope supersession and the pointer swap are known before the
+    first row is written. Prod-mode AI needs every field mapping up front
+    and is therefore batch-only.
+    """
+    model_config = ConfigDict(populate_by_name=True)
+    tenant_id: str
+    dcl_ingest_id: str = Field(..., alias="run_id")
+    entity_id: str
+    source_run_tag: Optional[str] = None
+    source_farm_manifest_id: Optional[str] = None
+    source_rows: Optional[int] = None
+    snapshot_name: Optional[str] = None
+    run_mode: Literal["Dev"] = "Dev"
+
+
+def _iter_ndjson_lines(chunks):
+    """Yield (line_no, line_bytes) for every non-blank line across body chunks."""
+    pending = b""
+    line_no = 0
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            line_no += 1
+            if line.strip():
+                yield line_no, line
+    if pending.strip():
+        yield line_no + 1, pending
+
+
+def _ndjson_error(line_no: int, message: str) -> HTTPException:
+    return HTTPException(
+        status_code=400,
+        detail={
+            "error": "VALIDATION_FAILED",
+            "message": f"NDJSON line {line_no}: {message}",
+            "line": line_no,
+        },
+    )
+
+
+class _StreamIngestState:
+    """Per-stream accumulators the row generator fills as COPY consumes it.
+
+    `failure` holds the HTTPException raised mid-stream: psycopg2 reports an
+    exception from the COPY source's read() as a generic "COPY from stdin
+    failed" error, so the handler re-raises the original from here.
+    """
+
+    def __init__(self) -> None:
+        self.received = 0
+        self.coords: set[tuple] = set()
+        self.source_systems: set[str] = set()
+        self.concept_verdicts: dict[str, Optional[str]] = {}
+        self.failure: Optional[HTTPException] = None
+
+
+def _stream_rows(
+    lines,
+    header: IngestStreamHeader,
+    normalizer: value_normalizer.BatchNormalizer,
+    state: _StreamIngestState,
+):
+    """Validate + normalize each NDJSON triple line and yield its store row.
+
+    Same per-triple contract as the batch endpoint (_validate_triple, the ME
+    entity guard, the normalization chokepoint); errors carry the triple index.
+    """
+    for line_no, raw in lines:
+        index = state.received
+        try:
+            try:
+                t = TriplePayload.model_validate_json(raw)
+            except ValidationError as e:
+                raise _ndjson_error(
+                    line_no, f"triple #{index} is not a valid TriplePayload: {e.errors()[:3]}"
+                )
+            _validate_triple(t, index, state.concept_verdicts)
+            if t.entity_id != header.entity_id:
+                raise HTTPException(
+                    status_code=422,
+                    detail={
+                        "error": "ENTITY_MISMATCH",
+                        "message": (
+                            f"Triple #{index}: entity_id {t.entity_id!r} does not match "
+                            f"the stream header entity_id {header.entity_id!r}. "
+                            f"A stream carries one run for one entity."
+                        ),
+                        "triple_index": index,
+                    },
+                )
+            meta = _normalize_triple(t, index, normalizer)
+        except HTTPException as e:
+            state.failure = e
+            raise
+        state.received += 1
+        state.coords.add((t.concept, t.property, t.period or ""))
+        state.source_systems.add(t.source_system)
+        yield _build_row(
+            t,
+            tenant_id=header.tenant_id,
+            dcl_ingest_id=header.dcl_ingest_id,
+            source_run_tag=header.source_run_tag,
+            normalization_metadata=meta,
+        )
+
+
+def _ingest_ndjson(chunks, replace: bool, append: bool, sync: Optional[bool]) -> IngestResponse:
+    """Synchronous body of the stream endpoint (runs in a worker thread)."""
+    lines = _iter_ndjson_lines(chunks)
+    first = next(lines, None)
+    if first is None:
+        raise _ndjson_error(0, "empty body — expected a header line then triples.")
+    try:
+        header = IngestStreamHeader.model_validate_json(first[1])
+    except ValidationError as e:
+        raise _ndjson_error(first[0], f"invalid stream header: {e.errors()[:3]}")
+
+    _validate_uuid(header.tenant_id, "tenant_id")
+    _validate_uuid(header.dcl_ingest_id, "dcl_ingest_id")
+    _check_blocked_entities({header.entity_id})
+    _check_snapshot_name(header.snapshot_name, header.entity_id, header.dcl_ingest_id)
+    run_exists = _check_run_idempotency(header.dcl_ingest_id, replace, append)
+    if run_exists and replace:
+        logger.info(
+            f"[ingest-triples/stream] replace=true for existing "
+            f"dcl_ingest_id={header.dcl_ingest_id}; streaming new triples"
+        )
+
+    normalizer = value_normalizer.BatchNormalizer(
+        _normalization_policy_store.load_policy(str(header.tenant_id))
+    )
+    state = _StreamIngestState()
+    rows = _stream_rows(lines, header, normalizer, state)
+
+    # Pull the first triple before touching the store: an empty stream must
+    # 400 without a replace having superseded the entity's live rows.
+    first_row = next(rows, None)
+    if first_row is None:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "VALIDATION_FAILED",
+                "message": "triples stream must not be empty.",
+            },
+        )
+
+    start_ts = time.monotonic()
+    try:
+        count = _triple_store.stream_triples(
+            str(header.tenant_id), str(header.dcl_ingest_id), header.entity_id,
+            itertools.chain([first_row], rows),
+            replace=replace,
+        )
+    except Exception as db_err:
+        # A validation failure mid-stream aborted the COPY (the transaction
+        # rolled back — nothing from this stream is visible).
+        if state.failure is not None:
+            raise state.failure
+        raise _db_write_error(
+            db_err,
+            dcl_ingest_id=header.dcl_ingest_id,
+            tenant_id=header.tenant_id,
+            triples_attempted=state.received,
+            duration_ms=int((time.monotonic() - start_ts) * 1000),
+        )
+    duration_ms = int((time.monotonic() - start_ts) * 1000)
+
+    concept_summary, conflicts_touched, job_id, job_status = _finalize_ingest(
+        tenant_id=str(header.tenant_id),
+        dcl_ingest_id=str(header.dcl_ingest_id),
+        resolved_entity_id=header.entity_id,
+        snapshot_name=header.snapshot_name,
+        append=append,
+        batch_coords=sorted(state.coords),
+        entity_ids=[header.entity_id],
+        source_systems=sorted(state.source_systems),
+        triples_received=state.received,
+        count=count,
+        duration_ms=duration_ms,
+        farm_run_id=header.source_farm_manifest_id,
+        sync=sync,
+    )
+
+    source_rows_val = header.source_rows if header.source_rows is not None else state.received
+    expansion = round(count / source_rows_val, 1) if source_rows_val > 0 else 0.0
+    return IngestResponse(
+        dcl_ingest_id=header.dcl_ingest_id,
+        tenant_id=header.tenant_id,
+        entity_id=header.entity_id,
+        source_farm_manifest_id=header.source_farm_manifest_id,
+        triple_count=count,
+        concept_summary=concept_summary,
+        source_rows=source_rows_val,
+        triples_written=count,
+        expansion_factor=expansion,
+        conflicts_detected=conflicts_touched,
+        post_ingest_job_id=job_id,
+        post_ingest_status=job_status,
+    )
+
+
+@router.post(
+    "/api/dcl/ingest-triples/stream", status_code=201, response_model=IngestResponse,
+)
+async def ingest_triples_stream(
+    request: Request,
+    replace: bool = Query(False),
+    append: bool = Query(False),
+    sync: Optional[bool] = Query(None),
+):
+    """
+    Streaming ingest — one NDJSON body (application/x-ndjson) for one run.
+
+    Line 1 is the IngestStreamHeader envelope; every following line is one
+    TriplePayload. Rows are validated and normalized as they arrive and piped
+    straight into a single COPY transaction, so a run Farm would push as 20
+    `?append=true` batches becomes one connection and one transaction. The
+    idempotency probe and policy load run once before the first row; the
+    pointer swap runs once at end of stream and enqueues ONE post-ingest job
+    (conflict detection over the run's coordinates, ingest_log, manifest).
+    Any invalid line aborts the COPY — nothing from the stream is written
+    (atomic, like the batch endpoint). ?replace / ?append / ?sync behave
+    exactly as on the batch endpoint.
+    """
+    body = request.stream()
+
+    async def _next_chunk():
+        try:
+            return await body.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    def _chunks():
+        # Runs in the worker thread: each pull hops back to the event loop
+        # for the next body chunk, so the COPY consumes the request body at
+        # the network's pace without buffering it.
+        while True:
+            chunk = anyio.from_thread.run(_next_chunk)
+            if chunk is None:
+                return
+            if chunk:
+                yield chunk
+
+    return await run_in_threadpool(_ingest_ndjson, _chunks(), replace, append, sync)
+
+
+_JOB_STATUS_PRECEDENCE = ("failed", "running", "queued", "done")
+
+
+@router.get("/api/dcl/ingest-triples/status/{run_id}")
+def get_post_ingest_status(run_id: str):
+    """Post-ingest job status for one run — one job per batch / stream.
+
+    `status` is the run's worst job status (failed > running > queued >
+    done); a failed job surfaces here with its last_error, never silently.
+    conflicts_detected sums the finished jobs; concept_summary is the latest
+    finished job's run-wide summary.
+    """
+    _validate_uuid(run_id, "run_id")
+
+    jobs = _ingest_jobs.list_for_ingest(run_id)
+    if not jobs:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "RUN_NOT_FOUND",
+                "message": f"No post-ingest jobs found for run_id={run_id}.",
+            },
+        )
+
+    statuses = {j["status"] for j in jobs}
+    status = next(s for s in _JOB_STATUS_PRECEDENCE if s in statuses)
+    done = [j for j in jobs if j["status"] == "done" and j["result"]]
+    return {
+        "dcl_ingest_id": run_id,
+        "tenant_id": jobs[0]["tenant_id"],
+        "status": status,
+        "jobs_total": len(jobs),
+        "jobs_done": len(done),
+        "conflicts_detected": sum(j["result"].get("conflicts_detected", 0) for j in done),
+        "concept_summary": done[-1]["result"].get("concept_summary", {}) if done else {},
+        "jobs": [
+            {k: j[k] for k in (
+                "job_id", "job_type", "entity_id", "status", "attempts", "worker_id",
+                "last_error", "enqueued_at", "started_at", "finished_at", "result",
+            )}
+            for j in jobs
+        ],
+    }
+
+
 @router.get("/api/dcl/ingest-status/{run_id}")
 def get_ingest_status(run_id: str):
     """Get ingest status for a specific run."""
@@ -721,6 +1287,9 @@ def get_ingest_status(run_id: str):
         "concept_summary": concept_summary,
         "created_at": info["created_at"].isoformat() if info["created_at"] else None,
         "is_active": info["is_active"],
+        "state": info["state"],
+        "entity_ids": info["entity_ids"],
+        "last_write_at": info["last_write_at"].isoformat() if info["last_write_at"] else None,
     }
 
 
@@ -736,6 +1305,7 @@ def list_ingest_status():
             "triple_count": r["triple_count"],
             "created_at": r["created_at"].isoformat() if r["created_at"] else None,
             "is_active": r["is_active"],
+            "state": r["state"],
         })
     return result
 
@@ -982,11 +1552,11 @@ def _update_seed_manifest(
             with get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute(
-                        "SELECT DISTINCT entity_id FROM semantic_triples "
-                        "WHERE run_id = %s AND entity_id IS NOT NULL LIMIT 20",
+                        "SELECT entity_ids[1:20] FROM ingest_runs WHERE dcl_ingest_id = %s",
                         (run_id,),
                     )
-                    entity_ids = [str(r[0]) for r in cur.fetchall()]
+                    row = cur.fetchone()
+                    entity_ids = [str(e) for e in row[0]] if row and row[0] else []
 
         _UUID_RE = __import__("re").compile(
             r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
@@ -1030,40 +1600,57 @@ def _update_seed_manifest(
 
 def promote_canonical_to_manual(tenant_id: str, canonical_id: str) -> int:
     """Flip fuzzy-bound triples for a canonical to manual @ 0.99 on operator HITL
-    approval (the hitl_confirmed path). Returns the number of triples updated."""
+    approval (the hitl_confirmed path). Returns the number of triples updated.
+    The touched runs' ingest_runs.updated_at moves in the same statement, so
+    other processes' read caches see the change (backend/core/read_cache.py)."""
     with get_connection() as conn:
         with conn.cursor() as cur:
             cur.execute(
-                "UPDATE semantic_triples "
-                "SET resolution_method='manual', resolution_confidence=0.99, updated_at=now() "
-                "WHERE tenant_id=%s AND canonical_id=%s AND resolution_method='fuzzy'",
+                "WITH p AS ("
+                "    UPDATE semantic_triples "
+                "    SET resolution_method='manual', resolution_confidence=0.99, updated_at=now() "
+                "    WHERE tenant_id=%s AND canonical_id=%s AND resolution_method='fuzzy' "
+                "    RETURNING run_id"
+                "), reg AS ("
+                "    UPDATE ingest_runs SET updated_at = now() "
+                "    WHERE dcl_ingest_id IN (SELECT DISTINCT run_id FROM p)"
+                ") SELECT COUNT(*) FROM p",
                 (tenant_id, canonical_id),
             )
-            n = cur.rowcount
+            n = cur.fetchone()[0]
             conn.commit()
+    read_cache.invalidate(tenant_id)
     logger.info(
         "[resolver-hitl] promoted %d triples to manual for canonical_id=%s", n, canonical_id
     )
     return n
 
 
+_RUN_TRIPLE_COLS = [
+    "concept", "property", "value", "source_system", "source_field",
+    "pipe_id", "fabric_plane", "fabric_product", "confidence_score",
+    "confidence_tier", "canonical_id", "resolution_method", "resolution_confidence",
+]
+_RUN_TRIPLES_SQL = (
+    f"SELECT {', '.join(_RUN_TRIPLE_COLS)} FROM semantic_triples "
+    "WHERE tenant_id=%s AND run_id=%s"
+)
+
+
 def get_run_triples(tenant_id: str, run_id: str) -> list[dict]:
     """Return all triples for a (tenant_id, run_id) with resolution + provenance
     columns. Read primitive used by fabric-connect verification."""
-    cols = [
-        "concept", "property", "value", "source_system", "source_field",
-        "pipe_id", "fabric_plane", "fabric_product", "confidence_score",
-        "confidence_tier", "canonical_id", "resolution_method", "resolution_confidence",
-    ]
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                f"SELECT {', '.join(cols)} FROM semantic_triples "
-                "WHERE tenant_id=%s AND run_id=%s",
-                (tenant_id, run_id),
-            )
+            cur.execute(_RUN_TRIPLES_SQL, (tenant_id, run_id))
             rows = cur.fetchall()
-    return [dict(zip(cols, r)) for r in rows]
+    return [dict(zip(_RUN_TRIPLE_COLS, r)) for r in rows]
+
+
+def iter_run_triples(tenant_id: str, run_id: str) -> Iterator[dict]:
+    """get_run_triples streamed from a server-side cursor — for runs too large
+    to materialize in one list."""
+    return stream_rows(_RUN_TRIPLES_SQL, (tenant_id, run_id))
 
 
 def delete_tenant_triples(tenant_id: str) -> int:
@@ -1072,7 +1659,7 @@ def delete_tenant_triples(tenant_id: str) -> int:
     _validate_uuid(tenant_id, "tenant_id")
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute("DELETE FROM semantic_triples WHERE tenant_id=%s", (tenant_id,))
-            n = cur.rowcount
+            n = delete_triples_tx(cur, "tenant_id = %s", (tenant_id,))
             conn.commit()
+    read_cache.invalidate(tenant_id)
     return n
@@ -0,0 +1,60 @@
+"""Financial statement bundle route. Read-only, tenant-scoped.
+
+  GET /api/dcl/statements — income statement, balance sheet and cash flow for
+                            one entity over one or more periods, resolved by
+                            TripleQueryResolver.get_statements in a single
+                            query regardless of how many periods are asked for
+
+Contract:
+  - entity_id and at least one period REQUIRED; periods may repeat
+    (?periods=2026-Q1&periods=2026-Q2) and/or be comma-separated
+    (?periods=2026-Q1,2026-Q2); a year ('2026') sums its quarters for the
+    flow statements and reads the Q4 balance sheet;
+  - tenant_id / dcl_ingest_id optional — resolved through v2_helpers with the
+    'financial' domain hint when omitted (400 if nothing resolves);
+  - an incomplete statement or a failed P&L / BS / CF identity in ANY period
+    fails the whole request loud (422 naming the period) — never a partial
+    bundle;
+  - the resolved ingest run is reported as dcl_ingest_id, never run_id (I1).
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query
+
+from backend.api.routes.v2_helpers import resolve_tenant_and_run
+from backend.engine.query_resolver_v2 import TripleQueryResolver
+from backend.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter(tags=["Financial Statements"])
+
+
+def _split_periods(periods: list[str]) -> list[str]:
+    return [p.strip() for raw in periods for p in raw.split(",") if p.strip()]
+
+
+@router.get("/api/dcl/statements")
+def get_statements(
+    entity_id: str = Query(..., description="Entity whose statements to assemble"),
+    periods: list[str] = Query(..., description="Quarter ('2026-Q1') or year ('2026') codes"),
+    tenant_id: Optional[str] = Query(None, description="Tenant UUID (latest tenant if omitted)"),
+    dcl_ingest_id: Optional[str] = Query(None, description="Ingest run (primary financial run if omitted)"),
+):
+    period_list = _split_periods(periods)
+    if not period_list:
+        raise HTTPException(
+            status_code=422,
+            detail={"error": "PERIODS_REQUIRED", "message": "At least one period is required."},
+        )
+    tid, rid = resolve_tenant_and_run(tenant_id, dcl_ingest_id, domain_hint="financial")
+    try:
+        bundle = TripleQueryResolver(tid, rid).get_statements(entity_id, period_list)
+    except ValueError as exc:
+        logger.warning("statement bundle failed for entity %r: %s", entity_id, exc)
+        raise HTTPException(
+            status_code=422,
+            detail={"error": "STATEMENTS_UNRESOLVED", "message": str(exc)},
+        )
+    return {**bundle, "dcl_ingest_id": rid}
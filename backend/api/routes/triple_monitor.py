@@ -5,13 +5,18 @@ GET /api/dcl/triples/overview         — high-level summary
 GET /api/dcl/triples/runs             — ingest run list
 GET /api/dcl/triples/identity-checks  — accounting identity verification
 GET /api/dcl/triples/browse           — paginated triple browser
+GET /api/dcl/triples/browse/stream    — the same rows, unpaginated, as streamed NDJSON / JSON
 POST /api/dcl/triples/browse-batch    — batch browse (multiple domains, one SQL)
 GET /api/dcl/triples/engagement       — engagement state
 GET /api/dcl/triples/resolution-summary — resolution workspace stats
 GET /api/dcl/triples/persona-stats    — per-persona stats from triples
+GET /api/dcl/triples/read-cache       — read-cache hit-rate metrics
 POST /api/dcl/triples/deactivate-run  — deactivate a run
+GET /api/dcl/dashboard-data           — Dashboard tab rows (keyset) + aggregations
 """
 
+import base64
+import itertools
 import json
 import os
 import time
@@ -21,12 +26,14 @@ from pathlib import Path
 
 import yaml
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Iterator, List, Literal, Optional
 
-from backend.db.triple_store import TripleStore
+from backend.db.triple_store import TripleStore, as_of_clause, domain_clause
 from psycopg2 import sql as pgsql
-from backend.core.db import get_connection, PoolExhausted
+from backend.core import read_cache
+from backend.core.db import get_connection, stream_rows, PoolExhausted
 from backend.utils.log_utils import get_logger
 
 logger = get_logger(__name__)
@@ -65,6 +72,17 @@ def _serialize_row(row: dict) -> dict:
     return {k: _serialize_value(v) for k, v in row.items()}
 
 
+# Generated semantic_triples columns browse rows leave out: `domain`
+# (migration 035) and `knowledge_range` (migration 037).
+_GENERATED_COLUMNS = frozenset({"domain", "knowledge_range"})
+
+
+def _stored_columns(columns: list[str], row: tuple) -> dict:
+    """A `SELECT *` semantic_triples row as a dict without the generated
+    columns — browse responses keep their shape."""
+    return {k: v for k, v in zip(columns, row) if k not in _GENERATED_COLUMNS}
+
+
 def _persona_scope_or_422(persona: str, explicit_domains: list[str]) -> list[str]:
     """Resolve a persona's domain list for the browse surfaces (Gate 2B).
 
@@ -184,69 +202,90 @@ def triples_overview(
     Optional filters narrow results:
     - tenant_id: scope to a single deal/tenant (required for multi-tenant accuracy)
     - source_run_tag: scope to triples from a specific Farm run
+
+    Reads the triple_rollups groups (migration 034); only a source_run_tag
+    filter falls back to scanning semantic_triples.
     """
-    extra_filter = ""
     params: list = []
-    if tenant_id:
-        extra_filter += " AND tenant_id = %s"
-        params.append(tenant_id)
-        extra_filter += " AND run_id IN (SELECT current_run_id FROM tenant_runs WHERE tenant_id = %s)"
-        params.append(tenant_id)
     if source_run_tag:
+        # source_run_tag is not a rollup dimension — scan the live triples.
+        extra_filter = ""
+        if tenant_id:
+            extra_filter += " AND tenant_id = %s"
+            params.append(tenant_id)
+            extra_filter += " AND run_id IN (SELECT current_run_id FROM tenant_runs WHERE tenant_id = %s)"
+            params.append(tenant_id)
         extra_filter += " AND source_run_tag = %s"
         params.append(source_run_tag)
-
-    sql_total = f"SELECT COUNT(*) FROM semantic_triples WHERE is_active = true{extra_filter}"
-    sql_entities = (
-        f"SELECT entity_id, COUNT(*) AS triple_count "
-        f"FROM semantic_triples WHERE is_active = true{extra_filter} "
-        f"GROUP BY entity_id ORDER BY triple_count DESC"
-    )
-    sql_domains = (
-        f"SELECT split_part(concept, '.', 1) AS domain, entity_id, COUNT(*) AS cnt "
-        f"FROM semantic_triples WHERE is_active = true{extra_filter} "
-        f"GROUP BY domain, entity_id ORDER BY domain, entity_id"
-    )
-    sql_periods = (
-        f"SELECT DISTINCT period FROM semantic_triples "
-        f"WHERE is_active = true AND period IS NOT NULL{extra_filter} "
-        f"ORDER BY period"
-    )
-    sql_latest = (
-        f"SELECT run_id, MIN(created_at) AS timestamp, COUNT(*) AS triple_count "
-        f"FROM semantic_triples WHERE is_active = true{extra_filter} "
-        f"GROUP BY run_id ORDER BY MIN(created_at) DESC LIMIT 1"
-    )
+        sql_groups = (
+            f"SELECT entity_id, split_part(concept, '.', 1) AS domain, "
+            f"COALESCE(period, '') AS period, COUNT(*) AS cnt "
+            f"FROM semantic_triples WHERE is_active = true{extra_filter} "
+            f"GROUP BY 1, 2, 3 ORDER BY domain, entity_id"
+        )
+        sql_latest = (
+            f"SELECT run_id, MIN(created_at) AS timestamp, COUNT(*) AS triple_count "
+            f"FROM semantic_triples WHERE is_active = true{extra_filter} "
+            f"GROUP BY run_id ORDER BY MIN(created_at) DESC LIMIT 1"
+        )
+    else:
+        # Live-triple groups from triple_rollups (migration 034): one pass
+        # over O(groups) rows yields the total, per-entity, domain x entity
+        # and period breakdowns.
+        extra_filter = ""
+        if tenant_id:
+            extra_filter += " AND r.tenant_id = %s"
+            params.append(tenant_id)
+            extra_filter += (
+                " AND r.dcl_ingest_id IN "
+                "(SELECT current_run_id FROM tenant_runs WHERE tenant_id = %s)"
+            )
+            params.append(tenant_id)
+        sql_groups = (
+            f"SELECT r.entity_id, r.domain, r.period, SUM(r.live_count)::bigint AS cnt "
+            f"FROM triple_rollups r WHERE r.live_count > 0{extra_filter} "
+            f"GROUP BY 1, 2, 3 ORDER BY r.domain, r.entity_id"
+        )
+        sql_latest = (
+            f"SELECT r.dcl_ingest_id, ir.first_write_at, SUM(r.live_count)::bigint "
+            f"FROM triple_rollups r "
+            f"JOIN ingest_runs ir ON ir.dcl_ingest_id = r.dcl_ingest_id "
+            f"WHERE r.live_count > 0{extra_filter} "
+            f"GROUP BY r.dcl_ingest_id, ir.first_write_at "
+            f"ORDER BY ir.first_write_at DESC LIMIT 1"
+        )
 
     try:
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql_total, params)
-                total_triples = cur.fetchone()[0]
-
-                cur.execute(sql_entities, params)
-                entities = []
-                for row in cur.fetchall():
-                    entity_id = row[0]
-                    entities.append({
-                        "entity_id": entity_id,
-                        "triple_count": row[1],
-                        "display_name": _entity_display_name(entity_id),
-                    })
-
-                cur.execute(sql_domains, params)
+                cur.execute(sql_groups, params)
+                total_triples = 0
+                entity_counts: dict[str, int] = {}
                 # Pivot per-entity counts into {domain, count, by_entity}
                 domain_map: dict[str, dict] = {}
-                for r in cur.fetchall():
-                    domain, entity_id, cnt = r[0], r[1], r[2]
+                period_set: set[str] = set()
+                for entity_id, domain, period, cnt in cur.fetchall():
+                    total_triples += cnt
+                    entity_counts[entity_id] = entity_counts.get(entity_id, 0) + cnt
                     if domain not in domain_map:
                         domain_map[domain] = {"domain": domain, "count": 0, "by_entity": {}}
                     domain_map[domain]["count"] += cnt
-                    domain_map[domain]["by_entity"][entity_id] = cnt
+                    by_entity = domain_map[domain]["by_entity"]
+                    by_entity[entity_id] = by_entity.get(entity_id, 0) + cnt
+                    if period:
+                        period_set.add(period)
+                entities = [
+                    {
+                        "entity_id": entity_id,
+                        "triple_count": cnt,
+                        "display_name": _entity_display_name(entity_id),
+                    }
+                    for entity_id, cnt in sorted(
+                        entity_counts.items(), key=lambda kv: (-kv[1], kv[0]),
+                    )
+                ]
                 domains = sorted(domain_map.values(), key=lambda d: d["count"], reverse=True)
-
-                cur.execute(sql_periods, params)
-                periods = [r[0] for r in cur.fetchall()]
+                periods = sorted(period_set)
 
                 cur.execute(sql_latest, params)
                 latest_row = cur.fetchone()
@@ -299,7 +338,7 @@ def triples_runs():
     domain_sql = (
         "SELECT run_id, split_part(concept, '.', 1) AS domain, COUNT(*) AS cnt "
         "FROM semantic_triples WHERE is_active = true "
-        "GROUP BY run_id, domain ORDER BY run_id, domain"
+        "GROUP BY 1, 2 ORDER BY run_id, domain"
     )
 
     entity_sql = (
@@ -598,57 +637,22 @@ def triples_identity_checks():
 # GET /api/dcl/triples/browse
 # ---------------------------------------------------------------------------
 
-@router.get("/api/dcl/triples/browse")
-def triples_browse(
-    tenant_id: str = Query(..., description="Tenant UUID — REQUIRED. Every browse is tenant-scoped."),
-    domain: Optional[str] = None,
-    entity_id: Optional[str] = None,
-    period: Optional[str] = None,
-    property: Optional[str] = Query(None, alias="property"),
-    run_id: Optional[str] = Query(None, description="Scope to a single ingest batch (dcl_ingest_id / aam_inference_id)"),
-    as_of: Optional[str] = Query(None, description="ISO timestamp — knowledge-time travel: rows live at that instant (ingested on or before, not yet superseded)"),
-    limit: int = Query(50, ge=1, le=500),
-    offset: int = Query(0, ge=0),
-    persona: Optional[str] = Query(None, description=(
-        "Executive persona key (exact, case-sensitive — e.g. 'CFO') from "
-        "persona_domains.yaml. Restricts results to the persona's domain "
-        "list; an explicit domain outside that list is a 422 conflict. "
-        "Persona-scoped answers append a decision trace; omit for the "
-        "unchanged unscoped behavior."
-    )),
-):
-    """Browse raw triples with filtering and pagination.
-
-    tenant_id is REQUIRED — the query always filters `WHERE tenant_id =`,
-    so the endpoint can never return another tenant's triples or, with
-    no params, every tenant's data. A wholly-absent tenant_id yields a
-    422. NOTE: this is tenant *scoping*, not authentication — the
-    endpoint does not verify that the caller owns the tenant_id it
-    passes. Cryptographic auth (token-derived tenant, mirroring the MCP
-    path) is a deliberate follow-up; see the deferred-work log.
-
-    When `run_id` is explicitly provided, is_active filter is dropped:
-    the caller wants THIS batch's data regardless of whether tenant_runs
-    has marked a later run as current. Required for AAM Fabrics drill
-    view of a recent push that's been superseded by a subsequent push
-    in the same trigger (5-sync trigger batches flip earlier ones
-    inactive within seconds of each other). Without this, drilling into
-    any but the absolute-latest run returns 0 triples even though the
-    rows are present. See aam_deferred_work.md#20 for the cross-source
-    aggregation case that needs the same opt-out.
-    """
+def _browse_where(tenant_id: str, *, domain: Optional[str], entity_id: Optional[str],
+                  period: Optional[str], property: Optional[str], run_id: Optional[str],
+                  as_of: Optional[str], persona: Optional[str]) -> tuple[str, list]:
+    """WHERE clause + params shared by /triples/browse and its streaming
+    variant. Raises the browse surface's 400 / 422 validation errors."""
     # tenant_id filter is unconditional and first — every browse is scoped.
     clauses: list[str] = ["tenant_id = %s"]
     params: list = [tenant_id]
-    persona_domains: Optional[list] = None
     if persona:
         # Unknown persona / explicit out-of-scope domain → 422 (loud).
         persona_domains = _persona_scope_or_422(
             persona, [domain] if domain else [],
         )
-        clauses.append("(concept = ANY(%s) OR concept LIKE ANY(%s))")
-        params.append(list(persona_domains))
-        params.append([f"{d}.%" for d in persona_domains])
+        persona_sql, persona_params = domain_clause(persona_domains)
+        clauses.append(persona_sql)
+        params.extend(persona_params)
     if as_of and run_id:
         raise HTTPException(
             status_code=400,
@@ -665,18 +669,19 @@ def triples_browse(
                 status_code=400,
                 detail=f"as_of must be an ISO-8601 timestamp; got {as_of!r}",
             )
-        clauses.append(
-            "ingested_at <= %s AND (superseded_at IS NULL OR superseded_at > %s)"
-        )
-        params.extend([as_of, as_of])
+        as_of_sql, as_of_params = as_of_clause(as_of)
+        clauses.append(as_of_sql)
+        params.extend(as_of_params)
     elif not run_id:
         clauses.append("is_active = true")
 
     if domain:
-        # Use prefix LIKE instead of split_part for index-friendly filtering.
-        # concept LIKE 'revenue.%' can use btree indexes on concept.
-        clauses.append("concept LIKE %s")
-        params.append(f"{domain}.%")
+        # Equality on the generated domain column (migration 035) — the
+        # leading key of idx_triples_tenant_domain_coord — or the prefix LIKE
+        # on a store without it.
+        domain_sql, domain_params = domain_clause([domain], include_root=False)
+        clauses.append(domain_sql)
+        params.extend(domain_params)
     if entity_id:
         clauses.append("entity_id = %s")
         params.append(entity_id)
@@ -696,7 +701,52 @@ def triples_browse(
         clauses.append("run_id = %s")
         params.append(run_id)
 
-    where = " AND ".join(clauses) if clauses else "TRUE"
+    return " AND ".join(clauses), params
+
+
+@router.get("/api/dcl/triples/browse")
+def triples_browse(
+    tenant_id: str = Query(..., description="Tenant UUID — REQUIRED. Every browse is tenant-scoped."),
+    domain: Optional[str] = None,
+    entity_id: Optional[str] = None,
+    period: Optional[str] = None,
+    property: Optional[str] = Query(None, alias="property"),
+    run_id: Optional[str] = Query(None, description="Scope to a single ingest batch (dcl_ingest_id / aam_inference_id)"),
+    as_of: Optional[str] = Query(None, description="ISO timestamp — knowledge-time travel: rows live at that instant (ingested on or before, not yet superseded)"),
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    persona: Optional[str] = Query(None, description=(
+        "Executive persona key (exact, case-sensitive — e.g. 'CFO') from "
+        "persona_domains.yaml. Restricts results to the persona's domain "
+        "list; an explicit domain outside that list is a 422 conflict. "
+        "Persona-scoped answers append a decision trace; omit for the "
+        "unchanged unscoped behavior."
+    )),
+):
+    """Browse raw triples with filtering and pagination.
+
+    tenant_id is REQUIRED — the query always filters `WHERE tenant_id =`,
+    so the endpoint can never return another tenant's triples or, with
+    no params, every tenant's data. A wholly-absent tenant_id yields a
+    422. NOTE: this is tenant *scoping*, not authentication — the
+    endpoint does not verify that the caller owns the tenant_id it
+    passes. Cryptographic auth (token-derived tenant, mirroring the MCP
+    path) is a deliberate follow-up; see the deferred-work log.
+
+    When `run_id` is explicitly provided, is_active filter is dropped:
+    the caller wants THIS batch's data regardless of whether tenant_runs
+    has marked a later run as current. Required for AAM Fabrics drill
+    view of a recent push that's been superseded by a subsequent push
+    in the same trigger (5-sync trigger batches flip earlier ones
+    inactive within seconds of each other). Without this, drilling into
+    any but the absolute-latest run returns 0 triples even though the
+    rows are present. See aam_deferred_work.md#20 for the cross-source
+    aggregation case that needs the same opt-out.
+    """
+    where, params = _browse_where(
+        tenant_id, domain=domain, entity_id=entity_id, period=period,
+        property=property, run_id=run_id, as_of=as_of, persona=persona,
+    )
 
     # Deduplicate triples that differ only by run_id or source_run_tag
     # (multiple pipeline runs produce duplicates). Keep the most recent
@@ -712,16 +762,25 @@ def triples_browse(
         f"LIMIT %s OFFSET %s"
     )
 
-    query_started = time.perf_counter() if persona else None
-    try:
+    def load() -> dict:
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(count_sql, params)
-                total_count = cur.fetchone()[0]
+                total = cur.fetchone()[0]
 
                 cur.execute(data_sql, params + [limit, offset])
                 columns = [desc[0] for desc in cur.description]
-                triples = [_serialize_row(dict(zip(columns, row))) for row in cur.fetchall()]
+                page = [_serialize_row(_stored_columns(columns, row)) for row in cur.fetchall()]
+        return {"total_count": total, "triples": page}
+
+    query_started = time.perf_counter() if persona else None
+    try:
+        # Only the DB read is cached — a persona answer still writes its
+        # decision trace on every call.
+        fetched = read_cache.get_or_load(
+            "triples_browse", tenant_id, [data_sql, params, limit, offset], load,
+        )
+        total_count, triples = fetched["total_count"], fetched["triples"]
     except PoolExhausted as e:
         raise HTTPException(
             status_code=503,
@@ -781,6 +840,96 @@ def triples_browse(
     }
 
 
+# ---------------------------------------------------------------------------
+# GET /api/dcl/triples/browse/stream
+# ---------------------------------------------------------------------------
+
+# Response chunk size for streamed bodies: rows are encoded into ~64 KiB
+# chunks, not one ASGI message per row.
+_STREAM_CHUNK_CHARS = 65536
+
+
+def _encode_stream(rows: Iterator[dict], fmt: str) -> Iterator[bytes]:
+    """Encode dict rows as NDJSON (one object per line) or one JSON array,
+    chunked. A database error mid-stream is logged and re-raised — the
+    response is cut short (an unterminated JSON array, a missing NDJSON
+    tail), never silently completed."""
+    buf: list[str] = []
+    size = 0
+    first = True
+    if fmt == "json":
+        buf.append("[")
+    try:
+        for row in rows:
+            text = json.dumps(_serialize_row(row), default=str)
+            if fmt == "json":
+                text = text if first else "," + text
+                first = False
+            else:
+                text += "\n"
+            buf.append(text)
+            size += len(text)
+            if size >= _STREAM_CHUNK_CHARS:
+                yield "".join(buf).encode()
+                buf, size = [], 0
+    except Exception as e:
+        logger.error(f"[triples/browse/stream] stream aborted: {e}")
+        raise
+    if fmt == "json":
+        buf.append("]")
+    if buf:
+        yield "".join(buf).encode()
+
+
+@router.get("/api/dcl/triples/browse/stream")
+def triples_browse_stream(
+    tenant_id: str = Query(..., description="Tenant UUID — REQUIRED. Every browse is tenant-scoped."),
+    domain: Optional[str] = None,
+    entity_id: Optional[str] = None,
+    period: Optional[str] = None,
+    property: Optional[str] = Query(None, alias="property"),
+    run_id: Optional[str] = Query(None, description="Scope to a single ingest batch (dcl_ingest_id / aam_inference_id)"),
+    as_of: Optional[str] = Query(None, description="ISO timestamp — knowledge-time travel (see /triples/browse)"),
+    format: Literal["ndjson", "json"] = Query("ndjson", description="ndjson: one triple per line; json: one array"),
+):
+    """Every triple /triples/browse would page through, in one streamed
+    response — same filters, same per-coordinate dedup and order, no
+    limit/offset and no total_count. Rows come from a server-side cursor
+    (db.stream_rows) STREAM_ITERSIZE at a time, so worker memory stays flat
+    whatever the run size. Persona scoping is not offered here: persona
+    answers carry a decision trace per answer, a paged-browse concern.
+
+    The first FETCH runs before the response starts, so pool exhaustion or
+    a bad query is still a 503 with a JSON body; later failures truncate the
+    stream. Never cached."""
+    where, params = _browse_where(
+        tenant_id, domain=domain, entity_id=entity_id, period=period,
+        property=property, run_id=run_id, as_of=as_of, persona=None,
+    )
+    data_sql = (
+        f"SELECT DISTINCT ON (entity_id, concept, property, period) * "
+        f"FROM semantic_triples WHERE {where} "
+        f"ORDER BY entity_id, concept, property, period, created_at DESC"
+    )
+    rows = (
+        {k: v for k, v in row.items() if k not in _GENERATED_COLUMNS}
+        for row in stream_rows(data_sql, params)
+    )
+    try:
+        head = list(itertools.islice(rows, 1))
+    except PoolExhausted as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"DCL database pool exhausted — too many concurrent requests. {e}",
+        )
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    media_type = "application/x-ndjson" if format == "ndjson" else "application/json"
+    return StreamingResponse(
+        _encode_stream(itertools.chain(head, rows), format), media_type=media_type,
+    )
+
+
 # ---------------------------------------------------------------------------
 # POST /api/dcl/triples/browse-batch
 # ---------------------------------------------------------------------------
@@ -828,12 +977,11 @@ def triples_browse_batch(req: BrowseBatchRequest):
     clauses = ["is_active = true", "tenant_id = %s"]
     params: list = [req.tenant_id]
 
-    # Domain filter: concept LIKE 'domain1.%' OR concept LIKE 'domain2.%' ...
-    domain_conditions = []
-    for domain in req.domains:
-        domain_conditions.append("concept LIKE %s")
-        params.append(f"{domain}.%")
-    clauses.append(f"({' OR '.join(domain_conditions)})")
+    # Domain filter: the requested domains' subtrees (domain = ANY(...) on a
+    # store with the domain column, concept LIKE ANY('d.%', ...) before it).
+    domain_sql, domain_params = domain_clause(req.domains, include_root=False)
+    clauses.append(domain_sql)
+    params.extend(domain_params)
 
     if req.entity_ids:
         placeholders = ", ".join(["%s"] * len(req.entity_ids))
@@ -852,13 +1000,18 @@ def triples_browse_batch(req: BrowseBatchRequest):
         f"ORDER BY entity_id, concept, property, period, created_at DESC"
     )
 
-    query_started = time.perf_counter() if req.persona else None
-    try:
+    def load() -> list:
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(data_sql, params)
                 columns = [desc[0] for desc in cur.description]
-                all_triples = [_serialize_row(dict(zip(columns, row))) for row in cur.fetchall()]
+                return [_serialize_row(_stored_columns(columns, row)) for row in cur.fetchall()]
+
+    query_started = time.perf_counter() if req.persona else None
+    try:
+        all_triples = read_cache.get_or_load(
+            "triples_browse_batch", req.tenant_id, [data_sql, params], load,
+        )
     except PoolExhausted as e:
         raise HTTPException(
             status_code=503,
@@ -1081,6 +1234,17 @@ def triples_persona_stats():
     return stats
 
 
+# ---------------------------------------------------------------------------
+# GET /api/dcl/triples/read-cache
+# ---------------------------------------------------------------------------
+
+@router.get("/api/dcl/triples/read-cache")
+def triples_read_cache():
+    """Read-cache metrics: entries, evictions, invalidations, and hits /
+    misses / hit_rate overall and per read path (backend/core/read_cache.py)."""
+    return read_cache.stats()
+
+
 # ---------------------------------------------------------------------------
 # POST /api/dcl/triples/deactivate-run
 # ---------------------------------------------------------------------------
@@ -1180,44 +1344,54 @@ def contextualization_summary(
     run_id: Optional[str] = Query(None),
     tenant_id: Optional[str] = Query(None, description="Filter by tenant_id (deal scope)"),
 ):
-    """Contextualization quality summary: domain coverage, confidence, resolution, sources."""
-    clauses = ["is_active = true"]
+    """Contextualization quality summary: domain coverage, confidence, resolution, sources.
+
+    Domain and source breakdowns are sums over the live triple_rollups groups
+    (migration 034): concepts_used counts the distinct keys of the groups'
+    concept_counts, avg_confidence is SUM(confidence_sum) / SUM(live_count).
+    """
+    clauses = ["live_count > 0"]
     params: list = []
 
     if tenant_id:
         clauses.append("tenant_id = %s")
         params.append(tenant_id)
-        clauses.append("run_id IN (SELECT current_run_id FROM tenant_runs WHERE tenant_id = %s)")
+        clauses.append("dcl_ingest_id IN (SELECT current_run_id FROM tenant_runs WHERE tenant_id = %s)")
         params.append(tenant_id)
     if entity_id:
         clauses.append("entity_id = %s")
         params.append(entity_id)
     if run_id:
-        clauses.append("run_id = %s")
+        clauses.append("dcl_ingest_id = %s")
         params.append(run_id)
 
     where = " AND ".join(clauses)
 
     # Query 1: per-domain aggregation
     domain_sql = (
-        f"SELECT split_part(concept, '.', 1) AS domain, "
-        f"COUNT(*) AS triple_count, "
-        f"COUNT(DISTINCT concept) AS concepts_used, "
-        f"COUNT(DISTINCT source_system) AS source_count, "
-        f"AVG(confidence_score) AS avg_confidence, "
-        f"COUNT(*) FILTER (WHERE confidence_tier = 'exact') AS tier_exact, "
-        f"COUNT(*) FILTER (WHERE confidence_tier = 'high') AS tier_high, "
-        f"COUNT(*) FILTER (WHERE confidence_tier = 'medium') AS tier_medium, "
-        f"COUNT(*) FILTER (WHERE confidence_tier = 'low') AS tier_low "
-        f"FROM semantic_triples WHERE {where} "
-        f"GROUP BY domain ORDER BY triple_count DESC"
+        f"WITH g AS (SELECT * FROM triple_rollups WHERE {where}), "
+        f"c AS ("
+        f"    SELECT g.domain, COUNT(DISTINCT k) AS concepts_used "
+        f"    FROM g, jsonb_object_keys(g.concept_counts) AS k GROUP BY g.domain"
+        f") "
+        f"SELECT g.domain, "
+        f"SUM(g.live_count)::bigint AS triple_count, "
+        f"COALESCE(MAX(c.concepts_used), 0) AS concepts_used, "
+        f"COUNT(DISTINCT g.source_system) AS source_count, "
+        f"SUM(g.confidence_sum) / NULLIF(SUM(g.live_count), 0) AS avg_confidence, "
+        f"SUM(g.tier_exact)::bigint AS tier_exact, "
+        f"SUM(g.tier_high)::bigint AS tier_high, "
+        f"SUM(g.tier_medium)::bigint AS tier_medium, "
+        f"SUM(g.tier_low)::bigint AS tier_low "
+        f"FROM g LEFT JOIN c ON c.domain = g.domain "
+        f"GROUP BY g.domain ORDER BY triple_count DESC"
     )
 
     # Query 2: source system breakdown
     source_sql = (
-        f"SELECT source_system, COUNT(*) AS triple_count, "
-        f"AVG(confidence_score) AS avg_confidence "
-        f"FROM semantic_triples WHERE {where} "
+        f"SELECT source_system, SUM(live_count)::bigint AS triple_count, "
+        f"SUM(confidence_sum) / NULLIF(SUM(live_count), 0) AS avg_confidence "
+        f"FROM triple_rollups WHERE {where} "
         f"GROUP BY source_system ORDER BY triple_count DESC"
     )
 
@@ -1325,6 +1499,29 @@ def contextualization_summary(
 # GET /api/dcl/dashboard-data
 # ---------------------------------------------------------------------------
 
+def _encode_dashboard_cursor(key: tuple) -> str:
+    """Opaque keyset token for the last row of a dashboard page: its
+    (entity_id, concept, property, period) coordinate, period None when the
+    row has none."""
+    raw = json.dumps(list(key), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_dashboard_cursor(cursor: str) -> list:
+    """Cursor -> the keyset row-comparison params
+    (entity_id, concept, property, period IS NULL, COALESCE(period, ''))."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"cursor is not a dashboard-data cursor: {e}")
+    if not (isinstance(key, list) and len(key) == 4
+            and all(isinstance(k, str) for k in key[:3])
+            and (key[3] is None or isinstance(key[3], str))):
+        raise HTTPException(status_code=400, detail="cursor is not a dashboard-data cursor")
+    entity, concept, prop, period = key
+    return [entity, concept, prop, period is None, period or ""]
+
+
 @router.get("/api/dcl/dashboard-data")
 def dashboard_data(
     entity_id: Optional[str] = Query(None),
@@ -1334,8 +1531,24 @@ def dashboard_data(
     run_id: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+    aggregations: bool = Query(True),
+    count: Literal["exact", "estimate", "none"] = Query("exact"),
 ):
-    """Paginated, filterable triple data with aggregations for the Dashboard tab."""
+    """Paginated, filterable triple data with aggregations for the Dashboard tab.
+
+    Rows are one per (entity_id, concept, property, period) coordinate (the
+    latest write), ordered by that coordinate. Pagination is keyset: pass the
+    previous response's next_cursor as ?cursor= (page is then ignored and
+    echoed only). ?page=N without a cursor still works as an OFFSET for old
+    callers, but its cost grows with N.
+
+    The domain / source / period aggregations and the exact total_count come
+    from ONE GROUPING SETS pass over the filtered rows deduplicated to
+    (coordinate, source). ?aggregations=false skips the breakdowns (a cursor
+    page needs only rows); ?count=estimate returns the planner's estimate
+    instead of an exact count and ?count=none skips it (total_count null).
+    """
     clauses = ["is_active = true"]
     params: list = []
 
@@ -1346,8 +1559,9 @@ def dashboard_data(
         clauses.append("run_id = %s")
         params.append(run_id)
     if domain:
-        clauses.append("concept LIKE %s")
-        params.append(f"{domain}.%")
+        domain_sql, domain_params = domain_clause([domain], include_root=False)
+        clauses.append(domain_sql)
+        params.extend(domain_params)
     if source_system:
         clauses.append("source_system = %s")
         params.append(source_system)
@@ -1356,62 +1570,102 @@ def dashboard_data(
         params.append(period)
 
     where = " AND ".join(clauses)
-    offset = (page - 1) * page_size
-
-    # Count query (deduplicated)
-    count_sql = (
-        f"SELECT COUNT(DISTINCT (entity_id, concept, property, period)) "
-        f"FROM semantic_triples WHERE {where}"
-    )
 
-    # Paginated data query (deduplicated)
+    # Coordinate key. period is nullable, and a row comparison against NULL
+    # is never true, so the key carries COALESCE(period, '') — preceded by
+    # period IS NULL, so a period-less coordinate stays distinct from a
+    # ''-period one and sorts after every period (the NULLS LAST order of a
+    # plain ORDER BY period). The page (DISTINCT ON, ORDER BY, > cursor) is
+    # an ordered scan of idx_triples_active_coord_key (migration 038), which
+    # indexes exactly these expressions.
+    coord = "entity_id, concept, property, (period IS NULL), COALESCE(period, '')"
+    page_clause = ""
+    page_params: list = []
+    if cursor:
+        page_clause = f"AND ({coord}) > (%s, %s, %s, %s, %s)"
+        page_params = _decode_dashboard_cursor(cursor)
+        offset_clause = ""
+        offset_params: list = []
+    else:
+        offset_clause = "OFFSET %s"
+        offset_params = [(page - 1) * page_size]
+
+    # Fetch one row past the page to learn whether a next page exists.
     data_sql = (
-        f"SELECT DISTINCT ON (entity_id, concept, property, period) "
+        f"SELECT DISTINCT ON ({coord}) "
         f"id, entity_id, concept, property, value, period, "
         f"source_system, confidence_score, confidence_tier, pipe_id, run_id "
-        f"FROM semantic_triples WHERE {where} "
-        f"ORDER BY entity_id, concept, property, period, created_at DESC "
-        f"LIMIT %s OFFSET %s"
+        f"FROM semantic_triples WHERE {where} {page_clause} "
+        f"ORDER BY {coord}, created_at DESC "
+        f"LIMIT %s {offset_clause}"
     )
 
-    # Aggregation queries (ignore pagination, apply same filters)
-    agg_domain_sql = (
-        f"SELECT split_part(concept, '.', 1) AS domain, "
-        f"COUNT(DISTINCT (entity_id, concept, property, period)) AS cnt "
-        f"FROM semantic_triples WHERE {where} "
-        f"GROUP BY domain ORDER BY cnt DESC"
-    )
-    agg_source_sql = (
-        f"SELECT source_system, "
-        f"COUNT(DISTINCT (entity_id, concept, property, period)) AS cnt "
-        f"FROM semantic_triples WHERE {where} "
-        f"GROUP BY source_system ORDER BY cnt DESC"
-    )
-    agg_period_sql = (
-        f"SELECT period, "
-        f"COUNT(DISTINCT (entity_id, concept, property, period)) AS cnt "
-        f"FROM semantic_triples WHERE {where} AND period IS NOT NULL "
-        f"GROUP BY period ORDER BY period"
-    )
-
-    try:
+    # Aggregations + exact total in one pass. The dedup CTE keeps one row
+    # per (coordinate, source) — enough for every breakdown: a coordinate
+    # counts once per domain and period, and once under each source that
+    # claims it. GROUPING(...) tells the sets apart; the () set is the total.
+    sets = []
+    if aggregations:
+        sets += ["(domain)", "(source_system)", "(period)"]
+    if count == "exact":
+        sets.append("()")
+    agg_sql = (
+        f"WITH coords AS ("
+        f"    SELECT DISTINCT entity_id, concept, property, period, source_system, "
+        f"           split_part(concept, '.', 1) AS domain "
+        f"    FROM semantic_triples WHERE {where}"
+        f") "
+        f"SELECT GROUPING(domain), GROUPING(source_system), GROUPING(period), "
+        f"       domain, source_system, period, "
+        f"       COUNT(DISTINCT (entity_id, concept, property, period)) AS cnt "
+        f"FROM coords GROUP BY GROUPING SETS ({', '.join(sets)})"
+    ) if sets else None
+
+    def load() -> dict:
+        total_count: Optional[int] = None
+        by_domain: list = []
+        by_source: list = []
+        by_period: list = []
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(count_sql, params)
-                total_count = cur.fetchone()[0]
-
-                cur.execute(data_sql, params + [page_size, offset])
+                cur.execute(data_sql, params + page_params + [page_size + 1] + offset_params)
                 columns = [desc[0] for desc in cur.description]
-                rows = [_serialize_row(dict(zip(columns, row))) for row in cur.fetchall()]
-
-                cur.execute(agg_domain_sql, params)
-                by_domain = [{"domain": r[0], "count": r[1]} for r in cur.fetchall()]
-
-                cur.execute(agg_source_sql, params)
-                by_source = [{"system": r[0], "count": r[1]} for r in cur.fetchall()]
+                fetched = cur.fetchall()
+                has_more = len(fetched) > page_size
+                rows = [_serialize_row(dict(zip(columns, row))) for row in fetched[:page_size]]
+
+                if agg_sql:
+                    cur.execute(agg_sql, params)
+                    for g_dom, g_src, g_per, dom, src, per, cnt in cur.fetchall():
+                        if not g_dom:
+                            by_domain.append({"domain": dom, "count": cnt})
+                        elif not g_src:
+                            by_source.append({"system": src, "count": cnt})
+                        elif not g_per:
+                            if per is not None:
+                                by_period.append({"period": per, "count": cnt})
+                        else:
+                            total_count = cnt
+                if count == "estimate":
+                    cur.execute(
+                        f"EXPLAIN (FORMAT JSON) SELECT DISTINCT entity_id, concept, property, period "
+                        f"FROM semantic_triples WHERE {where}",
+                        params,
+                    )
+                    total_count = int(cur.fetchone()[0][0]["Plan"]["Plan Rows"])
+        return {
+            "rows": rows, "has_more": has_more, "total_count": total_count,
+            "by_domain": by_domain, "by_source": by_source, "by_period": by_period,
+        }
 
-                cur.execute(agg_period_sql, params)
-                by_period = [{"period": r[0], "count": r[1]} for r in cur.fetchall()]
+    try:
+        # Not tenant-scoped: keyed on the global generation, which every
+        # tenant's write bumps.
+        result = read_cache.get_or_load(
+            "dashboard_data", None,
+            [data_sql, params, page_params, page_size, offset_params, agg_sql, count],
+            load,
+        )
     except PoolExhausted as e:
         raise HTTPException(
             status_code=503,
@@ -1420,6 +1674,21 @@ def dashboard_data(
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e))
 
+    rows, has_more, total_count = result["rows"], result["has_more"], result["total_count"]
+    by_domain, by_source, by_period = result["by_domain"], result["by_source"], result["by_period"]
+
+    # Deterministic order (B14): count desc, then name.
+    by_domain.sort(key=lambda d: (-d["count"], d["domain"] or ""))
+    by_source.sort(key=lambda d: (-d["count"], d["system"] or ""))
+    by_period.sort(key=lambda d: d["period"])
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = _encode_dashboard_cursor(
+            (last["entity_id"], last["concept"], last["property"], last["period"])
+        )
+
     filters_applied = {}
     if entity_id:
         filters_applied["entity_id"] = entity_id
@@ -1433,12 +1702,14 @@ def dashboard_data(
     return {
         "rows": rows,
         "total_count": total_count,
+        "count_mode": count,
         "page": page,
         "page_size": page_size,
+        "next_cursor": next_cursor,
         "filters_applied": filters_applied,
         "aggregations": {
             "by_domain": by_domain,
             "by_source": by_source,
             "by_period": by_period,
-        },
+        } if aggregations else None,
     }
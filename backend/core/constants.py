@@ -79,6 +79,96 @@ QUERY_STATEMENT_TIMEOUT_MS = int(os.getenv("DCL_QUERY_STATEMENT_TIMEOUT_MS", "15
 # is slow on bulk UPDATE (deactivate) or INSERT (triple write).
 # Must stay below Farm's 150s httpx timeout so failures propagate before Farm times out.
 INGEST_STATEMENT_TIMEOUT_MS = int(os.getenv("DCL_INGEST_STATEMENT_TIMEOUT_MS", "90000"))
+# COPY block size for triple writes — the streaming encoder hands copy_expert
+# one block of this many characters at a time, so a batch is encoded while
+# the previous block is on the wire and peak memory is one block, not one
+# fully materialized batch.
+INGEST_COPY_BLOCK_CHARS = int(os.getenv("DCL_INGEST_COPY_BLOCK_CHARS", "65536"))
+# Sharded writes (migration 032) — opt-in. A batch spanning several entity_ids
+# is split per entity and written on up to INGEST_SHARD_WORKERS pooled
+# connections at once, each shard a prepared transaction (two-phase commit),
+# plus one coordinator connection. Needs max_prepared_transactions >=
+# INGEST_SHARD_WORKERS on the server and INGEST_SHARD_WORKERS + 1 well under
+# POOL_MAX_CONN. Prepared shard branches older than
+# INGEST_SHARD_RECOVERY_AGE_S are treated as orphaned by a dead process and
+# resolved by recover_shard_transactions().
+INGEST_SHARD_WRITES = os.getenv("DCL_INGEST_SHARD_WRITES", "false").lower() in ("true", "1")
+INGEST_SHARD_WORKERS = int(os.getenv("DCL_INGEST_SHARD_WORKERS", "4"))
+INGEST_SHARD_RECOVERY_AGE_S = int(os.getenv(
+    "DCL_INGEST_SHARD_RECOVERY_AGE_S", str(2 * INGEST_STATEMENT_TIMEOUT_MS // 1000)
+))
+
+# --- Post-ingest work queue (migration 030) ---
+# Domain summary, conflict detection, ingest_log and the seed manifest run off
+# the request path through ingest_jobs unless the caller passes ?sync=true.
+# DCL_INGEST_SYNC_DEFAULT flips the default for callers that omit ?sync
+# (tests/conftest.py sets it so suites keep read-your-writes conflicts).
+INGEST_SYNC_DEFAULT = os.getenv("DCL_INGEST_SYNC_DEFAULT", "false").lower() in ("true", "1")
+INGEST_JOB_POLL_S = float(os.getenv("DCL_INGEST_JOB_POLL_S", "1.0"))
+# A 'running' job whose worker has not finished it within the lease is
+# reclaimable — covers a worker killed mid-job. Must exceed the slowest
+# conflict detection (bounded by INGEST_STATEMENT_TIMEOUT_MS per statement).
+INGEST_JOB_LEASE_S = int(os.getenv("DCL_INGEST_JOB_LEASE_S", "300"))
+INGEST_JOB_MAX_ATTEMPTS = int(os.getenv("DCL_INGEST_JOB_MAX_ATTEMPTS", "3"))
+# Store maintenance the ingest worker runs between jobs: creating the next
+# months' history-tier partitions of semantic_triples (migration 033).
+INGEST_MAINTENANCE_INTERVAL_S = float(os.getenv("DCL_INGEST_MAINTENANCE_INTERVAL_S", "3600"))
+
+# --- Triple read cache (backend/core/read_cache.py) ---
+# Results of the hot triple reads are cached per (query, tenant store
+# generation). Writers in this process invalidate their tenant at commit; the
+# generation is re-probed from tenant_runs + ingest_runs (and Redis, when the
+# Redis tier is on) at most every READ_CACHE_POINTER_TTL_S, which bounds
+# staleness for writes made by another process. tests/conftest.py turns the cache off so
+# suites that mutate the store with raw SQL keep read-your-writes.
+READ_CACHE_ENABLED = os.getenv("DCL_READ_CACHE_ENABLED", "true").lower() in ("true", "1")
+READ_CACHE_MAX_ENTRIES = int(os.getenv("DCL_READ_CACHE_MAX_ENTRIES", "1024"))
+# Larger results are served but not cached.
+READ_CACHE_MAX_ENTRY_BYTES = int(os.getenv("DCL_READ_CACHE_MAX_ENTRY_BYTES", str(4 * 1024 * 1024)))
+READ_CACHE_POINTER_TTL_S = float(os.getenv("DCL_READ_CACHE_POINTER_TTL_S", "2.0"))
+# Optional shared tier: entries and invalidation generations in Redis
+# (REDIS_URL), so several API processes share warm results and see each
+# other's invalidations within one pointer TTL.
+READ_CACHE_REDIS = os.getenv("DCL_READ_CACHE_REDIS", "false").lower() in ("true", "1")
+READ_CACHE_REDIS_TTL_S = int(os.getenv("DCL_READ_CACHE_REDIS_TTL_S", "300"))
+
+# --- Streaming reads (backend/core/db.py stream_rows / server_cursor) ---
+# Rows per FETCH round trip from a server-side cursor. Worker memory for a
+# streamed read is about one FETCH of rows, whatever the result size.
+STREAM_ITERSIZE = int(os.getenv("DCL_STREAM_ITERSIZE", "5000"))
+
+# --- Prepared statements (backend/core/db.py execute_prepared) ---
+# "on" / "off" / "auto". PREPAREd statements live in the server session, so a
+# transaction pooler (Supavisor / PgBouncer on :6543) that hands each
+# transaction a different backend cannot carry them: "auto" enables them
+# unless DATABASE_URL points at port 6543.
+PREPARED_STATEMENTS = os.getenv("DCL_PREPARED_STATEMENTS", "auto").lower()
+# Named statements kept per pooled connection; the least recently used one is
+# DEALLOCATEd (in the same round trip) when a new one would exceed this.
+PREPARED_STATEMENT_CACHE_SIZE = int(os.getenv("DCL_PREPARED_STATEMENT_CACHE_SIZE", "64"))
+
+# --- Columnar run export (backend/engine/arrow_export.py) ---
+# Rows per server-side cursor fetch, and so per Arrow RecordBatch / Parquet
+# row group. Worker memory for an export is one batch of rows, whatever the
+# run size; each FETCH is bounded by QUERY_STATEMENT_TIMEOUT_MS.
+EXPORT_BATCH_ROWS = int(os.getenv("DCL_EXPORT_BATCH_ROWS", "20000"))
+
+# --- Entity-graph traversal (backend/db/edge_adjacency.py) ---
+# Multi-hop traversals run over an in-memory CSR snapshot of one
+# (tenant, entity) edge set. Live snapshots are kept in an LRU of this many
+# entities; their generation is re-probed from store_versions at most every
+# GRAPH_SNAPSHOT_PROBE_TTL_S (bounded staleness for edges written by another
+# process — this process's writes invalidate at commit).
+GRAPH_SNAPSHOT_CACHE_SIZE = int(os.getenv("DCL_GRAPH_SNAPSHOT_CACHE_SIZE", "64"))
+GRAPH_SNAPSHOT_PROBE_TTL_S = float(os.getenv("DCL_GRAPH_SNAPSHOT_PROBE_TTL_S", "2.0"))
+# An entity with more edges than this is refused rather than loaded whole.
+GRAPH_SNAPSHOT_MAX_EDGES = int(os.getenv("DCL_GRAPH_SNAPSHOT_MAX_EDGES", "200000"))
+# Request bounds for depth / max_nodes on /graph/neighbors and traverse_graph
+# (depth also bounds max_hops on /graph/paths).
+GRAPH_TRAVERSAL_MAX_DEPTH = int(os.getenv("DCL_GRAPH_TRAVERSAL_MAX_DEPTH", "6"))
+GRAPH_TRAVERSAL_MAX_NODES = int(os.getenv("DCL_GRAPH_TRAVERSAL_MAX_NODES", "5000"))
+# Most paths one /graph/paths (find_graph_paths) request may ask for.
+GRAPH_PATHS_MAX_K = int(os.getenv("DCL_GRAPH_PATHS_MAX_K", "10"))
 
 # --- Source Normalizer ---
 CB_COOLDOWN = float(os.getenv("DCL_CB_COOLDOWN", "120.0"))
@@ -18,14 +18,30 @@ Usage:
 
     # get_connection() raises RuntimeError or PoolExhausted on failure —
     # it never returns None. Do not check `if conn is None`.
+
+    # Large reads: rows arrive STREAM_ITERSIZE at a time from a server-side
+    # cursor instead of one fetchall().
+    for row in stream_rows("SELECT ...", params):
+        ...
+
+    # Hot reads: parsed and planned once per pooled connection, EXECUTEd after.
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            execute_prepared(cur, "SELECT ... WHERE tenant_id = %s", [tenant_id])
 """
 
+import hashlib
 import os
+import re
 import select
 import time
 import threading
+import uuid
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Optional
+from functools import lru_cache
+from typing import Iterator, Optional
+from urllib.parse import urlparse
 
 from backend.core.constants import (
     POOL_MIN_CONN,
@@ -34,7 +50,10 @@ from backend.core.constants import (
     POOL_RETRY_COOLDOWN,
     POOL_GETCONN_TIMEOUT,
     POOL_PREPING_IDLE_S,
+    PREPARED_STATEMENT_CACHE_SIZE,
+    PREPARED_STATEMENTS,
     QUERY_STATEMENT_TIMEOUT_MS,
+    STREAM_ITERSIZE,
 )
 from backend.utils.log_utils import get_logger
 
@@ -77,6 +96,11 @@ class PoolExhausted(Exception):
 #    carries no placeholders, so client-side interpolation is unaffected.
 #  - Works for any requested cursor class (incl. RealDictCursor): the factory
 #    wraps whatever class the caller asked for, cached per base class.
+#  - Named (server-side) cursors cannot take the prefix: psycopg2 sends their
+#    execute as DECLARE ... CURSOR FOR <query>, and a multi-statement string
+#    there is a syntax error. On a fresh transaction the wrapper binds the
+#    ceiling with its own SET LOCAL first (bytes, so it is not prefixed
+#    again) — one extra round trip, paid only by streaming reads.
 # ---------------------------------------------------------------------------
 
 _bound_factory_cache: dict = {}
@@ -90,6 +114,7 @@ def _bound_cursor_factory(base):
         return cached
 
     prefix = f"SET LOCAL statement_timeout = {int(QUERY_STATEMENT_TIMEOUT_MS)}; "
+    bind_stmt = prefix.strip().rstrip(";").encode()
 
     class _TimeoutBoundCursor(base):  # type: ignore[misc,valid-type]
         def execute(self, query, vars=None):
@@ -101,7 +126,11 @@ def _bound_cursor_factory(base):
             except Exception:
                 fresh_txn = False
             if fresh_txn and isinstance(query, str):
-                query = prefix + query
+                if self.name is None:
+                    query = prefix + query
+                else:
+                    with self.connection.cursor() as binder:
+                        binder.execute(bind_stmt)
             return super().execute(query, vars)
 
     _TimeoutBoundCursor.__name__ = f"TimeoutBound{getattr(base, '__name__', 'Cursor')}"
@@ -423,6 +452,209 @@ def get_connection():
                     )
 
 
+# ---------------------------------------------------------------------------
+# Streaming reads (server-side cursors)
+#
+# fetchall() materializes a whole result set in the worker — a large run is
+# a memory spike, then a second one when it is serialized. A named cursor
+# keeps the result on the server and pulls `itersize` rows per FETCH round
+# trip; the read ceiling above binds to every FETCH (see _TimeoutBoundCursor).
+# The transaction stays open while the caller iterates, so the connection is
+# held for the whole stream: use it for bulk reads, not per-request lookups.
+# ---------------------------------------------------------------------------
+
+@contextmanager
+def server_cursor(itersize: int = STREAM_ITERSIZE, cursor_factory=None):
+    """Borrow a connection and yield a named (server-side) cursor on it.
+
+    The caller executes one query and iterates (or fetchmany()s) the rows.
+    The read-only transaction is rolled back on exit — including when the
+    consumer stops early — which also closes the server-side portal.
+    """
+    with get_connection() as conn:
+        try:
+            kwargs = {"name": f"dcl_stream_{uuid.uuid4().hex[:12]}"}
+            if cursor_factory is not None:
+                kwargs["cursor_factory"] = cursor_factory
+            with conn.cursor(**kwargs) as cur:
+                cur.itersize = itersize
+                yield cur
+        finally:
+            try:
+                conn.rollback()
+            except Exception as e:
+                logger.warning(f"[db] Rollback after streaming read failed: {e}")
+
+
+def stream_rows(sql: str, params=None, itersize: int = STREAM_ITERSIZE) -> Iterator[dict]:
+    """Yield the rows of `sql` as dicts, `itersize` rows per round trip.
+
+    A generator: nothing is borrowed until the first row is requested, and
+    the connection is returned when iteration ends or the generator is
+    closed.
+    """
+    with server_cursor(itersize) as cur:
+        cur.execute(sql, params)
+        columns = None
+        for row in cur:
+            if columns is None:
+                columns = [desc[0] for desc in cur.description]
+            yield dict(zip(columns, row))
+
+
+# ---------------------------------------------------------------------------
+# Prepared statements (hot reads)
+#
+# A hot read (mcp_query_triples, get_neighbors, count_by_domain, the edge
+# derivation's per-concept read) is parsed, analyzed and planned by the server
+# on every call. execute_prepared() runs it as a named prepared statement: the
+# first call on a pooled connection sends "PREPARE dcl_ps_<hash> AS <sql with
+# $n>; EXECUTE dcl_ps_<hash>(<args>)" in ONE round trip, every later call only
+# "EXECUTE dcl_ps_<hash>(<args>)". After five executions Postgres may settle
+# on a cached generic plan, and planning drops out of the call entirely.
+#
+#  - Both shapes are plain str queries, so the #62 TimeoutBound prefix rides
+#    the first statement of a transaction exactly as it does for execute().
+#  - The name is a hash of the SQL text: each dynamic WHERE shape gets its own
+#    statement, and one name always means one statement text.
+#  - The registry (names this session holds) lives on the connection object
+#    and dies with it; at most PREPARED_STATEMENT_CACHE_SIZE per connection,
+#    the least recently used DEALLOCATEd in the same round trip as a new
+#    PREPARE.
+#  - Arguments are still client-side literals (EXECUTE takes expressions) and
+#    the server infers each $n's type from context at PREPARE. Route only
+#    queries whose placeholders sit in a typed context (col = %s, = ANY(%s),
+#    LIMIT %s) — a bare "%s IS NULL" cannot be PREPAREd.
+#  - Registry/session disagreement (26000 no such statement, 42P05 already
+#    exists — a backend swapped under the connection) clears the registry. A
+#    statement that opened its transaction is rolled back, the registry is
+#    resynced from pg_prepared_statements and the call retried once; later in
+#    a transaction the error propagates (the caller's transaction is already
+#    aborted).
+#  - Named cursors and PREPARED_STATEMENTS=off (or "auto" behind the :6543
+#    transaction pooler, where sessions are not ours) use plain execute().
+# ---------------------------------------------------------------------------
+
+_PREPARED_PREFIX = "dcl_ps_"
+_PLACEHOLDER_RE = re.compile(r"%(?:%|s|\()")
+_STALE_PREPARED_CODES = ("26000", "42P05")
+
+
+@lru_cache(maxsize=8)
+def _prepared_enabled_for(mode: str, database_url: str) -> bool:
+    if mode in ("on", "true", "1"):
+        return True
+    if mode in ("off", "false", "0"):
+        return False
+    try:
+        return urlparse(database_url).port != 6543
+    except ValueError:
+        return False
+
+
+def prepared_statements_enabled() -> bool:
+    return _prepared_enabled_for(PREPARED_STATEMENTS, os.environ.get("DATABASE_URL", ""))
+
+
+def _server_placeholders(sql: str) -> tuple[str, int]:
+    """'... a = %s AND b = %s' -> ('... a = $1 AND b = $2', 2). %% is kept —
+    the combined PREPARE/EXECUTE string is still mogrified with the args."""
+    count = 0
+
+    def number(m):
+        nonlocal count
+        if m.group(0) == "%%":
+            return "%%"
+        if m.group(0) == "%(":
+            raise ValueError("execute_prepared takes positional %s parameters only")
+        count += 1
+        return f"${count}"
+
+    return _PLACEHOLDER_RE.sub(number, sql), count
+
+
+def prepared_name(sql: str) -> str:
+    """Server-side statement name execute_prepared() uses for `sql`."""
+    return _PREPARED_PREFIX + hashlib.sha1(sql.encode()).hexdigest()[:24]
+
+
+def _prepared_registry(conn) -> Optional["OrderedDict[str, None]"]:
+    registry = getattr(conn, "_dcl_prepared", None)
+    if registry is None:
+        registry = OrderedDict()
+        try:
+            conn._dcl_prepared = registry
+        except AttributeError:
+            return None  # not a pool connection class — no per-connection state
+    return registry
+
+
+def _resync_prepared(cur, registry) -> None:
+    registry.clear()
+    cur.execute(
+        "SELECT name FROM pg_prepared_statements "
+        f"WHERE starts_with(name, '{_PREPARED_PREFIX}') ORDER BY prepare_time"
+    )
+    for (name,) in cur.fetchall():
+        registry[name] = None
+
+
+def _run_prepared(cur, registry, name: str, body: str, params: list) -> None:
+    execute = f"EXECUTE {name}({', '.join(['%s'] * len(params))})" if params else f"EXECUTE {name}"
+    if name in registry:
+        registry.move_to_end(name)
+        cur.execute(execute, params or None)
+        return
+    statements = []
+    while len(registry) >= max(PREPARED_STATEMENT_CACHE_SIZE, 1):
+        stale, _ = registry.popitem(last=False)
+        statements.append(f"DEALLOCATE {stale}")
+    statements += [f"PREPARE {name} AS {body}", execute]
+    cur.execute("; ".join(statements), params or None)
+    registry[name] = None
+
+
+def execute_prepared(cur, sql: str, params=None):
+    """cur.execute(sql, params), as a per-connection prepared statement.
+
+    `sql` uses positional %s placeholders like any psycopg2 query; results
+    are read from `cur` as usual. Falls back to a plain execute where
+    prepared statements cannot be used (see the section comment).
+    """
+    params = list(params or ())
+    registry = None
+    if cur.name is None and prepared_statements_enabled():
+        registry = _prepared_registry(cur.connection)
+    if registry is None:
+        return cur.execute(sql, params or None)
+
+    body, count = _server_placeholders(sql) if params else (sql, 0)
+    if count != len(params):
+        raise ValueError(
+            f"execute_prepared: {count} placeholders but {len(params)} parameters"
+        )
+    name = prepared_name(sql)
+    conn = cur.connection
+    try:
+        fresh_txn = (
+            conn.info.transaction_status == _pg_extensions.TRANSACTION_STATUS_IDLE
+        )
+    except Exception:
+        fresh_txn = False
+    try:
+        _run_prepared(cur, registry, name, body, params)
+    except psycopg2.Error as e:
+        if e.pgcode not in _STALE_PREPARED_CODES:
+            raise
+        registry.clear()
+        if not fresh_txn:
+            raise
+        logger.info(f"[db] Prepared-statement registry out of sync ({e.pgcode}) — resyncing")
+        conn.rollback()
+        _resync_prepared(cur, registry)
+        _run_prepared(cur, registry, name, body, params)
+
+
 def close_pool() -> None:
     """Close the shared pool. Call once on shutdown."""
     global _pool, _pool_initialized
@@ -0,0 +1,358 @@
+"""
+Run-pointer-versioned read cache for the hot triple read paths.
+
+A tenant's triple reads only change when its data changes, and every write
+to semantic_triples moves the registry rows of the runs it touched in the
+same transaction: COPY credits (new runs and ?append=true batches),
+supersession debits (pointer swaps, conflict dispositions, proposal
+approvals) and retention deletes all update ingest_runs, and an ingest's
+swap_and_deactivate moves the tenant_runs pointer. Those writes bump the
+tenant's store_versions 'triples' counter AT COMMIT (migration 040), so the
+counter moves on every committed write in commit order — a long write that
+commits after a shorter, later-started one still moves it. A read's result
+is cached under its query plus the tenant's GENERATION:
+
+    generation = store token    (store_versions 'triples' counter)
+               + in-process invalidation counter for the tenant
+               + Redis invalidation counter    (Redis tier only)
+
+Invalidation is a generation bump, never a scan for matching keys:
+TripleStore's write paths (COPY, pointer swap, supersession, retention) call
+invalidate(tenant_id) after commit, so the next read in this process
+computes a new key and misses. The store token is re-probed at most every
+READ_CACHE_POINTER_TTL_S — between probes a warm read costs no database
+round trip — which also catches writers in other processes (bounded
+staleness of one TTL, Redis tier or not). With the Redis tier the probe also
+reads the shared invalidation counters every process bumps.
+
+Tiers: an in-process LRU (READ_CACHE_MAX_ENTRIES) and, with
+DCL_READ_CACHE_REDIS=true and REDIS_URL reachable, a shared Redis tier
+(READ_CACHE_REDIS_TTL_S). Values are stored as tagged JSON, so a hit hands
+the caller fresh objects (no aliasing between requests) with Decimal /
+datetime / date / UUID preserved. Redis errors degrade to the LRU.
+
+Reads with no tenant scope (tenant_id=None) use the global generation,
+which every tenant invalidation also bumps.
+
+Usage:
+    from backend.core import read_cache
+
+    rows = read_cache.get_or_load("mcp_query_triples", tenant_id, (sql, params), load)
+    read_cache.invalidate(tenant_id)   # after a committed write
+    read_cache.stats()                 # hit-rate metrics
+"""
+
+import hashlib
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+from backend.core.constants import (
+    READ_CACHE_ENABLED,
+    READ_CACHE_MAX_ENTRIES,
+    READ_CACHE_MAX_ENTRY_BYTES,
+    READ_CACHE_POINTER_TTL_S,
+    READ_CACHE_REDIS,
+    READ_CACHE_REDIS_TTL_S,
+)
+from backend.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+_GLOBAL = "*"
+_REDIS_PREFIX = "dcl:read_cache:"
+
+
+# ---------------------------------------------------------------------------
+# Tagged JSON codec
+# ---------------------------------------------------------------------------
+
+def _encode_default(o):
+    if isinstance(o, Decimal):
+        return {"$t": "dec", "v": str(o)}
+    if isinstance(o, datetime):
+        return {"$t": "dt", "v": o.isoformat()}
+    if isinstance(o, date):
+        return {"$t": "d", "v": o.isoformat()}
+    if isinstance(o, uuid.UUID):
+        return {"$t": "uuid", "v": str(o)}
+    raise TypeError(f"read_cache cannot encode {type(o).__name__}")
+
+
+_DECODERS = {
+    "dec": Decimal,
+    "dt": datetime.fromisoformat,
+    "d": date.fromisoformat,
+    "uuid": uuid.UUID,
+}
+
+
+def _decode_hook(d: dict):
+    if len(d) == 2 and "$t" in d and "v" in d:
+        decode = _DECODERS.get(d["$t"])
+        if decode is not None:
+            return decode(d["v"])
+    return d
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, default=_encode_default, separators=(",", ":"))
+
+
+def _loads(text: str):
+    return json.loads(text, object_hook=_decode_hook)
+
+
+class ReadCache:
+    """Two-tier (LRU + optional Redis) cache keyed on query + generation."""
+
+    def __init__(
+        self,
+        *,
+        enabled: bool = READ_CACHE_ENABLED,
+        max_entries: int = READ_CACHE_MAX_ENTRIES,
+        max_entry_bytes: int = READ_CACHE_MAX_ENTRY_BYTES,
+        pointer_ttl_s: float = READ_CACHE_POINTER_TTL_S,
+        use_redis: bool = READ_CACHE_REDIS,
+        redis_ttl_s: int = READ_CACHE_REDIS_TTL_S,
+    ):
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.max_entry_bytes = max_entry_bytes
+        self.pointer_ttl_s = pointer_ttl_s
+        self.use_redis = use_redis
+        self.redis_ttl_s = redis_ttl_s
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._local_gen: dict[str, int] = {}
+        self._epoch = 0
+        self._pointer: dict[str, tuple[str, float]] = {}
+        self._counters: dict[str, dict[str, int]] = {}
+        self._invalidations = 0
+        self._evictions = 0
+
+    # -- tiers -------------------------------------------------------------
+
+    def _redis(self):
+        if not self.use_redis:
+            return None
+        from backend.core.redis_client import get_redis
+        return get_redis()
+
+    def _count(self, namespace: str, field: str) -> None:
+        with self._lock:
+            c = self._counters.setdefault(
+                namespace, {"hits": 0, "redis_hits": 0, "misses": 0, "bypassed": 0},
+            )
+            c[field] += 1
+
+    # -- generation --------------------------------------------------------
+
+    def _probe(self, scope: str) -> str:
+        """Store token for a scope: the tenant's store_versions 'triples'
+        counter, bumped at commit by every tenant_runs / ingest_runs write
+        (the global scope sums every tenant's; counters only grow, so the
+        sum moves whenever one does) (+ the shared Redis counter). One
+        primary-key read."""
+        from backend.core.db import get_connection
+
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                if scope == _GLOBAL:
+                    cur.execute(
+                        "SELECT COALESCE(SUM(version), 0) FROM store_versions "
+                        "WHERE scope = 'triples'"
+                    )
+                else:
+                    cur.execute(
+                        "SELECT COALESCE(MAX(version), 0) FROM store_versions "
+                        "WHERE tenant_id = %s AND scope = 'triples'",
+                        (scope,),
+                    )
+                token = str(cur.fetchone()[0])
+        r = self._redis()
+        if r is not None:
+            try:
+                token += f"#{r.get(_REDIS_PREFIX + 'gen:' + scope) or 0}"
+            except Exception as e:
+                logger.warning("[read_cache] redis generation read failed: %s", e)
+        return token
+
+    def generation(self, tenant_id: Optional[str]) -> str:
+        scope = str(tenant_id) if tenant_id else _GLOBAL
+        now = time.monotonic()
+        with self._lock:
+            cached = self._pointer.get(scope)
+        if cached is None or now - cached[1] >= self.pointer_ttl_s:
+            token = self._probe(scope)
+            with self._lock:
+                self._pointer[scope] = (token, now)
+        else:
+            token = cached[0]
+        with self._lock:
+            return f"{token}:{self._epoch}:{self._local_gen.get(scope, 0)}"
+
+    def invalidate(self, tenant_id: Optional[str] = None) -> None:
+        """Bump the generation of `tenant_id` (and the global scope, whose
+        reads span every tenant); None invalidates everything. Call after
+        the write commits."""
+        scopes = [str(tenant_id), _GLOBAL] if tenant_id else [_GLOBAL]
+        with self._lock:
+            self._invalidations += 1
+            if tenant_id:
+                for scope in scopes:
+                    self._local_gen[scope] = self._local_gen.get(scope, 0) + 1
+                    self._pointer.pop(scope, None)
+                # Superseded generations can never hit again — drop them now
+                # instead of waiting for LRU eviction.
+                prefixes = tuple(f"{scope}|" for scope in scopes)
+                for key in [k for k in self._entries if k.startswith(prefixes)]:
+                    del self._entries[key]
+            else:
+                self._epoch += 1
+                self._pointer.clear()
+                self._entries.clear()
+        r = self._redis()
+        if r is not None:
+            try:
+                if tenant_id:
+                    for scope in scopes:
+                        r.incr(_REDIS_PREFIX + "gen:" + scope)
+                else:
+                    r.incr(_REDIS_PREFIX + "gen:" + _GLOBAL)
+            except Exception as e:
+                logger.warning("[read_cache] redis invalidation failed: %s", e)
+
+    # -- read-through ------------------------------------------------------
+
+    def get_or_load(
+        self, namespace: str, tenant_id: Optional[str], query_key: Any,
+        loader: Callable[[], Any],
+    ):
+        """Return the cached result for (namespace, query_key) at the
+        tenant's current generation, or call loader() and cache what it
+        returns. query_key is anything JSON-encodable that identifies the
+        read (typically the SQL and its params). Loader exceptions propagate
+        and nothing is cached; a result the codec cannot encode is returned
+        uncached."""
+        if not self.enabled:
+            return loader()
+        try:
+            gen = self.generation(tenant_id)
+        except Exception as e:
+            # Generation unknown (e.g. malformed tenant_id, pool exhausted):
+            # serve uncached — the loader surfaces any real error itself.
+            logger.debug("[read_cache] generation probe failed (%s) — bypassing", e)
+            self._count(namespace, "bypassed")
+            return loader()
+
+        scope = str(tenant_id) if tenant_id else _GLOBAL
+        digest = hashlib.sha1(_dumps([namespace, query_key]).encode()).hexdigest()
+        key = f"{scope}|{gen}|{namespace}|{digest}"
+
+        with self._lock:
+            text = self._entries.get(key)
+            if text is not None:
+                self._entries.move_to_end(key)
+        if text is not None:
+            self._count(namespace, "hits")
+            return _loads(text)
+
+        r = self._redis()
+        if r is not None:
+            try:
+                text = r.get(_REDIS_PREFIX + key)
+            except Exception as e:
+                logger.warning("[read_cache] redis get failed: %s", e)
+                text = None
+            if text is not None:
+                self._count(namespace, "redis_hits")
+                self._store(key, text)
+                return _loads(text)
+
+        self._count(namespace, "misses")
+        value = loader()
+        try:
+            text = _dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.debug("[read_cache] %s result not cacheable: %s", namespace, e)
+            return value
+        if len(text) <= self.max_entry_bytes:
+            self._store(key, text)
+            if r is not None:
+                try:
+                    r.setex(_REDIS_PREFIX + key, self.redis_ttl_s, text)
+                except Exception as e:
+                    logger.warning("[read_cache] redis set failed: %s", e)
+        return value
+
+    def _store(self, key: str, text: str) -> None:
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    # -- metrics -----------------------------------------------------------
+
+    def stats(self) -> dict:
+        with self._lock:
+            namespaces = {}
+            totals = {"hits": 0, "redis_hits": 0, "misses": 0, "bypassed": 0}
+            for ns, c in sorted(self._counters.items()):
+                served = c["hits"] + c["redis_hits"] + c["misses"]
+                namespaces[ns] = {
+                    **c,
+                    "hit_rate": round((c["hits"] + c["redis_hits"]) / served, 4) if served else None,
+                }
+                for k in totals:
+                    totals[k] += c[k]
+            served = totals["hits"] + totals["redis_hits"] + totals["misses"]
+            return {
+                "enabled": self.enabled,
+                "redis_tier": self._redis() is not None,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "pointer_ttl_s": self.pointer_ttl_s,
+                **totals,
+                "hit_rate": round((totals["hits"] + totals["redis_hits"]) / served, 4) if served else None,
+                "namespaces": namespaces,
+            }
+
+    def clear(self) -> None:
+        """Drop every entry and reset the metrics (tests / operator reset)."""
+        with self._lock:
+            self._entries.clear()
+            self._pointer.clear()
+            self._counters.clear()
+            self._epoch += 1
+            self._invalidations = 0
+            self._evictions = 0
+
+
+_cache = ReadCache()
+
+
+def get_cache() -> ReadCache:
+    return _cache
+
+
+def get_or_load(namespace: str, tenant_id: Optional[str], query_key: Any,
+                loader: Callable[[], Any]):
+    return _cache.get_or_load(namespace, tenant_id, query_key, loader)
+
+
+def invalidate(tenant_id: Optional[str] = None) -> None:
+    _cache.invalidate(tenant_id)
+
+
+def stats() -> dict:
+    return _cache.stats()
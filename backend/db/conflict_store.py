@@ -11,7 +11,9 @@ live in backend/engine/conflict_detection.py).
 import json
 from typing import Any, Optional
 
+from backend.core import read_cache
 from backend.core.db import get_connection
+from backend.db.triple_store import supersede_triples_tx
 from backend.utils.log_utils import get_logger
 
 logger = get_logger(__name__)
@@ -252,12 +254,10 @@ class ConflictStore:
         )
         superseded = 0
         if superseded_triple_ids:
-            cur.execute(
-                "UPDATE semantic_triples SET superseded_at = now(), updated_at = now() "
-                "WHERE id = ANY(%s::uuid[]) AND tenant_id = %s AND is_active = true",
+            superseded = supersede_triples_tx(
+                cur, "id = ANY(%s::uuid[]) AND tenant_id = %s",
                 (superseded_triple_ids, tenant_id),
             )
-            superseded = cur.rowcount
         logger.info(
             "[conflict-disposition] conflict=%s action=%s winner=%s superseded=%d by=%s",
             conflict_id, action, winner_source, superseded, decided_by,
@@ -295,6 +295,8 @@ class ConflictStore:
                     context=context, new_status=new_status,
                 )
             conn.commit()
+        if superseded_triple_ids:
+            read_cache.invalidate(tenant_id)
         return result
 
     def latest_precedent(self, tenant_id: str, conflict_class: str) -> Optional[dict]:
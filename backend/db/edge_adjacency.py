@@ -0,0 +1,353 @@
+"""In-memory CSR adjacency snapshots of one enterprise's entity graph.
+
+EdgeStore.get_neighbors answers one hop per SQL round trip, so a k-hop
+question ("everything within three hops of this department") cost the caller
+k or more reads. EdgeStore.traverse instead loads the (tenant, entity) edge set
+ONCE into an AdjacencySnapshot and runs the breadth-first search in memory:
+
+  nodes       list of (node_type, node_key); node ids are list positions
+  offsets     array('l', n + 1) — node u's adjacency slots are
+              offsets[u] .. offsets[u + 1]
+  targets     array('l') — the node at the other end of each slot
+  type_codes  array('H') — the slot's edge type as an index into edge_types
+  dirs        array('B') — OUT (u is the edge's src) or IN (u is its dst);
+              every edge fills one OUT slot and one IN slot, so a direction
+              filter is a bit test, not a second index
+  edge_ids    array('l') — the slot's edge as an index into `edges` (the
+              EdgeStore row dicts, returned as-is)
+
+Live snapshots are cached per (tenant, entity) under a generation that
+combines an in-process edge-write counter — bumped by EdgeStore.assert_edges
+after commit — with the entity's commit-ordered store version
+(store_versions, migration 041) re-read at most every
+GRAPH_SNAPSHOT_PROBE_TTL_S, which bounds staleness for edges written by
+another process (the read_cache convention).
+As-of snapshots are built per call and not cached.
+
+Path questions ("how is department X connected to market band Y") use the
+same snapshot: AdjacencySnapshot.paths returns the k shortest loopless typed
+paths between two nodes (Yen's algorithm over hop-count BFS), so a path
+query is one edge-set read plus in-memory search.
+"""
+
+import heapq
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Callable, Hashable, Iterable, Optional
+
+from backend.core.constants import (
+    GRAPH_SNAPSHOT_CACHE_SIZE,
+    GRAPH_SNAPSHOT_PROBE_TTL_S,
+)
+
+OUT = 1
+IN = 2
+_DIRECTION_MASKS = {"out": OUT, "in": IN, "both": OUT | IN}
+
+
+class AdjacencySnapshot:
+    """Compressed-sparse-row adjacency over one edge list (see module doc)."""
+
+    __slots__ = ("nodes", "node_index", "edge_types", "offsets", "targets",
+                 "type_codes", "dirs", "edge_ids", "edges", "generation")
+
+    def __init__(self, edges: list[dict], generation: Hashable = None):
+        self.edges = edges
+        self.generation = generation
+        self.nodes: list[tuple[str, str]] = []
+        self.node_index: dict[tuple[str, str], int] = {}
+        self.edge_types: list[str] = []
+        type_index: dict[str, int] = {}
+
+        ends = array("l")    # (src, dst) node ids, flattened
+        codes = array("H")
+        for e in edges:
+            for side in ((e["src_type"], e["src_key"]), (e["dst_type"], e["dst_key"])):
+                nid = self.node_index.get(side)
+                if nid is None:
+                    nid = self.node_index[side] = len(self.nodes)
+                    self.nodes.append(side)
+                ends.append(nid)
+            code = type_index.get(e["edge_type"])
+            if code is None:
+                code = type_index[e["edge_type"]] = len(self.edge_types)
+                self.edge_types.append(e["edge_type"])
+            codes.append(code)
+
+        n = len(self.nodes)
+        offsets = array("l", [0]) * (n + 1)
+        for nid in ends:
+            offsets[nid + 1] += 1
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+        self.offsets = offsets
+        slots = 2 * len(edges)
+        self.targets = array("l", [0]) * slots
+        self.type_codes = array("H", [0]) * slots
+        self.dirs = array("B", [0]) * slots
+        self.edge_ids = array("l", [0]) * slots
+        fill = offsets[:n]  # next free slot per node
+        for i in range(len(edges)):
+            src, dst = ends[2 * i], ends[2 * i + 1]
+            for here, there, bit in ((src, dst, OUT), (dst, src, IN)):
+                slot = fill[here]
+                fill[here] += 1
+                self.targets[slot] = there
+                self.type_codes[slot] = codes[i]
+                self.dirs[slot] = bit
+                self.edge_ids[slot] = i
+
+    def bfs(
+        self,
+        node_type: str,
+        node_key: str,
+        *,
+        depth: int,
+        edge_types: Optional[Iterable[str]] = None,
+        direction: str = "both",
+        max_nodes: int,
+    ) -> dict:
+        """Breadth-first search from (node_type, node_key), at most `depth`
+        hops, following only `edge_types` (all when None) in `direction`.
+
+        Stops admitting nodes once `max_nodes` (start included) are reached
+        and reports truncated=True; an edge is returned only when both its
+        ends are. Nodes come back in BFS order with their hop distance, edges
+        in first-traversal order — deterministic for a given edge list.
+        """
+        mask = _DIRECTION_MASKS[direction]
+        codes = None
+        if edge_types is not None:
+            wanted = set(edge_types)
+            codes = {c for c, t in enumerate(self.edge_types) if t in wanted}
+
+        start = self.node_index.get((node_type, node_key))
+        found = [{"node_type": node_type, "node_key": node_key, "hop": 0}]
+        if start is None:
+            return {"nodes": found, "edges": [], "truncated": False}
+
+        offsets, targets, type_codes, dirs, edge_ids = (
+            self.offsets, self.targets, self.type_codes, self.dirs, self.edge_ids,
+        )
+        hops = {start: 0}
+        seen_edges: set[int] = set()
+        edge_order: list[int] = []
+        truncated = False
+        frontier = [start]
+        for hop in range(1, depth + 1):
+            nxt = []
+            for u in frontier:
+                for slot in range(offsets[u], offsets[u + 1]):
+                    if not dirs[slot] & mask:
+                        continue
+                    if codes is not None and type_codes[slot] not in codes:
+                        continue
+                    v = targets[slot]
+                    if v not in hops:
+                        if len(hops) >= max_nodes:
+                            truncated = True
+                            continue
+                        hops[v] = hop
+                        nxt.append(v)
+                    eid = edge_ids[slot]
+                    if eid not in seen_edges:
+                        seen_edges.add(eid)
+                        edge_order.append(eid)
+            if not nxt:
+                break
+            frontier = nxt
+
+        for nid, hop in hops.items():
+            if nid != start:
+                t, k = self.nodes[nid]
+                found.append({"node_type": t, "node_key": k, "hop": hop})
+        return {
+            "nodes": found,
+            "edges": [self.edges[i] for i in edge_order],
+            "truncated": truncated,
+        }
+
+    def _type_codes(self, edge_types: Optional[Iterable[str]]) -> Optional[set[int]]:
+        if edge_types is None:
+            return None
+        wanted = set(edge_types)
+        return {c for c, t in enumerate(self.edge_types) if t in wanted}
+
+    def _shortest(
+        self,
+        start: int,
+        goal: int,
+        mask: int,
+        codes: Optional[set[int]],
+        max_hops: int,
+        banned_nodes: set[int],
+        banned_edges: set[int],
+    ) -> Optional[list[int]]:
+        """Slots of one fewest-hop path start → goal (None when there is none
+        within max_hops), avoiding banned nodes and edge ids. Ties resolve to
+        the lowest slots — the snapshot's edge order — so results are stable."""
+        if start == goal:
+            return []
+        offsets, targets, type_codes, dirs, edge_ids = (
+            self.offsets, self.targets, self.type_codes, self.dirs, self.edge_ids,
+        )
+        via = {start: (-1, -1)}   # node -> (previous node, slot that reached it)
+        frontier = [start]
+        for _ in range(max_hops):
+            nxt = []
+            for u in frontier:
+                for slot in range(offsets[u], offsets[u + 1]):
+                    if not dirs[slot] & mask:
+                        continue
+                    if codes is not None and type_codes[slot] not in codes:
+                        continue
+                    v = targets[slot]
+                    if v in via or v in banned_nodes or edge_ids[slot] in banned_edges:
+                        continue
+                    via[v] = (u, slot)
+                    if v == goal:
+                        path = []
+                        while v != start:
+                            v, slot = via[v]
+                            path.append(slot)
+                        path.reverse()
+                        return path
+                    nxt.append(v)
+            if not nxt:
+                return None
+            frontier = nxt
+        return None
+
+    def paths(
+        self,
+        src: tuple[str, str],
+        dst: tuple[str, str],
+        *,
+        k: int,
+        max_hops: int,
+        edge_types: Optional[Iterable[str]] = None,
+        direction: str = "both",
+    ) -> list[dict]:
+        """Up to k shortest loopless paths src → dst of at most max_hops edges,
+        following only `edge_types` (all when None) in `direction` ("out"
+        walks edges src→dst as stored; "both" ignores orientation). Yen's
+        algorithm: each further path deviates from an earlier one at a spur
+        node, with that prefix's used edges and nodes banned.
+
+        Each path: {"hops", "nodes": [{node_type, node_key}], "edges": [edge
+        row + "direction": "out"|"in" relative to the walk]}. Fewest hops
+        first; deterministic for a given edge list."""
+        mask = _DIRECTION_MASKS[direction]
+        codes = self._type_codes(edge_types)
+        start, goal = self.node_index.get(src), self.node_index.get(dst)
+        if start is None or goal is None or start == goal:
+            return []
+
+        first = self._shortest(start, goal, mask, codes, max_hops, set(), set())
+        if first is None:
+            return []
+        found: list[list[int]] = [first]
+        seen = {tuple(first)}
+        candidates: list[tuple[int, list[int]]] = []
+        while len(found) < k:
+            prev = found[-1]
+            prev_nodes = [start] + [self.targets[s] for s in prev]
+            for j in range(len(prev)):
+                root = prev[:j]
+                banned_edges = {
+                    self.edge_ids[p[j]] for p in found if len(p) > j and p[:j] == root
+                }
+                spur = self._shortest(
+                    prev_nodes[j], goal, mask, codes, max_hops - j,
+                    set(prev_nodes[:j]), banned_edges,
+                )
+                if spur is None:
+                    continue
+                cand = root + spur
+                if tuple(cand) in seen:
+                    continue
+                seen.add(tuple(cand))
+                heapq.heappush(candidates, (len(cand), cand))
+            if not candidates:
+                break
+            found.append(heapq.heappop(candidates)[1])
+
+        out = []
+        for slots in found:
+            nodes = [start] + [self.targets[s] for s in slots]
+            out.append({
+                "hops": len(slots),
+                "nodes": [{"node_type": t, "node_key": k_}
+                          for t, k_ in (self.nodes[n] for n in nodes)],
+                "edges": [{**self.edges[self.edge_ids[s]],
+                           "direction": "out" if self.dirs[s] == OUT else "in"}
+                          for s in slots],
+            })
+        return out
+
+
+class AdjacencyCache:
+    """LRU of live AdjacencySnapshots keyed (tenant_id, entity_id)."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = GRAPH_SNAPSHOT_CACHE_SIZE,
+        probe_ttl_s: float = GRAPH_SNAPSHOT_PROBE_TTL_S,
+    ):
+        self.max_entries = max_entries
+        self.probe_ttl_s = probe_ttl_s
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple, AdjacencySnapshot]" = OrderedDict()
+        self._writes: dict[tuple, int] = {}
+        self._tokens: dict[tuple, tuple[Hashable, float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def invalidate(self, tenant_id: str, entity_id: str) -> None:
+        """Bump the (tenant, entity) edge-write generation — called after an
+        edge write commits — and force the next read to re-probe."""
+        key = (str(tenant_id), entity_id)
+        with self._lock:
+            self._writes[key] = self._writes.get(key, 0) + 1
+            self._tokens.pop(key, None)
+            self._entries.pop(key, None)
+
+    def get(
+        self,
+        tenant_id: str,
+        entity_id: str,
+        probe: Callable[[], Hashable],
+        load: Callable[[], list[dict]],
+    ) -> AdjacencySnapshot:
+        """The cached snapshot when its generation is current, else a fresh
+        one built from load(). probe() returns the store-side edge token."""
+        key = (str(tenant_id), entity_id)
+        now = time.monotonic()
+        with self._lock:
+            writes = self._writes.get(key, 0)
+            token = self._tokens.get(key)
+        if token is None or now - token[1] >= self.probe_ttl_s:
+            token = (probe(), now)
+            with self._lock:
+                self._tokens[key] = token
+        generation = (writes, token[0])
+        with self._lock:
+            snap = self._entries.get(key)
+            if snap is not None and snap.generation == generation:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return snap
+            self.misses += 1
+        # Built outside the lock; a write that lands meanwhile bumps the
+        # counter, so this snapshot's generation is already stale for the
+        # next reader.
+        snap = AdjacencySnapshot(load(), generation)
+        with self._lock:
+            self._entries[key] = snap
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return snap
@@ -16,19 +16,34 @@ conflict register's structural class (migration 018) in the same
 transaction — never silently dropped (Blueprint §7). Identity (tenant_id
 UUID + entity_id) is required on every call: missing ⇒ EdgeIdentityError,
 which routes surface as 422 (I2, no fallback).
+
+Multi-hop reads (traverse, find_paths) run over an in-memory CSR snapshot of
+the (tenant, entity) edge set (backend/db/edge_adjacency.py); assert_edges
+bumps the snapshot generation after every commit.
 """
 
 import json
 import uuid as _uuid
 from dataclasses import dataclass, field
-from typing import Any, Optional
-
-from backend.core.db import get_connection
-from backend.core.constants import INGEST_STATEMENT_TIMEOUT_MS
+from typing import Any, Iterable, Optional
+
+from backend.core.db import execute_prepared, get_connection
+from backend.core.constants import (
+    GRAPH_PATHS_MAX_K,
+    GRAPH_SNAPSHOT_MAX_EDGES,
+    GRAPH_TRAVERSAL_MAX_DEPTH,
+    GRAPH_TRAVERSAL_MAX_NODES,
+    INGEST_STATEMENT_TIMEOUT_MS,
+)
+from backend.db.edge_adjacency import AdjacencyCache, AdjacencySnapshot
+from backend.db.triple_store import as_of_clause
 from backend.utils.log_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Values carried by org_unit nodes (node_values): the enterprise headline trio.
+ORG_HEADLINE_CONCEPTS = ("workforce.headcount.total", "revenue.total", "arr.ending")
+
 # Wildcard tenant for built-in edge types (same convention as tenant_authority_map).
 _BUILTIN_TENANT = "*"
 
@@ -158,6 +173,8 @@ class EdgeStore:
         edges: list[dict],
         *,
         replace: bool = False,
+        retire: Optional[list[dict]] = None,
+        scrub: bool = True,
     ) -> EdgeWriteResult:
         """Persist a batch of edges with constraint enforcement.
 
@@ -168,6 +185,13 @@ class EdgeStore:
                          first (clean re-run), then the batch inserts; rows
                          already carrying THIS batch's run_id are scrubbed
                          (same-run redelivery, identical to the facts path).
+          retire       — coordinates (src/edge/dst type+key dicts) whose live
+                         rows are superseded in the same transaction without
+                         a successor: the incremental re-derivation's edges
+                         that no longer hold. May be the whole write.
+          scrub=False  — skip the same-run redelivery scrub, for callers that
+                         write only the coordinates that changed (incremental
+                         derivation) and must not drop this run's other rows.
 
         Constraint rules (edge_types registry) are evaluated against the
         post-supersession live state plus the in-batch accepted set.
@@ -177,7 +201,7 @@ class EdgeStore:
         back together (a violation can never be silently lost).
         """
         _require_identity(tenant_id, entity_id)
-        if not edges:
+        if not edges and not retire:
             return EdgeWriteResult()
         for i, e in enumerate(edges):
             _validate_edge_payload(e, i)
@@ -185,11 +209,11 @@ class EdgeStore:
         # Payload contract is the NAMESPACED id (I1); only the storage column
         # is named run_id (schema contract).
         run_ids = {str(e["dcl_ingest_id"]) for e in edges}
-        if len(run_ids) != 1:
+        if len(run_ids) > 1:
             raise EdgeContractError(
                 f"assert_edges requires exactly one dcl_ingest_id across the batch; got {sorted(run_ids)}"
             )
-        run_id = run_ids.pop()
+        run_id = run_ids.pop() if run_ids else None
 
         registry = load_edge_types(tenant_id)
 
@@ -198,11 +222,13 @@ class EdgeStore:
                 cur.execute(f"SET LOCAL statement_timeout = {int(INGEST_STATEMENT_TIMEOUT_MS)}")
 
                 # Same-run redelivery scrub (idempotent replay of THIS ingest event).
-                cur.execute(
-                    "DELETE FROM entity_edges WHERE tenant_id = %s AND entity_id = %s AND run_id = %s",
-                    [str(tenant_id), entity_id, run_id],
-                )
-                scrubbed = cur.rowcount
+                scrubbed = 0
+                if scrub and run_id is not None:
+                    cur.execute(
+                        "DELETE FROM entity_edges WHERE tenant_id = %s AND entity_id = %s AND run_id = %s",
+                        [str(tenant_id), entity_id, run_id],
+                    )
+                    scrubbed = cur.rowcount
 
                 superseded = 0
                 if replace:
@@ -212,6 +238,20 @@ class EdgeStore:
                         [str(tenant_id), entity_id],
                     )
                     superseded = cur.rowcount
+                if retire:
+                    # One set-based statement for every retired coordinate.
+                    cols = list(zip(*(_coord(c) for c in retire)))
+                    cur.execute(
+                        "UPDATE entity_edges e SET superseded_at = now(), updated_at = now() "
+                        "FROM unnest(%s::text[], %s::text[], %s::text[], %s::text[], %s::text[]) "
+                        "     AS r(src_type, src_key, edge_type, dst_type, dst_key) "
+                        "WHERE e.tenant_id = %s AND e.entity_id = %s AND e.is_active = true "
+                        "AND e.src_type = r.src_type AND e.src_key = r.src_key "
+                        "AND e.edge_type = r.edge_type AND e.dst_type = r.dst_type "
+                        "AND e.dst_key = r.dst_key",
+                        [*(list(col) for col in cols), str(tenant_id), entity_id],
+                    )
+                    superseded += cur.rowcount
 
                 # Live state AFTER supersession — the baseline constraints check
                 # against. source_system + id ride along so a violation's register
@@ -339,6 +379,7 @@ class EdgeStore:
                     )
 
                 conn.commit()
+        _adjacency.invalidate(tenant_id, entity_id)
 
         if violations:
             logger.warning(
@@ -453,11 +494,14 @@ class EdgeStore:
     @staticmethod
     def _temporal_clause(as_of: Optional[str], params: list) -> str:
         """Knowledge-time predicate: live now, or live as of T (same predicate
-        as the facts store: ingested_at <= T AND (superseded_at IS NULL OR > T))."""
+        as the facts store — triple_store.as_of_clause: knowledge_range @> T
+        once migration 037 is applied, ingested_at <= T AND (superseded_at IS
+        NULL OR > T) before)."""
         if as_of is None:
             return " AND is_active = true"
-        params.extend([as_of, as_of])
-        return " AND ingested_at <= %s AND (superseded_at IS NULL OR superseded_at > %s)"
+        clause, clause_params = as_of_clause(as_of, "entity_edges")
+        params.extend(clause_params)
+        return f" AND {clause}"
 
     def get_neighbors(
         self,
@@ -497,7 +541,8 @@ class EdgeStore:
 
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(
+                execute_prepared(
+                    cur,
                     f"SELECT {self._READ_COLS} FROM entity_edges "
                     f"WHERE tenant_id = %s AND entity_id = %s AND {node_clause}"
                     f"{type_clause}{temporal} "
@@ -506,6 +551,130 @@ class EdgeStore:
                 )
                 return [self._row_to_edge(r) for r in cur.fetchall()]
 
+    def traverse(
+        self,
+        tenant_id: str,
+        entity_id: str,
+        node_type: str,
+        node_key: str,
+        *,
+        depth: int = 1,
+        edge_types: Optional[list[str]] = None,
+        direction: str = "both",      # out | in | both
+        max_nodes: int = 500,
+        as_of: Optional[str] = None,
+    ) -> dict:
+        """Multi-hop BFS from one node: every node within `depth` hops along
+        `edge_types` (all when None) in `direction`, with its hop distance,
+        and the edges traversed to reach them. At most `max_nodes` nodes
+        (start included) — truncated=True when the cap cut the search.
+
+        One read of the entity's edge set, whatever the depth: live traversals
+        share a cached adjacency snapshot (invalidated by assert_edges), as-of
+        traversals build one from the as-of edge set."""
+        _require_identity(tenant_id, entity_id)
+        if direction not in ("out", "in", "both"):
+            raise EdgeContractError(f"direction must be out|in|both, got {direction!r}")
+        if not 1 <= int(depth) <= GRAPH_TRAVERSAL_MAX_DEPTH:
+            raise EdgeContractError(
+                f"depth must be between 1 and {GRAPH_TRAVERSAL_MAX_DEPTH}, got {depth!r}"
+            )
+        if not 1 <= int(max_nodes) <= GRAPH_TRAVERSAL_MAX_NODES:
+            raise EdgeContractError(
+                f"max_nodes must be between 1 and {GRAPH_TRAVERSAL_MAX_NODES}, got {max_nodes!r}"
+            )
+
+        result = self._snapshot(tenant_id, entity_id, as_of).bfs(
+            node_type, node_key, depth=int(depth), edge_types=edge_types,
+            direction=direction, max_nodes=int(max_nodes),
+        )
+        return {"depth": int(depth), **result}
+
+    def find_paths(
+        self,
+        tenant_id: str,
+        entity_id: str,
+        src: tuple[str, str],
+        dst: tuple[str, str],
+        *,
+        k: int = 3,
+        max_hops: int = 4,
+        edge_types: Optional[list[str]] = None,
+        direction: str = "both",      # out | in | both
+        as_of: Optional[str] = None,
+    ) -> list[dict]:
+        """The k shortest loopless typed paths between two (node_type,
+        node_key) nodes, at most max_hops edges each, following `edge_types`
+        (all when None) in `direction`. Fewest hops first; [] when the nodes
+        are not connected within the bounds. Runs over the same adjacency
+        snapshot as traverse (cached live, built per call as-of)."""
+        _require_identity(tenant_id, entity_id)
+        if direction not in ("out", "in", "both"):
+            raise EdgeContractError(f"direction must be out|in|both, got {direction!r}")
+        if not 1 <= int(max_hops) <= GRAPH_TRAVERSAL_MAX_DEPTH:
+            raise EdgeContractError(
+                f"max_hops must be between 1 and {GRAPH_TRAVERSAL_MAX_DEPTH}, got {max_hops!r}"
+            )
+        if not 1 <= int(k) <= GRAPH_PATHS_MAX_K:
+            raise EdgeContractError(f"k must be between 1 and {GRAPH_PATHS_MAX_K}, got {k!r}")
+        return self._snapshot(tenant_id, entity_id, as_of).paths(
+            tuple(src), tuple(dst), k=int(k), max_hops=int(max_hops),
+            edge_types=edge_types, direction=direction,
+        )
+
+    def live_edges(self, tenant_id: str, entity_id: str) -> list[dict]:
+        """Every live edge of the entity, read fresh (not the cached snapshot) —
+        the baseline a write decision diffs against."""
+        _require_identity(tenant_id, entity_id)
+        return self._snapshot_edges(tenant_id, entity_id, None)
+
+    def _snapshot(self, tenant_id: str, entity_id: str, as_of: Optional[str]) -> AdjacencySnapshot:
+        if as_of is not None:
+            return AdjacencySnapshot(self._snapshot_edges(tenant_id, entity_id, as_of))
+        return _adjacency.get(
+            tenant_id, entity_id,
+            probe=lambda: self._edge_token(tenant_id, entity_id),
+            load=lambda: self._snapshot_edges(tenant_id, entity_id, None),
+        )
+
+    def _snapshot_edges(self, tenant_id: str, entity_id: str, as_of: Optional[str]) -> list[dict]:
+        """The entity's whole edge set (live or as-of) for an adjacency
+        snapshot — complete or refused, never silently cut."""
+        params: list[Any] = [str(tenant_id), entity_id]
+        temporal = self._temporal_clause(as_of, params)
+        params.append(GRAPH_SNAPSHOT_MAX_EDGES + 1)
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"SELECT {self._READ_COLS} FROM entity_edges "
+                    f"WHERE tenant_id = %s AND entity_id = %s{temporal} "
+                    f"ORDER BY edge_type, src_type, src_key, dst_type, dst_key LIMIT %s",
+                    params,
+                )
+                rows = cur.fetchall()
+        if len(rows) > GRAPH_SNAPSHOT_MAX_EDGES:
+            raise EdgeContractError(
+                f"entity {entity_id!r} has more than {GRAPH_SNAPSHOT_MAX_EDGES} edges — "
+                f"too large to traverse in memory (DCL_GRAPH_SNAPSHOT_MAX_EDGES)"
+            )
+        return [self._row_to_edge(r) for r in rows]
+
+    @staticmethod
+    def _edge_token(tenant_id: str, entity_id: str) -> int:
+        """Store-side generation of an entity's edge set: its store_versions
+        'edges:<entity_id>' counter, bumped at commit by every transaction
+        that writes the entity's edges (migration 041) — so it moves on every
+        committed write, retire-only ones included, in commit order."""
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                execute_prepared(
+                    cur,
+                    "SELECT COALESCE(MAX(version), 0) FROM store_versions "
+                    "WHERE tenant_id = %s AND scope = %s",
+                    [str(tenant_id), f"edges:{entity_id}"],
+                )
+                return cur.fetchone()[0]
+
     def list_entities(self, tenant_id: str) -> list[str]:
         """Distinct entity_ids holding at least one live edge for the tenant —
         the tenant-wide enumeration the Gate 2C exports walk (and their
@@ -531,7 +700,7 @@ class EdgeStore:
     ) -> dict:
         """The enterprise's edge set (live or as-of) + derived node list —
         the hero read. Nodes are derived from edge endpoints; node values are
-        joined from semantic_triples by the route layer."""
+        joined from semantic_triples by node_values()."""
         _require_identity(tenant_id, entity_id)
         params: list[Any] = [str(tenant_id), entity_id]
         type_clause = ""
@@ -558,7 +727,66 @@ class EdgeStore:
                 nodes.setdefault(k, {"node_type": k[0], "node_key": k[1]})
         return {"edges": edges, "nodes": list(nodes.values())}
 
+    def node_values(
+        self, tenant_id: str, entity_id: str, nodes: Iterable[tuple[str, str]],
+    ) -> dict[tuple[str, str], dict[str, dict]]:
+        """Active triples for graph nodes, keyed (node_type, node_key) →
+        {concept: {value, property, period}} — every requested node present,
+        {} when nothing joins. ONE deterministic rule: property == node_key
+        AND concept ends in '.by_<node_type>' (covers both records-path
+        'headcount.by_department' and SE families); org_unit nodes get the
+        headline trio. Latest period per concept wins (lexicographic period
+        sort — periods are 'YYYY-Qn').
+
+        Set-based: one query per node_type over all of its keys, on one
+        connection, with latest-period-wins resolved by DISTINCT ON — a
+        2,000-node subgraph costs a handful of round trips, not 2,000."""
+        _require_identity(tenant_id, entity_id)
+        out: dict[tuple[str, str], dict[str, dict]] = {}
+        keys_by_type: dict[str, list[str]] = {}
+        for node_type, node_key in nodes:
+            if (node_type, node_key) not in out:
+                out[(node_type, node_key)] = {}
+                keys_by_type.setdefault(node_type, []).append(node_key)
+        if not out:
+            return out
+
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                for node_type, keys in keys_by_type.items():
+                    if node_type == "org_unit":
+                        # The headline trio is per enterprise, not per key.
+                        cur.execute(
+                            "SELECT DISTINCT ON (concept) concept, property, value, period "
+                            "FROM semantic_triples "
+                            "WHERE tenant_id = %s AND entity_id = %s AND is_active = true "
+                            "AND concept = ANY(%s) "
+                            "ORDER BY concept, COALESCE(period, '') DESC",
+                            [str(tenant_id), entity_id, list(ORG_HEADLINE_CONCEPTS)],
+                        )
+                        headline = {
+                            concept: {"value": value, "property": prop, "period": period}
+                            for concept, prop, value, period in cur.fetchall()
+                        }
+                        for key in keys:
+                            out[(node_type, key)] = dict(headline)
+                        continue
+                    cur.execute(
+                        "SELECT DISTINCT ON (property, concept) property, concept, value, period "
+                        "FROM semantic_triples "
+                        "WHERE tenant_id = %s AND entity_id = %s AND is_active = true "
+                        "AND property = ANY(%s) AND concept LIKE %s "
+                        "ORDER BY property, concept, COALESCE(period, '') DESC",
+                        [str(tenant_id), entity_id, keys, f"%.by_{node_type}"],
+                    )
+                    for prop, concept, value, period in cur.fetchall():
+                        out[(node_type, prop)][concept] = {
+                            "value": value, "property": prop, "period": period,
+                        }
+        return out
+
 
+_adjacency = AdjacencyCache()
 _edge_store: Optional[EdgeStore] = None
 
 
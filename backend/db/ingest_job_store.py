@@ -0,0 +1,153 @@
+"""IngestJobStore — data access for the ingest_jobs queue (migration 030).
+
+Post-ingest work (domain summary, conflict detection, ingest_log, seed
+manifest) is enqueued here by the ingest endpoints and drained by
+backend/api/ingest_worker.py. Claiming uses SELECT ... FOR UPDATE SKIP
+LOCKED, so concurrent workers never take the same job and never block on
+each other. I1: the ingest identity is dcl_ingest_id in every shape.
+"""
+
+import json
+from typing import Optional
+
+from backend.core.db import get_connection
+from backend.utils.log_utils import get_logger
+
+logger = get_logger(__name__)
+
+_JOB_COLS = (
+    "id, tenant_id, dcl_ingest_id, entity_id, job_type, payload, status, attempts, "
+    "worker_id, result, last_error, enqueued_at, started_at, finished_at"
+)
+
+
+def _row_to_job(row: tuple) -> dict:
+    (job_id, tenant_id, dcl_ingest_id, entity_id, job_type, payload, status, attempts,
+     worker_id, result, last_error, enqueued_at, started_at, finished_at) = row
+    return {
+        "job_id": job_id,
+        "tenant_id": str(tenant_id),
+        "dcl_ingest_id": str(dcl_ingest_id),
+        "entity_id": entity_id,
+        "job_type": job_type,
+        "payload": payload,
+        "status": status,
+        "attempts": attempts,
+        "worker_id": worker_id,
+        "result": result,
+        "last_error": last_error,
+        "enqueued_at": enqueued_at.isoformat() if enqueued_at else None,
+        "started_at": started_at.isoformat() if started_at else None,
+        "finished_at": finished_at.isoformat() if finished_at else None,
+    }
+
+
+class IngestJobStore:
+    def enqueue(
+        self,
+        tenant_id: str,
+        dcl_ingest_id: str,
+        job_type: str,
+        payload: dict,
+        *,
+        entity_id: Optional[str] = None,
+        worker_id: Optional[str] = None,
+    ) -> int:
+        """Insert a job and return its id.
+
+        With worker_id set the row is inserted already claimed ('running',
+        attempt 1) — the ?sync=true path, which executes the job in-request
+        and must not race a background worker for it.
+        """
+        status = "running" if worker_id else "queued"
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "INSERT INTO ingest_jobs "
+                    "(tenant_id, dcl_ingest_id, entity_id, job_type, payload, status, "
+                    " attempts, worker_id, started_at) "
+                    "VALUES (%s, %s, %s, %s, %s, %s, %s, %s, "
+                    "        CASE WHEN %s = 'running' THEN now() END) "
+                    "RETURNING id",
+                    (tenant_id, dcl_ingest_id, entity_id, job_type, json.dumps(payload),
+                     status, 1 if worker_id else 0, worker_id, status),
+                )
+                job_id = cur.fetchone()[0]
+            conn.commit()
+        return job_id
+
+    def claim(self, worker_id: str, lease_seconds: int) -> Optional[dict]:
+        """Claim the oldest claimable job, or None when the queue is empty.
+
+        Claimable = queued, or running with an expired lease (its worker died
+        mid-job). SKIP LOCKED: a row another worker is claiming right now is
+        skipped, not waited on.
+        """
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"UPDATE ingest_jobs SET status = 'running', attempts = attempts + 1, "
+                    f"       worker_id = %s, started_at = now(), last_error = NULL "
+                    f"WHERE id = ("
+                    f"    SELECT id FROM ingest_jobs "
+                    f"    WHERE status = 'queued' "
+                    f"       OR (status = 'running' "
+                    f"           AND started_at < now() - make_interval(secs => %s)) "
+                    f"    ORDER BY id "
+                    f"    FOR UPDATE SKIP LOCKED "
+                    f"    LIMIT 1"
+                    f") RETURNING {_JOB_COLS}",
+                    (worker_id, lease_seconds),
+                )
+                row = cur.fetchone()
+            conn.commit()
+        return _row_to_job(row) if row else None
+
+    def complete(self, job_id: int, result: dict) -> None:
+        """Mark a job done and store its result."""
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "UPDATE ingest_jobs SET status = 'done', result = %s, "
+                    "       last_error = NULL, finished_at = now() "
+                    "WHERE id = %s",
+                    (json.dumps(result), job_id),
+                )
+            conn.commit()
+
+    def fail(self, job_id: int, error: str, max_attempts: int) -> str:
+        """Record a failed attempt. Requeues below max_attempts, otherwise
+        marks the job failed for good. Returns the new status."""
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "UPDATE ingest_jobs SET "
+                    "  status = CASE WHEN attempts < %s THEN 'queued' ELSE 'failed' END, "
+                    "  last_error = %s, "
+                    "  finished_at = CASE WHEN attempts < %s THEN NULL ELSE now() END "
+                    "WHERE id = %s RETURNING status",
+                    (max_attempts, error, max_attempts, job_id),
+                )
+                row = cur.fetchone()
+            conn.commit()
+        return row[0] if row else "failed"
+
+    def list_for_ingest(self, dcl_ingest_id: str) -> list[dict]:
+        """All jobs for one ingest id, oldest first (one per batch / stream)."""
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"SELECT {_JOB_COLS} FROM ingest_jobs "
+                    f"WHERE dcl_ingest_id = %s ORDER BY id",
+                    (dcl_ingest_id,),
+                )
+                return [_row_to_job(r) for r in cur.fetchall()]
+
+    def delete_for_tenant(self, tenant_id: str) -> int:
+        """Hard-delete all jobs for a tenant (test cleanup only)."""
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM ingest_jobs WHERE tenant_id = %s", (tenant_id,))
+                deleted = cur.rowcount
+            conn.commit()
+        return deleted
@@ -14,6 +14,7 @@ import json
 import uuid
 from typing import Any, Optional
 
+from backend.core import read_cache
 from backend.core.db import get_connection
 from backend.utils.log_utils import get_logger
 
@@ -459,6 +460,9 @@ class ProposalStore:
                     )
                     decision_id, decided_at = cur.fetchone()
                     conn.commit()
+                    if ptype == "value_drift" and canonical_artifact_id:
+                        # The disposition superseded the losing triples.
+                        read_cache.invalidate(tenant_id)
 
                     logger.info(
                         "[proposal-decide] proposal=%s type=%s decision=%s step=%d/%d "
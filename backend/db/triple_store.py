@@ -11,16 +11,723 @@ time). Lifecycle writes CLOSE a fact's knowledge window (SET superseded_at)
 at the database. Hard DELETEs survive only in the explicit retention tools
 (delete_inactive / purge_old_runs / delete_by_run — B19 operator scope) and
 in the same-run redelivery scrub inside replace_tenant_triples.
+
+Run registry (migration 031): every write that changes a run's rows also
+updates its ingest_runs row in the same transaction — COPY writes through
+_register_copied, supersession through supersede_triples_tx, hard deletes
+through delete_triples_tx — so run_exists / get_run_info / list_runs /
+count_by_run read the registry instead of scanning semantic_triples.
+
+Sharded writes (migration 032): write_entity_shards splits a multi-entity
+batch per entity and writes the shards concurrently as prepared transactions
+on separate pooled connections; a coordinator transaction applies the
+registry deltas and records the commit decision, then the shards commit.
+
+Tiered layout (migration 033): semantic_triples is partitioned — a live tier
+hash-partitioned by tenant_id and a superseded-history tier range-partitioned
+by superseded_at. Writers are unchanged (supersession moves the row between
+tiers); the supersede / delete helpers retry the 40001 a concurrent row move
+raises. Current-state reads (is_active = true) plan against the live tier
+only; as-of reads keep their predicate.
+
+Rollups (migration 034): triple_rollups holds live-triple counts per
+(tenant, entity, run, domain, source, fabric plane/product, period), credited
+by _credit_rollups after every COPY and debited inside the supersede / delete
+statements, so the operator surfaces (count_by_domain, persona stats, Sankey,
+overview, contextualization summary) aggregate groups instead of triples.
+
+Domain column (migration 035): concept-root filters go through domain_clause,
+which emits `domain = ...` equality against the generated column (served by
+the tenant/domain composite indexes) once the store has it, and the original
+LIKE predicates until then.
+
+Group digests (migration 036): run_group_digests holds, per run and
+(entity, concept, property, period, source) group, the row count and an
+order-independent value hash, credited by _credit_group_digests after every
+COPY and debited by delete_triples_tx, so diff_runs joins two runs' digests
+instead of re-hashing both runs' triples on every call.
+
+Knowledge range (migration 037): as-of reads go through as_of_clause, which
+emits `knowledge_range @> T` (served by the tenant/entity GiST index) once the
+table has the generated range column, and the two-column predicate until then.
+
+Read cache (backend/core/read_cache.py): every write path that changes what a
+tenant reads calls read_cache.invalidate after its commit; the MCP query
+methods read through the cache.
 """
 
-import io
 import json
-from backend.core.db import get_connection
-from backend.core.constants import INGEST_STATEMENT_TIMEOUT_MS
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Iterable, Iterator
+
+from psycopg2.errors import SerializationFailure
+
+from backend.core import read_cache
+from backend.core.db import execute_prepared, get_connection, stream_rows
+from backend.core.constants import (
+    INGEST_COPY_BLOCK_CHARS,
+    INGEST_SHARD_RECOVERY_AGE_S,
+    INGEST_SHARD_WORKERS,
+    INGEST_STATEMENT_TIMEOUT_MS,
+)
 from backend.utils.log_utils import get_logger
 
 logger = get_logger(__name__)
 
+# PostgreSQL COPY TEXT escapes, applied in one str.translate pass per cell
+# (previously four chained str.replace calls per cell).
+_COPY_ESCAPES = str.maketrans({
+    "\\": "\\\\",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\r": "\\r",
+})
+
+
+# confidence_tier -> counter slot in a _CopyRowStream.rollups entry.
+_TIER_SLOTS = {"exact": 2, "high": 3, "medium": 4, "low": 5}
+
+
+class _CopyRowStream:
+    """File-like COPY TEXT encoder over an iterable of triple dicts.
+
+    copy_expert() pulls fixed-size blocks via read(size); each call encodes
+    only as many rows as it takes to fill one block, so encoding interleaves
+    with the network send and memory stays at one block regardless of batch
+    size. The rows iterable may be a list or a lazy generator (streaming
+    ingest). rows_written counts rows actually handed to COPY; run_stats
+    maps (tenant_id, run_id) -> [rows, entity_ids] for the ingest_runs
+    registry update that commits with the COPY, and rollups maps each
+    triple_rollups key -> [rows, confidence_sum, exact, high, medium, low,
+    {concept: rows}] for _credit_rollups.
+    """
+
+    def __init__(self, rows: Iterable[dict], cols: list[str], json_cols: frozenset):
+        self._rows = iter(rows)
+        self._cols = tuple((c, c in json_cols) for c in cols)
+        self._pending = ""
+        self.rows_written = 0
+        self.run_stats: dict[tuple, list] = {}
+        self.rollups: dict[tuple, list] = {}
+
+    def _encode(self, t: dict) -> str:
+        cells = []
+        for c, is_json in self._cols:
+            v = t.get(c)
+            if v is None:
+                # NULL stays NULL (\N); a present JSONB value is json.dumps'd.
+                cells.append("\\N")
+            elif is_json:
+                cells.append(json.dumps(v).translate(_COPY_ESCAPES))
+            else:
+                cells.append(str(v).translate(_COPY_ESCAPES))
+        return "\t".join(cells) + "\n"
+
+    def read(self, size: int = -1) -> str:
+        parts = [self._pending]
+        filled = len(self._pending)
+        while size < 0 or filled < size:
+            t = next(self._rows, None)
+            if t is None:
+                break
+            line = self._encode(t)
+            parts.append(line)
+            filled += len(line)
+            self.rows_written += 1
+            key = (t.get("tenant_id"), t.get("run_id"))
+            stat = self.run_stats.get(key)
+            if stat is None:
+                stat = self.run_stats[key] = [0, set()]
+            stat[0] += 1
+            if t.get("entity_id"):
+                stat[1].add(t["entity_id"])
+            concept = t.get("concept") or ""
+            rkey = (
+                key[0], t.get("entity_id"), key[1], concept.split(".", 1)[0],
+                t.get("source_system"), t.get("fabric_plane") or "",
+                t.get("fabric_product") or "", t.get("period") or "",
+            )
+            roll = self.rollups.get(rkey)
+            if roll is None:
+                roll = self.rollups[rkey] = [0, 0.0, 0, 0, 0, 0, {}]
+            roll[0] += 1
+            roll[1] += round(float(t.get("confidence_score") or 0), 2)
+            slot = _TIER_SLOTS.get(t.get("confidence_tier"))
+            if slot:
+                roll[slot] += 1
+            roll[6][concept] = roll[6].get(concept, 0) + 1
+        block = "".join(parts)
+        if size < 0 or len(block) <= size:
+            self._pending = ""
+            return block
+        self._pending = block[size:]
+        return block[:size]
+
+
+_ROW_MOVE_RETRIES = 3
+
+
+def _execute_row_moving(cur, sql: str, params) -> None:
+    """Execute a supersede / delete statement on semantic_triples, retrying
+    when it collides with a concurrent supersession of the same row.
+
+    With the tiered layout (migration 033) supersession MOVES a row from the
+    live tier to the history tier, and a concurrent UPDATE/DELETE that was
+    waiting on it gets SQLSTATE 40001 instead of READ COMMITTED's re-check.
+    A savepoint rides the statement's own round trip, so a retry rolls back
+    only this statement and re-runs it against the committed state.
+    """
+    for attempt in range(_ROW_MOVE_RETRIES):
+        try:
+            cur.execute("SAVEPOINT row_move; " + sql, params)
+            return
+        except SerializationFailure:
+            if attempt == _ROW_MOVE_RETRIES - 1:
+                raise
+            cur.execute("ROLLBACK TO SAVEPOINT row_move")
+            logger.warning(
+                "[triple_store] row moved by a concurrent supersession — retrying (%d/%d)",
+                attempt + 1, _ROW_MOVE_RETRIES - 1,
+            )
+
+
+# Rollup columns a supersede / delete statement RETURNs so the same
+# statement can debit triple_rollups (migration 034).
+_ROLLUP_RETURNING = (
+    "tenant_id, entity_id, concept, source_system, fabric_plane, "
+    "fabric_product, period, confidence_score, confidence_tier"
+)
+
+
+def _rollup_debit_ctes(src: str, live: str) -> str:
+    """CTEs that debit triple_rollups for the rows of CTE `src` matching
+    `live` (the rows that were live before the statement). Groups the
+    returned rows per rollup key — per concept first, to build the
+    concept_counts debit — and updates the existing rollup rows; a group with
+    no rollup row (written before the backfill) is left to the backfill."""
+    return (
+        f"roll_c AS ("
+        f"    SELECT tenant_id, entity_id, run_id, split_part(concept, '.', 1) AS domain, "
+        f"           source_system, COALESCE(fabric_plane, '') AS fabric_plane, "
+        f"           COALESCE(fabric_product, '') AS fabric_product, "
+        f"           COALESCE(period, '') AS period, concept, COUNT(*) AS n, "
+        f"           SUM(confidence_score) AS conf, "
+        f"           COUNT(*) FILTER (WHERE confidence_tier = 'exact') AS t_exact, "
+        f"           COUNT(*) FILTER (WHERE confidence_tier = 'high') AS t_high, "
+        f"           COUNT(*) FILTER (WHERE confidence_tier = 'medium') AS t_medium, "
+        f"           COUNT(*) FILTER (WHERE confidence_tier = 'low') AS t_low "
+        f"    FROM {src} WHERE {live} GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9"
+        f"), roll AS ("
+        f"    SELECT tenant_id, entity_id, run_id, domain, source_system, fabric_plane, "
+        f"           fabric_product, period, SUM(n) AS n, SUM(conf) AS conf, "
+        f"           SUM(t_exact) AS t_exact, SUM(t_high) AS t_high, "
+        f"           SUM(t_medium) AS t_medium, SUM(t_low) AS t_low, "
+        f"           jsonb_object_agg(concept, n) AS concepts "
+        f"    FROM roll_c GROUP BY 1, 2, 3, 4, 5, 6, 7, 8"
+        f"), roll_debit AS ("
+        f"    UPDATE triple_rollups r SET live_count = r.live_count - roll.n, "
+        f"           confidence_sum = r.confidence_sum - roll.conf, "
+        f"           tier_exact = r.tier_exact - roll.t_exact, "
+        f"           tier_high = r.tier_high - roll.t_high, "
+        f"           tier_medium = r.tier_medium - roll.t_medium, "
+        f"           tier_low = r.tier_low - roll.t_low, "
+        f"           concept_counts = triple_rollup_merge_counts(r.concept_counts, roll.concepts, -1), "
+        f"           updated_at = now() "
+        f"    FROM roll WHERE r.tenant_id = roll.tenant_id AND r.entity_id = roll.entity_id "
+        f"      AND r.dcl_ingest_id = roll.run_id AND r.domain = roll.domain "
+        f"      AND r.source_system = roll.source_system "
+        f"      AND r.fabric_plane = roll.fabric_plane "
+        f"      AND r.fabric_product = roll.fabric_product AND r.period = roll.period"
+        f")"
+    )
+
+
+# Run group digests (migration 036) cover every row a run wrote, so only a
+# hard DELETE debits them; the statement RETURNs these extra columns.
+_DIGEST_RETURNING = "property, value"
+
+
+def _digest_debit_cte(src: str) -> str:
+    """CTE debiting run_group_digests for every row of CTE `src` (a DELETE's
+    RETURNING) — one group per (entity, run, concept, property, period,
+    source). A group with no digest row (a run written before migration 036)
+    is left to the backfill."""
+    return (
+        f"dg AS ("
+        f"    SELECT tenant_id, entity_id, run_id, concept, property, "
+        f"           COALESCE(period, '') AS period, source_system, COUNT(*) AS n, "
+        f"           SUM(triple_value_hash(value)) AS h "
+        f"    FROM {src} GROUP BY 1, 2, 3, 4, 5, 6, 7"
+        f"), dg_debit AS ("
+        f"    UPDATE run_group_digests g SET row_count = g.row_count - dg.n, "
+        f"           value_hash = g.value_hash - dg.h, updated_at = now() "
+        f"    FROM dg WHERE g.tenant_id = dg.tenant_id AND g.entity_id = dg.entity_id "
+        f"      AND g.dcl_ingest_id = dg.run_id AND g.concept = dg.concept "
+        f"      AND g.property = dg.property AND g.period = dg.period "
+        f"      AND g.source_system = dg.source_system"
+        f")"
+    )
+
+
+def supersede_triples_tx(cur, where: str, params, deltas: dict | None = None) -> int:
+    """Close the knowledge window of every live row matching `where` and
+    debit each affected run's ingest_runs.live_count and triple_rollups
+    groups — one statement on the caller's cursor, so it commits (or rolls
+    back) with the caller's transaction. Returns the number of rows
+    superseded.
+
+    With `deltas` the registry is NOT touched: per-run debits are added to
+    deltas[run_id] = [triple_delta, live_delta] for the caller to apply
+    (sharded writes, where the registry is written by the coordinator).
+    Rollups are always debited in-statement — they are keyed per entity, so
+    a shard owns its rollup rows.
+    """
+    if deltas is not None:
+        _execute_row_moving(
+            cur,
+            f"WITH s AS ("
+            f"    UPDATE semantic_triples SET superseded_at = now(), updated_at = now() "
+            f"    WHERE is_active = true AND ({where}) RETURNING run_id, {_ROLLUP_RETURNING}"
+            f"), {_rollup_debit_ctes('s', 'true')} "
+            f"SELECT run_id, COUNT(*) FROM s GROUP BY run_id",
+            params,
+        )
+        rows = cur.fetchall()
+        _accumulate_deltas(deltas, ((run_id, 0, n) for run_id, n in rows))
+        return sum(n for _, n in rows)
+    _execute_row_moving(
+        cur,
+        f"WITH s AS ("
+        f"    UPDATE semantic_triples SET superseded_at = now(), updated_at = now() "
+        f"    WHERE is_active = true AND ({where}) RETURNING run_id, {_ROLLUP_RETURNING}"
+        f"), agg AS (SELECT run_id, COUNT(*) AS n FROM s GROUP BY run_id), "
+        f"reg AS ("
+        f"    UPDATE ingest_runs r SET live_count = r.live_count - agg.n, updated_at = now() "
+        f"    FROM agg WHERE r.dcl_ingest_id = agg.run_id"
+        f"), {_rollup_debit_ctes('s', 'true')} "
+        f"SELECT COALESCE(SUM(n), 0)::bigint FROM agg",
+        params,
+    )
+    return cur.fetchone()[0]
+
+
+def delete_triples_tx(cur, where: str, params, deltas: dict | None = None) -> int:
+    """Hard-delete every row matching `where` and debit each affected run's
+    ingest_runs triple_count and run_group_digests groups (and live_count
+    and triple_rollups groups for rows that were live) — one statement on
+    the caller's cursor. Returns the number of rows deleted. Retention /
+    redelivery-scrub paths only (B19). `deltas` as in supersede_triples_tx."""
+    if deltas is not None:
+        _execute_row_moving(
+            cur,
+            f"WITH d AS ("
+            f"    DELETE FROM semantic_triples WHERE {where} "
+            f"    RETURNING run_id, superseded_at IS NULL AS live, {_ROLLUP_RETURNING}, "
+            f"              {_DIGEST_RETURNING}"
+            f"), {_rollup_debit_ctes('d', 'live')}, {_digest_debit_cte('d')} "
+            f"SELECT run_id, COUNT(*), COUNT(*) FILTER (WHERE live) "
+            f"FROM d GROUP BY run_id",
+            params,
+        )
+        rows = cur.fetchall()
+        _accumulate_deltas(deltas, rows)
+        return sum(n for _, n, _ in rows)
+    _execute_row_moving(
+        cur,
+        f"WITH d AS ("
+        f"    DELETE FROM semantic_triples WHERE {where} "
+        f"    RETURNING run_id, superseded_at IS NULL AS live, {_ROLLUP_RETURNING}, "
+        f"              {_DIGEST_RETURNING}"
+        f"), agg AS ("
+        f"    SELECT run_id, COUNT(*) AS n, COUNT(*) FILTER (WHERE live) AS n_live "
+        f"    FROM d GROUP BY run_id"
+        f"), reg AS ("
+        f"    UPDATE ingest_runs r SET triple_count = r.triple_count - agg.n, "
+        f"           live_count = r.live_count - agg.n_live, updated_at = now() "
+        f"    FROM agg WHERE r.dcl_ingest_id = agg.run_id"
+        f"), {_rollup_debit_ctes('d', 'live')}, {_digest_debit_cte('d')} "
+        f"SELECT COALESCE(SUM(n), 0)::bigint FROM agg",
+        params,
+    )
+    return cur.fetchone()[0]
+
+
+def _accumulate_deltas(deltas: dict, rows) -> None:
+    """Add (run_id, rows_removed, live_removed) debits into deltas."""
+    for run_id, n, n_live in rows:
+        d = deltas.setdefault(str(run_id), [0, 0])
+        d[0] -= n
+        d[1] -= n_live
+
+
+def _apply_run_deltas(cur, deltas: dict) -> None:
+    """Apply accumulated per-run debits to ingest_runs (coordinator side of
+    a sharded write)."""
+    for run_id, (d_triples, d_live) in deltas.items():
+        if d_triples or d_live:
+            cur.execute(
+                "UPDATE ingest_runs SET triple_count = triple_count + %s, "
+                "       live_count = live_count + %s, updated_at = now() "
+                "WHERE dcl_ingest_id = %s",
+                (d_triples, d_live, run_id),
+            )
+
+
+def _touch_run(cur, run_id: str) -> None:
+    """Move a run's registry row after its sharded rows became visible. The
+    coordinator's commit bumped the tenant's store version (migration 040)
+    before COMMIT PREPARED made the shards visible; a reader probing in
+    between cached the pre-shard state under the new version, so the
+    version moves once more after the shards land."""
+    cur.execute(cur.mogrify(
+        "UPDATE ingest_runs SET updated_at = now() WHERE dcl_ingest_id = %s", (run_id,),
+    ))
+
+
+def _invalidate_written(run_stats: dict) -> None:
+    """Invalidate the read cache for every tenant a committed COPY wrote."""
+    for tenant_id in {t for t, _ in run_stats}:
+        read_cache.invalidate(str(tenant_id) if tenant_id else None)
+
+
+def _register_copied(cur, run_stats: dict) -> None:
+    """Credit the runs a COPY just wrote (a _CopyRowStream's run_stats) into
+    ingest_runs, in the caller's transaction. Upsert: a new run gets its row
+    (group_digests = true — every write path credits run_group_digests from
+    migration 036 on); an append batch adds to the counts and entity set and
+    moves last_write_at, and leaves group_digests as it was."""
+    for (tenant_id, run_id), (n, entity_ids) in run_stats.items():
+        if not run_id:
+            continue
+        cur.execute(
+            "INSERT INTO ingest_runs "
+            "(dcl_ingest_id, tenant_id, entity_ids, triple_count, live_count, group_digests) "
+            "VALUES (%s, %s, %s, %s, %s, true) "
+            "ON CONFLICT (dcl_ingest_id) DO UPDATE SET "
+            "  entity_ids = ARRAY(SELECT DISTINCT e FROM "
+            "      unnest(ingest_runs.entity_ids || EXCLUDED.entity_ids) AS e ORDER BY e), "
+            "  triple_count = ingest_runs.triple_count + EXCLUDED.triple_count, "
+            "  live_count = ingest_runs.live_count + EXCLUDED.live_count, "
+            "  last_write_at = now(), updated_at = now()",
+            (str(run_id), str(tenant_id), sorted(entity_ids), n, n),
+        )
+
+
+_ROLLUP_CREDIT_SQL = (
+    "INSERT INTO triple_rollups "
+    "(tenant_id, entity_id, dcl_ingest_id, domain, source_system, fabric_plane, "
+    " fabric_product, period, live_count, confidence_sum, "
+    " tier_exact, tier_high, tier_medium, tier_low, concept_counts) "
+    "VALUES %s "
+    "ON CONFLICT (tenant_id, entity_id, dcl_ingest_id, domain, source_system, "
+    "             fabric_plane, fabric_product, period) DO UPDATE SET "
+    "  live_count = triple_rollups.live_count + EXCLUDED.live_count, "
+    "  confidence_sum = triple_rollups.confidence_sum + EXCLUDED.confidence_sum, "
+    "  tier_exact = triple_rollups.tier_exact + EXCLUDED.tier_exact, "
+    "  tier_high = triple_rollups.tier_high + EXCLUDED.tier_high, "
+    "  tier_medium = triple_rollups.tier_medium + EXCLUDED.tier_medium, "
+    "  tier_low = triple_rollups.tier_low + EXCLUDED.tier_low, "
+    "  concept_counts = triple_rollup_merge_counts("
+    "      triple_rollups.concept_counts, EXCLUDED.concept_counts, 1), "
+    "  updated_at = now()"
+)
+_ROLLUP_CREDIT_TEMPLATE = (
+    "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s::jsonb)"
+)
+
+
+def _credit_rollups(cur, rollups: dict) -> None:
+    """Credit the triple_rollups groups a COPY just wrote (a
+    _CopyRowStream's rollups), in the caller's transaction — one
+    multi-row upsert. Called on the COPY's own cursor (shards included:
+    rollup keys carry entity_id, so concurrent shards never share a row)."""
+    if not rollups:
+        return
+    from psycopg2.extras import execute_values
+
+    rows = [
+        (str(tenant_id), entity_id, str(run_id), domain, source, plane, product,
+         period, n, round(conf, 2), exact, high, medium, low, json.dumps(concepts))
+        for (tenant_id, entity_id, run_id, domain, source, plane, product, period),
+            (n, conf, exact, high, medium, low, concepts) in rollups.items()
+    ]
+    # Sorted so concurrent writers touching overlapping groups lock them in
+    # the same order.
+    rows.sort(key=lambda r: r[:8])
+    execute_values(cur, _ROLLUP_CREDIT_SQL, rows,
+                   template=_ROLLUP_CREDIT_TEMPLATE, page_size=1000)
+
+
+_DIGEST_CREDIT_SQL = (
+    "WITH w AS ("
+    "    SELECT tenant_id, entity_id, run_id, concept, property, "
+    "           COALESCE(period, '') AS period, source_system, "
+    "           COUNT(*) AS n, SUM(triple_value_hash(value)) AS h "
+    "    FROM semantic_triples "
+    "    WHERE tenant_id = %s AND run_id = %s AND entity_id = ANY(%s) "
+    "      AND ingested_at = now() "
+    "    GROUP BY 1, 2, 3, 4, 5, 6, 7"
+    "), credit AS ("
+    "    INSERT INTO run_group_digests AS g "
+    "    (tenant_id, entity_id, dcl_ingest_id, concept, property, period, "
+    "     source_system, row_count, value_hash) "
+    "    SELECT * FROM w ORDER BY 1, 2, 3, 4, 5, 6, 7 "
+    "    ON CONFLICT (tenant_id, entity_id, dcl_ingest_id, concept, property, "
+    "                 period, source_system) DO UPDATE SET "
+    "      row_count = g.row_count + EXCLUDED.row_count, "
+    "      value_hash = g.value_hash + EXCLUDED.value_hash, "
+    "      updated_at = now()"
+    ") "
+    "SELECT COALESCE(SUM(n), 0)::bigint FROM w"
+)
+
+
+def _credit_group_digests(cur, run_stats: dict) -> None:
+    """Credit the run_group_digests groups a COPY just wrote, in the
+    caller's transaction (shards included — digest keys carry entity_id).
+
+    The rows are read back rather than hashed client-side: the digest is
+    triple_value_hash over Postgres' own jsonb text, the form the backfill
+    and the delete debits hash too. ingested_at defaults to now(), the
+    transaction start, so `ingested_at = now()` selects the rows this
+    transaction wrote for the run's entities. That rests on the COPY never
+    supplying ingested_at, so the read-back is checked against the rows the
+    COPY actually wrote: a mismatch raises and the whole write rolls back,
+    rather than committing a digest that silently misses rows (diff_runs
+    would report those groups as unchanged)."""
+    for (tenant_id, run_id), (n, entity_ids) in run_stats.items():
+        if not run_id or not entity_ids:
+            continue
+        cur.execute(
+            _DIGEST_CREDIT_SQL, (str(tenant_id), str(run_id), sorted(entity_ids)),
+        )
+        credited = cur.fetchone()[0]
+        if credited != n:
+            raise RuntimeError(
+                f"run_group_digests credit for run {run_id} covered {credited} of the "
+                f"{n} rows this transaction wrote — the ingested_at = now() read-back "
+                f"no longer matches the COPY; refusing to commit an incomplete digest"
+            )
+
+
+_SHARD_GID_PREFIX = "dcl-shard:"
+
+
+def _rollback_shards(conns: list, gids: list[str]) -> None:
+    """Roll back every shard branch of a failed sharded write, prepared or
+    not. A branch that cannot be rolled back here is left to
+    recover_shard_transactions() (no decision row -> rollback)."""
+    for conn, gid in zip(conns, gids):
+        try:
+            conn.tpc_rollback()
+        except Exception as e:
+            logger.error("[write_entity_shards] rollback of %s failed: %s", gid, e)
+
+
+def recover_shard_transactions(min_age_s: int = INGEST_SHARD_RECOVERY_AGE_S) -> dict:
+    """Resolve prepared sharded-write branches orphaned by a dead process.
+
+    A 'dcl-shard:' branch prepared more than min_age_s ago is committed when
+    its group has a row in ingest_shard_decisions and rolled back when it
+    has none — so a batch lands whole or not at all. Decisions older than
+    7 days are pruned. Returns {"committed": [gid...], "rolled_back": [gid...]}.
+    """
+    resolved: dict[str, list[str]] = {"committed": [], "rolled_back": []}
+    with get_connection() as conn:
+        prior_autocommit = conn.autocommit
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                # Bytes queries: COMMIT/ROLLBACK PREPARED cannot run inside a
+                # transaction block, and the read-timeout SET LOCAL prefix
+                # (backend/core/db.py, ledger #62) applies to str queries only.
+                cur.execute(cur.mogrify(
+                    "SELECT p.gid, d.group_id IS NOT NULL, d.dcl_ingest_id "
+                    "FROM pg_prepared_xacts p "
+                    "LEFT JOIN ingest_shard_decisions d "
+                    "  ON d.group_id = regexp_replace(p.gid, ':[0-9]+/[0-9]+$', '') "
+                    "WHERE p.database = current_database() "
+                    "  AND starts_with(p.gid, %s) "
+                    "  AND p.prepared < now() - make_interval(secs => %s)",
+                    (_SHARD_GID_PREFIX, min_age_s),
+                ))
+                committed_runs = set()
+                for gid, decided, run_id in cur.fetchall():
+                    verb = "COMMIT" if decided else "ROLLBACK"
+                    cur.execute(cur.mogrify(f"{verb} PREPARED %s", (gid,)))
+                    resolved["committed" if decided else "rolled_back"].append(gid)
+                    if decided:
+                        committed_runs.add(str(run_id))
+                    logger.error(
+                        "[recover_shard_transactions] orphaned shard %s -> %s PREPARED",
+                        gid, verb,
+                    )
+                for run_id in committed_runs:
+                    _touch_run(cur, run_id)
+                cur.execute(
+                    b"DELETE FROM ingest_shard_decisions "
+                    b"WHERE decided_at < now() - interval '7 days'"
+                )
+        finally:
+            conn.autocommit = prior_autocommit
+    if resolved["committed"]:
+        read_cache.invalidate()
+    return resolved
+
+
+# semantic_triples.domain (migration 035) and the knowledge_range columns
+# (migration 037) arrive on populated stores through operator scripts, so
+# readers check for them; a negative answer is re-checked after this many
+# seconds.
+_COLUMN_RECHECK_S = 60.0
+_columns: dict[tuple[str, str], dict] = {}
+
+
+def _column_ready(table: str, column: str) -> bool:
+    """True once `table` has `column` (cached; misses re-checked)."""
+    state = _columns.setdefault((table, column), {"ready": False, "checked_at": None})
+    if state["ready"]:
+        return True
+    checked_at = state["checked_at"]
+    if checked_at is not None and time.monotonic() - checked_at < _COLUMN_RECHECK_S:
+        return False
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT EXISTS (SELECT 1 FROM pg_attribute "
+                    "WHERE attrelid = %s::regclass "
+                    "AND attname = %s AND NOT attisdropped)",
+                    (table, column),
+                )
+                ready = bool(cur.fetchone()[0])
+    except Exception as e:
+        # Unknown — answer with the predicates every store supports and ask
+        # again on the next read.
+        logger.debug("[triple_store] %s.%s column check failed: %s", table, column, e)
+        return False
+    state.update(ready=ready, checked_at=time.monotonic())
+    return ready
+
+
+def domain_column_ready() -> bool:
+    """True once semantic_triples has the generated `domain` column."""
+    return _column_ready("semantic_triples", "domain")
+
+
+def knowledge_range_ready(table: str = "semantic_triples") -> bool:
+    """True once `table` (semantic_triples / entity_edges) has the generated
+    `knowledge_range` column (migration 037)."""
+    return _column_ready(table, "knowledge_range")
+
+
+def as_of_clause(as_of: str, table: str = "semantic_triples") -> tuple[str, list]:
+    """SQL predicate (+ params) selecting the rows of `table` the store
+    believed at knowledge time `as_of`: ingested_at <= T and not yet
+    superseded at T. On a table with the knowledge_range column (migration
+    037) this is `knowledge_range @> T`, served by the tenant/entity GiST
+    index; before it, the two-column form."""
+    if knowledge_range_ready(table):
+        return "knowledge_range @> %s::timestamptz", [as_of]
+    return (
+        "ingested_at <= %s AND (superseded_at IS NULL OR superseded_at > %s)",
+        [as_of, as_of],
+    )
+
+
+def domain_clause(domains: list[str], *, include_root: bool = True) -> tuple[str, list]:
+    """SQL predicate (+ params) selecting triples whose concept root is one of
+    `domains`.
+
+    include_root=True matches the root concept itself and its subtree
+    (`concept = d OR concept LIKE 'd.%'` — the MCP / persona scoping shape);
+    include_root=False matches only the subtree (`concept LIKE 'd.%'` — the
+    browse / dashboard shape). On a store with the domain column (migration
+    035) both become an equality on `domain`, the leading key of the
+    tenant/domain indexes. A dotted entry is a subtree, not a root, and
+    keeps the LIKE form.
+    """
+    domains = list(domains)
+    prefixes = [f"{d}.%" for d in domains]
+    if domain_column_ready() and not any("." in d for d in domains):
+        if len(domains) == 1:
+            eq, params = "domain = %s", [domains[0]]
+        else:
+            eq, params = "domain = ANY(%s)", [domains]
+        if include_root:
+            return eq, params
+        # Subtree only: same root, but not the bare root concept itself.
+        return f"{eq} AND concept <> domain", params
+    if len(domains) == 1:
+        if include_root:
+            return "(concept = %s OR concept LIKE %s)", [domains[0], prefixes[0]]
+        return "concept LIKE %s", [prefixes[0]]
+    if include_root:
+        return "(concept = ANY(%s) OR concept LIKE ANY(%s))", [domains, prefixes]
+    return "concept LIKE ANY(%s)", [prefixes]
+
+
+# TripleStore.diff_runs: one side of the diff — a run's assertion groups with
+# row count, value digest and (scan only) the single value. The digest form
+# reads run_group_digests (migration 036); the scan form aggregates the
+# run's triples and serves runs written before it.
+_DIFF_DIGEST_GROUPS = """
+    SELECT concept, property, period, source_system,
+           row_count AS cnt, value_hash::text AS digest,
+           NULL::text AS single_value
+    FROM run_group_digests
+    WHERE tenant_id = %s AND entity_id = %s AND dcl_ingest_id = %s
+      AND row_count > 0
+"""
+_DIFF_SCAN_GROUPS = """
+    SELECT concept, property, COALESCE(period, '') AS period,
+           source_system,
+           COUNT(*) AS cnt,
+           md5(string_agg(value::text, '|' ORDER BY value::text)) AS digest,
+           MIN(value::text) AS single_value
+    FROM semantic_triples
+    WHERE tenant_id = %s AND entity_id = %s AND run_id = %s
+    GROUP BY concept, property, COALESCE(period, ''), source_system
+"""
+_DIFF_JOIN = """
+    , joined AS (
+        SELECT
+            COALESCE(b.concept, c.concept)             AS concept,
+            COALESCE(b.property, c.property)           AS property,
+            COALESCE(b.period, c.period)               AS period,
+            COALESCE(b.source_system, c.source_system) AS source_system,
+            b.cnt AS base_count, c.cnt AS compare_count,
+            b.single_value AS base_value, c.single_value AS compare_value,
+            CASE
+                WHEN b.concept IS NULL THEN 'added'
+                WHEN c.concept IS NULL THEN 'removed'
+                WHEN b.cnt != c.cnt OR b.digest != c.digest THEN 'changed'
+                ELSE 'unchanged'
+            END AS category
+        FROM base b
+        FULL OUTER JOIN cmp c
+          USING (concept, property, period, source_system)
+    ),
+    ranked AS (
+        SELECT *,
+               ROW_NUMBER() OVER (PARTITION BY category
+                                  ORDER BY concept, property, period,
+                                           source_system) AS rn,
+               COUNT(*) OVER (PARTITION BY category) AS total
+        FROM joined
+    )
+    SELECT category, total, concept, property,
+           NULLIF(period, '') AS period, source_system,
+           base_count, compare_count, base_value, compare_value
+    FROM ranked
+    WHERE (category != 'unchanged' AND rn <= %s)
+       OR (category = 'unchanged' AND rn = 1)
+    ORDER BY category, rn
+"""
+
 
 class TripleStore:
 
@@ -44,46 +751,31 @@ class TripleStore:
         f"FROM STDIN WITH (FORMAT text)"
     )
 
-    @staticmethod
-    def _copy_escape(val) -> str:
-        """Escape a value for PostgreSQL COPY TEXT format."""
-        if val is None:
-            return "\\N"
-        s = str(val)
-        s = s.replace("\\", "\\\\")
-        s = s.replace("\t", "\\t")
-        s = s.replace("\n", "\\n")
-        s = s.replace("\r", "\\r")
-        return s
-
-    def insert_triples(self, triples: list[dict]) -> int:
-        """Batch insert triples using COPY for maximum throughput."""
-        if not triples:
-            return 0
+    def _copy_stream(self, triples: Iterable[dict]) -> _CopyRowStream:
+        """Shared COPY encoder for every semantic_triples write path."""
+        return _CopyRowStream(triples, self._COPY_COLS, self._JSON_COPY_COLS)
 
-        escape = self._copy_escape
-        cols = self._COPY_COLS
-        json_cols = self._JSON_COPY_COLS
-        buf = io.StringIO()
-        for t in triples:
-            row_vals = []
-            for c in cols:
-                if c in json_cols:
-                    v = t.get(c)
-                    # NULL stays NULL (\N); a present value is JSON-serialized.
-                    row_vals.append(escape(json.dumps(v) if v is not None else None))
-                else:
-                    row_vals.append(escape(t.get(c)))
-            buf.write("\t".join(row_vals))
-            buf.write("\n")
-        buf.seek(0)
+    def insert_triples(self, triples: Iterable[dict]) -> int:
+        """Batch insert triples using COPY for maximum throughput.
+
+        Rows are encoded block-by-block as COPY consumes them (see
+        _CopyRowStream), so `triples` may also be a generator — the return
+        value is the number of rows the stream actually wrote.
+        """
+        if isinstance(triples, list) and not triples:
+            return 0
 
+        stream = self._copy_stream(triples)
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(f"SET LOCAL statement_timeout = {int(INGEST_STATEMENT_TIMEOUT_MS)}")
-                cur.copy_expert(self._COPY_SQL, buf)
+                cur.copy_expert(self._COPY_SQL, stream, size=INGEST_COPY_BLOCK_CHARS)
+                _register_copied(cur, stream.run_stats)
+                _credit_rollups(cur, stream.rollups)
+                _credit_group_digests(cur, stream.run_stats)
                 conn.commit()
-                return len(triples)
+        _invalidate_written(stream.run_stats)
+        return stream.rows_written
 
     def replace_tenant_triples(self, tenant_id: str, triples: list[dict]) -> int:
         """Atomically supersede prior live triples, then COPY-insert new batch.
@@ -115,56 +807,247 @@ class TripleStore:
 
         entity_ids = sorted({t["entity_id"] for t in triples if t.get("entity_id")})
 
-        escape = self._copy_escape
-        cols = self._COPY_COLS
-        json_cols = self._JSON_COPY_COLS
-        buf = io.StringIO()
-        for t in triples:
-            row_vals = []
-            for c in cols:
-                if c in json_cols:
-                    v = t.get(c)
-                    row_vals.append(escape(json.dumps(v) if v is not None else None))
-                else:
-                    row_vals.append(escape(t.get(c)))
-            buf.write("\t".join(row_vals))
-            buf.write("\n")
-        buf.seek(0)
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    f"SET LOCAL statement_timeout = {int(INGEST_STATEMENT_TIMEOUT_MS)}"
+                )
+                self._supersede_for_replace(cur, tenant_id, run_id, entity_ids)
+                stream = self._copy_stream(triples)
+                cur.copy_expert(self._COPY_SQL, stream, size=INGEST_COPY_BLOCK_CHARS)
+                _register_copied(cur, stream.run_stats)
+                _credit_rollups(cur, stream.rollups)
+                _credit_group_digests(cur, stream.run_stats)
+                conn.commit()
+        read_cache.invalidate(tenant_id)
+        return stream.rows_written
+
+    @staticmethod
+    def _supersede_for_replace(
+        cur, tenant_id: str, run_id: str, entity_ids: list[str], deltas: dict | None = None,
+    ) -> None:
+        """Same-run redelivery scrub + supersession of the entities' live rows.
 
+        Runs on the caller's cursor so it shares the COPY's transaction.
+        `deltas` defers the registry debits (see supersede_triples_tx).
+        """
         ent_clause = ""
         ent_params: list = []
         if entity_ids:
             placeholders = ", ".join(["%s"] * len(entity_ids))
             ent_clause = f" AND entity_id IN ({placeholders})"
-            ent_params = entity_ids
+            ent_params = list(entity_ids)
+
+        scrubbed = delete_triples_tx(
+            cur, f"tenant_id = %s AND run_id = %s{ent_clause}",
+            [tenant_id, run_id] + ent_params, deltas,
+        )
+        superseded = supersede_triples_tx(
+            cur, f"tenant_id = %s{ent_clause}", [tenant_id] + ent_params, deltas,
+        )
+        logger.info(
+            "[replace_tenant_triples] Superseded %d live triples "
+            "(+%d same-run redelivery rows scrubbed) for "
+            "tenant_id=%s, entity_ids=%s",
+            superseded, scrubbed, tenant_id, entity_ids or "(all)",
+        )
 
+    def stream_triples(
+        self,
+        tenant_id: str,
+        run_id: str,
+        entity_id: str,
+        triples: Iterable[dict],
+        *,
+        replace: bool = False,
+    ) -> int:
+        """One-transaction COPY from a lazy row source (NDJSON streaming ingest).
+
+        The stream is one run for one entity, so the replace scope is known
+        before the first row arrives: with replace=True the same scrub +
+        supersession as replace_tenant_triples runs first, in the same
+        transaction. Rows are pulled from `triples` only as COPY consumes
+        them; an exception raised by the source aborts the COPY and rolls
+        the whole stream back. Returns the number of rows written.
+        """
+        if not tenant_id:
+            raise ValueError("stream_triples requires tenant_id")
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(
                     f"SET LOCAL statement_timeout = {int(INGEST_STATEMENT_TIMEOUT_MS)}"
                 )
+                if replace:
+                    self._supersede_for_replace(cur, tenant_id, run_id, [entity_id])
+                stream = self._copy_stream(triples)
+                cur.copy_expert(self._COPY_SQL, stream, size=INGEST_COPY_BLOCK_CHARS)
+                _register_copied(cur, stream.run_stats)
+                _credit_rollups(cur, stream.rollups)
+                _credit_group_digests(cur, stream.run_stats)
+                conn.commit()
+        read_cache.invalidate(tenant_id)
+        return stream.rows_written
+
+    def write_entity_shards(
+        self,
+        tenant_id: str,
+        triples: list[dict],
+        *,
+        replace: bool = False,
+        workers: int = INGEST_SHARD_WORKERS,
+    ) -> int:
+        """Write one multi-entity run as concurrent per-entity shards, atomically.
+
+        Opt-in alternative to replace_tenant_triples / insert_triples
+        (DCL_INGEST_SHARD_WRITES). Entities are packed into at most `workers`
+        shards balanced by row count; each shard runs its scrub + supersession
+        (replace=True) and COPY on its own pooled connection as a PREPARED
+        transaction, all shards at once. Two-phase commit keeps the batch
+        atomic:
+          1. every shard prepares — any failure rolls all of them back;
+          2. one coordinator transaction applies the ingest_runs deltas the
+             shards deferred and records the decision in
+             ingest_shard_decisions (migration 032) — its commit is the
+             commit point;
+          3. the prepared shards are committed.
+        A crash between 2 and 3 leaves prepared branches that
+        recover_shard_transactions() commits (decision recorded) or rolls back
+        (not recorded). A single-entity batch takes the ordinary
+        one-transaction path. Returns the number of rows written.
+        """
+        if not tenant_id:
+            raise ValueError("write_entity_shards requires tenant_id")
+        if not triples:
+            return 0
+
+        run_ids = {str(t["run_id"]) for t in triples if t.get("run_id")}
+        if len(run_ids) != 1:
+            raise ValueError(
+                f"write_entity_shards requires exactly one run_id across "
+                f"the batch; got {sorted(run_ids) or '(none)'}"
+            )
+        run_id = run_ids.pop()
+
+        by_entity: dict[str, list[dict]] = {}
+        for t in triples:
+            by_entity.setdefault(t.get("entity_id") or "", []).append(t)
+        n_shards = min(max(workers, 1), len(by_entity))
+        if n_shards <= 1:
+            if replace:
+                return self.replace_tenant_triples(tenant_id, triples)
+            return self.insert_triples(triples)
+
+        # Largest entity first onto the lightest shard.
+        shards: list[list[str]] = [[] for _ in range(n_shards)]
+        loads = [0] * n_shards
+        for eid in sorted(by_entity, key=lambda e: -len(by_entity[e])):
+            i = loads.index(min(loads))
+            shards[i].append(eid)
+            loads[i] += len(by_entity[eid])
+
+        recover_shard_transactions()
+
+        group_id = f"{_SHARD_GID_PREFIX}{run_id}:{uuid.uuid4().hex[:12]}"
+        gids = [f"{group_id}:{i}/{n_shards}" for i in range(n_shards)]
+
+        def write_shard(conn, gid: str, entity_ids: list[str]):
+            deltas: dict = {}
+            conn.tpc_begin(gid)
+            with conn.cursor() as cur:
                 cur.execute(
-                    f"DELETE FROM semantic_triples "
-                    f"WHERE tenant_id = %s AND run_id = %s{ent_clause}",
-                    [tenant_id, run_id] + ent_params,
-                )
-                scrubbed = cur.rowcount
-                cur.execute(
-                    f"UPDATE semantic_triples "
-                    f"SET superseded_at = now(), updated_at = now() "
-                    f"WHERE tenant_id = %s AND is_active = true{ent_clause}",
-                    [tenant_id] + ent_params,
-                )
-                superseded = cur.rowcount
-                logger.info(
-                    "[replace_tenant_triples] Superseded %d live triples "
-                    "(+%d same-run redelivery rows scrubbed) for "
-                    "tenant_id=%s, entity_ids=%s",
-                    superseded, scrubbed, tenant_id, entity_ids or "(all)",
+                    f"SET LOCAL statement_timeout = {int(INGEST_STATEMENT_TIMEOUT_MS)}"
                 )
-                cur.copy_expert(self._COPY_SQL, buf)
-                conn.commit()
-                return len(triples)
+                scope = [e for e in entity_ids if e]
+                if replace and scope:
+                    self._supersede_for_replace(cur, tenant_id, run_id, scope, deltas)
+                stream = self._copy_stream(t for e in entity_ids for t in by_entity[e])
+                cur.copy_expert(self._COPY_SQL, stream, size=INGEST_COPY_BLOCK_CHARS)
+                _credit_rollups(cur, stream.rollups)
+                _credit_group_digests(cur, stream.run_stats)
+            conn.tpc_prepare()
+            return stream, deltas
+
+        with ExitStack() as stack:
+            conns = [stack.enter_context(get_connection()) for _ in range(n_shards + 1)]
+            coordinator = conns.pop()
+
+            # Phase 1 — prepare every shard concurrently.
+            with ThreadPoolExecutor(max_workers=n_shards, thread_name_prefix="ingest-shard") as ex:
+                futures = [
+                    ex.submit(write_shard, conn, gid, entity_ids)
+                    for conn, gid, entity_ids in zip(conns, gids, shards)
+                ]
+                outcomes = []
+                for f in futures:
+                    try:
+                        outcomes.append(f.result())
+                    except Exception as e:
+                        outcomes.append(e)
+            errors = [o for o in outcomes if isinstance(o, Exception)]
+            if errors:
+                _rollback_shards(conns, gids)
+                if "prepared transactions are disabled" in str(errors[0]):
+                    raise RuntimeError(
+                        "Sharded ingest writes need max_prepared_transactions >= "
+                        f"DCL_INGEST_SHARD_WORKERS ({n_shards}) on the server — it is 0. "
+                        "Raise it or unset DCL_INGEST_SHARD_WRITES."
+                    ) from errors[0]
+                raise errors[0]
+
+            run_stats: dict[tuple, list] = {}
+            deltas: dict = {}
+            written = 0
+            for stream, shard_deltas in outcomes:
+                written += stream.rows_written
+                for key, (n, entity_ids) in stream.run_stats.items():
+                    stat = run_stats.setdefault(key, [0, set()])
+                    stat[0] += n
+                    stat[1] |= entity_ids
+                for rid, (d_triples, d_live) in shard_deltas.items():
+                    d = deltas.setdefault(rid, [0, 0])
+                    d[0] += d_triples
+                    d[1] += d_live
+
+            # Phase 2 — the coordinator commit is the decision.
+            try:
+                with coordinator.cursor() as cur:
+                    cur.execute(
+                        f"SET LOCAL statement_timeout = {int(INGEST_STATEMENT_TIMEOUT_MS)}"
+                    )
+                    cur.execute(
+                        "INSERT INTO ingest_shard_decisions "
+                        "(group_id, dcl_ingest_id, tenant_id, shard_count) "
+                        "VALUES (%s, %s, %s, %s)",
+                        (group_id, run_id, tenant_id, n_shards),
+                    )
+                    _apply_run_deltas(cur, deltas)
+                    _register_copied(cur, run_stats)
+                coordinator.commit()
+            except Exception:
+                coordinator.rollback()
+                _rollback_shards(conns, gids)
+                raise
+
+            for conn, gid in zip(conns, gids):
+                try:
+                    conn.tpc_commit()
+                except Exception as e:
+                    # Decision is durable — recover_shard_transactions()
+                    # commits this branch once it ages past the threshold.
+                    logger.error(
+                        "[write_entity_shards] COMMIT PREPARED failed for %s: %s — "
+                        "left for recover_shard_transactions()", gid, e,
+                    )
+            with coordinator.cursor() as cur:
+                _touch_run(cur, run_id)
+            coordinator.commit()
+
+        read_cache.invalidate(tenant_id)
+        logger.info(
+            "[write_entity_shards] run_id=%s: %d rows across %d entities in %d shards",
+            run_id, written, len(by_entity), n_shards,
+        )
+        return written
 
     def get_triples(
         self,
@@ -175,6 +1058,28 @@ class TripleStore:
         active_only: bool = True,
     ) -> list[dict]:
         """Query by concept with optional filters."""
+        sql, params = self._triples_sql(tenant_id, concept, entity_id, period, active_only)
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(sql, params)
+                columns = [desc[0] for desc in cur.description]
+                return [dict(zip(columns, row)) for row in cur.fetchall()]
+
+    def iter_triples(
+        self,
+        tenant_id: str,
+        concept: str,
+        entity_id: str | None = None,
+        period: str | None = None,
+        active_only: bool = True,
+    ) -> Iterator[dict]:
+        """get_triples as a generator over a server-side cursor — rows arrive
+        STREAM_ITERSIZE at a time instead of one fetchall()."""
+        sql, params = self._triples_sql(tenant_id, concept, entity_id, period, active_only)
+        return stream_rows(sql, params)
+
+    @staticmethod
+    def _triples_sql(tenant_id, concept, entity_id, period, active_only) -> tuple[str, list]:
         clauses = ["tenant_id = %s", "concept = %s"]
         params: list = [tenant_id, concept]
 
@@ -209,22 +1114,22 @@ class TripleStore:
         table = "semantic_triples_current" if active_only else "semantic_triples"
         where = " AND ".join(clauses)
         sql = f"SELECT * FROM {table} WHERE {where} ORDER BY created_at"
+        return sql, params
 
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(sql, params)
-                columns = [desc[0] for desc in cur.description]
-                return [dict(zip(columns, row)) for row in cur.fetchall()]
+    _BY_RUN_SQL = "SELECT * FROM semantic_triples WHERE run_id = %s ORDER BY created_at"
 
     def get_triples_by_run(self, run_id: str) -> list[dict]:
         """All triples from a run."""
-        sql = "SELECT * FROM semantic_triples WHERE run_id = %s ORDER BY created_at"
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, (run_id,))
+                cur.execute(self._BY_RUN_SQL, (run_id,))
                 columns = [desc[0] for desc in cur.description]
                 return [dict(zip(columns, row)) for row in cur.fetchall()]
 
+    def iter_triples_by_run(self, run_id: str) -> Iterator[dict]:
+        """All triples from a run, streamed from a server-side cursor."""
+        return stream_rows(self._BY_RUN_SQL, (run_id,))
+
     def deactivate_entity_triples(self, entity_ids: list[str], tenant_id: str = "") -> int:
         """Deactivate all active triples for given entity_ids within a tenant.
 
@@ -243,17 +1148,15 @@ class TripleStore:
                 "cross-tenant data corruption."
             )
         placeholders = ", ".join(["%s"] * len(entity_ids))
-        sql = (
-            "UPDATE semantic_triples SET superseded_at = now(), updated_at = now() "
-            f"WHERE is_active = true AND tenant_id = %s AND entity_id IN ({placeholders})"
-        )
+        where = f"tenant_id = %s AND entity_id IN ({placeholders})"
         params = [tenant_id] + entity_ids
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(f"SET LOCAL statement_timeout = {int(INGEST_STATEMENT_TIMEOUT_MS)}")
-                cur.execute(sql, params)
+                n = supersede_triples_tx(cur, where, params)
                 conn.commit()
-                return cur.rowcount
+        read_cache.invalidate(tenant_id)
+        return n
 
     def deactivate_tenant_triples(self, tenant_id: str) -> int:
         """Deactivate all active triples for a tenant.
@@ -263,16 +1166,13 @@ class TripleStore:
         """
         if not tenant_id:
             raise ValueError("deactivate_tenant_triples requires tenant_id.")
-        sql = (
-            "UPDATE semantic_triples SET superseded_at = now(), updated_at = now() "
-            "WHERE is_active = true AND tenant_id = %s"
-        )
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(f"SET LOCAL statement_timeout = {int(INGEST_STATEMENT_TIMEOUT_MS)}")
-                cur.execute(sql, (tenant_id,))
+                n = supersede_triples_tx(cur, "tenant_id = %s", (tenant_id,))
                 conn.commit()
-                return cur.rowcount
+        read_cache.invalidate(tenant_id)
+        return n
 
     def delete_inactive(self) -> int:
         """Hard-delete all superseded triples across all tenants.
@@ -282,26 +1182,56 @@ class TripleStore:
         operator runs this deliberately to reclaim space, destroying as-of
         history older than the live set.
         """
-        sql = "DELETE FROM semantic_triples WHERE is_active = false"
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql)
+                n = delete_triples_tx(cur, "is_active = false", ())
+                conn.commit()
+        read_cache.invalidate()
+        return n
+
+    def ensure_history_partitions(self, months_ahead: int = 3) -> int:
+        """Create the monthly history-tier partitions through `months_ahead`
+        months from now (migration 033). Superseded rows for a month with no
+        partition land in semantic_triples_history_default; creating that
+        month's partition later fails while the default holds rows for it,
+        so this runs ahead of time (ingest worker maintenance tick). Returns
+        the number of partitions created; 0 on an unpartitioned store."""
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT semantic_triples_ensure_history_partitions(now(), %s)",
+                    (months_ahead,),
+                )
+                created = cur.fetchone()[0]
+                conn.commit()
+        if created:
+            logger.info("[triple_store] created %d history partition(s)", created)
+        return created
+
+    def prune_rollups(self) -> int:
+        """Delete triple_rollups groups debited to zero live triples (a
+        superseded run's groups) and run_group_digests groups debited to zero
+        rows (deleted by retention). Readers already skip them; this keeps
+        the tables O(live groups). Returns the number of rows removed."""
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM triple_rollups WHERE live_count <= 0")
+                n = cur.rowcount
+                cur.execute("DELETE FROM run_group_digests WHERE row_count <= 0")
+                n += cur.rowcount
                 conn.commit()
-                return cur.rowcount
+        return n
 
     def deactivate_run(self, run_id: str) -> int:
         """Supersede all live triples in a run (closes their knowledge window).
         Returns count affected. Rows remain queryable via as-of reads."""
-        sql = (
-            "UPDATE semantic_triples SET superseded_at = now(), updated_at = now() "
-            "WHERE run_id = %s AND is_active = true"
-        )
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(f"SET LOCAL statement_timeout = {int(INGEST_STATEMENT_TIMEOUT_MS)}")
-                cur.execute(sql, (run_id,))
+                n = supersede_triples_tx(cur, "run_id = %s", (run_id,))
                 conn.commit()
-                return cur.rowcount
+        read_cache.invalidate()
+        return n
 
     def upsert_tenant_run(
         self, tenant_id: str, new_run_id: str,
@@ -338,7 +1268,8 @@ class TripleStore:
                 cur.execute(sql, (tenant_id, entity_id, new_run_id, snapshot_name))
                 row = cur.fetchone()
                 conn.commit()
-                return str(row[0]) if row and row[0] else None
+        read_cache.invalidate(tenant_id)
+        return str(row[0]) if row and row[0] else None
 
     def swap_and_deactivate(
         self, tenant_id: str, new_run_id: str,
@@ -350,7 +1281,9 @@ class TripleStore:
         Entity-scoped: each (tenant_id, entity_id) pair has its own pointer.
         Pushing entity B does not deactivate entity A's triples.
 
-        Single transaction: if either statement fails, both roll back.
+        Single transaction: if either statement fails, both roll back. The
+        supersession debits the displaced run's ingest_runs and
+        triple_rollups rows in the same statement.
         Returns (previous_run_id, deactivated_count).
         """
         upsert_sql = """
@@ -373,10 +1306,6 @@ class TripleStore:
                   updated_at            = now()
             RETURNING previous_run_id
         """
-        deactivate_sql = (
-            "UPDATE semantic_triples SET superseded_at = now(), updated_at = now() "
-            "WHERE run_id = %s AND is_active = true"
-        )
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(f"SET LOCAL statement_timeout = {int(INGEST_STATEMENT_TIMEOUT_MS)}")
@@ -385,9 +1314,11 @@ class TripleStore:
                 previous_run_id = str(row[0]) if row and row[0] else None
                 deactivated = 0
                 if previous_run_id and previous_run_id != new_run_id:
-                    cur.execute(deactivate_sql, (previous_run_id,))
-                    deactivated = cur.rowcount
+                    deactivated = supersede_triples_tx(
+                        cur, "run_id = %s", (previous_run_id,),
+                    )
                 conn.commit()
+        read_cache.invalidate(tenant_id)
         return previous_run_id, deactivated
 
     def resolve_single_tenant(self) -> str:
@@ -683,17 +1614,16 @@ class TripleStore:
     def purge_old_runs(self, tenant_id: str, keep_runs: int = 2) -> int:
         """Hard-delete triples from old runs, keeping the N most recent run_ids.
 
-        Finds runs ordered by first-triple created_at DESC, skips the first
-        keep_runs, deletes the rest. Current run is always among the kept runs
+        Finds runs in the ingest_runs registry ordered by first write DESC,
+        skips the first keep_runs, deletes the rest. Current run is always among the kept runs
         (it's the most recent by definition).
         """
         if keep_runs < 1:
             raise ValueError("keep_runs must be >= 1")
         sql_find = """
-            SELECT run_id FROM semantic_triples
-            WHERE tenant_id = %s
-            GROUP BY run_id
-            ORDER BY MIN(created_at) DESC
+            SELECT dcl_ingest_id FROM ingest_runs
+            WHERE tenant_id = %s AND triple_count > 0
+            ORDER BY first_write_at DESC
             OFFSET %s
         """
         with get_connection() as conn:
@@ -703,21 +1633,22 @@ class TripleStore:
                 if not old_run_ids:
                     return 0
                 placeholders = ", ".join(["%s"] * len(old_run_ids))
-                sql_delete = (
-                    f"DELETE FROM semantic_triples "
-                    f"WHERE tenant_id = %s AND run_id IN ({placeholders})"
+                n = delete_triples_tx(
+                    cur, f"tenant_id = %s AND run_id IN ({placeholders})",
+                    [tenant_id] + old_run_ids,
                 )
-                cur.execute(sql_delete, [tenant_id] + old_run_ids)
                 conn.commit()
-                return cur.rowcount
+        read_cache.invalidate(tenant_id)
+        return n
 
     def count_by_domain(self, tenant_id: str | None, run_id: str | None = None, entity_id: str | None = None) -> dict:
-        """Count triples grouped by root concept domain (first segment before dot)."""
-        clauses = []
+        """Count live triples grouped by root concept domain (first segment
+        before dot) — a sum over triple_rollups groups (migration 034)."""
+        clauses = ["live_count > 0"]
         params: list = []
         if run_id is not None:
             # Explicit run_id (e.g. ingest confirmation summary) — use directly
-            clauses.append("run_id = %s")
+            clauses.append("dcl_ingest_id = %s")
             params.append(run_id)
             if tenant_id is not None:
                 clauses.append("tenant_id = %s")
@@ -726,52 +1657,61 @@ class TripleStore:
             # Tenant-scoped: all active entity runs for tenant
             clauses.append("tenant_id = %s")
             clauses.append(
-                "run_id IN (SELECT current_run_id FROM tenant_runs WHERE tenant_id = %s)"
+                "dcl_ingest_id IN (SELECT current_run_id FROM tenant_runs WHERE tenant_id = %s)"
             )
             params.extend([tenant_id, tenant_id])
-        else:
-            # Global aggregation — no tenant context, fall back to is_active
-            clauses.append("is_active = true")
+        # else: global aggregation — every rollup row is a live group
         if entity_id is not None:
             clauses.append("entity_id = %s")
             params.append(entity_id)
 
         where = " AND ".join(clauses)
         sql = (
-            f"SELECT split_part(concept, '.', 1) AS domain, COUNT(*) AS cnt "
-            f"FROM semantic_triples WHERE {where} "
+            f"SELECT domain, SUM(live_count)::bigint AS cnt "
+            f"FROM triple_rollups WHERE {where} "
             f"GROUP BY domain ORDER BY domain"
         )
 
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, params)
+                execute_prepared(cur, sql, params)
                 return {row[0]: row[1] for row in cur.fetchall()}
 
+    # Registry projection shared by get_run_info / list_runs: the same
+    # columns the old GROUP BY over semantic_triples produced. is_active keeps
+    # its bool_and(is_active) meaning — every stored row is live.
+    _RUN_INFO_COLS = (
+        "dcl_ingest_id AS run_id, tenant_id, triple_count, "
+        "first_write_at AS created_at, (live_count = triple_count) AS is_active, "
+        "entity_ids, live_count, state, last_write_at"
+    )
+
     def count_by_run(self, run_id: str) -> int:
-        """Count triples for a given run_id."""
-        sql = "SELECT COUNT(*) FROM semantic_triples WHERE run_id = %s"
+        """Count triples for a given run_id (ingest_runs registry read)."""
+        sql = "SELECT triple_count FROM ingest_runs WHERE dcl_ingest_id = %s"
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(sql, (run_id,))
-                return cur.fetchone()[0]
+                row = cur.fetchone()
+                return max(row[0], 0) if row else 0
 
     def run_exists(self, run_id: str) -> bool:
-        """Check if any triples exist for a run_id."""
-        sql = "SELECT EXISTS(SELECT 1 FROM semantic_triples WHERE run_id = %s)"
+        """Check if any triples exist for a run_id — primary-key probe of the
+        ingest_runs registry (a purged run has a row with triple_count 0)."""
+        sql = (
+            "SELECT EXISTS(SELECT 1 FROM ingest_runs "
+            "WHERE dcl_ingest_id = %s AND triple_count > 0)"
+        )
         with get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(sql, (run_id,))
                 return cur.fetchone()[0]
 
     def get_run_info(self, run_id: str) -> dict | None:
-        """Get summary info for a run."""
+        """Get summary info for a run (ingest_runs registry read)."""
         sql = (
-            "SELECT run_id, COUNT(*) as triple_count, "
-            "MIN(created_at) as created_at, "
-            "bool_and(is_active) as is_active "
-            "FROM semantic_triples WHERE run_id = %s "
-            "GROUP BY run_id"
+            f"SELECT {self._RUN_INFO_COLS} FROM ingest_runs "
+            f"WHERE dcl_ingest_id = %s AND triple_count > 0"
         )
         with get_connection() as conn:
             with conn.cursor() as cur:
@@ -783,23 +1723,18 @@ class TripleStore:
                 return dict(zip(columns, row))
 
     def list_runs(self, tenant_id: str | None = None) -> list[dict]:
-        """List all runs, most recent first."""
+        """List all runs, most recent first (ingest_runs registry read)."""
         if tenant_id:
             sql = (
-                "SELECT run_id, tenant_id, COUNT(*) as triple_count, "
-                "MIN(created_at) as created_at, "
-                "bool_and(is_active) as is_active "
-                "FROM semantic_triples WHERE tenant_id = %s "
-                "GROUP BY run_id, tenant_id ORDER BY MIN(created_at) DESC"
+                f"SELECT {self._RUN_INFO_COLS} FROM ingest_runs "
+                f"WHERE tenant_id = %s AND triple_count > 0 "
+                f"ORDER BY first_write_at DESC"
             )
             params = (tenant_id,)
         else:
             sql = (
-                "SELECT run_id, tenant_id, COUNT(*) as triple_count, "
-                "MIN(created_at) as created_at, "
-                "bool_and(is_active) as is_active "
-                "FROM semantic_triples "
-                "GROUP BY run_id, tenant_id ORDER BY MIN(created_at) DESC"
+                f"SELECT {self._RUN_INFO_COLS} FROM ingest_runs "
+                f"WHERE triple_count > 0 ORDER BY first_write_at DESC"
             )
             params = ()
 
@@ -873,25 +1808,22 @@ class TripleStore:
         Returns:
             dict keyed by persona, each with data_sources, domains, triple_count, domain_list.
         """
-        # One pass over the live triple set: per-domain triple_count plus the
-        # distinct set of source systems. Joining tenant_runs keeps it to
-        # current runs; is_active = true is the liveness invariant — it drives
-        # the query off idx_triples_active and excludes deactivated runs.
-        # Returning the per-domain source SET (not a count) lets per-persona
-        # data_sources be unioned in Python, so this stays one query no matter
-        # how many personas the config defines — previously it was one extra
-        # full COUNT(DISTINCT) scan per persona (the N+1 that made this ~19s
-        # on the prod-scale triple store).
+        # One pass over the live rollup groups of current runs (migration
+        # 034): per-domain triple_count plus the distinct set of source
+        # systems. Returning the per-domain source SET (not a count) lets
+        # per-persona data_sources be unioned in Python, so this stays one
+        # query no matter how many personas the config defines — previously
+        # it was one extra full COUNT(DISTINCT) scan per persona (the N+1
+        # that made this ~19s on the prod-scale triple store), and until the
+        # rollups one full scan of the live triples.
         sql = (
-            "SELECT split_part(st.concept, '.', 1) AS domain, "
-            "array_agg(DISTINCT st.source_system) "
-            "  FILTER (WHERE st.source_system IS NOT NULL) AS sources, "
-            "COUNT(*) AS triple_count "
-            "FROM semantic_triples st "
-            "JOIN tenant_runs tr "
-            "  ON tr.tenant_id = st.tenant_id AND tr.current_run_id = st.run_id "
-            "WHERE st.is_active = true "
-            "GROUP BY domain"
+            "SELECT r.domain, array_agg(DISTINCT r.source_system) AS sources, "
+            "SUM(r.live_count)::bigint AS triple_count "
+            "FROM triple_rollups r "
+            "WHERE r.live_count > 0 "
+            "  AND (r.tenant_id, r.dcl_ingest_id) IN "
+            "      (SELECT tenant_id, current_run_id FROM tenant_runs) "
+            "GROUP BY r.domain"
         )
         domain_stats: dict[str, dict] = {}
         with get_connection() as conn:
@@ -925,8 +1857,9 @@ class TripleStore:
         """Aggregate triples for Sankey visualization, scoped to a tenant.
 
         Returns rows of {fabric_plane, fabric_product, source_system, domain,
-        entity_id, triple_count} grouped by fabric × source × domain × entity.
-        When entity_id is provided, only that entity's triples are aggregated.
+        entity_id, triple_count} grouped by fabric × source × domain × entity,
+        summed from the current runs' triple_rollups groups. When entity_id
+        is provided, only that entity's triples are aggregated.
         """
         sub = "SELECT current_run_id FROM tenant_runs WHERE tenant_id = %s"
         params: list = [tenant_id, tenant_id]
@@ -934,15 +1867,12 @@ class TripleStore:
             sub += " AND entity_id = %s"
             params.append(entity_id)
         sql = (
-            "SELECT COALESCE(fabric_plane, 'unattributed') AS fabric_plane, "
-            "COALESCE(fabric_product, 'unknown') AS fabric_product, "
-            "source_system, split_part(concept, '.', 1) AS domain, "
-            "entity_id, COUNT(*) AS triple_count "
-            "FROM semantic_triples "
-            f"WHERE tenant_id = %s AND run_id IN ({sub}) "
-            "GROUP BY COALESCE(fabric_plane, 'unattributed'), "
-            "COALESCE(fabric_product, 'unknown'), "
-            "source_system, split_part(concept, '.', 1), entity_id "
+            "SELECT COALESCE(NULLIF(fabric_plane, ''), 'unattributed') AS fabric_plane, "
+            "COALESCE(NULLIF(fabric_product, ''), 'unknown') AS fabric_product, "
+            "source_system, domain, entity_id, SUM(live_count)::bigint AS triple_count "
+            "FROM triple_rollups "
+            f"WHERE tenant_id = %s AND dcl_ingest_id IN ({sub}) AND live_count > 0 "
+            "GROUP BY 1, 2, source_system, domain, entity_id "
             "ORDER BY triple_count DESC"
         )
         with get_connection() as conn:
@@ -1051,124 +1981,151 @@ class TripleStore:
         source collisions; per-record ledger rows), so each side aggregates to
         row count + an order-independent digest of the value multiset, and the
         join can never fan out. Categories: added / removed / changed
-        (count or value-set differs). Single bounded SQL — both runs reach
-        their rows via idx_triples_run; per-category samples capped at
-        `limit`, totals always exact (dcl_deferred_work.md#56 discipline).
+        (count or value-set differs). When both runs carry group digests
+        (ingest_runs.group_digests, migration 036) the join reads two
+        run_group_digests primary-key ranges and semantic_triples is touched
+        only for the single-row values of the sampled groups; otherwise both
+        runs' triples are aggregated on the fly via idx_triples_run. Per-
+        category samples capped at `limit`, totals always exact
+        (dcl_deferred_work.md#56 discipline).
 
         Returns {counts: {added, removed, changed, unchanged}, samples:
         {added: [...], removed: [...], changed: [...]}, truncated: {...}}.
         """
         safe_limit = max(1, min(int(limit), 1000))
-        sql = """
-            WITH base AS (
-                SELECT concept, property, COALESCE(period, '') AS period,
-                       source_system,
-                       COUNT(*) AS cnt,
-                       md5(string_agg(value::text, '|' ORDER BY value::text)) AS digest,
-                       MIN(value::text) AS single_value
-                FROM semantic_triples
-                WHERE tenant_id = %s AND entity_id = %s AND run_id = %s
-                GROUP BY concept, property, COALESCE(period, ''), source_system
-            ),
-            cmp AS (
-                SELECT concept, property, COALESCE(period, '') AS period,
-                       source_system,
-                       COUNT(*) AS cnt,
-                       md5(string_agg(value::text, '|' ORDER BY value::text)) AS digest,
-                       MIN(value::text) AS single_value
-                FROM semantic_triples
-                WHERE tenant_id = %s AND entity_id = %s AND run_id = %s
-                GROUP BY concept, property, COALESCE(period, ''), source_system
-            ),
-            joined AS (
-                SELECT
-                    COALESCE(b.concept, c.concept)             AS concept,
-                    COALESCE(b.property, c.property)           AS property,
-                    COALESCE(b.period, c.period)               AS period,
-                    COALESCE(b.source_system, c.source_system) AS source_system,
-                    b.cnt AS base_count, c.cnt AS compare_count,
-                    b.single_value AS base_value, c.single_value AS compare_value,
-                    CASE
-                        WHEN b.concept IS NULL THEN 'added'
-                        WHEN c.concept IS NULL THEN 'removed'
-                        WHEN b.cnt != c.cnt OR b.digest != c.digest THEN 'changed'
-                        ELSE 'unchanged'
-                    END AS category
-                FROM base b
-                FULL OUTER JOIN cmp c
-                  USING (concept, property, period, source_system)
-            ),
-            ranked AS (
-                SELECT *,
-                       ROW_NUMBER() OVER (PARTITION BY category
-                                          ORDER BY concept, property, period,
-                                                   source_system) AS rn,
-                       COUNT(*) OVER (PARTITION BY category) AS total
-                FROM joined
-            )
-            SELECT category, total, concept, property,
-                   NULLIF(period, '') AS period, source_system,
-                   base_count, compare_count, base_value, compare_value
-            FROM ranked
-            WHERE (category != 'unchanged' AND rn <= %s)
-               OR (category = 'unchanged' AND rn = 1)
-            ORDER BY category, rn
-        """
-        params = [tenant_id, entity_id, base_run_id,
-                  tenant_id, entity_id, compare_run_id, safe_limit]
+        run_ids = sorted({str(base_run_id), str(compare_run_id)})
         counts = {"added": 0, "removed": 0, "changed": 0, "unchanged": 0}
         samples: dict[str, list[dict]] = {"added": [], "removed": [], "changed": []}
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, params)
-                for (category, total, concept, prop, period, source_system,
-                     base_count, compare_count, base_value, compare_value) in cur.fetchall():
-                    counts[category] = total
-                    if category == "unchanged":
-                        continue
-                    entry = {
-                        "concept": concept,
-                        "property": prop,
-                        "period": period,
-                        "source_system": source_system,
-                    }
-                    if category == "changed":
-                        entry["base_count"] = base_count
-                        entry["compare_count"] = compare_count
-                        # Scalar values shown only when unambiguous (one row
-                        # per side); multi-row groups differ by digest/count.
-                        if base_count == 1 and compare_count == 1:
-                            entry["base_value"] = base_value
-                            entry["compare_value"] = compare_value
-                    elif category == "added":
-                        entry["count"] = compare_count
-                        if compare_count == 1:
-                            entry["value"] = compare_value
-                    else:
-                        entry["count"] = base_count
-                        if base_count == 1:
-                            entry["value"] = base_value
-                    samples[category].append(entry)
+                cur.execute(
+                    "SELECT COUNT(*) FROM ingest_runs WHERE tenant_id = %s "
+                    "AND dcl_ingest_id = ANY(%s::uuid[]) AND group_digests",
+                    [tenant_id, run_ids],
+                )
+                digested = cur.fetchone()[0] == len(run_ids)
+                group_sql = _DIFF_DIGEST_GROUPS if digested else _DIFF_SCAN_GROUPS
+                cur.execute(
+                    f"WITH base AS ({group_sql}), cmp AS ({group_sql}) {_DIFF_JOIN}",
+                    [tenant_id, entity_id, base_run_id,
+                     tenant_id, entity_id, compare_run_id, safe_limit],
+                )
+                rows = cur.fetchall()
+                if digested:
+                    rows = self._fill_diff_values(
+                        cur, tenant_id, entity_id, base_run_id, compare_run_id, rows,
+                    )
+        for (category, total, concept, prop, period, source_system,
+             base_count, compare_count, base_value, compare_value) in rows:
+            counts[category] = total
+            if category == "unchanged":
+                continue
+            entry = {
+                "concept": concept,
+                "property": prop,
+                "period": period,
+                "source_system": source_system,
+            }
+            if category == "changed":
+                entry["base_count"] = base_count
+                entry["compare_count"] = compare_count
+                # Scalar values shown only when unambiguous (one row
+                # per side); multi-row groups differ by digest/count.
+                if base_count == 1 and compare_count == 1:
+                    entry["base_value"] = base_value
+                    entry["compare_value"] = compare_value
+            elif category == "added":
+                entry["count"] = compare_count
+                if compare_count == 1:
+                    entry["value"] = compare_value
+            else:
+                entry["count"] = base_count
+                if base_count == 1:
+                    entry["value"] = base_value
+            samples[category].append(entry)
         truncated = {
             cat: counts[cat] > len(samples[cat]) for cat in samples
         }
         return {"counts": counts, "samples": samples, "truncated": truncated,
                 "sample_limit": safe_limit}
 
+    @staticmethod
+    def _fill_diff_values(
+        cur, tenant_id: str, entity_id: str, base_run_id: str, compare_run_id: str,
+        rows: list[tuple],
+    ) -> list[tuple]:
+        """Attach value::text to the sampled diff rows of a digest join, for
+        the sides whose group holds exactly one row (the only values
+        diff_runs reports) — one read of those groups' triples."""
+        wanted = []  # (run_id, concept, property, period, source_system)
+        for category, _, concept, prop, period, source, base_count, compare_count, _, _ in rows:
+            key = (concept, prop, period or "", source)
+            if category in ("changed", "removed") and base_count == 1:
+                wanted.append((str(base_run_id),) + key)
+            if category in ("changed", "added") and compare_count == 1:
+                wanted.append((str(compare_run_id),) + key)
+        if not wanted:
+            return rows
+        cur.execute(
+            "SELECT t.run_id = %s::uuid, t.concept, t.property, COALESCE(t.period, ''), "
+            "       t.source_system, t.value::text "
+            "FROM semantic_triples t "
+            "JOIN unnest(%s::uuid[], %s::text[], %s::text[], %s::text[], %s::text[]) "
+            "     AS k(run_id, concept, property, period, source_system) "
+            "  ON t.run_id = k.run_id AND t.concept = k.concept "
+            " AND t.property = k.property AND COALESCE(t.period, '') = k.period "
+            " AND t.source_system = k.source_system "
+            "WHERE t.tenant_id = %s AND t.entity_id = %s",
+            [base_run_id] + [list(col) for col in zip(*wanted)] + [tenant_id, entity_id],
+        )
+        # Keyed (is_base_run, concept, property, period, source_system).
+        values = {tuple(r[:5]): r[5] for r in cur.fetchall()}
+        filled = []
+        for row in rows:
+            key = (row[2], row[3], row[4] or "", row[5])
+            filled.append(row[:8] + (values.get((True,) + key), values.get((False,) + key)))
+        return filled
+
     def delete_by_run(self, run_id: str) -> int:
         """Hard-delete all triples for a run (retention/test cleanup only —
         B19 scope; default lifecycle supersedes, never deletes)."""
-        sql = "DELETE FROM semantic_triples WHERE run_id = %s"
         with get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(sql, (run_id,))
+                n = delete_triples_tx(cur, "run_id = %s", (run_id,))
                 conn.commit()
-                return cur.rowcount
+        read_cache.invalidate()
+        return n
 
     # =========================================================================
     # MCP wire-protocol queries (Plan B WP5 §11.4)
     # =========================================================================
 
+    @staticmethod
+    def _mcp_rows(tenant_id: str, sql: str, params: list) -> list[dict]:
+        """Run an MCP triple read and convert its rows to JSON-safe values,
+        through the run-pointer-versioned read cache."""
+        def load() -> list[dict]:
+            rows: list[dict] = []
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    execute_prepared(cur, sql, params)
+                    cols = [d[0] for d in cur.description]
+                    for r in cur.fetchall():
+                        d = dict(zip(cols, r))
+                        for k in ("id", "tenant_id", "pipe_id", "run_id"):
+                            if d.get(k) is not None:
+                                d[k] = str(d[k])
+                        for k in ("created_at", "ingested_at", "superseded_at",
+                                  "valid_from", "valid_to"):
+                            if d.get(k) is not None:
+                                d[k] = d[k].isoformat()
+                        if d.get("confidence_score") is not None:
+                            d["confidence_score"] = float(d["confidence_score"])
+                        rows.append(d)
+            return rows
+
+        return read_cache.get_or_load("mcp_query_triples", tenant_id, [sql, params], load)
+
     def mcp_query_triples(
         self,
         tenant_id: str,
@@ -1206,9 +2163,9 @@ class TripleStore:
                     "non-empty when provided — an empty scope is a "
                     "caller bug, not an empty result."
                 )
-            clauses.append("(concept = ANY(%s) OR concept LIKE ANY(%s))")
-            params.append(list(domains))
-            params.append([f"{d}.%" for d in domains])
+            clause, clause_params = domain_clause(domains)
+            clauses.append(clause)
+            params.extend(clause_params)
         if concept is not None:
             if "." in concept:
                 clauses.append("concept = %s")
@@ -1226,8 +2183,9 @@ class TripleStore:
                 clauses.append("(concept = %s OR concept LIKE %s OR concept LIKE %s)")
                 params.extend([concept, f"{concept}.%", f"%.{concept}"])
         if domain is not None:
-            clauses.append("(concept = %s OR concept LIKE %s)")
-            params.extend([domain, f"{domain}.%"])
+            clause, clause_params = domain_clause([domain])
+            clauses.append(clause)
+            params.extend(clause_params)
         if entity_id is not None:
             clauses.append("entity_id = %s")
             params.append(entity_id)
@@ -1235,10 +2193,9 @@ class TripleStore:
             clauses.append("period = %s")
             params.append(period)
         if as_of is not None:
-            clauses.append(
-                "ingested_at <= %s AND (superseded_at IS NULL OR superseded_at > %s)"
-            )
-            params.extend([as_of, as_of])
+            clause, clause_params = as_of_clause(as_of)
+            clauses.append(clause)
+            params.extend(clause_params)
         elif active_only:
             clauses.append("is_active = true")
 
@@ -1256,24 +2213,7 @@ class TripleStore:
             # different row orders (consumers compare reads; B14).
             f"ORDER BY created_at DESC, id DESC LIMIT {safe_limit}"
         )
-        rows: list[dict] = []
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(sql, params)
-                cols = [d[0] for d in cur.description]
-                for r in cur.fetchall():
-                    d = dict(zip(cols, r))
-                    for k in ("id", "tenant_id", "pipe_id", "run_id"):
-                        if d.get(k) is not None:
-                            d[k] = str(d[k])
-                    for k in ("created_at", "ingested_at", "superseded_at",
-                              "valid_from", "valid_to"):
-                        if d.get(k) is not None:
-                            d[k] = d[k].isoformat()
-                    if d.get("confidence_score") is not None:
-                        d["confidence_score"] = float(d["confidence_score"])
-                    rows.append(d)
-        return rows
+        return self._mcp_rows(tenant_id, sql, params)
 
     def mcp_query_triples_expanded(
         self,
@@ -1308,9 +2248,15 @@ class TripleStore:
                     "be non-empty when provided — an empty scope is a "
                     "caller bug, not an empty result."
                 )
-            clauses.append("(concept = ANY(%s) OR concept LIKE ANY(%s))")
-            params.append(list(domains))
-            params.append([f"{d}.%" for d in domains])
+            clause, clause_params = domain_clause(domains)
+            clauses.append(clause)
+            params.extend(clause_params)
+        if domain_column_ready():
+            # Every expansion term lives under its first segment's root, so
+            # the root set bounds the read to those domains' index ranges
+            # before the subtree LIKEs run.
+            clauses.append("domain = ANY(%s)")
+            params.append(sorted({c.split(".", 1)[0] for c in [*exacts, *prefixes]}))
         concept_terms: list[str] = []
         if exacts:
             concept_terms.append("concept = ANY(%s)")
@@ -1326,10 +2272,9 @@ class TripleStore:
             clauses.append("period = %s")
             params.append(period)
         if as_of is not None:
-            clauses.append(
-                "ingested_at <= %s AND (superseded_at IS NULL OR superseded_at > %s)"
-            )
-            params.extend([as_of, as_of])
+            clause, clause_params = as_of_clause(as_of)
+            clauses.append(clause)
+            params.extend(clause_params)
         elif active_only:
             clauses.append("is_active = true")
 
@@ -1343,24 +2288,7 @@ class TripleStore:
             f"FROM semantic_triples WHERE {' AND '.join(clauses)} "
             f"ORDER BY created_at DESC, id DESC LIMIT {safe_limit}"
         )
-        rows: list[dict] = []
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(sql, params)
-                cols = [d[0] for d in cur.description]
-                for r in cur.fetchall():
-                    d = dict(zip(cols, r))
-                    for k in ("id", "tenant_id", "pipe_id", "run_id"):
-                        if d.get(k) is not None:
-                            d[k] = str(d[k])
-                    for k in ("created_at", "ingested_at", "superseded_at",
-                              "valid_from", "valid_to"):
-                        if d.get(k) is not None:
-                            d[k] = d[k].isoformat()
-                    if d.get("confidence_score") is not None:
-                        d["confidence_score"] = float(d["confidence_score"])
-                    rows.append(d)
-        return rows
+        return self._mcp_rows(tenant_id, sql, params)
 
     def mcp_list_domains(
         self, tenant_id: str, entity_id: str | None = None
@@ -1380,7 +2308,9 @@ class TripleStore:
             "SELECT split_part(concept, '.', 1) AS domain, COUNT(*) AS cnt "
             "FROM semantic_triples_current "
             f"WHERE {' AND '.join(clauses)} "
-            "GROUP BY domain ORDER BY cnt DESC"
+            # Positional: once semantic_triples has its own domain column
+            # (migration 035) a bare GROUP BY domain would bind to it.
+            "GROUP BY 1 ORDER BY cnt DESC"
         )
         with get_connection() as conn:
             with conn.cursor() as cur:
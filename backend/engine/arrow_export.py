@@ -0,0 +1,242 @@
+"""Columnar run-snapshot export — a tenant's (or tenant + entity's) triples as
+Apache Arrow record batches, serialized by the export routes as an Arrow IPC
+stream or Parquet.
+
+Rows are read from a server-side cursor (db.server_cursor) EXPORT_BATCH_ROWS
+at a time and each fetch becomes one RecordBatch (one Parquet row group), so
+a million-row run costs one batch of Python tuples plus one batch of Arrow
+buffers in worker memory — never the whole result set, never JSON.
+
+Column contract (EXPORT_COLUMNS, in order):
+  - entity_id, concept, period, value_type, currency, unit, source_system,
+    source_table, confidence_tier, resolution_method, dcl_ingest_id —
+    dictionary<int32, string>: low-cardinality text, encoded per batch;
+  - value_num float64 / value_str string — the JSONB value split server side
+    on jsonb_typeof: numbers land in value_num, strings in value_str,
+    booleans / objects / arrays as their JSON text in value_str, JSON null in
+    neither; value_type carries the jsonb_typeof name;
+  - confidence_score float64, created_at timestamp[us, UTC];
+  - property, source_field, canonical_id — plain string.
+
+The value split, numeric casts and created_at epoch conversion run in SQL, so
+psycopg2 never builds dict / Decimal / datetime objects for exported rows.
+
+Identity: no tenant column (I2); the ingest run rides as dcl_ingest_id —
+never a bare run_id (I1). Row order is unspecified (no server-side sort in
+front of the cursor).
+
+Scope: by default the snapshot is the current-state rows of the tenant's
+pointed-at runs (tenant_runs.current_run_id per entity, read through
+semantic_triples_current); an explicit dcl_ingest_id exports every row that
+run wrote, superseded or not (base table — a displaced run is history).
+
+pyarrow is optional at import time: ARROW_AVAILABLE is False without it and
+the routes answer 503.
+"""
+
+import io
+from typing import Iterator, Optional
+
+from backend.core.constants import EXPORT_BATCH_ROWS
+from backend.core.db import get_connection, server_cursor
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None  # type: ignore[assignment]
+    pa_ipc = None  # type: ignore[assignment]
+    pq = None  # type: ignore[assignment]
+
+ARROW_AVAILABLE = pa is not None
+
+# (column name, SQL select expression, kind) — kind is "dict", "str", "f64" or "ts".
+EXPORT_COLUMNS: list[tuple[str, str, str]] = [
+    ("entity_id", "entity_id", "dict"),
+    ("concept", "concept", "dict"),
+    ("property", "property", "str"),
+    ("period", "period", "dict"),
+    ("value_type", "jsonb_typeof(value)", "dict"),
+    ("value_num",
+     "CASE WHEN jsonb_typeof(value) = 'number' THEN (value #>> '{}')::float8 END",
+     "f64"),
+    ("value_str",
+     "CASE jsonb_typeof(value) WHEN 'string' THEN value #>> '{}' "
+     "WHEN 'number' THEN NULL WHEN 'null' THEN NULL ELSE value::text END",
+     "str"),
+    ("currency", "currency", "dict"),
+    ("unit", "unit", "dict"),
+    ("source_system", "source_system", "dict"),
+    ("source_table", "source_table", "dict"),
+    ("source_field", "source_field", "str"),
+    ("confidence_score", "confidence_score::float8", "f64"),
+    ("confidence_tier", "confidence_tier", "dict"),
+    ("canonical_id", "canonical_id::text", "str"),
+    ("resolution_method", "resolution_method", "dict"),
+    ("dcl_ingest_id", "run_id::text", "dict"),
+    ("created_at", "(extract(epoch FROM created_at) * 1000000)::int8", "ts"),
+]
+
+
+class RunExportEmpty(LookupError):
+    """The tenant (or tenant + entity / ingest filter) has no rows to export."""
+
+
+def _arrow_type(kind: str):
+    return {
+        "dict": pa.dictionary(pa.int32(), pa.string()),
+        "str": pa.string(),
+        "f64": pa.float64(),
+        "ts": pa.timestamp("us", tz="UTC"),
+    }[kind]
+
+
+def export_schema():
+    return pa.schema([(name, _arrow_type(kind)) for name, _, kind in EXPORT_COLUMNS])
+
+
+def _scope_sql(tenant_id: str, entity_id: Optional[str],
+               dcl_ingest_id: Optional[str]) -> tuple[str, str, list]:
+    """(table, WHERE clause, params) for an export scope."""
+    clauses = ["tenant_id = %s"]
+    params: list = [tenant_id]
+    if entity_id is not None:
+        clauses.append("entity_id = %s")
+        params.append(entity_id)
+    if dcl_ingest_id is not None:
+        clauses.append("run_id = %s")
+        params.append(dcl_ingest_id)
+        return "semantic_triples", " AND ".join(clauses), params
+    if entity_id is not None:
+        clauses.append(
+            "run_id = (SELECT current_run_id FROM tenant_runs "
+            "WHERE tenant_id = %s AND entity_id = %s)"
+        )
+        params.extend([tenant_id, entity_id])
+    else:
+        clauses.append(
+            "run_id IN (SELECT current_run_id FROM tenant_runs WHERE tenant_id = %s)"
+        )
+        params.append(tenant_id)
+    return "semantic_triples_current", " AND ".join(clauses), params
+
+
+def _describe_scope(tenant_id, entity_id, dcl_ingest_id) -> str:
+    scope = f"tenant {tenant_id}"
+    if entity_id is not None:
+        scope += f", entity {entity_id!r}"
+    if dcl_ingest_id is not None:
+        scope += f", dcl_ingest_id {dcl_ingest_id}"
+    return scope
+
+
+def check_run_exists(tenant_id: str, entity_id: Optional[str] = None,
+                     dcl_ingest_id: Optional[str] = None) -> None:
+    """Raise RunExportEmpty unless the scope has at least one row.
+    Called before a response starts streaming — the status code cannot
+    change once the first chunk is sent."""
+    table, where, params = _scope_sql(tenant_id, entity_id, dcl_ingest_id)
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"SELECT EXISTS (SELECT 1 FROM {table} WHERE {where})",
+                params,
+            )
+            found = cur.fetchone()[0]
+    if not found:
+        raise RunExportEmpty(
+            f"No triples for {_describe_scope(tenant_id, entity_id, dcl_ingest_id)}"
+        )
+
+
+def _to_batch(rows: list[tuple], schema):
+    arrays = []
+    for (_, _, kind), field, values in zip(EXPORT_COLUMNS, schema, zip(*rows)):
+        if kind == "dict":
+            arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+        elif kind == "ts":
+            arrays.append(pa.array(values, type=pa.int64()).cast(field.type))
+        else:
+            arrays.append(pa.array(values, type=field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def iter_record_batches(tenant_id: str, entity_id: Optional[str] = None,
+                        dcl_ingest_id: Optional[str] = None,
+                        batch_rows: int = EXPORT_BATCH_ROWS) -> Iterator:
+    """Yield the scope's rows as RecordBatches of at most batch_rows
+    rows, fetched from a server-side cursor."""
+    schema = export_schema()
+    table, where, params = _scope_sql(tenant_id, entity_id, dcl_ingest_id)
+    select = ", ".join(expr for _, expr, _ in EXPORT_COLUMNS)
+    sql = f"SELECT {select} FROM {table} WHERE {where}"
+    with server_cursor(itersize=batch_rows) as cur:
+        cur.execute(sql, params)
+        while True:
+            rows = cur.fetchmany(batch_rows)
+            if not rows:
+                break
+            yield _to_batch(rows, schema)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands written bytes back to a generator —
+    lets the Arrow / Parquet writers stream instead of buffering a file."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        data = bytes(b)
+        self._chunks.append(data)
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_ipc(batches) -> Iterator[bytes]:
+    """Arrow IPC stream format: schema, then each batch with its own
+    dictionaries (the stream format permits dictionary replacement)."""
+    sink = _ChunkSink()
+    writer = pa_ipc.new_stream(sink, export_schema())
+    try:
+        for batch in batches:
+            writer.write_batch(batch)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    tail = sink.drain()
+    if tail:
+        yield tail
+
+
+def stream_parquet(batches) -> Iterator[bytes]:
+    """Parquet with one row group per batch; each row group is flushed to the
+    response as soon as it is written, the footer last."""
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, export_schema(), compression="snappy")
+    try:
+        for batch in batches:
+            writer.write_batch(batch, row_group_size=batch.num_rows)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    tail = sink.drain()
+    if tail:
+        yield tail
@@ -22,11 +22,16 @@ future rule engine needs.
 Scope note: coordinate groups where one source contributes multiple rows
 (per-record ledger detail like invoice.billing) are not value-comparable —
 they are registered as structural with per-source row summaries.
+
+Materiality is computed set-based: the detection query classifies each group
+(numeric / non-numeric scalar / per-record), computes the deltas against the
+tenant policy and shapes the claims server-side, so only bounded claims cross
+the wire.
 """
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Optional
 
 from backend.db.conflict_store import ConflictStore
 from backend.core.db import get_connection
@@ -54,12 +59,6 @@ def conflict_class_key(concept: str, property: str, sources: list[str]) -> str:
     return f"{_ENTITY_TYPE}|{concept}|{property}|{pair}"
 
 
-def _numeric(v: Any) -> Optional[float]:
-    if isinstance(v, bool) or not isinstance(v, (int, float)):
-        return None
-    return float(v)
-
-
 def _concept_metadata_explanation(
     concept: str, claims: list[dict], abs_delta: float | None,
     rel_delta: float | None,
@@ -166,35 +165,104 @@ def detect_and_register(
     abs_thr, rel_thr = policy["abs_threshold"], policy["rel_threshold"]
 
     coord_clause = ""
-    params: list = [tenant_id, entity_id, dcl_ingest_id]
+    params: dict = {
+        "tenant_id": tenant_id, "entity_id": entity_id, "run_id": dcl_ingest_id,
+        "cap": _CLAIMS_DETAIL_CAP, "abs_thr": abs_thr, "rel_thr": rel_thr,
+    }
     if coords is not None:
         if not coords:
             return {"tenant_id": str(tenant_id), "entity_id": entity_id,
                     "dcl_ingest_id": str(dcl_ingest_id),
                     "detected_new": 0, "refreshed": 0, "conflicts": []}
-        coord_clause = "AND (concept, property, COALESCE(period, '')) IN %s"
-        params.append(tuple((c, p, per or "") for (c, p, per) in coords))
-
+        coord_clause = "AND (concept, property, COALESCE(period, '')) IN %(coords)s"
+        params["coords"] = tuple((c, p, per or "") for (c, p, per) in coords)
+
+    # Classification, deltas, materiality and claim shaping all happen in
+    # SQL: a per-record ledger group ships one summary per source and a
+    # scalar group at most _CLAIMS_DETAIL_CAP claims, never every row's
+    # provenance. Python only recommends and upserts.
+    #   per_source — one row per (coordinate, source): row count, sample id,
+    #                and the full claim object for the source's first row
+    #                (built only for that row — FILTER skips the rest).
+    #   grouped    — one row per conflicting coordinate (>1 source).
     sql = f"""
-        SELECT concept, property, period,
-               COUNT(*) AS n_rows,
-               COUNT(DISTINCT source_system) AS n_sources,
-               jsonb_agg(jsonb_build_object(
-                   'source_system', source_system,
-                   'value', value,
-                   'triple_id', id,
-                   'confidence_score', confidence_score,
-                   'confidence_tier', confidence_tier,
-                   'ingested_at', ingested_at,
-                   'source_table', source_table,
-                   'source_field', source_field,
-                   'pipe_id', pipe_id
-               ) ORDER BY source_system, id) AS claims
-        FROM semantic_triples_current
-        WHERE tenant_id = %s AND entity_id = %s AND run_id = %s
-        {coord_clause}
-        GROUP BY concept, property, period
-        HAVING COUNT(DISTINCT source_system) > 1
+        WITH src_rows AS (
+            SELECT concept, property, period, source_system, id, value,
+                   confidence_score, confidence_tier, ingested_at,
+                   source_table, source_field, pipe_id,
+                   row_number() OVER (
+                       PARTITION BY concept, property, period, source_system
+                       ORDER BY id
+                   ) AS src_rn
+            FROM semantic_triples_current
+            WHERE tenant_id = %(tenant_id)s AND entity_id = %(entity_id)s
+              AND run_id = %(run_id)s
+            {coord_clause}
+        ),
+        per_source AS (
+            SELECT concept, property, period, source_system,
+                   COUNT(*) AS row_count,
+                   (jsonb_agg(jsonb_build_object(
+                       'source_system', source_system,
+                       'value', value,
+                       'triple_id', id,
+                       'confidence_score', confidence_score,
+                       'confidence_tier', confidence_tier,
+                       'ingested_at', ingested_at,
+                       'source_table', source_table,
+                       'source_field', source_field,
+                       'pipe_id', pipe_id
+                   )) FILTER (WHERE src_rn = 1)) -> 0 AS claim,
+                   row_number() OVER (
+                       PARTITION BY concept, property, period ORDER BY source_system
+                   ) AS src_idx
+            FROM src_rows
+            GROUP BY concept, property, period, source_system
+        ),
+        grouped AS (
+            SELECT concept, property, period,
+                   bool_and(row_count = 1) AS scalar_per_source,
+                   bool_and(row_count = 1 AND jsonb_typeof(claim->'value') = 'number') AS is_numeric,
+                   max((claim->>'value')::numeric)
+                       FILTER (WHERE jsonb_typeof(claim->'value') = 'number') AS vmax,
+                   min((claim->>'value')::numeric)
+                       FILTER (WHERE jsonb_typeof(claim->'value') = 'number') AS vmin,
+                   COUNT(DISTINCT claim->'value') AS n_values,
+                   CASE WHEN bool_and(row_count = 1)
+                        THEN jsonb_agg(claim ORDER BY source_system)
+                                 FILTER (WHERE src_idx <= %(cap)s)
+                        ELSE jsonb_agg(jsonb_build_object(
+                                 'source_system', source_system,
+                                 'row_count', row_count,
+                                 'sample_triple_id', claim->'triple_id'
+                             ) ORDER BY source_system)
+                   END AS claims
+            FROM per_source
+            GROUP BY concept, property, period
+            HAVING COUNT(*) > 1
+        ),
+        deltas AS (
+            SELECT g.*,
+                   CASE WHEN is_numeric THEN round(vmax - vmin, 10) END AS abs_delta,
+                   CASE WHEN is_numeric THEN greatest(abs(vmax), abs(vmin)) END AS denom
+            FROM grouped g
+        ),
+        scored AS (
+            SELECT d.*,
+                   CASE WHEN denom > 0 THEN abs_delta / denom
+                        WHEN abs_delta = 0 THEN 0 END AS rel_delta
+            FROM deltas d
+        )
+        SELECT concept, property, period, scalar_per_source, is_numeric,
+               abs_delta::float8, rel_delta::float8,
+               CASE WHEN is_numeric
+                        THEN COALESCE(abs_delta >= %(abs_thr)s, false)
+                          OR COALESCE(rel_delta >= %(rel_thr)s, false)
+                    WHEN scalar_per_source THEN n_values > 1
+                    ELSE false
+               END AS material,
+               claims
+        FROM scored
     """
     with get_connection() as conn:
         with conn.cursor() as cur:
@@ -203,41 +271,8 @@ def detect_and_register(
 
     pending_rows: list[dict] = []
     conflicts: list[dict] = []
-    for concept, prop, period, n_rows, n_sources, claims in groups:
-        scalar_per_source = n_rows == n_sources
-        values = [_numeric(c.get("value")) for c in claims]
-        numeric = scalar_per_source and all(v is not None for v in values)
-
-        abs_delta = rel_delta = None
-        material = False
-        if numeric:
-            vmax, vmin = max(values), min(values)
-            abs_delta = round(vmax - vmin, 10)
-            denom = max(abs(vmax), abs(vmin))
-            rel_delta = (abs_delta / denom) if denom > 0 else (0.0 if abs_delta == 0 else None)
-            material = (
-                (abs_thr is not None and abs_delta >= abs_thr)
-                or (rel_thr is not None and rel_delta is not None and rel_delta >= rel_thr)
-            )
-        elif scalar_per_source:
-            # Non-numeric scalars: any inequality is a value conflict.
-            distinct = {repr(c.get("value")) for c in claims}
-            material = len(distinct) > 1
-
-        if not scalar_per_source:
-            # Per-record detail (e.g. ledger rows): summarize per source.
-            by_src: dict[str, dict] = {}
-            for c in claims:
-                s = by_src.setdefault(
-                    c["source_system"],
-                    {"source_system": c["source_system"], "row_count": 0,
-                     "sample_triple_id": c["triple_id"]},
-                )
-                s["row_count"] += 1
-            claims = sorted(by_src.values(), key=lambda s: s["source_system"])
-        elif len(claims) > _CLAIMS_DETAIL_CAP:
-            claims = claims[:_CLAIMS_DETAIL_CAP]
-
+    for (concept, prop, period, scalar_per_source, numeric,
+         abs_delta, rel_delta, material, claims) in groups:
         conflict_type = "value" if material else "structural"
         sources = [c["source_system"] for c in claims]
         cls = conflict_class_key(concept, prop, sources)
@@ -49,6 +49,10 @@ generally from a group-membership record field whose value declares each group's
 parent department (read from data), and the declared internal->external resolution
 (RESOLVES_TO) the gap rule stands on.
 
+Inputs are read in one query. The default run rewrites the whole derived graph;
+the incremental run re-derives only the rules whose input concepts the latest
+ingest wrote or superseded and supersedes just the edges whose content changed.
+
 Identity (tenant_id + entity_id) and one dcl_ingest_id ride every edge (I1/I2).
 Fail loud (A1): an internal median with no resolvable external median is a
 derivation gap — it RAISES, never silently skips.
@@ -56,9 +60,10 @@ derivation gap — it RAISES, never silently skips.
 
 from __future__ import annotations
 
+import json
 from typing import Any, Optional
 
-from backend.core.db import get_connection
+from backend.core.db import execute_prepared, get_connection
 from backend.db.edge_store import EdgeStore, put_edge_type
 from backend.utils.log_utils import get_logger
 
@@ -105,6 +110,38 @@ _EXIT_CONCEPT_PREFIX = "workforce.exit_theme."
 _EXIT_CONCEPT_SUFFIX = ".by_department"
 _EXIT_CONCEPT_TMPL = _EXIT_CONCEPT_PREFIX + "{reason}" + _EXIT_CONCEPT_SUFFIX
 
+# The fixed input concepts read at the headline period (exit-theme reasons are
+# discovered alongside; the resolution is read across periods).
+_INPUT_CONCEPTS = (
+    _COMP_CONCEPT, _MARKET_CONCEPT, _COMP_BAND_CONCEPT, _MARKET_BAND_CONCEPT,
+    _GROUP_MEMBER_CONCEPT, _DEPARTURES_BY_GROUP_BAND_CONCEPT,
+)
+
+# Incremental derivation: the input concepts each rule consumes (a batch that
+# wrote none of them leaves the rule's edges untouched), and the (edge_type,
+# src_type) shapes of the edges the rule owns (its live dcl_derived edges are
+# what a re-run replaces). Exit-theme reasons are matched as one input.
+_RULE_INPUTS: dict[str, tuple[str, ...]] = {
+    "comp_gap": (_COMP_CONCEPT, _MARKET_CONCEPT, _RESOLUTION_CONCEPT),
+    "exit_driver": (_EXIT_CONCEPT_TMPL,),
+    "resolution": (_COMP_CONCEPT, _RESOLUTION_CONCEPT),
+    "comp_gap_band": (_COMP_BAND_CONCEPT, _MARKET_BAND_CONCEPT, _RESOLUTION_CONCEPT),
+    "membership": (_COMP_CONCEPT, _GROUP_MEMBER_CONCEPT),
+    "synthesis": (
+        _DEPARTURES_BY_GROUP_BAND_CONCEPT, _GROUP_MEMBER_CONCEPT,
+        _COMP_BAND_CONCEPT, _MARKET_BAND_CONCEPT, _RESOLUTION_CONCEPT,
+    ),
+}
+_RULE_SHAPES: dict[str, tuple[tuple[str, str], ...]] = {
+    "comp_gap": (("BELOW_MARKET", "department"),),
+    "exit_driver": (("DRIVEN_BY", "department"),),
+    "resolution": (("RESOLVES_TO", "department"),),
+    "comp_gap_band": (("BELOW_MARKET", "department_band"),),
+    "membership": (("HAS_DEPARTMENT", "org_unit"), ("HAS_TEAM", "department")),
+    "synthesis": (("DRIVEN_BY", "team"),),
+}
+_DERIVED_SOURCE = "dcl_derived"
+
 
 class EdgeDerivationError(RuntimeError):
     """A derivation could not complete with the integrity the gate requires
@@ -112,47 +149,118 @@ class EdgeDerivationError(RuntimeError):
     (A1) — never a silent skip."""
 
 
-def _read_current_triples(tenant_id: str, entity_id: str, concept: str, period: str) -> dict[str, dict]:
-    """All active (Stage-2) triples for one concept at one period, keyed by
-    property. source_system rides along so the derivation can assert provenance
-    on the edge it builds."""
-    out: dict[str, dict] = {}
+def _exit_reason(concept: str) -> Optional[str]:
+    """The reason segment of an exit-theme concept, or None when `concept` is
+    not one. A nested-deeper concept (extra dots) is not a flat reason, so the
+    reason is exactly the single segment between prefix and suffix."""
+    if not concept.startswith(_EXIT_CONCEPT_PREFIX) or not concept.endswith(_EXIT_CONCEPT_SUFFIX):
+        return None
+    reason = concept[len(_EXIT_CONCEPT_PREFIX):-len(_EXIT_CONCEPT_SUFFIX)]
+    return reason if reason and "." not in reason else None
+
+
+def _read_inputs(tenant_id: str, entity_id: str, period: str) -> dict[str, Any]:
+    """Every derivation input in ONE read of Stage-2 current state: the input
+    concepts at `period` (comp/market medians, their band forms, team
+    membership, team-band departures, and every exit-theme reason concept
+    present — the reason set is DISCOVERED, this rule enumerates none), plus
+    the declared resolution across all periods.
+
+    Returns the per-concept maps the rules consume — property -> {value,
+    source_system}, with source_system riding along so each edge can assert
+    provenance.
+
+    The resolution is the ENTITY'S internal->external mapping, carried as data
+    (property = internal key, value = external key), never a hardcoded dict.
+    It is atemporal (an annual declaration the survey feed repeats every
+    month), so rows are deduped across periods; a key declaring two different
+    external targets is a data conflict and RAISES (A1)."""
+    by_concept: dict[str, dict[str, dict]] = {c: {} for c in _INPUT_CONCEPTS}
+    exit_by_reason: dict[str, dict[str, dict]] = {}
+    resolution: dict[str, str] = {}
+    like = _EXIT_CONCEPT_PREFIX + "%" + _EXIT_CONCEPT_SUFFIX
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                "SELECT property, value, source_system FROM semantic_triples_current "
-                "WHERE tenant_id = %s AND entity_id = %s AND concept = %s AND period = %s",
-                [tenant_id, entity_id, concept, period],
+            execute_prepared(
+                cur,
+                "SELECT concept, property, value, source_system "
+                "FROM semantic_triples_current "
+                "WHERE tenant_id = %s AND entity_id = %s AND ("
+                "  (period = %s AND (concept = ANY(%s) OR concept LIKE %s))"
+                "  OR concept = %s)",
+                [tenant_id, entity_id, period, list(_INPUT_CONCEPTS), like,
+                 _RESOLUTION_CONCEPT],
             )
-            for prop, value, source_system in cur.fetchall():
-                out[prop] = {"value": value, "source_system": source_system}
-    return out
+            rows = cur.fetchall()
+
+    for concept, prop, value, source_system in rows:
+        if concept == _RESOLUTION_CONCEPT:
+            external = str(value)
+            if prop in resolution and resolution[prop] != external:
+                raise EdgeDerivationError(
+                    f"the declared resolution is inconsistent: internal key {prop!r} "
+                    f"maps to both {resolution[prop]!r} and {external!r} in "
+                    f"{_RESOLUTION_CONCEPT}; a key must resolve to one external "
+                    f"target — fix the source mapping, do not pick one silently"
+                )
+            resolution[prop] = external
+            continue
+        record = {"value": value, "source_system": source_system}
+        if concept in by_concept:
+            by_concept[concept][prop] = record
+            continue
+        reason = _exit_reason(concept)
+        if reason is not None:
+            exit_by_reason.setdefault(reason, {})[prop] = record
+
+    return {
+        "comp": by_concept[_COMP_CONCEPT],
+        "market": by_concept[_MARKET_CONCEPT],
+        "comp_band": by_concept[_COMP_BAND_CONCEPT],
+        "market_band": by_concept[_MARKET_BAND_CONCEPT],
+        "team_members": by_concept[_GROUP_MEMBER_CONCEPT],
+        "departures_by_team_band": by_concept[_DEPARTURES_BY_GROUP_BAND_CONCEPT],
+        "exit_by_reason": exit_by_reason,
+        "resolution": resolution,
+    }
+
 
+def _read_batch_concepts(tenant_id: str, entity_id: str, dcl_ingest_id: str) -> set[str]:
+    """The input concepts a dcl_ingest_id touched, for the incremental mode to
+    map to the rules it affects (exit-theme reasons collapse to
+    _EXIT_CONCEPT_TMPL).
 
-def _discover_exit_concepts(tenant_id: str, entity_id: str, period: str) -> dict[str, str]:
-    """Discover the exit-theme reason concepts present in the data — reason ->
-    full concept. The reason set is the entity's (whatever reasons its feed
-    carries); this rule enumerates none. Matches concepts of the shape
-    'workforce.exit_theme.<reason>.by_department' at the period."""
-    out: dict[str, str] = {}
+    Read from the full bi-temporal history at every period, not the current
+    view: a batch that REMOVES a fact leaves no current row, only the row it
+    superseded. So a concept counts when the batch wrote a row of it, or when
+    one of its rows was superseded by the batch's transaction — superseded_at
+    equal to an ingested_at the batch stamped (both are that transaction's
+    now()). Another write in the same instant can only over-include, which
+    costs a re-derivation, never a stale edge."""
     like = _EXIT_CONCEPT_PREFIX + "%" + _EXIT_CONCEPT_SUFFIX
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                "SELECT DISTINCT concept FROM semantic_triples_current "
-                "WHERE tenant_id = %s AND entity_id = %s AND period = %s "
-                "AND concept LIKE %s",
-                [tenant_id, entity_id, period, like],
+            execute_prepared(
+                cur,
+                "SELECT DISTINCT concept FROM semantic_triples "
+                "WHERE tenant_id = %s AND entity_id = %s "
+                "AND (concept = ANY(%s) OR concept LIKE %s OR concept = %s) "
+                "AND (run_id = %s OR superseded_at IN ("
+                "  SELECT ingested_at FROM semantic_triples "
+                "  WHERE tenant_id = %s AND entity_id = %s AND run_id = %s))",
+                [tenant_id, entity_id, list(_INPUT_CONCEPTS), like,
+                 _RESOLUTION_CONCEPT, str(dcl_ingest_id),
+                 tenant_id, entity_id, str(dcl_ingest_id)],
             )
-            for (concept,) in cur.fetchall():
-                if not concept.startswith(_EXIT_CONCEPT_PREFIX) or not concept.endswith(_EXIT_CONCEPT_SUFFIX):
-                    continue
-                reason = concept[len(_EXIT_CONCEPT_PREFIX):-len(_EXIT_CONCEPT_SUFFIX)]
-                # A nested-deeper concept (extra dots) is not a flat reason — skip
-                # so the reason is exactly the single segment between prefix/suffix.
-                if reason and "." not in reason:
-                    out[reason] = concept
-    return out
+            rows = cur.fetchall()
+
+    batch: set[str] = set()
+    for (concept,) in rows:
+        if concept in _INPUT_CONCEPTS or concept == _RESOLUTION_CONCEPT:
+            batch.add(concept)
+        elif _exit_reason(concept) is not None:
+            batch.add(_EXIT_CONCEPT_TMPL)
+    return batch
 
 
 def _as_int(value: Any) -> int:
@@ -180,36 +288,6 @@ def _split_band(prop: str) -> Optional[tuple[str, str]]:
     return base, band
 
 
-def _read_resolution(tenant_id: str, entity_id: str) -> dict[str, str]:
-    """The DECLARED internal->external resolution, read from the data (the
-    comp_resolution.* triples). property = internal key, value = external key
-    (a string). This is the mapping the gap rule resolves the cross-source pair
-    through — it is the ENTITY'S, carried as data, never a hardcoded dict.
-
-    Read across all periods then deduped (the mapping is atemporal — an annual
-    declaration the survey feed repeats every month); a key declaring two
-    different external targets is a data conflict and RAISES (A1)."""
-    resolution: dict[str, str] = {}
-    with get_connection() as conn:
-        with conn.cursor() as cur:
-            cur.execute(
-                "SELECT DISTINCT property, value FROM semantic_triples_current "
-                "WHERE tenant_id = %s AND entity_id = %s AND concept = %s",
-                [tenant_id, entity_id, _RESOLUTION_CONCEPT],
-            )
-            for prop, value in cur.fetchall():
-                external = str(value)
-                if prop in resolution and resolution[prop] != external:
-                    raise EdgeDerivationError(
-                        f"the declared resolution is inconsistent: internal key {prop!r} "
-                        f"maps to both {resolution[prop]!r} and {external!r} in "
-                        f"{_RESOLUTION_CONCEPT}; a key must resolve to one external "
-                        f"target — fix the source mapping, do not pick one silently"
-                    )
-                resolution[prop] = external
-    return resolution
-
-
 def _edge(
     dcl_ingest_id: str, *, src_type: str, src_key: str, edge_type: str,
     dst_type: str, dst_key: str, properties: dict,
@@ -223,7 +301,7 @@ def _edge(
         "edge_type": edge_type,
         "dst_type": dst_type, "dst_key": dst_key,
         "properties": properties,
-        "source_system": "dcl_derived",
+        "source_system": _DERIVED_SOURCE,
         "source_table": None, "source_field": None,
         "pipe_id": None, "source_run_tag": None,
         "dcl_ingest_id": dcl_ingest_id,
@@ -728,13 +806,75 @@ def _register_edge_types(tenant_id: str) -> None:
     )
 
 
-def derive_edges(tenant_id: str, entity_id: str, dcl_ingest_id: str) -> dict:
+def _edge_coord(e: dict) -> tuple:
+    return (e["src_type"], e["src_key"], e["edge_type"], e["dst_type"], e["dst_key"])
+
+
+def _same_edge(live: dict, derived: dict) -> bool:
+    """A live edge already says what the re-derivation says — same properties
+    (compared through their JSON form, as stored), derivation and confidence."""
+    return (
+        live["properties"] == json.loads(json.dumps(derived["properties"]))
+        and live["derivation"] == derived["derivation"]
+        and live["confidence_tier"] == derived["confidence_tier"]
+        and float(live["confidence_score"]) == float(derived["confidence_score"])
+    )
+
+
+def _plan_incremental(
+    live: list[dict], by_rule: dict[str, list[dict]], batch: set[str],
+) -> tuple[list[str], list[dict], list[dict], int]:
+    """Which edges an incremental re-derivation writes.
+
+    A rule is affected when the batch wrote one of its input concepts
+    (_RULE_INPUTS); unaffected rules' edges are not touched. Within an
+    affected rule, a derived edge is re-asserted only when its coordinate is
+    new or its live row differs; the rule's live dcl_derived edges (its
+    _RULE_SHAPES) that the re-derivation no longer produces are retired.
+    Returns (affected rules, edges to assert, coordinates to retire, count of
+    derived edges left as they are)."""
+    affected = [rule for rule, inputs in _RULE_INPUTS.items() if batch.intersection(inputs)]
+    shapes = {shape for rule in affected for shape in _RULE_SHAPES[rule]}
+    owned = {
+        _edge_coord(e): e for e in live
+        if e["source_system"] == _DERIVED_SOURCE and (e["edge_type"], e["src_type"]) in shapes
+    }
+    write: list[dict] = []
+    derived: set[tuple] = set()
+    unchanged = 0
+    for rule in affected:
+        for e in by_rule[rule]:
+            coord = _edge_coord(e)
+            derived.add(coord)
+            held = owned.get(coord)
+            if held is not None and _same_edge(held, e):
+                unchanged += 1
+                continue
+            write.append(e)
+    retire = [
+        {k: held[k] for k in ("src_type", "src_key", "edge_type", "dst_type", "dst_key")}
+        for coord, held in owned.items() if coord not in derived
+    ]
+    return affected, write, retire, unchanged
+
+
+def derive_edges(
+    tenant_id: str, entity_id: str, dcl_ingest_id: str, *, incremental: bool = False,
+) -> dict:
     """Derive the Stage-3 stitched graph for one entity and persist it.
 
-    Reads Stage-2 current-state triples, derives the gap edges (rule 1), the exit
-    driver, the declared resolution, the structural membership, and the band-
-    driver synthesis (rules 2+3), registers the edge types, and writes the batch
-    via EdgeStore.assert_edges(replace=True). Returns the counts and the edges.
+    Reads every Stage-2 input in one query (_read_inputs), derives the gap
+    edges (rule 1), the exit driver, the declared resolution, the structural
+    membership, and the band-driver synthesis (rules 2+3), registers the edge
+    types, and writes the batch. Returns the counts and the edges.
+
+    Full mode writes the whole derived graph via
+    EdgeStore.assert_edges(replace=True). incremental=True re-runs only the
+    rules whose input concepts this dcl_ingest_id wrote or superseded
+    (_read_batch_concepts) and re-asserts only the edges that changed,
+    retiring the ones that no longer hold — a small correction re-versions
+    its own edges, not the whole graph. It diffs
+    against the live graph, so it assumes a prior full derivation.
 
     Identity (tenant_id + entity_id) is required (I2); one dcl_ingest_id stamps
     the whole batch (I1). Raises EdgeDerivationError (A1) on any unresolvable
@@ -747,22 +887,14 @@ def derive_edges(tenant_id: str, entity_id: str, dcl_ingest_id: str) -> dict:
     if not dcl_ingest_id or not str(dcl_ingest_id).strip():
         raise EdgeDerivationError("dcl_ingest_id is required to stamp the edge batch (I1)")
 
-    comp = _read_current_triples(tenant_id, entity_id, _COMP_CONCEPT, _HEADLINE_PERIOD)
-    market = _read_current_triples(tenant_id, entity_id, _MARKET_CONCEPT, _HEADLINE_PERIOD)
-    resolution = _read_resolution(tenant_id, entity_id)
-    exit_concepts = _discover_exit_concepts(tenant_id, entity_id, _HEADLINE_PERIOD)
-    exit_by_reason: dict[str, dict[str, dict]] = {
-        reason: _read_current_triples(tenant_id, entity_id, concept, _HEADLINE_PERIOD)
-        for reason, concept in exit_concepts.items()
-    }
+    inputs = _read_inputs(tenant_id, entity_id, _HEADLINE_PERIOD)
+    comp, market, resolution = inputs["comp"], inputs["market"], inputs["resolution"]
+    exit_by_reason = inputs["exit_by_reason"]
     # Band/team inputs — band-level comp/market, the team membership, and the
     # team-band departure feed (rule 2's input).
-    comp_band = _read_current_triples(tenant_id, entity_id, _COMP_BAND_CONCEPT, _HEADLINE_PERIOD)
-    market_band = _read_current_triples(tenant_id, entity_id, _MARKET_BAND_CONCEPT, _HEADLINE_PERIOD)
-    team_members = _read_current_triples(tenant_id, entity_id, _GROUP_MEMBER_CONCEPT, _HEADLINE_PERIOD)
-    departures_by_team_band = _read_current_triples(
-        tenant_id, entity_id, _DEPARTURES_BY_GROUP_BAND_CONCEPT, _HEADLINE_PERIOD
-    )
+    comp_band, market_band = inputs["comp_band"], inputs["market_band"]
+    team_members = inputs["team_members"]
+    departures_by_team_band = inputs["departures_by_team_band"]
 
     if not comp:
         raise EdgeDerivationError(
@@ -804,14 +936,30 @@ def derive_edges(tenant_id: str, entity_id: str, dcl_ingest_id: str) -> dict:
             concentration, gap_index, team_members,
         )
 
-    all_edges = (
-        comp_gap_edges + exit_driver_edges + resolution_edges
-        + comp_gap_band_edges + membership_edges + synthesis_edges
-    )
+    by_rule = {
+        "comp_gap": comp_gap_edges,
+        "exit_driver": exit_driver_edges,
+        "resolution": resolution_edges,
+        "comp_gap_band": comp_gap_band_edges,
+        "membership": membership_edges,
+        "synthesis": synthesis_edges,
+    }
+    all_edges = [e for edges in by_rule.values() for e in edges]
 
-    _register_edge_types(tenant_id)
     store = EdgeStore()
-    result = store.assert_edges(tenant_id, entity_id, all_edges, replace=True)
+    if incremental:
+        affected, to_write, to_retire, unchanged = _plan_incremental(
+            store.live_edges(tenant_id, entity_id), by_rule,
+            _read_batch_concepts(tenant_id, entity_id, dcl_ingest_id),
+        )
+        if to_write:
+            _register_edge_types(tenant_id)
+        result = store.assert_edges(
+            tenant_id, entity_id, to_write, retire=to_retire, scrub=False,
+        )
+    else:
+        _register_edge_types(tenant_id)
+        result = store.assert_edges(tenant_id, entity_id, all_edges, replace=True)
 
     if result.violations:
         raise EdgeDerivationError(
@@ -820,25 +968,27 @@ def derive_edges(tenant_id: str, entity_id: str, dcl_ingest_id: str) -> dict:
             f"not silently dropped: {result.violations}"
         )
 
-    counts = {
-        "comp_gap": len(comp_gap_edges),
-        "exit_driver": len(exit_driver_edges),
-        "resolution": len(resolution_edges),
-        "comp_gap_band": len(comp_gap_band_edges),
-        "membership": len(membership_edges),
-        "synthesis": len(synthesis_edges),
+    counts = {name: len(edges) for name, edges in by_rule.items()}
+    counts.update({
         "total": len(all_edges),
         "written": result.written,
         "superseded": result.superseded,
-    }
+    })
+    if incremental:
+        counts.update({
+            "rules_affected": affected,
+            "retired": len(to_retire),
+            "unchanged": unchanged,
+        })
     logger.info(
-        "[edge_derivation] tenant=%s entity=%s ingest=%s: derived %s",
-        tenant_id, entity_id, dcl_ingest_id, counts,
+        "[edge_derivation] tenant=%s entity=%s ingest=%s incremental=%s: derived %s",
+        tenant_id, entity_id, dcl_ingest_id, incremental, counts,
     )
     return {
         "tenant_id": tenant_id,
         "entity_id": entity_id,
         "dcl_ingest_id": dcl_ingest_id,
+        "incremental": incremental,
         "counts": counts,
         "edges": all_edges,
     }
@@ -116,4 +116,7 @@ def rebuild_graph() -> None:
     except AAMEdgeFetchError as e:
         logger.warning(f"[GraphStore] Could not load AAM edges: {e}")
 
+    # 5. System-level join paths — precomputed so find_join_path is a lookup
+    graph.build_join_index()
+
     set_semantic_graph(graph)
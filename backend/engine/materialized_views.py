@@ -62,7 +62,7 @@ class MaterializedViews:
             WHERE tenant_id = %s
               AND run_id = %s
               AND entity_id = %s
-            GROUP BY domain ORDER BY domain
+            GROUP BY 1 ORDER BY domain
         """
         domain_rows = self._query(domain_sql, [self.tenant_id, self.run_id, entity_id])
         domain_counts = {r["domain"]: r["cnt"] for r in domain_rows}
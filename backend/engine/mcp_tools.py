@@ -3,7 +3,8 @@ Shared MCP tool implementations (Plan B WP5, §11.4).
 
 Single source of truth for the external tool surface (TOOL_SCHEMAS /
 PUBLIC_TOOLS — the §11.4 base tools plus the Gate 1A conflict pair, the
-Gate 1B traversal, and the Gate 2A trace_query). Both the legacy HTTP
+Gate 1B traversal and find_graph_paths, the Gate 2A trace_query, and the
+financial_statements bundle). Both the legacy HTTP
 path (backend/api/mcp_server.py) and the real wire-protocol MCP server
 (backend/api/mcp_server_real.py) call these functions.
 
@@ -454,12 +455,20 @@ def tool_traverse_graph(
     direction: str = "both",
     as_of: str | None = None,
     limit: int = 500,
+    depth: int = 1,
+    edge_types: list[str] | None = None,
+    max_nodes: int = 500,
+    include_values: bool = False,
 ) -> dict:
     """Traverse the persisted entity↔entity graph.
 
-    With (node_type, node_key): that node's typed edges + neighbor list.
+    With (node_type, node_key): that node's typed edges + neighbor list; with
+    depth > 1 (or edge_types), every node within `depth` hops (BFS, each with
+    its hop distance) and the edges that reached them, capped at max_nodes.
     Without: the entity's whole subgraph (nodes + typed edges). as_of is the
     bi-temporal knowledge-time read — the topology as it was believed at T.
+    include_values attaches each returned node's values (the subgraph
+    route's join rule, EdgeStore.node_values — one query per node type).
 
     A NEW tool rather than a query_triples overload: traversal returns
     nodes+edges, a different shape from fact rows — overloading would muddy
@@ -479,8 +488,26 @@ def tool_traverse_graph(
 
     from backend.db.edge_store import EdgeContractError, EdgeIdentityError, get_edge_store
     store = get_edge_store()
+    types = list(edge_types or [])
+    if edge_type:
+        types.append(edge_type)
     try:
-        if node_type is not None:
+        if node_type is not None and (depth > 1 or edge_types):
+            result = store.traverse(
+                tenant_id, entity_id, node_type, node_key,
+                depth=depth, edge_types=types or None, direction=direction,
+                max_nodes=max_nodes, as_of=as_of,
+            )
+            out = {
+                "entity_id": entity_id,
+                "node": {"node_type": node_type, "node_key": node_key},
+                "as_of": as_of,
+                "depth": result["depth"],
+                "edges": result["edges"],
+                "neighbors": result["nodes"][1:],
+                "truncated": result["truncated"],
+            }
+        elif node_type is not None:
             edges = store.get_neighbors(
                 tenant_id, entity_id, node_type, node_key,
                 edge_type=edge_type, direction=direction, as_of=as_of, limit=limit,
@@ -490,23 +517,132 @@ def tool_traverse_graph(
                 for t, k in ((e["src_type"], e["src_key"]), (e["dst_type"], e["dst_key"])):
                     if (t, k) != (node_type, node_key):
                         neighbors.setdefault((t, k), {"node_type": t, "node_key": k})
-            return {
+            out = {
                 "entity_id": entity_id,
                 "node": {"node_type": node_type, "node_key": node_key},
                 "as_of": as_of,
                 "edges": edges,
                 "neighbors": list(neighbors.values()),
             }
-        sub = store.get_subgraph(
-            tenant_id, entity_id,
-            edge_types=[edge_type] if edge_type else None, as_of=as_of, limit=limit,
-        )
-        return {"entity_id": entity_id, "as_of": as_of,
-                "nodes": sub["nodes"], "edges": sub["edges"]}
+        else:
+            sub = store.get_subgraph(
+                tenant_id, entity_id,
+                edge_types=types or None, as_of=as_of, limit=limit,
+            )
+            out = {"entity_id": entity_id, "as_of": as_of,
+                   "nodes": sub["nodes"], "edges": sub["edges"]}
+
+        if include_values:
+            nodes = out.get("nodes") or [out["node"], *out["neighbors"]]
+            values = store.node_values(
+                tenant_id, entity_id, [(n["node_type"], n["node_key"]) for n in nodes],
+            )
+            for n in nodes:
+                n["values"] = values[(n["node_type"], n["node_key"])]
+        return out
     except (EdgeIdentityError, EdgeContractError) as e:
         raise MCPToolError(f"traverse_graph: {e}")
 
 
+# =============================================================================
+# find_graph_paths — how two entity-graph nodes are connected
+# =============================================================================
+
+
+def tool_find_graph_paths(
+    tenant_id: str,
+    *,
+    entity_id: str,
+    src_type: str,
+    src_key: str,
+    dst_type: str,
+    dst_key: str,
+    k: int = 3,
+    max_hops: int = 4,
+    edge_types: list[str] | None = None,
+    direction: str = "both",
+    as_of: str | None = None,
+) -> dict:
+    """The k shortest typed paths between two nodes of the persisted entity
+    graph (fewest hops first, at most max_hops edges each). The path question
+    in one call — traverse_graph would need the agent to walk neighbors hop by
+    hop and stitch the route itself."""
+    if not tenant_id:
+        raise MCPToolError(
+            "find_graph_paths requires tenant_id — caller's token did not "
+            "carry one (I2 violation)."
+        )
+    if not entity_id or not str(entity_id).strip():
+        raise MCPToolError("find_graph_paths requires entity_id (I2).")
+
+    from backend.db.edge_store import EdgeContractError, EdgeIdentityError, get_edge_store
+    try:
+        paths = get_edge_store().find_paths(
+            tenant_id, entity_id, (src_type, src_key), (dst_type, dst_key),
+            k=k, max_hops=max_hops, edge_types=edge_types or None,
+            direction=direction, as_of=as_of,
+        )
+    except (EdgeIdentityError, EdgeContractError) as e:
+        raise MCPToolError(f"find_graph_paths: {e}")
+    return {
+        "entity_id": entity_id, "as_of": as_of,
+        "src": {"node_type": src_type, "node_key": src_key},
+        "dst": {"node_type": dst_type, "node_key": dst_key},
+        "paths": paths,
+    }
+
+
+# =============================================================================
+# financial_statements — multi-period statement bundle
+# =============================================================================
+
+
+def tool_financial_statements(
+    tenant_id: str,
+    *,
+    entity_id: str,
+    periods: list[str],
+    dcl_ingest_id: str | None = None,
+    _effective_domain_scope: tuple[str, ...] = (),
+) -> dict[str, Any]:
+    """Income statement, balance sheet and cash flow for one entity over
+    one or more periods, assembled and identity-checked from a single
+    store read (TripleQueryResolver.get_statements). dcl_ingest_id defaults
+    to the entity's current run pointer; the response names the run it
+    read as dcl_ingest_id, never a bare run_id (I1).
+
+    A statement spans eight domains — a token whose domain_scope excludes
+    any of them is refused outright rather than handed a partial statement
+    (Gate 3C D1)."""
+    if not tenant_id:
+        raise MCPToolError(
+            "financial_statements requires tenant_id — caller's token did "
+            "not carry one (I2 violation)."
+        )
+    if not entity_id or not str(entity_id).strip():
+        raise MCPToolError("financial_statements requires entity_id.")
+    if isinstance(periods, str):
+        periods = [periods]
+    if not periods:
+        raise MCPToolError("financial_statements requires at least one period.")
+
+    from backend.engine.query_resolver_v2 import STATEMENT_DOMAINS, TripleQueryResolver
+    if _effective_domain_scope:
+        missing = [d for d in STATEMENT_DOMAINS if d not in _effective_domain_scope]
+        if missing:
+            raise MCPToolError(
+                f"financial_statements: token domain_scope excludes "
+                f"{missing} — denied (allowed domains: "
+                f"{list(_effective_domain_scope)})"
+            )
+    try:
+        run_id = dcl_ingest_id or _store.get_current_run_id(tenant_id, entity_id)
+        bundle = TripleQueryResolver(tenant_id, run_id).get_statements(entity_id, periods)
+    except ValueError as e:
+        raise MCPToolError(f"financial_statements: {e}")
+    return {**bundle, "dcl_ingest_id": str(run_id)}
+
+
 # =============================================================================
 # Tool registry — the public tools (Gate 1A conflict pair + Gate 1B traversal)
 # =============================================================================
@@ -559,7 +695,9 @@ TOOL_SCHEMAS: dict[str, dict[str, Any]] = {
         "description": (
             "Traverse the persisted entity graph (typed entity-to-entity "
             "edges, bi-temporal). With node_type+node_key: that node's edges "
-            "and neighbors; without: the entity's whole subgraph. as_of (ISO "
+            "and neighbors — with depth > 1, every node within that many hops "
+            "(each with its hop distance) in one call, capped at max_nodes; "
+            "without: the entity's whole subgraph. as_of (ISO "
             "timestamp) reads the topology as it was believed at that time. "
             "tenant_id is derived from the caller's token."
         ),
@@ -574,6 +712,41 @@ TOOL_SCHEMAS: dict[str, dict[str, Any]] = {
                 "direction": {"type": "string", "enum": ["out", "in", "both"], "default": "both"},
                 "as_of": {"type": "string", "description": "ISO timestamp — knowledge-time as-of"},
                 "limit": {"type": "integer", "default": 500, "maximum": 5000},
+                "depth": {"type": "integer", "default": 1, "minimum": 1, "maximum": 6,
+                          "description": "Hops from node_type+node_key (BFS)"},
+                "edge_types": {"type": "array", "items": {"type": "string"},
+                               "description": "Edge types to follow (default: all)"},
+                "max_nodes": {"type": "integer", "default": 500, "maximum": 5000,
+                              "description": "Node cap for multi-hop traversal"},
+                "include_values": {"type": "boolean", "default": False,
+                                   "description": "Attach each node's current values"},
+            },
+        },
+    },
+    "find_graph_paths": {
+        "description": (
+            "How two nodes of the persisted entity graph are connected: the "
+            "k shortest typed paths from src to dst (fewest hops first), each "
+            "with its nodes and edges. Optional hop limit, edge-type "
+            "allow-list, direction and as_of (ISO timestamp). An empty list "
+            "means not connected within the bounds. tenant_id is derived "
+            "from the caller's token."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "required": ["entity_id", "src_type", "src_key", "dst_type", "dst_key"],
+            "properties": {
+                "entity_id": {"type": "string"},
+                "src_type": {"type": "string", "description": "e.g. department | service | org_unit"},
+                "src_key": {"type": "string"},
+                "dst_type": {"type": "string"},
+                "dst_key": {"type": "string"},
+                "k": {"type": "integer", "default": 3, "minimum": 1, "maximum": 10},
+                "max_hops": {"type": "integer", "default": 4, "minimum": 1, "maximum": 6},
+                "edge_types": {"type": "array", "items": {"type": "string"},
+                               "description": "Edge types a path may use (default: all)"},
+                "direction": {"type": "string", "enum": ["out", "in", "both"], "default": "both"},
+                "as_of": {"type": "string", "description": "ISO timestamp — knowledge-time as-of"},
             },
         },
     },
@@ -700,6 +873,29 @@ TOOL_SCHEMAS: dict[str, dict[str, Any]] = {
             },
         },
     },
+    "financial_statements": {
+        "description": (
+            "Income statement, balance sheet and cash flow for one entity "
+            "over one or more periods, read in a single query and checked "
+            "against the P&L / balance-sheet / cash-flow identities. A year "
+            "period ('2026') sums its quarters for the flow statements and "
+            "uses the Q4 balance sheet. dcl_ingest_id defaults to the "
+            "entity's current run. tenant_id is derived from the caller's "
+            "token."
+        ),
+        "inputSchema": {
+            "type": "object",
+            "required": ["entity_id", "periods"],
+            "properties": {
+                "entity_id": {"type": "string"},
+                "periods": {
+                    "type": "array", "items": {"type": "string"}, "minItems": 1,
+                    "description": "Quarter ('2026-Q1') or year ('2026') codes",
+                },
+                "dcl_ingest_id": {"type": "string", "description": "Ingest run to read (default: current)"},
+            },
+        },
+    },
 }
 
 
@@ -727,6 +923,8 @@ def dispatch(
         )
     if tool_name == "traverse_graph":
         return tool_traverse_graph(tenant_id, **args)
+    if tool_name == "find_graph_paths":
+        return tool_find_graph_paths(tenant_id, **args)
     if tool_name == "list_domains":
         return tool_list_domains(
             tenant_id, args.get("entity_id"),
@@ -748,4 +946,8 @@ def dispatch(
         return tool_reconciliation_recommend(tenant_id, **args)
     if tool_name == "trace_query":
         return tool_trace_query(tenant_id, **args)
+    if tool_name == "financial_statements":
+        return tool_financial_statements(
+            tenant_id, _effective_domain_scope=effective_domain_scope, **args
+        )
     raise MCPToolError(f"No dispatch handler for {tool_name!r}")
@@ -3,15 +3,30 @@ TripleQueryResolver v2 — resolves financial queries against semantic_triples i
 
 Unlike v1 (query_resolver.py) which resolves against the in-memory semantic graph,
 v2 resolves directly against the semantic_triples fact store.
+
+get_statements() is the multi-period report path: every statement domain for
+every requested period comes back in ONE query, and the three statements are
+assembled and identity-checked from that result by the same code the
+single-statement methods use.
 """
 
+from decimal import Decimal
+
+from backend.core import read_cache
 from backend.core.db import get_connection
+from backend.db.triple_store import domain_clause
 from backend.utils.log_utils import get_logger
 
 logger = get_logger(__name__)
 
 _IDENTITY_TOLERANCE = 0.05
 
+# Concept-root domains each statement is assembled from.
+_IS_DOMAINS = ["revenue", "cogs", "opex", "pnl"]
+_BS_DOMAINS = ["asset", "liability", "equity"]
+_CF_DOMAIN = "cash_flow"
+STATEMENT_DOMAINS = _IS_DOMAINS + _BS_DOMAINS + [_CF_DOMAIN]
+
 # Year-only period pattern: "2025", "2026" etc. — no quarter suffix
 import re
 _YEAR_ONLY_RE = re.compile(r"^\d{4}$")
@@ -41,20 +56,28 @@ class TripleQueryResolver:
         self.run_id = run_id
 
     def _query(self, sql: str, params: list) -> list[dict]:
-        """Execute a parameterized query and return rows as dicts."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(sql, params)
-                columns = [desc[0] for desc in cur.description]
-                return [dict(zip(columns, row)) for row in cur.fetchall()]
+        """Execute a parameterized query and return rows as dicts (through
+        the tenant's read cache)."""
+        def load() -> list[dict]:
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(sql, params)
+                    columns = [desc[0] for desc in cur.description]
+                    return [dict(zip(columns, row)) for row in cur.fetchall()]
+
+        return read_cache.get_or_load("query_resolver", self.tenant_id, [sql, params], load)
 
     def _query_scalar(self, sql: str, params: list):
-        """Execute a query and return a single scalar value."""
-        with get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(sql, params)
-                row = cur.fetchone()
-                return row[0] if row else None
+        """Execute a query and return a single scalar value (through the
+        tenant's read cache)."""
+        def load():
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(sql, params)
+                    row = cur.fetchone()
+                    return row[0] if row else None
+
+        return read_cache.get_or_load("query_resolver", self.tenant_id, [sql, params, "scalar"], load)
 
     # ------------------------------------------------------------------
     # Single metric
@@ -290,19 +313,25 @@ class TripleQueryResolver:
         cash_flow.operating.total -> {"operating": {"total": ...}}
         cash_flow.net_change -> {"net_change": ...}
         """
-        items = self.get_domain("cash_flow", entity_id, period)
-        result: dict = {}
+        items = self.get_domain(_CF_DOMAIN, entity_id, period)
         prefix_len = len("cash_flow.")
-        for item in items:
-            suffix = item["concept"][prefix_len:]
+        return self._nest_cash_flow(
+            {item["concept"][prefix_len:]: item["value"] for item in items}
+        )
+
+    @staticmethod
+    def _nest_cash_flow(flat: dict[str, float]) -> dict:
+        """{'operating.total': x, 'net_change': y} -> {'operating': {'total': x}, 'net_change': y}."""
+        result: dict = {}
+        for suffix, value in flat.items():
             parts = suffix.split(".", 1)
             if len(parts) == 2:
                 category, sub_key = parts
                 if category not in result:
                     result[category] = {}
-                result[category][sub_key] = item["value"]
+                result[category][sub_key] = value
             else:
-                result[parts[0]] = item["value"]
+                result[parts[0]] = value
         return result
 
     # ------------------------------------------------------------------
@@ -316,7 +345,11 @@ class TripleQueryResolver:
         Validates P&L identity: revenue.total - cogs.total - opex.total == pnl.ebitda.
         Raises ValueError if identity fails.
         """
-        all_domains = self._multi_domain_to_dict(["revenue", "cogs", "opex", "pnl"], entity_id, period)
+        all_domains = self._multi_domain_to_dict(_IS_DOMAINS, entity_id, period)
+        return self._assemble_income_statement(all_domains, entity_id, period)
+
+    def _assemble_income_statement(self, all_domains: dict, entity_id: str, period: str) -> dict:
+        """Completeness + P&L identity check over {domain: {sub_key: value}}."""
         revenue = all_domains["revenue"]
         cogs = all_domains["cogs"]
         opex = all_domains["opex"]
@@ -374,7 +407,11 @@ class TripleQueryResolver:
         uses Q4 snapshot rather than summing quarters.
         """
         bs_period = f"{period}-Q4" if _is_year_period(period) else period
-        all_domains = self._multi_domain_to_dict(["asset", "liability", "equity"], entity_id, bs_period)
+        all_domains = self._multi_domain_to_dict(_BS_DOMAINS, entity_id, bs_period)
+        return self._assemble_balance_sheet(all_domains, entity_id, period)
+
+    def _assemble_balance_sheet(self, all_domains: dict, entity_id: str, period: str) -> dict:
+        """Completeness + BS identity check over {domain: {sub_key: value}}."""
         assets = all_domains["asset"]
         liabilities = all_domains["liability"]
         equity = all_domains["equity"]
@@ -420,8 +457,10 @@ class TripleQueryResolver:
         Validates CF identity: operating.total + investing.total + financing.total == net_change.
         Raises ValueError if identity fails.
         """
-        cf = self._cf_to_dict(entity_id, period)
+        return self._assemble_cash_flow(self._cf_to_dict(entity_id, period), entity_id, period)
 
+    def _assemble_cash_flow(self, cf: dict, entity_id: str, period: str) -> dict:
+        """Completeness + CF identity check over the nested cash_flow dict."""
         op_total = cf.get("operating", {}).get("total")
         inv_total = cf.get("investing", {}).get("total")
         fin_total = cf.get("financing", {}).get("total")
@@ -453,6 +492,78 @@ class TripleQueryResolver:
 
         return cf
 
+    # ------------------------------------------------------------------
+    # Statement bundle (all three statements, many periods, one query)
+    # ------------------------------------------------------------------
+
+    def get_statements(self, entity_id: str, periods: list[str]) -> dict:
+        """
+        Income statement, balance sheet and cash flow for every period in
+        `periods`, from ONE query: the latest amount of every statement-domain
+        concept for every period code involved (a year expands to its four
+        quarters; its balance sheet is the Q4 snapshot, as in
+        get_balance_sheet). Year flows are summed per concept over the
+        quarters present, in exact numeric arithmetic like get_domain's SUM.
+
+        Returns {"entity_id", "periods", "statements": {period: {
+        "income_statement", "balance_sheet", "cash_flow"}}} with each
+        statement shaped exactly as its single-statement method returns it.
+        Raises ValueError (naming the period) if any statement is incomplete
+        or fails its identity — same checks, same messages.
+        """
+        periods = list(dict.fromkeys(periods))
+        if not periods:
+            raise ValueError("get_statements requires at least one period")
+        flow_codes = {
+            p: _quarter_periods(p) if _is_year_period(p) else [p] for p in periods
+        }
+        bs_code = {p: f"{p}-Q4" if _is_year_period(p) else p for p in periods}
+        codes = sorted({c for cs in flow_codes.values() for c in cs} | set(bs_code.values()))
+
+        domain_sql, domain_params = domain_clause(STATEMENT_DOMAINS, include_root=False)
+        sql = f"""
+            SELECT DISTINCT ON (entity_id, concept, property, period)
+                   concept, period, value::numeric AS value
+            FROM semantic_triples
+            WHERE tenant_id = %s
+              AND run_id = %s
+              AND {domain_sql}
+              AND entity_id = %s AND period = ANY(%s) AND property = 'amount'
+            ORDER BY entity_id, concept, property, period, created_at DESC
+        """
+        rows = self._query(
+            sql, [self.tenant_id, self.run_id, *domain_params, entity_id, codes],
+        )
+        by_code: dict[str, dict[str, Decimal]] = {}
+        for r in rows:
+            by_code.setdefault(r["period"], {})[r["concept"]] = r["value"]
+
+        def domains_at(domains: list[str], period_codes: list[str]) -> dict[str, dict[str, float]]:
+            totals: dict[str, Decimal] = {}
+            for code in period_codes:
+                for concept, value in by_code.get(code, {}).items():
+                    if concept.split(".", 1)[0] in domains:
+                        totals[concept] = totals.get(concept, Decimal(0)) + value
+            result: dict[str, dict[str, float]] = {d: {} for d in domains}
+            for concept, value in totals.items():
+                domain, sub_key = concept.split(".", 1)
+                result[domain][sub_key] = float(value)
+            return result
+
+        statements = {}
+        for p in periods:
+            cash_flow = self._nest_cash_flow(domains_at([_CF_DOMAIN], flow_codes[p])[_CF_DOMAIN])
+            statements[p] = {
+                "income_statement": self._assemble_income_statement(
+                    domains_at(_IS_DOMAINS, flow_codes[p]), entity_id, p,
+                ),
+                "balance_sheet": self._assemble_balance_sheet(
+                    domains_at(_BS_DOMAINS, [bs_code[p]]), entity_id, p,
+                ),
+                "cash_flow": self._assemble_cash_flow(cash_flow, entity_id, p),
+            }
+        return {"entity_id": entity_id, "periods": periods, "statements": statements}
+
     # ------------------------------------------------------------------
     # Provenance
     # ------------------------------------------------------------------
@@ -46,6 +46,9 @@ class SemanticGraph:
         self.edges: list[SGraphEdge] = []
         self._adjacency: dict[str, list[SGraphEdge]] = defaultdict(list)
         self._reverse_adj: dict[str, list[SGraphEdge]] = defaultdict(list)
+        # System-level MAPS_TO join index (build_join_index); None = stale.
+        self._sys_adj: dict[str, list[tuple[str, SGraphEdge]]] = {}
+        self._join_paths: Optional[dict[tuple[str, str], JoinPath]] = None
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -54,9 +57,11 @@ class SemanticGraph:
     def _add_node(self, node: SGraphNode) -> None:
         if node.id not in self.nodes:
             self.nodes[node.id] = node
+            self._join_paths = None
 
     def _add_edge(self, edge: SGraphEdge) -> None:
         self.edges.append(edge)
+        self._join_paths = None
         self._adjacency[edge.source_id].append(edge)
         self._reverse_adj[edge.target_id].append(edge)
 
@@ -307,30 +312,22 @@ class SemanticGraph:
             source="contour_map",
         )
 
-    def find_join_path(
-        self, system_a: str, system_b: str, max_hops: int = 3,
-    ) -> Optional[JoinPath]:
-        """BFS for the shortest path connecting two systems via MAPS_TO edges.
-
-        Returns the path with intermediate systems, join fields, and confidence.
+    def build_join_index(self) -> None:
+        """Precompute the system-level join paths find_join_path serves.
+
+        Builds the system adjacency from MAPS_TO edges once —
+        (system_a) --[field_a → field_b]--> (system_b), traversable both ways
+        — then runs one BFS per system, so every reachable (system_a,
+        system_b) pair has its shortest JoinPath in a table. Among equally
+        short paths the highest total confidence wins; equal confidences keep
+        the first path in BFS discovery order (the order the per-call BFS
+        found). Called by rebuild_graph; any later node/edge add marks the
+        index stale and the next find_join_path rebuilds it.
         """
-        if system_a == system_b:
-            return JoinPath(
-                hops=[], total_confidence=1.0,
-                description=f"Same system: {system_a}",
-            )
-
-        # Collect all MAPS_TO edges, keyed by source system
-        maps_to_edges: list[SGraphEdge] = [
-            e for e in self.edges if e.type == "MAPS_TO"
-        ]
-        if not maps_to_edges:
-            return None
-
-        # Build a system-level adjacency from MAPS_TO edges
-        # (system_a) --[field_a → field_b]--> (system_b)
         sys_adj: dict[str, list[tuple[str, SGraphEdge]]] = defaultdict(list)
-        for e in maps_to_edges:
+        for e in self.edges:
+            if e.type != "MAPS_TO":
+                continue
             src_node = self.nodes.get(e.source_id)
             tgt_node = self.nodes.get(e.target_id)
             if not src_node or not tgt_node:
@@ -342,59 +339,92 @@ class SemanticGraph:
                 # Bidirectional — AAM edges can be traversed both ways
                 sys_adj[tgt_sys].append((src_sys, e))
 
-        # BFS
-        from collections import deque
-        queue: deque[tuple[str, list[tuple[str, str, SGraphEdge]]]] = deque()
-        queue.append((system_a, []))
-        visited = {system_a}
+        paths: dict[tuple[str, str], JoinPath] = {}
+        for origin in sys_adj:
+            # system -> (total confidence, previous system, edge into it)
+            reached: dict[str, tuple[float, Optional[str], Optional[SGraphEdge]]] = {
+                origin: (1.0, None, None),
+            }
+            frontier = [origin]
+            while frontier:
+                layer: dict[str, tuple[float, str, SGraphEdge]] = {}
+                discovered: list[str] = []
+                for current in frontier:
+                    conf = reached[current][0]
+                    for neighbor_sys, edge in sys_adj[current]:
+                        if neighbor_sys in reached:
+                            continue
+                        total = conf * edge.confidence
+                        held = layer.get(neighbor_sys)
+                        if held is None:
+                            discovered.append(neighbor_sys)
+                            layer[neighbor_sys] = (total, current, edge)
+                        elif total > held[0]:
+                            layer[neighbor_sys] = (total, current, edge)
+                reached.update(layer)
+                for target in discovered:
+                    paths[(origin, target)] = self._materialize_join_path(target, reached)
+                frontier = discovered
+
+        self._sys_adj = dict(sys_adj)
+        self._join_paths = paths
+
+    def _materialize_join_path(
+        self,
+        target: str,
+        reached: dict[str, tuple[float, Optional[str], Optional[SGraphEdge]]],
+    ) -> JoinPath:
+        steps: list[tuple[str, str, SGraphEdge]] = []
+        current = target
+        while reached[current][1] is not None:
+            _, prev, edge = reached[current]
+            steps.append((prev, current, edge))
+            current = prev
+        steps.reverse()
+
+        hops = []
+        for from_sys, to_sys, e in steps:
+            s_node = self.nodes.get(e.source_id)
+            t_node = self.nodes.get(e.target_id)
+            s_m = s_node.metadata if s_node else {}
+            t_m = t_node.metadata if t_node else {}
+            hops.append(JoinHop(
+                from_system=from_sys,
+                from_field=f"{s_m.get('table','')}.{s_m.get('field','')}",
+                to_system=to_sys,
+                to_field=f"{t_m.get('table','')}.{t_m.get('field','')}",
+                via=e.metadata.get("edge_type", "MAPS_TO"),
+                confidence=e.confidence,
+            ))
+        desc_parts = [f"{h.from_system}→{h.to_system}" for h in hops]
+        return JoinPath(
+            hops=hops,
+            total_confidence=reached[target][0],
+            description=" → ".join(desc_parts),
+        )
 
-        while queue:
-            current, path = queue.popleft()
-            if len(path) >= max_hops:
-                continue
+    def find_join_path(
+        self, system_a: str, system_b: str, max_hops: int = 3,
+    ) -> Optional[JoinPath]:
+        """Shortest path connecting two systems via MAPS_TO edges — a lookup
+        in the precomputed join index (build_join_index).
+
+        Returns the path with intermediate systems, join fields, and
+        confidence; None when no path of at most max_hops exists. The
+        returned JoinPath is shared with the index — treat it as read-only.
+        """
+        if system_a == system_b:
+            return JoinPath(
+                hops=[], total_confidence=1.0,
+                description=f"Same system: {system_a}",
+            )
 
-            for neighbor_sys, edge in sys_adj.get(current, []):
-                if neighbor_sys in visited:
-                    continue
-
-                src_node = self.nodes.get(edge.source_id)
-                tgt_node = self.nodes.get(edge.target_id)
-                src_meta = src_node.metadata if src_node else {}
-                tgt_meta = tgt_node.metadata if tgt_node else {}
-
-                new_path = path + [(current, neighbor_sys, edge)]
-
-                if neighbor_sys == system_b:
-                    # Build JoinPath from BFS result
-                    hops = []
-                    total_conf = 1.0
-                    for from_sys, to_sys, e in new_path:
-                        s_node = self.nodes.get(e.source_id)
-                        t_node = self.nodes.get(e.target_id)
-                        s_m = s_node.metadata if s_node else {}
-                        t_m = t_node.metadata if t_node else {}
-                        hop = JoinHop(
-                            from_system=from_sys,
-                            from_field=f"{s_m.get('table','')}.{s_m.get('field','')}",
-                            to_system=to_sys,
-                            to_field=f"{t_m.get('table','')}.{t_m.get('field','')}",
-                            via=e.metadata.get("edge_type", "MAPS_TO"),
-                            confidence=e.confidence,
-                        )
-                        hops.append(hop)
-                        total_conf *= e.confidence
-
-                    desc_parts = [f"{h.from_system}→{h.to_system}" for h in hops]
-                    return JoinPath(
-                        hops=hops,
-                        total_confidence=total_conf,
-                        description=" → ".join(desc_parts),
-                    )
-
-                visited.add(neighbor_sys)
-                queue.append((neighbor_sys, new_path))
-
-        return None
+        if self._join_paths is None:
+            self.build_join_index()
+        path = self._join_paths.get((system_a, system_b))
+        if path is None or len(path.hops) > max_hops:
+            return None
+        return path
 
     def resolve_dimension_filter(self, dimension: str, value: str) -> ResolvedFilter:
         """Resolve a dimension value through hierarchy and management overlay.
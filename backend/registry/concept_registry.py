@@ -6,6 +6,8 @@ Provides prefix-based validation: if 'revenue' is registered, then
 """
 
 from pathlib import Path
+from typing import Iterable
+
 import yaml
 from backend.utils.log_utils import get_logger
 
@@ -31,6 +33,7 @@ class ConceptRegistry:
             cid = entry.get("id")
             if cid:
                 self._concepts[cid] = entry
+        self._roots: frozenset[str] = frozenset(self._concepts)
 
         logger.info(f"[ConceptRegistry] Loaded {len(self._concepts)} concepts from {path.name}")
 
@@ -46,6 +49,15 @@ class ConceptRegistry:
         root = concept.split(".")[0]
         return root in self._concepts
 
+    def valid_concepts(self, concepts: Iterable[str]) -> set[str]:
+        """Batch form of is_valid_concept — the subset of `concepts` that is valid.
+
+        Collapses the input to its distinct concepts and checks each root once
+        against the precompiled root set, so the cost scales with the number of
+        distinct concepts, not with how many rows carry them.
+        """
+        return {c for c in set(concepts) if c and c.split(".", 1)[0] in self._roots}
+
     def list_concepts(self) -> list[str]:
         """All registered root concept names."""
         return sorted(self._concepts.keys())
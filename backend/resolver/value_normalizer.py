@@ -28,7 +28,7 @@ an error. Period canonicalization still applies (it is representation-only).
 from __future__ import annotations
 
 import re
-from typing import Any, Optional, Tuple
+from typing import Any, Iterable, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -314,6 +314,19 @@ def normalize(
     # 3) canonicalize period representation
     canon = canon_period(period)
 
+    return _result(
+        value=value, conv_value=conv_value, unit=unit, currency=currency,
+        period=period, canon=canon, scale_factor=scale_factor,
+        fx_rate=fx_rate, canonical_currency=canonical_currency,
+    )
+
+
+def _result(
+    *, value: Any, conv_value: Any, unit: Optional[str],
+    currency: Optional[str], period: Optional[str], canon: Optional[str],
+    scale_factor: float, fx_rate: float, canonical_currency: str,
+) -> dict:
+    """Assemble normalize()'s return shape from the three resolved steps."""
     unit_changed = scale_factor != 1.0
     currency_changed = (
         currency is not None and currency != canonical_currency
@@ -349,6 +362,135 @@ def normalize(
     }
 
 
+# ---------------------------------------------------------------------------
+# Batch normalization. An ingest batch carries thousands of rows but only a
+# handful of distinct (unit, currency, period) combinations, so the unit-table
+# lookup, FX-rate lookup and period parse are resolved ONCE per combination
+# and only the per-row arithmetic (scale × rate on numerics) runs per row.
+# Results — values, units, periods and normalization_metadata — are identical
+# to calling normalize() row by row; so are the failures (same ValueError
+# message, raised for the same row).
+# ---------------------------------------------------------------------------
+
+_UNRESOLVED = object()
+
+
+class BatchNormalizationError(ValueError):
+    """A row in a normalize_batch() call failed. ``index`` is its position in
+    the input; the message is exactly what normalize() would have raised."""
+
+    def __init__(self, index: int, error: ValueError):
+        super().__init__(str(error))
+        self.index = index
+
+
+class BatchNormalizer:
+    """normalize() with per-(unit, currency, period) resolution memoized.
+
+    One instance per ingest (one policy). Used directly by the streaming
+    ingest, which sees rows one at a time, and by normalize_batch().
+    """
+
+    def __init__(self, policy: dict):
+        self._canonical_currency = policy["canonical_currency"]
+        self._fx_rates = policy.get("fx_rates") or {}
+        self._units: dict = {}
+        self._rates: dict = {}
+        self._periods: dict = {}
+
+    def _unit_factor(self, unit: Optional[str]):
+        """Scale factor for a unit, or _UNRESOLVED when it is not in the table."""
+        factor = self._units.get(unit)
+        if factor is None:
+            key = _unit_key(unit)
+            factor = BASE_UNIT_SCALES[key][0] if key in BASE_UNIT_SCALES else _UNRESOLVED
+            self._units[unit] = factor
+        return factor
+
+    def _fx_rate(self, currency: Optional[str]):
+        """FX rate to canonical, 1.0 for canonical/None, _UNRESOLVED if unset."""
+        rate = self._rates.get(currency)
+        if rate is None:
+            if currency is None or currency == self._canonical_currency:
+                rate = 1.0
+            else:
+                raw = self._fx_rates.get(currency)
+                rate = _UNRESOLVED if raw is None else float(raw)
+            self._rates[currency] = rate
+        return rate
+
+    def _canon(self, period: Optional[str]):
+        """Canonical period, or the ValueError canon_period raised for it."""
+        if period in self._periods:
+            return self._periods[period]
+        try:
+            canon = canon_period(period)
+        except ValueError as e:
+            canon = e
+        self._periods[period] = canon
+        return canon
+
+    def normalize(
+        self, *, value: Any, unit: Optional[str], currency: Optional[str],
+        period: Optional[str],
+    ) -> dict:
+        """Same contract as the module-level normalize()."""
+        # 1) scale unit -> base
+        factor = self._unit_factor(unit)
+        if factor is _UNRESOLVED:
+            # Unknown unit: fails loud on a numeric (scale_to_base raises the
+            # canonical message), passes a non-numeric through.
+            base_value, scale_factor = scale_to_base(value, unit)
+        elif factor == 1.0 or not _is_number(value):
+            base_value, scale_factor = value, 1.0
+        else:
+            base_value, scale_factor = _round_num(value * factor), factor
+
+        # 2) convert currency -> canonical
+        rate = self._fx_rate(currency)
+        if rate is _UNRESOLVED:
+            convert_currency(
+                base_value, currency, self._canonical_currency, self._fx_rates,
+            )  # raises the canonical missing-rate ValueError
+        if rate == 1.0 and (currency is None or currency == self._canonical_currency):
+            conv_value, fx_rate = base_value, 1.0
+        elif not _is_number(base_value):
+            conv_value, fx_rate = base_value, rate
+        else:
+            conv_value, fx_rate = _round_num(base_value * rate), rate
+
+        # 3) canonicalize period representation
+        canon = self._canon(period)
+        if isinstance(canon, ValueError):
+            raise ValueError(str(canon))
+
+        return _result(
+            value=value, conv_value=conv_value, unit=unit, currency=currency,
+            period=period, canon=canon, scale_factor=scale_factor,
+            fx_rate=fx_rate, canonical_currency=self._canonical_currency,
+        )
+
+
+def normalize_batch(items: Iterable[dict], *, policy: dict) -> list[dict]:
+    """Normalize many values against one policy.
+
+    ``items`` are dicts with value/unit/currency/period keys. Returns one
+    normalize()-shaped result per item, in order. The first failing row raises
+    BatchNormalizationError (a ValueError) carrying that row's index.
+    """
+    normalizer = BatchNormalizer(policy)
+    results = []
+    for i, item in enumerate(items):
+        try:
+            results.append(normalizer.normalize(
+                value=item["value"], unit=item.get("unit"),
+                currency=item.get("currency"), period=item.get("period"),
+            ))
+        except ValueError as e:
+            raise BatchNormalizationError(i, e) from e
+    return results
+
+
 def base_unit_for(unit: Optional[str]) -> Optional[str]:
     """The canonical base-unit name for a unit string ('usd_thousands' -> 'usd';
     'thousands' -> None). Unknown units pass through unchanged — only reached
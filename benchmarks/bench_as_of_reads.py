@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark — as-of (knowledge-time) reads against history depth (migration 037).
+
+For one tenant (optionally one entity) of semantic_triples or entity_edges,
+picks --points as-of timestamps spread over the quantiles of the tenant's
+ingested_at history and, at each, runs the as-of read two ways under
+EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON):
+
+  - two_column: ingested_at <= T AND (superseded_at IS NULL OR superseded_at > T)
+  - range:      knowledge_range @> T   (skipped until the table has the column)
+
+and reports per point the history depth (row versions ingested by T), the
+answer size (rows live at T), and per predicate the best execution time,
+shared buffers touched and the index the plan used. The two-column read's
+cost tracks history depth; the range read's should track the answer.
+
+Live database (DATABASE_URL). Read-only.
+
+Usage:
+    DATABASE_URL=postgresql://... python benchmarks/bench_as_of_reads.py \\
+        --tenant <uuid> [--entity <entity_id>] [--table entity_edges] \\
+        [--points 8] [--repeat 5]
+
+Prints a JSON summary.
+"""
+import argparse
+import json
+import os
+import sys
+
+try:
+    import psycopg2
+except ImportError:
+    print("ERROR: psycopg2 not installed.", file=sys.stderr)
+    sys.exit(1)
+
+_TWO_COLUMN = "ingested_at <= %s AND (superseded_at IS NULL OR superseded_at > %s)"
+_RANGE = "knowledge_range @> %s::timestamptz"
+
+
+def _indexes(node: dict, found: set[str]) -> set[str]:
+    """Index names the executed plan actually scanned."""
+    if node.get("Actual Loops", 1) and node.get("Index Name"):
+        found.add(node["Index Name"])
+    for child in node.get("Plans", []):
+        _indexes(child, found)
+    return found
+
+
+def _measure(cur, sql: str, params: list, repeat: int) -> dict:
+    best_ms, blocks, indexes = float("inf"), 0, set()
+    for _ in range(repeat):
+        cur.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql, params)
+        plan = cur.fetchone()[0][0]
+        if plan["Execution Time"] < best_ms:
+            best_ms = plan["Execution Time"]
+            # Buffer counts are cumulative — the root covers the tree.
+            blocks = plan["Plan"].get("Shared Hit Blocks", 0) \
+                + plan["Plan"].get("Shared Read Blocks", 0)
+            indexes = _indexes(plan["Plan"], set())
+    return {"best_ms": round(best_ms, 3), "shared_blocks": blocks,
+            "indexes": sorted(indexes)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tenant", required=True)
+    parser.add_argument("--entity", default=None)
+    parser.add_argument("--table", choices=["semantic_triples", "entity_edges"],
+                        default="semantic_triples")
+    parser.add_argument("--points", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        print("ERROR: DATABASE_URL not set.", file=sys.stderr)
+        return 2
+
+    scope, scope_params = "tenant_id = %s", [args.tenant]
+    if args.entity:
+        scope += " AND entity_id = %s"
+        scope_params.append(args.entity)
+
+    conn = psycopg2.connect(db_url)
+    conn.set_session(readonly=True, autocommit=True)
+    points = []
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT EXISTS (SELECT 1 FROM pg_attribute "
+                "WHERE attrelid = %s::regclass "
+                "AND attname = 'knowledge_range' AND NOT attisdropped)",
+                (args.table,),
+            )
+            has_range = cur.fetchone()[0]
+            fractions = [(i + 1) / args.points for i in range(args.points)]
+            cur.execute(
+                f"SELECT percentile_disc(%s::float8[]) WITHIN GROUP (ORDER BY ingested_at) "
+                f"FROM {args.table} WHERE {scope}",
+                [fractions] + scope_params,
+            )
+            as_ofs = sorted(set(cur.fetchone()[0] or []))
+            for as_of in as_ofs:
+                cur.execute(
+                    f"SELECT COUNT(*) FILTER (WHERE ingested_at <= %s), "
+                    f"       COUNT(*) FILTER (WHERE {_TWO_COLUMN}) "
+                    f"FROM {args.table} WHERE {scope}",
+                    [as_of, as_of, as_of] + scope_params,
+                )
+                depth, live = cur.fetchone()
+                base = f"SELECT * FROM {args.table} WHERE {scope} AND "
+                point = {
+                    "as_of": as_of.isoformat(),
+                    "history_depth": depth,
+                    "rows_live_at_as_of": live,
+                    "two_column": _measure(cur, base + _TWO_COLUMN,
+                                           scope_params + [as_of, as_of], args.repeat),
+                }
+                if has_range:
+                    point["range"] = _measure(cur, base + _RANGE,
+                                              scope_params + [as_of], args.repeat)
+                points.append(point)
+    finally:
+        conn.close()
+
+    print(json.dumps({
+        "table": args.table,
+        "tenant_id": args.tenant,
+        "entity_id": args.entity,
+        "knowledge_range": has_range,
+        "repeat": args.repeat,
+        "points": points,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark — current-state reads against the tiered semantic_triples (migration 033).
+
+For one tenant, runs the current-state read shapes the API issues
+(semantic_triples_current by tenant, by tenant + entity, the WHERE
+is_active = true domain count) under EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)
+and reports, per query, the relations the executed plan touched, whether any
+of them is a history-tier partition, shared buffers read and the best
+execution time. An as-of read is included for contrast — it is the one shape
+expected to reach into history.
+
+Live database (DATABASE_URL). Read-only.
+
+Usage:
+    DATABASE_URL=postgresql://... python benchmarks/bench_current_state_reads.py \\
+        --tenant <uuid> [--entity <entity_id>] [--repeat 5]
+
+Prints a JSON summary.
+"""
+import argparse
+import json
+import os
+import sys
+
+try:
+    import psycopg2
+except ImportError:
+    print("ERROR: psycopg2 not installed.", file=sys.stderr)
+    sys.exit(1)
+
+
+def _queries(tenant: str, entity: str | None) -> dict[str, tuple[str, tuple]]:
+    queries = {
+        "current_by_tenant": (
+            "SELECT entity_id, concept, property, value FROM semantic_triples_current "
+            "WHERE tenant_id = %s",
+            (tenant,),
+        ),
+        "domain_counts": (
+            "SELECT split_part(concept, '.', 1), COUNT(*) FROM semantic_triples "
+            "WHERE tenant_id = %s AND is_active = true GROUP BY 1",
+            (tenant,),
+        ),
+        "as_of_one_day_ago": (
+            "SELECT entity_id, concept, property, value FROM semantic_triples "
+            "WHERE tenant_id = %s AND ingested_at <= now() - interval '1 day' "
+            "  AND (superseded_at IS NULL OR superseded_at > now() - interval '1 day')",
+            (tenant,),
+        ),
+    }
+    if entity:
+        queries["current_by_entity"] = (
+            "SELECT concept, property, value FROM semantic_triples_current "
+            "WHERE tenant_id = %s AND entity_id = %s",
+            (tenant, entity),
+        )
+    return queries
+
+
+def _relations(node: dict, found: set[str]) -> set[str]:
+    """Relation names the executed plan actually scanned."""
+    # Partitions pruned at run time never execute (Actual Loops = 0).
+    if node.get("Actual Loops", 1) and node.get("Relation Name"):
+        found.add(node["Relation Name"])
+    for child in node.get("Plans", []):
+        _relations(child, found)
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tenant", required=True)
+    parser.add_argument("--entity", default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        print("ERROR: DATABASE_URL not set.", file=sys.stderr)
+        return 2
+
+    conn = psycopg2.connect(db_url)
+    conn.set_session(readonly=True, autocommit=True)
+    results = {}
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass('semantic_triples')")
+            partitioned = cur.fetchone()[0] == "p"
+            for name, (sql, params) in _queries(args.tenant, args.entity).items():
+                best_ms, relations, blocks = float("inf"), set(), 0
+                for _ in range(args.repeat):
+                    cur.execute("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + sql, params)
+                    plan = cur.fetchone()[0][0]
+                    run_relations = _relations(plan["Plan"], set())
+                    # Buffer counts are cumulative — the root covers the tree.
+                    run_blocks = plan["Plan"].get("Shared Hit Blocks", 0) \
+                        + plan["Plan"].get("Shared Read Blocks", 0)
+                    if plan["Execution Time"] < best_ms:
+                        best_ms, relations, blocks = plan["Execution Time"], run_relations, run_blocks
+                results[name] = {
+                    "best_ms": round(best_ms, 3),
+                    "shared_blocks": blocks,
+                    "relations": sorted(relations),
+                    "touches_history": any(r.startswith("semantic_triples_history") for r in relations),
+                }
+    finally:
+        conn.close()
+
+    print(json.dumps({
+        "partitioned": partitioned,
+        "tenant_id": args.tenant,
+        "repeat": args.repeat,
+        "queries": results,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark — k-shortest-path latency over entity-graph adjacency snapshots.
+
+Builds a deterministic synthetic enterprise graph per --sizes edge count: an
+org_unit → department → team → service ownership tree (HAS) plus random
+cross-links (GENERATES between services, REPORTS_TO between teams,
+BELONGS_TO back to departments) until the edge count is reached — the shape
+/api/dcl/graph/paths and find_graph_paths search. For each size it reports
+the AdjacencySnapshot build time (the cost of a cache miss, after the edge
+read) and, over --pairs random (src, dst) node pairs, p50/p95/max latency of
+AdjacencySnapshot.paths for each --k, plus how many pairs were connected
+within --max-hops. Pure CPU, no database.
+
+Usage:
+    python benchmarks/bench_graph_paths.py [--sizes 10000,100000,1000000] \\
+        [--k 1,3] [--max-hops 4] [--pairs 200] [--seed 7]
+
+Prints a JSON summary.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.db.edge_adjacency import AdjacencySnapshot
+
+
+def _edge(src_type, src_key, edge_type, dst_type, dst_key):
+    return {"src_type": src_type, "src_key": src_key, "edge_type": edge_type,
+            "dst_type": dst_type, "dst_key": dst_key}
+
+
+def synthetic_graph(edges: int, rng: random.Random) -> list[dict]:
+    """Ownership tree (~40% of the edges) plus random typed cross-links."""
+    tree = int(edges * 0.4)
+    depts = max(tree // 200, 1)
+    teams = max(tree // 20, 1)
+    services = max(tree - depts - teams, 1)
+    out = [_edge("org_unit", "org", "HAS", "department", f"d{i}") for i in range(depts)]
+    out += [_edge("department", f"d{i % depts}", "HAS", "team", f"t{i}") for i in range(teams)]
+    out += [_edge("team", f"t{i % teams}", "HAS", "service", f"s{i}") for i in range(services)]
+    seen = set()
+    while len(out) < edges:
+        kind = rng.random()
+        if kind < 0.6:
+            e = _edge("service", f"s{rng.randrange(services)}", "GENERATES",
+                      "service", f"s{rng.randrange(services)}")
+        elif kind < 0.9:
+            e = _edge("team", f"t{rng.randrange(teams)}", "REPORTS_TO",
+                      "team", f"t{rng.randrange(teams)}")
+        else:
+            e = _edge("service", f"s{rng.randrange(services)}", "BELONGS_TO",
+                      "department", f"d{rng.randrange(depts)}")
+        coord = (e["src_key"], e["edge_type"], e["dst_key"])
+        if e["src_key"] != e["dst_key"] and coord not in seen:
+            seen.add(coord)
+            out.append(e)
+    return out
+
+
+def _pct(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * p), len(ordered) - 1)]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--k", default="1,3")
+    parser.add_argument("--max-hops", type=int, default=4)
+    parser.add_argument("--pairs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    results = []
+    for size in (int(s) for s in args.sizes.split(",")):
+        rng = random.Random(args.seed)
+        edges = synthetic_graph(size, rng)
+        t0 = time.perf_counter()
+        snap = AdjacencySnapshot(edges)
+        build_ms = (time.perf_counter() - t0) * 1000
+        pairs = [(snap.nodes[rng.randrange(len(snap.nodes))],
+                  snap.nodes[rng.randrange(len(snap.nodes))])
+                 for _ in range(args.pairs)]
+        row = {"edges": len(edges), "nodes": len(snap.nodes),
+               "snapshot_build_ms": round(build_ms, 1), "queries": {}}
+        for k in (int(x) for x in args.k.split(",")):
+            lat, connected = [], 0
+            for src, dst in pairs:
+                t0 = time.perf_counter()
+                found = snap.paths(src, dst, k=k, max_hops=args.max_hops)
+                lat.append((time.perf_counter() - t0) * 1000)
+                connected += bool(found)
+            row["queries"][f"k={k}"] = {
+                "p50_ms": round(_pct(lat, 0.50), 3),
+                "p95_ms": round(_pct(lat, 0.95), 3),
+                "max_ms": round(max(lat), 3),
+                "connected_pairs": connected,
+            }
+        results.append(row)
+
+    print(json.dumps({
+        "max_hops": args.max_hops,
+        "pairs": args.pairs,
+        "seed": args.seed,
+        "results": results,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark — hot reads as ad-hoc statements vs per-connection prepared
+statements (backend.core.db.execute_prepared).
+
+For one tenant, runs the hot read shapes routed through execute_prepared —
+the MCP domain read (mcp_query_triples), the live domain count
+(count_by_domain) and the edge derivation's per-concept current read — on ONE
+pooled connection, first as plain cur.execute() and then through
+execute_prepared(), and reports per shape:
+
+  - planning_ms: server planning time from EXPLAIN (ANALYZE) of the ad-hoc
+    statement vs of EXECUTE <prepared statement> (median over --repeat; once
+    Postgres settles on the generic plan the prepared side is ~0);
+  - execution_ms: median server execution time, both ways;
+  - wall_ms: median client wall time per call, both ways (round trip included).
+
+Live database (DATABASE_URL), read-only. Prepared statements must be enabled
+for the connection (DCL_PREPARED_STATEMENTS=on, or auto off the :6543
+transaction pooler). The whole run holds one transaction so every call lands
+on the same server session.
+
+Usage:
+    DATABASE_URL=postgresql://... python benchmarks/bench_prepared_reads.py \\
+        --tenant <uuid> [--entity <entity_id>] [--domain revenue] [--repeat 20]
+
+Prints a JSON summary.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.core.db import (  # noqa: E402
+    execute_prepared,
+    get_connection,
+    prepared_name,
+    prepared_statements_enabled,
+)
+
+_MCP_COLS = (
+    "id, tenant_id, entity_id, concept, property, value, period, currency, unit, "
+    "source_system, source_field, fabric_plane, fabric_product, pipe_id, run_id, "
+    "confidence_score, confidence_tier, is_active, created_at, ingested_at, "
+    "superseded_at, valid_from, valid_to"
+)
+
+
+def _queries(tenant: str, entity: str | None, domain: str) -> dict[str, tuple[str, list]]:
+    queries = {
+        "mcp_query_triples_domain": (
+            f"SELECT {_MCP_COLS} FROM semantic_triples "
+            "WHERE tenant_id = %s AND (concept = %s OR concept LIKE %s) AND is_active = true "
+            "ORDER BY created_at DESC, id DESC LIMIT 100",
+            [tenant, domain, f"{domain}.%"],
+        ),
+        "count_by_domain": (
+            "SELECT domain, SUM(live_count)::bigint AS cnt FROM triple_rollups "
+            "WHERE live_count > 0 AND tenant_id = %s AND dcl_ingest_id IN "
+            "(SELECT current_run_id FROM tenant_runs WHERE tenant_id = %s) "
+            "GROUP BY domain ORDER BY domain",
+            [tenant, tenant],
+        ),
+    }
+    if entity:
+        queries["read_current_triples"] = (
+            "SELECT property, value, source_system FROM semantic_triples_current "
+            "WHERE tenant_id = %s AND entity_id = %s AND concept = %s AND period = %s",
+            [tenant, entity, f"{domain}.total", "2026-Q1"],
+        )
+    return queries
+
+
+def _explain(cur, sql: str, params: list) -> tuple[float, float]:
+    cur.execute("EXPLAIN (ANALYZE, FORMAT JSON) " + sql, params or None)
+    plan = cur.fetchone()[0][0]
+    return plan["Planning Time"], plan["Execution Time"]
+
+
+def _timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tenant", required=True)
+    parser.add_argument("--entity", default=None)
+    parser.add_argument("--domain", default="revenue")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if not prepared_statements_enabled():
+        print("ERROR: prepared statements are disabled for this DATABASE_URL "
+              "(set DCL_PREPARED_STATEMENTS=on against a session-mode host).", file=sys.stderr)
+        return 2
+
+    results = {}
+    with get_connection() as conn:
+        try:
+            with conn.cursor() as cur:
+                for name, (sql, params) in _queries(args.tenant, args.entity, args.domain).items():
+                    def plain():
+                        cur.execute(sql, params)
+                        cur.fetchall()
+
+                    def prepared():
+                        execute_prepared(cur, sql, params)
+                        cur.fetchall()
+
+                    plain_wall = _timed(plain, args.repeat)
+                    prepared_wall = _timed(prepared, args.repeat)
+                    execute = f"EXECUTE {prepared_name(sql)}({', '.join(['%s'] * len(params))})"
+                    adhoc = [_explain(cur, sql, params) for _ in range(args.repeat)]
+                    cached = [_explain(cur, execute, params) for _ in range(args.repeat)]
+                    results[name] = {
+                        "planning_ms": {
+                            "adhoc": round(statistics.median(p for p, _ in adhoc), 3),
+                            "prepared": round(statistics.median(p for p, _ in cached), 3),
+                        },
+                        "execution_ms": {
+                            "adhoc": round(statistics.median(e for _, e in adhoc), 3),
+                            "prepared": round(statistics.median(e for _, e in cached), 3),
+                        },
+                        "wall_ms": {
+                            "adhoc": round(plain_wall, 3),
+                            "prepared": round(prepared_wall, 3),
+                        },
+                    }
+        finally:
+            conn.rollback()
+
+    print(json.dumps({
+        "tenant_id": args.tenant,
+        "repeat": args.repeat,
+        "queries": results,
+    }, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark — per-triple cost of the ingest normalization chokepoint.
+
+Compares row-by-row value_normalizer.normalize() (one unit lookup, FX lookup
+and period parse per triple) against normalize_batch() (resolved once per
+distinct (unit, currency, period)) on a Farm-shaped 1K batch: mostly base USD
+monthly rows, some thousands-scaled general_ledger rows, a few EUR rows, mixed
+period spellings. Pure CPU, no database.
+
+Usage:
+    python benchmarks/bench_value_normalizer.py [--rows 1000] [--repeat 50]
+
+Prints a JSON summary (µs per triple, before/after, speedup).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend.resolver.value_normalizer import normalize, normalize_batch
+
+POLICY = {"canonical_currency": "USD", "fx_rates": {"EUR": 1.08}}
+
+_PERIODS = ["2026-01", "2026-02", "2026-03", "Mar-2026", "2026-Q1", "2026"]
+_SHAPES = [
+    ("usd", "USD"),
+    ("usd", "USD"),
+    ("usd", "USD"),
+    ("usd_thousands", "USD"),
+    (None, "USD"),
+    ("days", None),
+    ("usd", "EUR"),
+]
+
+
+def farm_batch(rows: int) -> list[dict]:
+    """Deterministic Farm-shaped batch: few distinct combinations, many rows."""
+    items = []
+    for i in range(rows):
+        unit, currency = _SHAPES[i % len(_SHAPES)]
+        items.append({
+            "value": 1000.0 + (i * 37) % 9973,
+            "unit": unit,
+            "currency": currency,
+            "period": _PERIODS[(i // len(_SHAPES)) % len(_PERIODS)],
+        })
+    return items
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    items = farm_batch(args.rows)
+    assert normalize_batch(items, policy=POLICY) == [
+        normalize(policy=POLICY, **it) for it in items
+    ], "normalize_batch diverged from normalize()"
+
+    before = _best_of(lambda: [normalize(policy=POLICY, **it) for it in items], args.repeat)
+    after = _best_of(lambda: normalize_batch(items, policy=POLICY), args.repeat)
+    distinct = len({(it["unit"], it["currency"], it["period"]) for it in items})
+
+    print(json.dumps({
+        "rows": args.rows,
+        "distinct_combinations": distinct,
+        "per_triple_us_before": round(before / args.rows * 1e6, 3),
+        "per_triple_us_after": round(after / args.rows * 1e6, 3),
+        "speedup": round(before / after, 2) if after else None,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Ingest throughput benchmark — POST /api/dcl/ingest-triples against a local Postgres.
+
+Drives the real FastAPI app in-process (TestClient: same validation,
+normalization, COPY write and post-ingest path as a Farm push, no network
+hop) with synthetic Farm-shaped batches (benchmarks/ingest/generator.py)
+across a matrix of:
+  - batch size            (--batch-sizes, triples per request)
+  - write mode            append: one run pushed in batches (?append=true)
+                          replace: the same run re-pushed (?replace=true)
+  - post-ingest           sync:   ?sync=true — domain summary + conflict
+                                  detection run before the response
+                          queued: ?sync=false — the same post-ingest job
+                                  (detection included) is only queued; the
+                                  in-process worker is disabled here, so
+                                  nothing drains it mid-measurement. This
+                                  measures deferring detection, not
+                                  skipping it — the job still runs it.
+
+Per case it reports triples/second over the measured requests and
+p50 / p99 / mean / max request latency. Results are JSON so two commits can
+be diffed with benchmarks/ingest/compare.py.
+
+Local database only: the URL's host must be localhost / a unix socket. The
+schema is brought up with migrations/run_migration.py first (idempotent);
+the bench tenant's rows are removed before and after.
+
+Usage:
+    DATABASE_URL=postgresql://postgres@localhost:5432/dcl_bench \\
+        python benchmarks/ingest/bench_ingest.py \\
+        [--batch-sizes 100,1000,5000] [--requests 10] [--warmup 1] \\
+        [--modes append,replace] [--post-ingest sync,queued] [--out results.json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlparse
+
+_repo = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(_repo))
+
+from benchmarks.ingest.generator import farm_batch
+
+BENCH_TENANT_ID = str(uuid.uuid5(uuid.NAMESPACE_DNS, "ingest-throughput-bench"))
+BENCH_ENTITY = "IngestBench-E1"
+
+_LOCAL_HOSTS = {None, "", "localhost", "127.0.0.1", "::1"}
+
+_CLEANUP_TABLES = (
+    "ingest_jobs", "conflict_dispositions", "conflict_register",
+    "semantic_triples", "ingest_runs", "triple_rollups",
+    "run_group_digests", "tenant_runs", "ingest_log",
+)
+
+
+def _percentile(sorted_ms: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, -(-len(sorted_ms) * pct // 100))  # ceil without math
+    return sorted_ms[int(rank) - 1]
+
+
+def _cleanup(get_connection) -> None:
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            for table in _CLEANUP_TABLES:
+                cur.execute(f"DELETE FROM {table} WHERE tenant_id = %s", (BENCH_TENANT_ID,))
+            conn.commit()
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=_repo, capture_output=True,
+            text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_case(client, batch_size: int, mode: str, post_ingest: str,
+             requests: int, warmup: int) -> dict:
+    run_id = str(uuid.uuid4())
+    params = {"sync": "true" if post_ingest == "sync" else "false"}
+    params["replace" if mode == "replace" else "append"] = "true"
+    latencies: list[float] = []
+    written = 0
+    for i in range(warmup + requests):
+        body = {
+            "tenant_id": BENCH_TENANT_ID, "dcl_ingest_id": run_id,
+            "entity_id": BENCH_ENTITY,
+            "snapshot_name": f"{BENCH_ENTITY}-{run_id.replace('-', '')[:4]}",
+            # replace re-pushes the entity's coordinates with new values;
+            # append moves each batch onto fresh coordinates so batches of
+            # the run never collide with each other.
+            "triples": farm_batch(
+                BENCH_ENTITY, batch_size, seed=i,
+                coord_offset=0 if mode == "replace" else i * batch_size,
+            ),
+        }
+        t0 = time.perf_counter()
+        resp = client.post("/api/dcl/ingest-triples", params=params, json=body)
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        if resp.status_code != 201:
+            raise RuntimeError(
+                f"ingest failed ({batch_size}/{mode}/{post_ingest}): "
+                f"{resp.status_code} {resp.text[:500]}"
+            )
+        if i >= warmup:
+            latencies.append(elapsed_ms)
+            written += resp.json()["triples_written"]
+
+    latencies.sort()
+    total_s = sum(latencies) / 1000
+    return {
+        "batch_size": batch_size,
+        "mode": mode,
+        "post_ingest": post_ingest,
+        "requests": requests,
+        "triples_written": written,
+        "triples_per_s": round(written / total_s, 1) if total_s else None,
+        "p50_ms": round(_percentile(latencies, 50), 2),
+        "p99_ms": round(_percentile(latencies, 99), 2),
+        "mean_ms": round(sum(latencies) / len(latencies), 2),
+        "max_ms": round(latencies[-1], 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--batch-sizes", default="100,1000,5000")
+    parser.add_argument("--requests", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--modes", default="append,replace")
+    parser.add_argument("--post-ingest", default="sync,queued")
+    parser.add_argument("--skip-migrations", action="store_true")
+    parser.add_argument("--out", default=None, help="Write JSON here (default: stdout).")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        print("ERROR: DATABASE_URL not set (or pass --database-url).", file=sys.stderr)
+        return 2
+    if urlparse(args.database_url).hostname not in _LOCAL_HOSTS:
+        print("ERROR: the ingest bench writes and deletes rows — local Postgres only.",
+              file=sys.stderr)
+        return 2
+
+    # Must be in the environment before backend imports read it.
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["DCL_INGEST_WORKER_ENABLED"] = "false"
+    os.environ.pop("DCL_INGEST_SYNC_DEFAULT", None)
+
+    if not args.skip_migrations:
+        subprocess.run(
+            [sys.executable, str(_repo / "migrations" / "run_migration.py")],
+            cwd=_repo, check=True, stdout=sys.stderr,
+        )
+
+    from fastapi.testclient import TestClient
+    from backend.api.main import app
+    from backend.core.db import get_connection
+
+    # No `with` — the lifespan (scheduler, ingest worker, warmup) stays off.
+    client = TestClient(app, raise_server_exceptions=True)
+
+    batch_sizes = [int(b) for b in args.batch_sizes.split(",") if b]
+    modes = [m for m in args.modes.split(",") if m]
+    post_ingests = [p for p in args.post_ingest.split(",") if p]
+    for p in post_ingests:
+        if p not in ("sync", "queued"):
+            parser.error(f"--post-ingest: unknown value {p!r} (sync, queued)")
+
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SHOW server_version")
+            server_version = cur.fetchone()[0]
+
+    cases = []
+    _cleanup(get_connection)
+    try:
+        for batch_size in batch_sizes:
+            for mode in modes:
+                for post_ingest in post_ingests:
+                    case = run_case(client, batch_size, mode, post_ingest,
+                                    args.requests, args.warmup)
+                    print(f"  {batch_size:>6} {mode:<7} {post_ingest:<6} "
+                          f"{case['triples_per_s']:>10} triples/s  "
+                          f"p50={case['p50_ms']}ms p99={case['p99_ms']}ms",
+                          file=sys.stderr)
+                    cases.append(case)
+                    _cleanup(get_connection)
+    finally:
+        _cleanup(get_connection)
+
+    result = json.dumps({
+        "benchmark": "ingest-triples",
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "postgres": server_version,
+        "config": {
+            "requests": args.requests, "warmup": args.warmup,
+            "batch_sizes": batch_sizes, "modes": modes,
+            "post_ingest": post_ingests,
+        },
+        "cases": cases,
+    }, indent=2)
+    if args.out:
+        Path(args.out).write_text(result + "\n")
+    else:
+        print(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Diff two bench_ingest.py result files (e.g. main vs a branch).
+
+Cases are matched on (batch_size, mode, post_ingest). For each it
+prints throughput and p50/p99 latency with the relative change, and exits 1
+when any matched case regressed past --threshold (throughput down, or p50 /
+p99 up, by more than that fraction) — usable as a CI gate.
+
+Usage:
+    python benchmarks/ingest/compare.py baseline.json candidate.json [--threshold 0.10]
+"""
+import argparse
+import json
+import sys
+
+
+def _key(case: dict) -> tuple:
+    return case["batch_size"], case["mode"], case["post_ingest"]
+
+
+def _change(old, new) -> float | None:
+    if not old or new is None:
+        return None
+    return (new - old) / old
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        base = json.load(f)
+    with open(args.candidate) as f:
+        cand = json.load(f)
+    base_cases = {_key(c): c for c in base["cases"]}
+
+    print(f"baseline  {base.get('commit') or '?'}")
+    print(f"candidate {cand.get('commit') or '?'}")
+    print(f"{'case':<28} {'triples/s':>22} {'p50 ms':>20} {'p99 ms':>20}")
+    regressions = []
+    for case in cand["cases"]:
+        old = base_cases.get(_key(case))
+        label = f"{case['batch_size']} {case['mode']} {case['post_ingest']}"
+        if old is None:
+            print(f"{label:<28} (no baseline)")
+            continue
+        cells = []
+        for metric, worse_if_up in (("triples_per_s", False), ("p50_ms", True), ("p99_ms", True)):
+            delta = _change(old[metric], case[metric])
+            cells.append(f"{case[metric]:>10} ({delta:+.1%})" if delta is not None
+                         else f"{case[metric]:>10} (   n/a)")
+            if delta is not None and (delta if worse_if_up else -delta) > args.threshold:
+                regressions.append(f"{label}: {metric} {delta:+.1%}")
+        print(f"{label:<28} {cells[0]:>22} {cells[1]:>20} {cells[2]:>20}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for r in regressions:
+            print(f"  {r}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Synthetic Farm-shaped triple generator for the ingest benchmarks.
+
+Deterministic (seeded) batches shaped like Farm's pushes to
+POST /api/dcl/ingest-triples:
+  - scalar KPIs per period, each from one source on its fabric plane;
+  - multi-source collisions — the same (concept, property, period) claimed
+    by two or three sources, some agreeing (structural) and some disagreeing
+    past the default materiality policy (value conflicts);
+  - ledger per-record rows — many rows per source for one coordinate
+    (invoice / journal detail), the shape conflict detection summarizes
+    per source.
+
+Every triple carries the full provenance contract (source_system,
+source_field, pipe_id, fabric_plane, confidence_score) so it passes the
+same validation a real Farm push does.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+
+# (source_system, fabric_plane, pipe_id) — one pipe per source, like a
+# Farm manifest.
+SOURCES = [
+    ("netsuite", "ipaas", "7a000000-0000-4000-8000-000000000001"),
+    ("sap", "ipaas", "7a000000-0000-4000-8000-000000000002"),
+    ("salesforce", "api_gateway", "7a000000-0000-4000-8000-000000000003"),
+    ("snowflake", "warehouse", "7a000000-0000-4000-8000-000000000004"),
+    ("workday", "ipaas", "7a000000-0000-4000-8000-000000000005"),
+    ("kafka_orders", "event_bus", "7a000000-0000-4000-8000-000000000006"),
+]
+
+# (concept, property) scalar KPIs.
+SCALAR_CONCEPTS = [
+    ("revenue.total", "amount"),
+    ("cost.opex.total", "amount"),
+    ("workforce.headcount.total", "count"),
+    ("accounts_receivable.balance", "amount"),
+    ("gl_account.balance", "amount"),
+    ("subscription.arr", "amount"),
+    ("opportunity.pipeline.value", "amount"),
+    ("cloud_spend.total", "amount"),
+]
+
+# (concept, property) ledger detail — many rows per source per coordinate.
+LEDGER_CONCEPTS = [
+    ("invoice.billing", "amount"),
+    ("journal_entry.amount", "amount"),
+]
+
+PERIODS = [f"2025-{m:02d}" for m in range(1, 13)]
+
+
+def _triple(entity_id: str, concept: str, prop: str, value, period: str,
+            source: tuple[str, str, str], field: str) -> dict:
+    system, plane, pipe = source
+    return {
+        "entity_id": entity_id, "concept": concept, "property": prop,
+        "value": value, "period": period, "currency": "USD",
+        "source_system": system, "source_table": f"{system}_{concept.split('.', 1)[0]}",
+        "source_field": field, "pipe_id": pipe, "fabric_plane": plane,
+        "confidence_score": 0.95, "confidence_tier": "exact",
+    }
+
+
+def farm_batch(
+    entity_id: str, n: int, *, seed: int = 0, coord_offset: int = 0,
+    collision_ratio: float = 0.15, ledger_ratio: float = 0.25,
+) -> list[dict]:
+    """Exactly `n` triples for one entity.
+
+    collision_ratio of the rows belong to multi-source collision groups,
+    ledger_ratio to per-record ledger groups, the rest are single-source
+    scalars. Coordinates never repeat within a batch except inside those
+    groups, so conflict counts scale with the ratios, not by accident.
+    Batches of one run that must not overlap (append) pass distinct
+    coord_offset values, e.g. batch_index * n.
+    """
+    rng = random.Random(seed)
+    out: list[dict] = []
+    coord = coord_offset
+
+    def next_coord(concepts):
+        nonlocal coord
+        concept, prop = concepts[coord % len(concepts)]
+        period = PERIODS[(coord // len(concepts)) % len(PERIODS)]
+        # Suffix the property once the concept x period grid is exhausted
+        # so large batches keep distinct coordinates.
+        lap = coord // (len(concepts) * len(PERIODS))
+        coord += 1
+        return concept, (f"{prop}_{lap}" if lap else prop), period
+
+    n_collide = int(n * collision_ratio)
+    n_ledger = int(n * ledger_ratio)
+
+    while n_collide > 0:
+        concept, prop, period = next_coord(SCALAR_CONCEPTS)
+        width = min(n_collide, rng.choice((2, 2, 3)))
+        base = round(rng.uniform(1e4, 1e7), 2)
+        disagree = rng.random() < 0.5
+        for i, source in enumerate(rng.sample(SOURCES, width)):
+            value = round(base * (1 + 0.1 * i), 2) if disagree else base
+            out.append(_triple(entity_id, concept, prop, value, period, source, prop))
+        n_collide -= width
+
+    while n_ledger > 0:
+        concept, prop, period = next_coord(LEDGER_CONCEPTS)
+        for source in rng.sample(SOURCES[:3], 2):
+            rows = min(n_ledger, rng.randint(5, 40))
+            for _ in range(rows):
+                out.append(_triple(
+                    entity_id, concept, prop, round(rng.uniform(10, 5e4), 2),
+                    period, source, f"line_{uuid.UUID(int=rng.getrandbits(128)).hex[:8]}",
+                ))
+            n_ledger -= rows
+            if n_ledger <= 0:
+                break
+
+    while len(out) < n:
+        concept, prop, period = next_coord(SCALAR_CONCEPTS)
+        out.append(_triple(
+            entity_id, concept, prop, round(rng.uniform(1e4, 1e7), 2), period,
+            rng.choice(SOURCES), prop,
+        ))
+    return out[:n]
@@ -0,0 +1,55 @@
+-- Migration 030: ingest_jobs — durable post-ingest work queue.
+--
+--   ingest_jobs — one row per ingest request (batch) or stream whose
+--     downstream stages (domain summary, conflict detection, ingest_log,
+--     seed manifest) run OFF the request path. The write + tenant_runs
+--     pointer swap stay synchronous; everything the response used to wait on
+--     afterwards is enqueued here and drained by the ingest worker
+--     (backend/api/ingest_worker.py) with SELECT ... FOR UPDATE SKIP LOCKED,
+--     so any number of workers can share the queue on a plain Postgres with
+--     no other services. ?sync=true callers insert the row already 'running'
+--     and execute it in-request, so every ingest has a status row.
+--
+--   Lifecycle: queued -> running -> done | failed. A failed attempt below
+--   max attempts goes back to queued; a 'running' row whose lease expired
+--   (worker died mid-job) is reclaimable. Every stage is idempotent per
+--   (coords, run), so a re-run is safe.
+--
+-- I1: the ingest identity column is dcl_ingest_id, never bare run_id.
+-- Additive only — new table, no existing column touched.
+-- Idempotent — safe to re-run.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    id              BIGSERIAL PRIMARY KEY,
+    tenant_id       UUID        NOT NULL,
+    dcl_ingest_id   UUID        NOT NULL,
+    entity_id       TEXT,
+    job_type        TEXT        NOT NULL CHECK (job_type IN ('post_ingest')),
+    payload         JSONB       NOT NULL,
+    status          TEXT        NOT NULL DEFAULT 'queued'
+                                CHECK (status IN ('queued', 'running', 'done', 'failed')),
+    attempts        INT         NOT NULL DEFAULT 0,
+    worker_id       TEXT,
+    result          JSONB,
+    last_error      TEXT,
+    enqueued_at     TIMESTAMPTZ NOT NULL DEFAULT now(),
+    started_at      TIMESTAMPTZ,
+    finished_at     TIMESTAMPTZ
+);
+
+-- Claim path: oldest claimable job first. Partial so the index stays the
+-- size of the backlog, not the job history.
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_claimable
+    ON ingest_jobs (id)
+    WHERE status IN ('queued', 'running');
+
+-- Status path: /api/dcl/ingest-triples/status/{run_id}.
+CREATE INDEX IF NOT EXISTS idx_ingest_jobs_ingest
+    ON ingest_jobs (dcl_ingest_id, id);
+
+COMMENT ON TABLE ingest_jobs IS
+    'Durable post-ingest work queue (domain summary, conflict detection, ingest_log, seed manifest). Drained by backend/api/ingest_worker.py via SELECT ... FOR UPDATE SKIP LOCKED. Lifecycle queued -> running -> done|failed; expired running leases are reclaimable. I1: ingest identity is dcl_ingest_id.';
+
+COMMIT;
@@ -0,0 +1,52 @@
+-- Migration 031: ingest_runs — per-ingest registry, one row per dcl_ingest_id.
+--
+--   ingest_runs — row counts, entity set, first/last write time and state of
+--     every ingest run, maintained in the SAME transaction as the
+--     semantic_triples write that changes them (backend/db/triple_store.py:
+--     COPY writes credit triple_count/live_count; supersession debits
+--     live_count; retention DELETEs debit both). The idempotency probe
+--     (run_exists), get_run_info, list_runs and count_by_run become primary-
+--     key / registry reads instead of scans of semantic_triples by run_id.
+--
+--   state is GENERATED from the counts (the is_active pattern, mig017):
+--     live        every stored row is current (superseded_at IS NULL)
+--     partial     some rows superseded (e.g. a conflict disposition)
+--     superseded  no live rows left — the run was displaced
+--     purged      no rows left at all (retention tools); run_exists = false
+--
+-- Existing runs: scripts/backfill_ingest_runs.py rebuilds rows from
+-- semantic_triples (idempotent; safe to re-run at any time).
+--
+-- I1: the ingest identity column is dcl_ingest_id, never bare run_id.
+-- Additive only — new table, no existing column touched.
+-- Idempotent — safe to re-run.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS ingest_runs (
+    dcl_ingest_id   UUID        PRIMARY KEY,
+    tenant_id       UUID        NOT NULL,
+    entity_ids      TEXT[]      NOT NULL DEFAULT '{}',
+    triple_count    BIGINT      NOT NULL DEFAULT 0,
+    live_count      BIGINT      NOT NULL DEFAULT 0,
+    state           TEXT        GENERATED ALWAYS AS (
+                        CASE
+                            WHEN triple_count <= 0 THEN 'purged'
+                            WHEN live_count <= 0 THEN 'superseded'
+                            WHEN live_count < triple_count THEN 'partial'
+                            ELSE 'live'
+                        END
+                    ) STORED,
+    first_write_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
+    last_write_at   TIMESTAMPTZ NOT NULL DEFAULT now(),
+    updated_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- list_runs(tenant_id): newest first per tenant.
+CREATE INDEX IF NOT EXISTS idx_ingest_runs_tenant_first_write
+    ON ingest_runs (tenant_id, first_write_at DESC);
+
+COMMENT ON TABLE ingest_runs IS
+    'Per-ingest registry (one row per dcl_ingest_id): triple_count, live_count, entity set, first/last write, generated state (live|partial|superseded|purged). Maintained transactionally by the TripleStore write paths; backfill via scripts/backfill_ingest_runs.py. I1: ingest identity is dcl_ingest_id.';
+
+COMMIT;
@@ -0,0 +1,41 @@
+-- Migration 032: ingest_shard_decisions — commit log for sharded ingest writes.
+--
+--   Opt-in sharded write mode (DCL_INGEST_SHARD_WRITES, backend/db/
+--   triple_store.py write_entity_shards) splits a multi-entity batch per
+--   entity and writes the shards concurrently, each on its own pooled
+--   connection inside a PREPARED transaction (two-phase commit). Once every
+--   shard has prepared, ONE ordinary coordinator transaction applies the
+--   ingest_runs registry deltas and inserts this row — that commit IS the
+--   decision. Only then are the prepared shards committed.
+--
+--   Recovery (recover_shard_transactions): a prepared 'dcl-shard:' branch
+--   left behind by a crashed process is committed when its group_id has a
+--   row here and rolled back when it does not — the batch lands whole or
+--   not at all, never partially.
+--
+--   Requires max_prepared_transactions >= DCL_INGEST_SHARD_WORKERS on the
+--   server; with it at 0 (the Postgres default) the sharded mode fails loud
+--   and the default single-transaction path is unaffected.
+--
+-- I1: the ingest identity column is dcl_ingest_id, never bare run_id.
+-- Additive only — new table, no existing column touched.
+-- Idempotent — safe to re-run.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS ingest_shard_decisions (
+    group_id        TEXT        PRIMARY KEY,
+    dcl_ingest_id   UUID        NOT NULL,
+    tenant_id       UUID        NOT NULL,
+    shard_count     INT         NOT NULL,
+    decided_at      TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- Pruning of old decisions (recover_shard_transactions).
+CREATE INDEX IF NOT EXISTS idx_ingest_shard_decisions_decided
+    ON ingest_shard_decisions (decided_at);
+
+COMMENT ON TABLE ingest_shard_decisions IS
+    'Two-phase-commit decision log for sharded ingest writes: a row means every shard of group_id prepared and the batch was committed. Prepared dcl-shard branches without a row are rolled back on recovery. I1: ingest identity is dcl_ingest_id.';
+
+COMMIT;
@@ -0,0 +1,221 @@
+-- Migration 033: semantic_triples — live tier hash-partitioned by tenant,
+-- superseded history tier range-partitioned by superseded_at.
+--
+--   semantic_triples                 PARTITION BY RANGE (superseded_at)
+--   ├─ semantic_triples_live         DEFAULT (superseded_at IS NULL — range
+--   │    │                           partitions never hold NULL keys)
+--   │    │                           PARTITION BY HASH (tenant_id),
+--   │    │                           CHECK (is_active)
+--   │    └─ semantic_triples_live_pNN   one per hash remainder
+--   └─ semantic_triples_history      FROM (MINVALUE) TO (MAXVALUE)
+--        │                           PARTITION BY RANGE (superseded_at),
+--        │                           CHECK (NOT is_active)
+--        ├─ semantic_triples_history_YYYY_MM   one per month
+--        └─ semantic_triples_history_default   anything outside the months
+--
+-- Writes do not change. semantic_triples is still the ONE table every writer
+-- targets: COPY lands in the live tier, and supersession (SET superseded_at
+-- = now()) moves the row into the history tier by partition row movement.
+-- Readers do not change either:
+--   - current-state reads (semantic_triples_current, WHERE is_active = true)
+--     never touch history. The tier CHECKs let the planner exclude every
+--     history partition from an is_active = true plan, and a
+--     superseded_at IS NULL predicate prunes to the live tier directly.
+--     tenant_id = X then prunes the live tier to one hash partition.
+--   - as-of reads (ingested_at <= T AND (superseded_at IS NULL OR
+--     superseded_at > T)) keep their exact predicate; they read the live
+--     tier plus only the history months after T.
+-- is_active stays the STORED GENERATED column (Convergence's SELECT-only
+-- WHERE is_active = true reads are unaffected — SCHEMA_CONTRACT "Convergence
+-- coordination note"). This is NOT the reverted current_triples rebuild: no
+-- second store, no second write path, no swap_and_delete.
+--
+-- Trade-offs, each recorded in SCHEMA_CONTRACT.md:
+--   - No PRIMARY KEY on id. A unique constraint on a partitioned table must
+--     contain the partition keys, and superseded_at is nullable. id keeps a
+--     plain index; uniqueness comes from gen_random_uuid().
+--   - An UPDATE or DELETE that collides with a concurrent supersession of
+--     the same row gets SQLSTATE 40001 ("tuple ... moved to another
+--     partition") instead of re-checking. The store helpers retry it
+--     (backend/db/triple_store.py).
+--
+-- Conversion is NOT an ambient boot side effect. The runner's pass has a
+-- 30s budget, and rewriting a populated store is a B19-gated operator step
+-- (ledger #70/#85). This file:
+--   1. defines semantic_triples_ensure_history_partitions(), which creates
+--      monthly history partitions ahead of time (the ingest worker calls it
+--      through TripleStore.ensure_history_partitions);
+--   2. defines semantic_triples_partition(), which does the conversion: a
+--      no-op if the table is already partitioned, otherwise a rebuild into
+--      the layout above that preserves every column, default, CHECK,
+--      secondary index, grant and the semantic_triples_current view;
+--   3. runs the conversion here ONLY when semantic_triples is empty (a fresh
+--      store or test database).
+-- Populated stores: python scripts/partition_semantic_triples.py --apply.
+--
+-- Idempotent — safe to re-run.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION semantic_triples_ensure_history_partitions(
+    p_from         TIMESTAMPTZ DEFAULT now(),
+    p_months_ahead INT         DEFAULT 3
+) RETURNS INT
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_month   DATE := date_trunc('month', COALESCE(p_from, now()) AT TIME ZONE 'UTC')::date;
+    v_last    DATE := (date_trunc('month', now() AT TIME ZONE 'UTC')
+                       + make_interval(months => p_months_ahead))::date;
+    v_name    TEXT;
+    v_created INT := 0;
+BEGIN
+    IF to_regclass('semantic_triples_history') IS NULL THEN
+        RETURN 0;
+    END IF;
+    WHILE v_month <= v_last LOOP
+        v_name := 'semantic_triples_history_' || to_char(v_month, 'YYYY_MM');
+        IF to_regclass(v_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF semantic_triples_history '
+                'FOR VALUES FROM (%L) TO (%L)',
+                v_name,
+                v_month::timestamp AT TIME ZONE 'UTC',
+                (v_month + INTERVAL '1 month')::timestamp AT TIME ZONE 'UTC'
+            );
+            v_created := v_created + 1;
+        END IF;
+        v_month := (v_month + INTERVAL '1 month')::date;
+    END LOOP;
+    RETURN v_created;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION semantic_triples_partition(
+    p_live_partitions INT DEFAULT 16
+) RETURNS TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_index_defs TEXT[];
+    v_dependents TEXT;
+    v_cols       TEXT;
+    v_oldest     TIMESTAMPTZ;
+    v_rows       BIGINT;
+    v_def        TEXT;
+    r            RECORD;
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = to_regclass('semantic_triples')) = 'p' THEN
+        RETURN 'already partitioned';
+    END IF;
+
+    -- Views other than semantic_triples_current would silently keep pointing
+    -- at the old table — refuse instead.
+    SELECT string_agg(DISTINCT v.relname, ', ') INTO v_dependents
+    FROM pg_depend d
+    JOIN pg_rewrite rw ON rw.oid = d.objid
+    JOIN pg_class v ON v.oid = rw.ev_class
+    WHERE d.refobjid = 'semantic_triples'::regclass
+      AND v.relname <> 'semantic_triples_current';
+    IF v_dependents IS NOT NULL THEN
+        RAISE EXCEPTION 'semantic_triples_partition: dependent views % must be handled first',
+            v_dependents;
+    END IF;
+
+    -- Secondary indexes, recreated on the partitioned parent after the copy.
+    -- The PRIMARY KEY on id cannot exist on it (see header); every other
+    -- unique index is refused for the same reason.
+    IF EXISTS (SELECT 1 FROM pg_index
+               WHERE indrelid = 'semantic_triples'::regclass
+                 AND indisunique AND NOT indisprimary) THEN
+        RAISE EXCEPTION 'semantic_triples_partition: non-PK unique index present — cannot partition';
+    END IF;
+    SELECT array_agg(pg_get_indexdef(indexrelid)) INTO v_index_defs
+    FROM pg_index
+    WHERE indrelid = 'semantic_triples'::regclass AND NOT indisprimary;
+
+    DROP VIEW IF EXISTS semantic_triples_current;
+    ALTER TABLE semantic_triples RENAME TO semantic_triples_unpartitioned;
+
+    EXECUTE
+        'CREATE TABLE semantic_triples ('
+        '    LIKE semantic_triples_unpartitioned '
+        '    INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS '
+        '    INCLUDING COMMENTS INCLUDING STATISTICS'
+        ') PARTITION BY RANGE (superseded_at)';
+
+    CREATE TABLE semantic_triples_live PARTITION OF semantic_triples DEFAULT
+        PARTITION BY HASH (tenant_id);
+    ALTER TABLE semantic_triples_live
+        ADD CONSTRAINT semantic_triples_live_is_active CHECK (is_active);
+    FOR i IN 0 .. p_live_partitions - 1 LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF semantic_triples_live '
+            'FOR VALUES WITH (MODULUS %s, REMAINDER %s)',
+            'semantic_triples_live_p' || lpad(i::text, 2, '0'), p_live_partitions, i
+        );
+    END LOOP;
+
+    CREATE TABLE semantic_triples_history PARTITION OF semantic_triples
+        FOR VALUES FROM (MINVALUE) TO (MAXVALUE)
+        PARTITION BY RANGE (superseded_at);
+    ALTER TABLE semantic_triples_history
+        ADD CONSTRAINT semantic_triples_history_not_active CHECK (NOT is_active);
+    CREATE TABLE semantic_triples_history_default
+        PARTITION OF semantic_triples_history DEFAULT;
+
+    SELECT min(superseded_at) INTO v_oldest FROM semantic_triples_unpartitioned;
+    PERFORM semantic_triples_ensure_history_partitions(COALESCE(v_oldest, now()), 3);
+
+    -- Copy every stored column (the generated is_active recomputes).
+    SELECT string_agg(quote_ident(attname), ', ' ORDER BY attnum) INTO v_cols
+    FROM pg_attribute
+    WHERE attrelid = 'semantic_triples_unpartitioned'::regclass
+      AND attnum > 0 AND NOT attisdropped AND attgenerated = '';
+    EXECUTE format(
+        'INSERT INTO semantic_triples (%s) SELECT %s FROM semantic_triples_unpartitioned',
+        v_cols, v_cols
+    );
+    GET DIAGNOSTICS v_rows = ROW_COUNT;
+
+    FOR r IN
+        SELECT grantee, privilege_type
+        FROM information_schema.role_table_grants
+        WHERE table_schema = current_schema()
+          AND table_name = 'semantic_triples_unpartitioned'
+          AND grantee <> current_user
+    LOOP
+        EXECUTE format(
+            'GRANT %s ON semantic_triples TO %s', r.privilege_type,
+            CASE WHEN r.grantee = 'PUBLIC' THEN 'PUBLIC' ELSE quote_ident(r.grantee) END
+        );
+    END LOOP;
+
+    DROP TABLE semantic_triples_unpartitioned;
+
+    -- Index names are free again; the captured definitions already name
+    -- semantic_triples, so they now build on the partitioned parent (and
+    -- cascade to every partition).
+    FOREACH v_def IN ARRAY COALESCE(v_index_defs, '{}') LOOP
+        EXECUTE v_def;
+    END LOOP;
+    CREATE INDEX IF NOT EXISTS idx_triples_id ON semantic_triples (id);
+
+    CREATE VIEW semantic_triples_current AS
+        SELECT * FROM semantic_triples WHERE is_active = true;
+    COMMENT ON VIEW semantic_triples_current IS
+        'ContextOS Stage 2 canonical current-state surface: rows where superseded_at IS NULL (is_active generated column). Surfacing + conflict + normalization reads route through this view so "current state" has ONE definition. As-of reads bypass it (parameterized bi-temporal predicate). Reads only the live tier (migration 033). NOT the reverted materialized current_triples table (see SCHEMA_CONTRACT Store Lineage); this is a logical view over the bi-temporal store.';
+
+    ANALYZE semantic_triples;
+    RETURN format('partitioned: %s rows, %s live partitions', v_rows, p_live_partitions);
+END;
+$$;
+
+DO $$
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = to_regclass('semantic_triples')) = 'r'
+       AND NOT EXISTS (SELECT 1 FROM semantic_triples) THEN
+        PERFORM semantic_triples_partition(16);
+    END IF;
+END;
+$$;
+
+COMMIT;
@@ -0,0 +1,138 @@
+-- Migration 034: triple_rollups — incrementally maintained live-triple counts
+-- per (tenant, entity, ingest, domain, source, fabric plane/product, period).
+--
+--   triple_rollups — one row per group of LIVE triples (superseded_at IS
+--     NULL), maintained in the SAME transaction as the semantic_triples write
+--     that changes the group (backend/db/triple_store.py):
+--       COPY writes          credit the groups through _credit_rollups
+--                            (counted in Python while the COPY streams);
+--       supersession         debits them inside supersede_triples_tx's
+--                            statement (swap_and_deactivate, replace,
+--                            deactivate_*, conflict dispositions);
+--       retention DELETEs    debit the groups of rows that were still live
+--                            (delete_triples_tx).
+--     The operator surfaces — /triples/overview, /contextualization-summary,
+--     /triples/persona-stats, the Sankey and count_by_domain — aggregate
+--     these rows instead of scanning semantic_triples, so they cost
+--     O(groups), not O(triples).
+--
+--   Key columns are NOT NULL; the nullable triple attributes (period,
+--   fabric_plane, fabric_product) are stored as '' so the key can be a
+--   PRIMARY KEY and upserts need no expression index. Readers map '' back.
+--   domain is split_part(concept, '.', 1) — the root concept domain every
+--   one of those surfaces already groups by.
+--
+--   Counters:
+--     live_count                 live triples in the group
+--     confidence_sum             SUM(confidence_score) -> AVG = sum / count
+--     tier_exact/high/medium/low COUNT per confidence_tier
+--     concept_counts             {concept: live count} — keeps
+--                                COUNT(DISTINCT concept) per domain exact
+--                                under decrements (zero keys are dropped)
+--   A group debited to zero keeps its row until the ingest worker's
+--   maintenance tick prunes it (TripleStore.prune_rollups); readers filter
+--   live_count > 0.
+--
+-- Existing stores: python scripts/backfill_triple_rollups.py --apply
+-- rebuilds every tenant's rows from semantic_triples (idempotent; also the
+-- repair path for drift). Until it has run, the surfaces above only see
+-- triples written after this migration.
+--
+-- I1: the ingest identity column is dcl_ingest_id, never bare run_id.
+-- Additive only — new table + functions, no existing column touched.
+-- Idempotent — safe to re-run.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS triple_rollups (
+    tenant_id       UUID          NOT NULL,
+    entity_id       TEXT          NOT NULL,
+    dcl_ingest_id   UUID          NOT NULL,
+    domain          TEXT          NOT NULL,
+    source_system   TEXT          NOT NULL,
+    fabric_plane    TEXT          NOT NULL DEFAULT '',
+    fabric_product  TEXT          NOT NULL DEFAULT '',
+    period          TEXT          NOT NULL DEFAULT '',
+    live_count      BIGINT        NOT NULL DEFAULT 0,
+    confidence_sum  NUMERIC       NOT NULL DEFAULT 0,
+    tier_exact      BIGINT        NOT NULL DEFAULT 0,
+    tier_high       BIGINT        NOT NULL DEFAULT 0,
+    tier_medium     BIGINT        NOT NULL DEFAULT 0,
+    tier_low        BIGINT        NOT NULL DEFAULT 0,
+    concept_counts  JSONB         NOT NULL DEFAULT '{}',
+    updated_at      TIMESTAMPTZ   NOT NULL DEFAULT now(),
+    PRIMARY KEY (tenant_id, entity_id, dcl_ingest_id, domain, source_system,
+                 fabric_plane, fabric_product, period)
+);
+
+-- Current-run reads join tenant_runs on (tenant_id, current_run_id).
+CREATE INDEX IF NOT EXISTS idx_triple_rollups_tenant_run
+    ON triple_rollups (tenant_id, dcl_ingest_id);
+
+-- Add `b` (scaled by `direction`) into the {concept: count} map `a`, dropping
+-- keys that reach zero.
+CREATE OR REPLACE FUNCTION triple_rollup_merge_counts(a JSONB, b JSONB, direction INT)
+RETURNS JSONB
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT COALESCE(jsonb_object_agg(k, n), '{}'::jsonb)
+    FROM (
+        SELECT k, SUM(n) AS n
+        FROM (
+            SELECT key AS k, value::bigint AS n FROM jsonb_each_text(COALESCE(a, '{}'))
+            UNION ALL
+            SELECT key, value::bigint * direction FROM jsonb_each_text(COALESCE(b, '{}'))
+        ) parts
+        GROUP BY k
+    ) merged
+    WHERE n <> 0
+$$;
+
+-- Recompute a tenant's rollup rows (optionally one ingest) from the live
+-- triples. Used by scripts/backfill_triple_rollups.py and by
+-- scripts/seed_database.py, whose execute_values path bypasses TripleStore.
+-- Returns the number of groups written.
+CREATE OR REPLACE FUNCTION triple_rollups_rebuild(p_tenant UUID, p_ingest UUID DEFAULT NULL)
+RETURNS BIGINT
+LANGUAGE plpgsql AS $$
+DECLARE
+    written BIGINT;
+BEGIN
+    DELETE FROM triple_rollups
+    WHERE tenant_id = p_tenant
+      AND (p_ingest IS NULL OR dcl_ingest_id = p_ingest);
+
+    INSERT INTO triple_rollups
+        (tenant_id, entity_id, dcl_ingest_id, domain, source_system,
+         fabric_plane, fabric_product, period, live_count, confidence_sum,
+         tier_exact, tier_high, tier_medium, tier_low, concept_counts)
+    SELECT tenant_id, entity_id, run_id, domain, source_system,
+           fabric_plane, fabric_product, period,
+           SUM(n), SUM(conf), SUM(t_exact), SUM(t_high), SUM(t_medium), SUM(t_low),
+           jsonb_object_agg(concept, n)
+    FROM (
+        SELECT tenant_id, entity_id, run_id,
+               split_part(concept, '.', 1) AS domain, source_system,
+               COALESCE(fabric_plane, '') AS fabric_plane,
+               COALESCE(fabric_product, '') AS fabric_product,
+               COALESCE(period, '') AS period, concept,
+               COUNT(*) AS n, SUM(confidence_score) AS conf,
+               COUNT(*) FILTER (WHERE confidence_tier = 'exact') AS t_exact,
+               COUNT(*) FILTER (WHERE confidence_tier = 'high') AS t_high,
+               COUNT(*) FILTER (WHERE confidence_tier = 'medium') AS t_medium,
+               COUNT(*) FILTER (WHERE confidence_tier = 'low') AS t_low
+        FROM semantic_triples
+        WHERE tenant_id = p_tenant
+          AND (p_ingest IS NULL OR run_id = p_ingest)
+          AND superseded_at IS NULL
+        GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9
+    ) per_concept
+    GROUP BY 1, 2, 3, 4, 5, 6, 7, 8;
+    GET DIAGNOSTICS written = ROW_COUNT;
+    RETURN written;
+END;
+$$;
+
+COMMENT ON TABLE triple_rollups IS
+    'Live-triple counts per (tenant, entity, dcl_ingest_id, domain, source_system, fabric_plane, fabric_product, period); NULL attributes stored as ''''. Maintained transactionally by the TripleStore write paths; read by the overview / contextualization / persona / Sankey surfaces. Backfill via scripts/backfill_triple_rollups.py. I1: ingest identity is dcl_ingest_id.';
+
+COMMIT;
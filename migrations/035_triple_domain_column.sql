@@ -0,0 +1,101 @@
+-- Migration 035: semantic_triples.domain — STORED generated concept root,
+-- plus composite indexes for the concept-prefix read paths.
+--
+--   domain TEXT GENERATED ALWAYS AS (split_part(concept, '.', 1)) STORED
+--     The root concept domain every prefix read filters on. Readers used
+--     `concept = d OR concept LIKE 'd.%'`, `LIKE ANY(...)` groups and
+--     split_part(concept, '.', 1) expressions — none of which a composite
+--     index can use as an equality key. With the column, TripleStore's query
+--     builders (triple_store.domain_clause) filter `domain = d` /
+--     `domain = ANY(...)` and the indexes below serve the filter AND the
+--     sort:
+--
+--   idx_triples_tenant_domain_recent  (tenant_id, domain, created_at DESC, id DESC)
+--       mcp_query_triples / _expanded: tenant + domain(s), newest first,
+--       LIMIT n — an ordered index scan stops after n rows, no sort.
+--   idx_triples_tenant_domain_coord   (tenant_id, domain, entity_id, concept,
+--                                      property, period, created_at DESC)
+--       /triples/browse and /triples/browse-batch (persona-scoped or not):
+--       DISTINCT ON (entity_id, concept, property, period) ... created_at
+--       DESC is the index order within one (tenant, domain).
+--   idx_triples_domain_coord          (domain, entity_id, concept, property,
+--                                      period) INCLUDE (source_system,
+--                                      run_id, is_active)
+--       /dashboard-data (not tenant-scoped): the GROUPING SETS pass reads
+--       only indexed columns — an index-only scan on a vacuumed store.
+--
+--   semantic_triples_current is re-created so the view exposes the column
+--   too (a view's SELECT * is expanded when the view is created).
+--
+--   A separate ltree concept path was considered and not added: the store's
+--   hierarchy reads (concept_hierarchy expansion -> mcp_query_triples_expanded)
+--   are dotted-prefix LIKEs that, narrowed by `domain = root` first, scan one
+--   domain's index range — ltree would need an extension install and a second
+--   generated column for no change in plan shape.
+--
+-- Adding a STORED generated column rewrites every partition under an ACCESS
+-- EXCLUSIVE lock, and building three indexes over a populated store does not
+-- fit the runner's 30s pass either — a B19-gated operator step (ledger
+-- #70/#85), same as migration 033. This file:
+--   1. defines semantic_triples_add_domain(), which adds the column (no-op if
+--      present), re-creates the view and creates the indexes IF NOT EXISTS;
+--   2. runs it here ONLY when semantic_triples is empty (a fresh store or
+--      test database).
+-- Populated stores: python scripts/add_triple_domain_column.py --apply.
+-- Until then readers keep the LIKE predicates (TripleStore checks for the
+-- column; see domain_column_ready()).
+--
+-- Additive only — one generated column, three indexes; no existing column
+-- touched, COPY column lists unchanged (generated columns are never written).
+-- Idempotent — safe to re-run.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION semantic_triples_add_domain() RETURNS TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_added BOOLEAN := false;
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_attribute
+        WHERE attrelid = 'semantic_triples'::regclass
+          AND attname = 'domain' AND NOT attisdropped
+    ) THEN
+        ALTER TABLE semantic_triples
+            ADD COLUMN domain TEXT GENERATED ALWAYS AS (split_part(concept, '.', 1)) STORED;
+        v_added := true;
+    END IF;
+
+    CREATE OR REPLACE VIEW semantic_triples_current AS
+        SELECT * FROM semantic_triples WHERE is_active = true;
+
+    CREATE INDEX IF NOT EXISTS idx_triples_tenant_domain_recent
+        ON semantic_triples (tenant_id, domain, created_at DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS idx_triples_tenant_domain_coord
+        ON semantic_triples (tenant_id, domain, entity_id, concept, property, period,
+                             created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_triples_domain_coord
+        ON semantic_triples (domain, entity_id, concept, property, period)
+        INCLUDE (source_system, run_id, is_active);
+
+    IF v_added THEN
+        ANALYZE semantic_triples;
+        RETURN 'domain column added, indexes built';
+    END IF;
+    RETURN 'domain column present, indexes ensured';
+END;
+$$;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_attribute
+        WHERE attrelid = 'semantic_triples'::regclass
+          AND attname = 'domain' AND NOT attisdropped
+    ) AND NOT EXISTS (SELECT 1 FROM semantic_triples) THEN
+        PERFORM semantic_triples_add_domain();
+    END IF;
+END;
+$$;
+
+COMMIT;
@@ -0,0 +1,113 @@
+-- Migration 036: run_group_digests — per-run assertion-group digests for
+-- run-over-run diffs.
+--
+--   run_group_digests — one row per assertion group of an ingest run: the
+--     (concept, property, period, source_system) coordinates TripleStore.
+--     diff_runs compares, with the group's row count and an order-
+--     independent digest of its value multiset:
+--       value_hash = SUM(triple_value_hash(value)) over the group's rows,
+--       triple_value_hash = the first 60 bits of md5(value::text).
+--     A sum of per-value hashes is insensitive to row order and sensitive to
+--     multiplicity, and it can be debited row by row — unlike the
+--     md5(string_agg(... ORDER BY ...)) diff_runs used to recompute over
+--     both runs on every call.
+--     Digests cover EVERY row a run wrote (superseded or not — a run's
+--     content is history; supersession never touches them), maintained in
+--     the SAME transaction as the semantic_triples write that changes them
+--     (backend/db/triple_store.py):
+--       COPY writes          credit through _credit_group_digests — one
+--                            aggregate over the rows this transaction just
+--                            wrote (ingested_at = now()), so the hash is
+--                            always Postgres' own value::text, identical to
+--                            the backfill's and the debits';
+--       retention DELETEs    debit inside delete_triples_tx's statement
+--                            (delete_by_run, purge_old_runs, delete_inactive,
+--                            the same-run redelivery scrub).
+--     diff_runs becomes a FULL OUTER JOIN of two runs' digest rows (primary-
+--     key range per run) and reads semantic_triples only for the value
+--     samples of the changed groups it returns.
+--
+--   ingest_runs.group_digests — TRUE when every row of the run was written
+--     with digests maintained: set on the INSERT that registers a new run
+--     (_register_copied), never by an append to an older run. diff_runs uses
+--     the digest join only when BOTH runs are covered and falls back to the
+--     on-the-fly scan otherwise, so runs written before this migration diff
+--     exactly as before. scripts/backfill_run_group_digests.py --apply
+--     rebuilds older runs (run_group_digests_rebuild) and flips the flag.
+--
+--   Key columns are NOT NULL; a NULL period is stored as '' (the triple_rollups
+--   convention). Groups debited to zero rows are pruned by the ingest worker's
+--   maintenance tick (TripleStore.prune_rollups).
+--
+-- I1: the ingest identity column is dcl_ingest_id, never bare run_id.
+-- Additive only — new table + function + one defaulted column.
+-- Idempotent — safe to re-run.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION triple_value_hash(v JSONB)
+RETURNS BIGINT
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT ('x' || substr(md5(v::text), 1, 15))::bit(60)::bigint
+$$;
+
+CREATE TABLE IF NOT EXISTS run_group_digests (
+    tenant_id       UUID          NOT NULL,
+    entity_id       TEXT          NOT NULL,
+    dcl_ingest_id   UUID          NOT NULL,
+    concept         TEXT          NOT NULL,
+    property        TEXT          NOT NULL,
+    period          TEXT          NOT NULL DEFAULT '',
+    source_system   TEXT          NOT NULL,
+    row_count       BIGINT        NOT NULL DEFAULT 0,
+    value_hash      NUMERIC       NOT NULL DEFAULT 0,
+    updated_at      TIMESTAMPTZ   NOT NULL DEFAULT now(),
+    -- Leading (tenant, entity, run): a diff reads each run as one PK range,
+    -- already in the join's (concept, property, period, source_system) order.
+    PRIMARY KEY (tenant_id, entity_id, dcl_ingest_id, concept, property,
+                 period, source_system)
+);
+
+ALTER TABLE ingest_runs
+    ADD COLUMN IF NOT EXISTS group_digests BOOLEAN NOT NULL DEFAULT false;
+
+-- Recompute a tenant's digest rows (optionally one ingest) from
+-- semantic_triples and mark the rebuilt runs covered. Used by
+-- scripts/backfill_run_group_digests.py and by scripts/seed_database.py,
+-- whose execute_values path bypasses TripleStore. Returns the number of
+-- groups written.
+CREATE OR REPLACE FUNCTION run_group_digests_rebuild(p_tenant UUID, p_ingest UUID DEFAULT NULL)
+RETURNS BIGINT
+LANGUAGE plpgsql AS $$
+DECLARE
+    written BIGINT;
+BEGIN
+    DELETE FROM run_group_digests
+    WHERE tenant_id = p_tenant
+      AND (p_ingest IS NULL OR dcl_ingest_id = p_ingest);
+
+    INSERT INTO run_group_digests
+        (tenant_id, entity_id, dcl_ingest_id, concept, property, period,
+         source_system, row_count, value_hash)
+    SELECT tenant_id, entity_id, run_id, concept, property,
+           COALESCE(period, ''), source_system,
+           COUNT(*), SUM(triple_value_hash(value))
+    FROM semantic_triples
+    WHERE tenant_id = p_tenant
+      AND (p_ingest IS NULL OR run_id = p_ingest)
+      AND entity_id IS NOT NULL AND run_id IS NOT NULL
+    GROUP BY 1, 2, 3, 4, 5, 6, 7;
+    GET DIAGNOSTICS written = ROW_COUNT;
+
+    UPDATE ingest_runs SET group_digests = true, updated_at = now()
+    WHERE tenant_id = p_tenant
+      AND (p_ingest IS NULL OR dcl_ingest_id = p_ingest)
+      AND NOT group_digests;
+    RETURN written;
+END;
+$$;
+
+COMMENT ON TABLE run_group_digests IS
+    'Per-run assertion-group digests (tenant, entity, dcl_ingest_id, concept, property, period, source_system) -> row_count + order-independent value_hash (SUM of triple_value_hash). Maintained transactionally by the TripleStore write paths; read by diff_runs. Backfill via scripts/backfill_run_group_digests.py. I1: ingest identity is dcl_ingest_id.';
+
+COMMIT;
@@ -0,0 +1,113 @@
+-- Migration 037: knowledge_range — STORED generated knowledge-time range on
+-- semantic_triples and entity_edges, plus GiST indexes for as-of reads.
+--
+--   knowledge_range TSTZRANGE GENERATED ALWAYS AS
+--       (tstzrange(ingested_at, superseded_at))            -- '[)' bounds
+--     The window during which the store believed the fact / edge. An as-of
+--     read was `ingested_at <= T AND (superseded_at IS NULL OR
+--     superseded_at > T)` — two inequalities on two columns plus an OR, which
+--     no B-tree serves past the tenant/entity prefix: every version of every
+--     fact ever ingested for the tenant is visited and filtered, and that
+--     grows with history depth, not with the answer. With the column, the
+--     as-of builders (triple_store.as_of_clause: mcp_query_triples / _expanded,
+--     /triples/browse, EdgeStore._temporal_clause) emit
+--         knowledge_range @> T
+--     which is exactly the same predicate ('[)' = ingested_at <= T <
+--     superseded_at, NULL upper = unbounded = still live) and is served by:
+--
+--   idx_triples_knowledge_range  GiST (tenant_id, entity_id, knowledge_range)
+--   idx_edges_knowledge_range    GiST (tenant_id, entity_id, knowledge_range)
+--       tenant / entity leading (btree_gist operator classes), range last.
+--       Tenant-wide as-of reads use the tenant key alone.
+--
+--   A row whose superseded_at precedes its ingested_at (hand-edited history)
+--   gets an EMPTY range instead of failing the row write — the old predicate
+--   never matched it either. semantic_triples_current is re-created so the
+--   view exposes the column (a view's SELECT * is expanded at creation).
+--
+--   Trace search (decision_traces) is not touched: traces are never
+--   superseded, so its as-of read is the single `ingested_at <= T` B-tree
+--   range it already is.
+--
+-- Adding a STORED generated column rewrites the table (every partition of
+-- semantic_triples) under an ACCESS EXCLUSIVE lock and the GiST builds scan
+-- it — a B19-gated operator step (ledger #70/#85), as in migrations 033/035.
+-- This file:
+--   1. installs btree_gist and defines knowledge_range_add(table), which adds
+--      the column (no-op if present) and creates the index IF NOT EXISTS;
+--   2. runs it here ONLY for a table that is empty (fresh store / test DB).
+-- Populated stores: python scripts/add_knowledge_range.py --apply.
+-- Until then readers keep the two-column predicate (TripleStore checks for
+-- the column per table; see knowledge_range_ready()).
+--
+-- Additive only — one generated column and one index per table; COPY / INSERT
+-- column lists unchanged (generated columns are never written).
+-- Idempotent — safe to re-run.
+
+BEGIN;
+
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
+CREATE OR REPLACE FUNCTION knowledge_range_add(p_table TEXT) RETURNS TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_index TEXT;
+    v_added BOOLEAN := false;
+BEGIN
+    IF p_table = 'semantic_triples' THEN
+        v_index := 'idx_triples_knowledge_range';
+    ELSIF p_table = 'entity_edges' THEN
+        v_index := 'idx_edges_knowledge_range';
+    ELSE
+        RAISE EXCEPTION 'knowledge_range_add: unsupported table %', p_table;
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_attribute
+        WHERE attrelid = p_table::regclass
+          AND attname = 'knowledge_range' AND NOT attisdropped
+    ) THEN
+        EXECUTE format(
+            'ALTER TABLE %I ADD COLUMN knowledge_range TSTZRANGE GENERATED ALWAYS AS ('
+            '  tstzrange(ingested_at, CASE WHEN superseded_at IS NULL THEN NULL'
+            '                              ELSE GREATEST(superseded_at, ingested_at) END)'
+            ') STORED', p_table);
+        v_added := true;
+    END IF;
+
+    IF p_table = 'semantic_triples' THEN
+        CREATE OR REPLACE VIEW semantic_triples_current AS
+            SELECT * FROM semantic_triples WHERE is_active = true;
+    END IF;
+
+    EXECUTE format(
+        'CREATE INDEX IF NOT EXISTS %I ON %I USING gist (tenant_id, entity_id, knowledge_range)',
+        v_index, p_table);
+
+    IF v_added THEN
+        EXECUTE format('ANALYZE %I', p_table);
+        RETURN p_table || ': knowledge_range added, index built';
+    END IF;
+    RETURN p_table || ': knowledge_range present, index ensured';
+END;
+$$;
+
+DO $$
+DECLARE
+    v_table TEXT;
+    v_empty BOOLEAN;
+BEGIN
+    FOREACH v_table IN ARRAY ARRAY['semantic_triples', 'entity_edges'] LOOP
+        EXECUTE format('SELECT NOT EXISTS (SELECT 1 FROM %I)', v_table) INTO v_empty;
+        IF v_empty AND NOT EXISTS (
+            SELECT 1 FROM pg_attribute
+            WHERE attrelid = v_table::regclass
+              AND attname = 'knowledge_range' AND NOT attisdropped
+        ) THEN
+            PERFORM knowledge_range_add(v_table);
+        END IF;
+    END LOOP;
+END;
+$$;
+
+COMMIT;
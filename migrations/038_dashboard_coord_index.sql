@@ -0,0 +1,63 @@
+-- Migration 038: idx_triples_active_coord_key — the /dashboard-data keyset.
+--
+--   idx_triples_active_coord_key
+--       (entity_id, concept, property, (period IS NULL), COALESCE(period, ''),
+--        created_at DESC)
+--       WHERE is_active = true
+--     /dashboard-data pages by the coordinate key
+--         (entity_id, concept, property, period IS NULL, COALESCE(period, ''))
+--     — DISTINCT ON the key, ORDER BY the key then created_at DESC, and
+--     `key > cursor` for the next page. period is nullable and a row
+--     comparison against NULL is never true, hence the COALESCE; the
+--     period IS NULL term keeps a period-less coordinate apart from a
+--     ''-period one (COALESCE alone merged them). No existing
+--     index carries that expression (migration 035's coordinate indexes are
+--     on plain period and lead with tenant / domain), so every page sorted
+--     the whole filtered live set and a deep page cost the same as the first
+--     plus everything before it. With this index the page is an ordered index
+--     scan starting at the cursor that stops after page_size + 1 coordinates.
+--     Partial on is_active: the route reads live rows only.
+--
+-- Building the index over a populated store scans every live partition and
+-- blocks writes for the duration — a B19-gated operator step (ledger
+-- #70/#85), as in migrations 033/035/037. This file:
+--   1. defines semantic_triples_add_coord_key_index(), which creates the
+--      index IF NOT EXISTS (and replaces an earlier build of it that lacks
+--      the period IS NULL term);
+--   2. runs it here ONLY when semantic_triples is empty (fresh store / test
+--      database).
+-- Populated stores, and the DO block below on a populated store that holds
+-- the earlier build: python scripts/add_dashboard_coord_index.py --apply.
+-- Until then the route's SQL is unchanged and plans as before (sort).
+--
+-- Additive only — one index; no column touched. Idempotent — safe to re-run.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION semantic_triples_add_coord_key_index() RETURNS TEXT
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF to_regclass('idx_triples_active_coord_key') IS NOT NULL THEN
+        IF pg_get_indexdef(to_regclass('idx_triples_active_coord_key'))
+           LIKE '%(period IS NULL)%' THEN
+            RETURN 'coordinate key index present';
+        END IF;
+        DROP INDEX idx_triples_active_coord_key;
+    END IF;
+    CREATE INDEX idx_triples_active_coord_key
+        ON semantic_triples (entity_id, concept, property, (period IS NULL),
+                             (COALESCE(period, '')), created_at DESC)
+        WHERE is_active = true;
+    RETURN 'coordinate key index built';
+END;
+$$;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM semantic_triples) THEN
+        PERFORM semantic_triples_add_coord_key_index();
+    END IF;
+END;
+$$;
+
+COMMIT;
@@ -0,0 +1,19 @@
+-- Migration 039: idx_ingest_runs_tenant_updated — the read-cache store token.
+--
+--   backend/core/read_cache.py versions cached triple reads on the tenant's
+--   store token, which includes MAX(ingest_runs.updated_at) and the row count
+--   per tenant: every semantic_triples write (COPY credit, ?append=true
+--   batch, supersession debit, retention delete) moves updated_at on the
+--   runs it touched, in the same transaction. The probe runs once per
+--   READ_CACHE_POINTER_TTL_S per tenant per API process; this index makes it
+--   a backward index scan for the MAX and an index-only count.
+--
+-- ingest_runs holds one row per ingest run — small; built in the runner pass.
+-- Additive only — one index. Idempotent — safe to re-run.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_ingest_runs_tenant_updated
+    ON ingest_runs (tenant_id, updated_at DESC);
+
+COMMIT;
@@ -0,0 +1,70 @@
+-- Migration 040: store_versions — commit-ordered store tokens.
+--
+--   store_versions (tenant_id, scope, version)
+--     A counter per tenant and scope, bumped AT COMMIT by every transaction
+--     that writes the scope's tables. Scope 'triples': ingest_runs (every
+--     semantic_triples COPY credit, supersession debit and retention delete
+--     moves it, same transaction) and tenant_runs (pointer swaps).
+--     backend/core/read_cache.py versions cached triple reads on it.
+--
+--   Why a counter and not MAX(updated_at) + COUNT(*) (migration 039):
+--   updated_at = now() is the TRANSACTION START time. A long write that
+--   starts before a short one and commits after it lands a timestamp below
+--   the current MAX and adds no row — the token did not move, and other
+--   processes served pre-commit state with no time bound. The bump here
+--   runs in a DEFERRED constraint trigger, i.e. at commit, and the upsert
+--   takes the counter row's lock until the commit completes: a later
+--   committer waits, then increments the value the earlier one committed.
+--   Every commit that writes the scope therefore moves the counter, in
+--   commit order, and the lock is held only for the commit itself.
+--
+-- Replaces 039's idx_ingest_runs_tenant_updated (no reader left).
+-- Additive otherwise — new table, function, triggers; no column touched.
+-- Idempotent — safe to re-run.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS store_versions (
+    tenant_id   UUID        NOT NULL,
+    scope       TEXT        NOT NULL,
+    version     BIGINT      NOT NULL DEFAULT 0,
+    updated_at  TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (tenant_id, scope)
+);
+
+CREATE OR REPLACE FUNCTION store_versions_bump() RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    rec RECORD;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        rec := OLD;
+    ELSE
+        rec := NEW;
+    END IF;
+    INSERT INTO store_versions (tenant_id, scope, version)
+    VALUES (rec.tenant_id, TG_ARGV[0], 1)
+    ON CONFLICT (tenant_id, scope)
+    DO UPDATE SET version = store_versions.version + 1, updated_at = clock_timestamp();
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_ingest_runs_store_version ON ingest_runs;
+CREATE CONSTRAINT TRIGGER trg_ingest_runs_store_version
+    AFTER INSERT OR UPDATE OR DELETE ON ingest_runs
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION store_versions_bump('triples');
+
+DROP TRIGGER IF EXISTS trg_tenant_runs_store_version ON tenant_runs;
+CREATE CONSTRAINT TRIGGER trg_tenant_runs_store_version
+    AFTER INSERT OR UPDATE OR DELETE ON tenant_runs
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION store_versions_bump('triples');
+
+DROP INDEX IF EXISTS idx_ingest_runs_tenant_updated;
+
+COMMENT ON TABLE store_versions IS
+    'Commit-ordered write counters per (tenant_id, scope), bumped by deferred constraint triggers at commit. ''triples'': ingest_runs + tenant_runs writes — the read-cache token (backend/core/read_cache.py).';
+
+COMMIT;
@@ -0,0 +1,54 @@
+-- Migration 041: store_versions scope 'edges:<entity_id>' — the adjacency
+-- snapshot token.
+--
+--   backend/db/edge_store.py caches an entity's CSR adjacency snapshot under
+--   a store-side token re-probed every GRAPH_SNAPSHOT_PROBE_TTL_S. The token
+--   was COUNT(*) + MAX(updated_at) over the entity's entity_edges rows: a
+--   retire-only write changes no row count, and a write whose transaction
+--   started before the current MAX does not move it, so another process
+--   traversed a stale snapshot with no time bound. This migration bumps the
+--   store_versions counter (migration 040) of scope 'edges:<entity_id>' at
+--   commit for every transaction that writes the entity's edges — the same
+--   commit-ordered version the read cache uses for triples.
+--
+--   The trigger is row-level (constraint triggers cannot be statement-level),
+--   so a derivation writing n edges runs n counter upserts at commit, all on
+--   one row.
+--
+-- Additive only — one function replaced, one trigger. Idempotent.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION store_versions_bump() RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    rec RECORD;
+    v_scope TEXT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        rec := OLD;
+    ELSE
+        rec := NEW;
+    END IF;
+    v_scope := TG_ARGV[0];
+    IF v_scope = 'edges' THEN
+        v_scope := 'edges:' || rec.entity_id;
+    END IF;
+    INSERT INTO store_versions (tenant_id, scope, version)
+    VALUES (rec.tenant_id, v_scope, 1)
+    ON CONFLICT (tenant_id, scope)
+    DO UPDATE SET version = store_versions.version + 1, updated_at = clock_timestamp();
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_entity_edges_store_version ON entity_edges;
+CREATE CONSTRAINT TRIGGER trg_entity_edges_store_version
+    AFTER INSERT OR UPDATE OR DELETE ON entity_edges
+    DEFERRABLE INITIALLY DEFERRED
+    FOR EACH ROW EXECUTE FUNCTION store_versions_bump('edges');
+
+COMMENT ON TABLE store_versions IS
+    'Commit-ordered write counters per (tenant_id, scope), bumped by deferred constraint triggers at commit. ''triples'': ingest_runs + tenant_runs writes — the read-cache token (backend/core/read_cache.py). ''edges:<entity_id>'': entity_edges writes — the adjacency snapshot token (backend/db/edge_store.py).';
+
+COMMIT;
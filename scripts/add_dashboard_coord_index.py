@@ -0,0 +1,99 @@
+"""Build the /dashboard-data keyset index on a populated store (migration 038).
+
+Migration 038 builds idx_triples_active_coord_key only on an EMPTY store at
+migration time; on a populated store the build scans every live partition
+and blocks writes, so it is a B19-gated operator step, never an ambient boot
+side effect (ledger #70/#85). This script runs that step:
+  1. AUDIT — report whether the index exists (and has the period IS NULL
+     key term; an earlier build without it counts as STALE), and the table
+     size.
+  2. APPLY — SELECT semantic_triples_add_coord_key_index() in one
+     transaction, with no statement timeout. The build holds a SHARE lock
+     on semantic_triples (writes wait), so run it in a write freeze.
+The route's SQL does not change; /dashboard-data cursor pages plan as an
+ordered index scan as soon as the index commits.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/add_dashboard_coord_index.py --audit-only
+    DATABASE_URL=postgresql://... python scripts/add_dashboard_coord_index.py --apply
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+try:
+    import psycopg2
+except ImportError:
+    print("ERROR: psycopg2 not installed.", file=sys.stderr)
+    sys.exit(1)
+
+
+_INDEX = "idx_triples_active_coord_key"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--audit-only", action="store_true",
+        help="Report whether the index exists; do NOT change anything.",
+    )
+    parser.add_argument(
+        "--apply", action="store_true",
+        help="Build the index. Mutually exclusive with --audit-only.",
+    )
+    args = parser.parse_args()
+
+    if args.audit_only == args.apply:
+        print("ERROR: pass exactly one of --audit-only or --apply.", file=sys.stderr)
+        return 2
+
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        print("ERROR: DATABASE_URL not set.", file=sys.stderr)
+        return 2
+
+    conn = psycopg2.connect(db_url)
+    conn.autocommit = False
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT pg_size_pretty(pg_total_relation_size(oid)) "
+                "FROM pg_class WHERE oid = to_regclass('semantic_triples')"
+            )
+            row = cur.fetchone()
+            if row is None:
+                print("ERROR: semantic_triples does not exist.", file=sys.stderr)
+                return 1
+            cur.execute("SELECT pg_get_indexdef(to_regclass(%s))", (_INDEX,))
+            indexdef = cur.fetchone()[0]
+            present = indexdef is not None and "(period IS NULL)" in indexdef
+            state = "present" if present else ("STALE" if indexdef else "MISSING")
+            print(f"semantic_triples: {row[0]}, {_INDEX} {state}")
+            conn.rollback()
+
+            if args.audit_only:
+                return 0
+            if present:
+                print("Nothing to do.")
+                return 0
+
+            cur.execute("SET statement_timeout = 0")
+            started = time.monotonic()
+            cur.execute("SELECT semantic_triples_add_coord_key_index()")
+            result = cur.fetchone()[0]
+            conn.commit()
+            print(f"{result} ({time.monotonic() - started:.1f}s)")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
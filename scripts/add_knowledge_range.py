@@ -0,0 +1,118 @@
+"""Add the knowledge_range column and its GiST index to a populated store (migration 037).
+
+Migration 037 adds the generated column only to an EMPTY semantic_triples /
+entity_edges at migration time; on a populated table the column add rewrites
+it (every partition of semantic_triples) and the GiST build scans it, so it is
+a B19-gated operator step, never an ambient boot side effect (ledger
+#70/#85). This script runs that step:
+  1. AUDIT — per table, report whether the column and the index exist, and
+     the table size.
+  2. APPLY — SELECT knowledge_range_add(<table>) per table, each in its own
+     transaction, with no statement timeout. The column add holds an ACCESS
+     EXCLUSIVE lock on the table for its whole duration, so run it in a
+     write freeze. Re-running on a table that already has the column only
+     ensures the index.
+Running API processes switch their as-of reads to `knowledge_range @> T`
+within a minute of the commit (TripleStore re-checks for the column).
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/add_knowledge_range.py --audit-only
+    DATABASE_URL=postgresql://... python scripts/add_knowledge_range.py --apply
+    DATABASE_URL=postgresql://... python scripts/add_knowledge_range.py --apply --table entity_edges
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+try:
+    import psycopg2
+except ImportError:
+    print("ERROR: psycopg2 not installed.", file=sys.stderr)
+    sys.exit(1)
+
+
+_INDEXES = {
+    "semantic_triples": "idx_triples_knowledge_range",
+    "entity_edges": "idx_edges_knowledge_range",
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--audit-only", action="store_true",
+        help="Report whether the columns and indexes exist; do NOT change anything.",
+    )
+    parser.add_argument(
+        "--apply", action="store_true",
+        help="Add the columns and build the indexes. Mutually exclusive with --audit-only.",
+    )
+    parser.add_argument(
+        "--table", choices=sorted(_INDEXES), default=None,
+        help="Limit to one table (default: both).",
+    )
+    args = parser.parse_args()
+
+    if args.audit_only == args.apply:
+        print("ERROR: pass exactly one of --audit-only or --apply.", file=sys.stderr)
+        return 2
+
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        print("ERROR: DATABASE_URL not set.", file=sys.stderr)
+        return 2
+
+    tables = [args.table] if args.table else list(_INDEXES)
+    conn = psycopg2.connect(db_url)
+    conn.autocommit = False
+    try:
+        with conn.cursor() as cur:
+            for table in tables:
+                index = _INDEXES[table]
+                cur.execute(
+                    "SELECT pg_size_pretty(pg_total_relation_size(oid)) "
+                    "FROM pg_class WHERE oid = to_regclass(%s)", (table,),
+                )
+                row = cur.fetchone()
+                if row is None:
+                    print(f"ERROR: {table} does not exist.", file=sys.stderr)
+                    return 1
+                cur.execute(
+                    "SELECT EXISTS (SELECT 1 FROM pg_attribute "
+                    "WHERE attrelid = %s::regclass "
+                    "AND attname = 'knowledge_range' AND NOT attisdropped)", (table,),
+                )
+                has_column = cur.fetchone()[0]
+                cur.execute("SELECT to_regclass(%s) IS NOT NULL", (index,))
+                has_index = cur.fetchone()[0]
+                print(f"{table}: {row[0]}, knowledge_range column "
+                      f"{'present' if has_column else 'MISSING'}")
+                print(f"  {index}: {'present' if has_index else 'MISSING'}")
+                conn.rollback()
+
+                if args.audit_only:
+                    continue
+                if has_column and has_index:
+                    print("  Nothing to do.")
+                    continue
+
+                cur.execute("SET statement_timeout = 0")
+                started = time.monotonic()
+                cur.execute("SELECT knowledge_range_add(%s)", (table,))
+                result = cur.fetchone()[0]
+                conn.commit()
+                print(f"  {result} ({time.monotonic() - started:.1f}s)")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Add semantic_triples.domain and its indexes to a populated store (migration 035).
+
+Migration 035 adds the generated column only to an EMPTY store at migration
+time; on a populated store the column add rewrites every partition and the
+three index builds scan it, so it is a B19-gated operator step, never an
+ambient boot side effect (ledger #70/#85). This script runs that step:
+  1. AUDIT — report whether the column and each index exist, and the table
+     size.
+  2. APPLY — SELECT semantic_triples_add_domain() in one transaction, with
+     no statement timeout. The column add holds an ACCESS EXCLUSIVE lock on
+     semantic_triples for its whole duration, so run it in a write freeze.
+     Re-running on a store that already has the column only ensures the
+     indexes.
+Running API processes switch their prefix reads to `domain` equality within
+a minute of the commit (TripleStore re-checks for the column).
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/add_triple_domain_column.py --audit-only
+    DATABASE_URL=postgresql://... python scripts/add_triple_domain_column.py --apply
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+try:
+    import psycopg2
+except ImportError:
+    print("ERROR: psycopg2 not installed.", file=sys.stderr)
+    sys.exit(1)
+
+
+_INDEXES = (
+    "idx_triples_tenant_domain_recent",
+    "idx_triples_tenant_domain_coord",
+    "idx_triples_domain_coord",
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--audit-only", action="store_true",
+        help="Report whether the column and indexes exist; do NOT change anything.",
+    )
+    parser.add_argument(
+        "--apply", action="store_true",
+        help="Add the column and build the indexes. Mutually exclusive with --audit-only.",
+    )
+    args = parser.parse_args()
+
+    if args.audit_only == args.apply:
+        print("ERROR: pass exactly one of --audit-only or --apply.", file=sys.stderr)
+        return 2
+
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        print("ERROR: DATABASE_URL not set.", file=sys.stderr)
+        return 2
+
+    conn = psycopg2.connect(db_url)
+    conn.autocommit = False
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT pg_size_pretty(pg_total_relation_size(oid)) "
+                "FROM pg_class WHERE oid = to_regclass('semantic_triples')"
+            )
+            row = cur.fetchone()
+            if row is None:
+                print("ERROR: semantic_triples does not exist.", file=sys.stderr)
+                return 1
+            cur.execute(
+                "SELECT EXISTS (SELECT 1 FROM pg_attribute "
+                "WHERE attrelid = 'semantic_triples'::regclass "
+                "AND attname = 'domain' AND NOT attisdropped)"
+            )
+            has_column = cur.fetchone()[0]
+            cur.execute(
+                "SELECT relname FROM pg_class WHERE relname = ANY(%s)", (list(_INDEXES),)
+            )
+            present = {r[0] for r in cur.fetchall()}
+            print(f"semantic_triples: {row[0]}, domain column "
+                  f"{'present' if has_column else 'MISSING'}")
+            for name in _INDEXES:
+                print(f"  {name}: {'present' if name in present else 'MISSING'}")
+            conn.rollback()
+
+            if args.audit_only:
+                return 0
+            if has_column and present == set(_INDEXES):
+                print("Nothing to do.")
+                return 0
+
+            cur.execute("SET statement_timeout = 0")
+            started = time.monotonic()
+            cur.execute("SELECT semantic_triples_add_domain()")
+            result = cur.fetchone()[0]
+            conn.commit()
+            print(f"{result} ({time.monotonic() - started:.1f}s)")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""Backfill the ingest_runs registry (migration 031) from semantic_triples.
+
+Write paths maintain ingest_runs transactionally from migration 031 on; runs
+written before it have no registry row, so run_exists / list_runs / get_run_info
+would not see them. This script rebuilds every registry row for a tenant from
+the triples themselves:
+  - triple_count / live_count / entity_ids / first_write_at / last_write_at
+    are RECOMPUTED (not incremented), so re-running is idempotent and also
+    repairs drift (e.g. rows removed by hand-written SQL outside TripleStore).
+  - registry rows whose run no longer has any triples are zeroed (state
+    becomes 'purged').
+
+Each tenant is rebuilt in one transaction holding a SHARE ROW EXCLUSIVE lock
+on ingest_runs, so a concurrent ingest either committed before the recompute
+(and is counted by it) or waits and applies its delta after — never both,
+never neither.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/backfill_ingest_runs.py --audit-only
+    DATABASE_URL=postgresql://... python scripts/backfill_ingest_runs.py --apply
+    DATABASE_URL=postgresql://... python scripts/backfill_ingest_runs.py --apply --tenant <uuid>
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+try:
+    import psycopg2
+except ImportError:
+    print("ERROR: psycopg2 not installed.", file=sys.stderr)
+    sys.exit(1)
+
+
+_AUDIT_SQL = """
+    SELECT st.run_id,
+           COUNT(*) AS triple_count,
+           COUNT(*) FILTER (WHERE st.superseded_at IS NULL) AS live_count,
+           ir.triple_count AS reg_triple_count,
+           ir.live_count AS reg_live_count
+    FROM semantic_triples st
+    LEFT JOIN ingest_runs ir ON ir.dcl_ingest_id = st.run_id
+    WHERE st.tenant_id = %s
+    GROUP BY st.run_id, ir.triple_count, ir.live_count
+"""
+
+_REBUILD_SQL = """
+    INSERT INTO ingest_runs
+        (dcl_ingest_id, tenant_id, entity_ids, triple_count, live_count,
+         first_write_at, last_write_at)
+    SELECT run_id, tenant_id,
+           COALESCE(array_agg(DISTINCT entity_id ORDER BY entity_id)
+                    FILTER (WHERE entity_id IS NOT NULL), '{}'),
+           COUNT(*),
+           COUNT(*) FILTER (WHERE superseded_at IS NULL),
+           MIN(created_at), MAX(created_at)
+    FROM semantic_triples
+    WHERE tenant_id = %s
+    GROUP BY run_id, tenant_id
+    ON CONFLICT (dcl_ingest_id) DO UPDATE SET
+        entity_ids = EXCLUDED.entity_ids,
+        triple_count = EXCLUDED.triple_count,
+        live_count = EXCLUDED.live_count,
+        first_write_at = LEAST(ingest_runs.first_write_at, EXCLUDED.first_write_at),
+        last_write_at = GREATEST(ingest_runs.last_write_at, EXCLUDED.last_write_at),
+        updated_at = now()
+"""
+
+_ZERO_ORPHANS_SQL = """
+    UPDATE ingest_runs ir
+    SET triple_count = 0, live_count = 0, updated_at = now()
+    WHERE ir.tenant_id = %s
+      AND (ir.triple_count <> 0 OR ir.live_count <> 0)
+      AND NOT EXISTS (
+          SELECT 1 FROM semantic_triples st
+          WHERE st.tenant_id = ir.tenant_id AND st.run_id = ir.dcl_ingest_id
+      )
+"""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--audit-only", action="store_true",
+        help="Report runs missing from / drifted in ingest_runs; do NOT write.",
+    )
+    parser.add_argument(
+        "--apply", action="store_true",
+        help="Rebuild ingest_runs rows. Mutually exclusive with --audit-only.",
+    )
+    parser.add_argument(
+        "--tenant", default=None,
+        help="Limit to one tenant_id (default: every tenant with triples).",
+    )
+    args = parser.parse_args()
+
+    if args.audit_only == args.apply:
+        print("ERROR: pass exactly one of --audit-only or --apply.", file=sys.stderr)
+        return 2
+
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        print("ERROR: DATABASE_URL not set.", file=sys.stderr)
+        return 2
+
+    conn = psycopg2.connect(db_url)
+    conn.autocommit = False
+    try:
+        if args.tenant:
+            tenants = [args.tenant]
+        else:
+            with conn.cursor() as cur:
+                cur.execute("SELECT DISTINCT tenant_id FROM semantic_triples ORDER BY 1")
+                tenants = [str(r[0]) for r in cur.fetchall()]
+            conn.rollback()
+
+        for tenant_id in tenants:
+            with conn.cursor() as cur:
+                if args.audit_only:
+                    cur.execute(_AUDIT_SQL, (tenant_id,))
+                    rows = cur.fetchall()
+                    missing = sum(1 for r in rows if r[3] is None)
+                    drifted = sum(
+                        1 for r in rows
+                        if r[3] is not None and (r[1], r[2]) != (r[3], r[4])
+                    )
+                    print(f"{tenant_id}: {len(rows)} run(s), "
+                          f"{missing} missing, {drifted} drifted")
+                    conn.rollback()
+                    continue
+                cur.execute("LOCK TABLE ingest_runs IN SHARE ROW EXCLUSIVE MODE")
+                cur.execute(_REBUILD_SQL, (tenant_id,))
+                rebuilt = cur.rowcount
+                cur.execute(_ZERO_ORPHANS_SQL, (tenant_id,))
+                zeroed = cur.rowcount
+            conn.commit()
+            print(f"{tenant_id}: {rebuilt} run(s) rebuilt, {zeroed} purged run(s) zeroed")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
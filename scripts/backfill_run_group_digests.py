@@ -0,0 +1,123 @@
+"""Backfill run_group_digests (migration 036) from semantic_triples.
+
+Write paths maintain run_group_digests transactionally from migration 036 on
+and mark every run they register ingest_runs.group_digests = true; runs
+written before it have no digests, so TripleStore.diff_runs falls back to
+hashing their triples on every call. This script rebuilds a tenant's digest
+rows from every row each run wrote (run_group_digests_rebuild()):
+  - groups are RECOMPUTED (deleted and re-inserted, not incremented), so
+    re-running is idempotent and also repairs drift (e.g. rows changed by
+    hand-written SQL outside TripleStore);
+  - every rebuilt run is flagged group_digests = true, switching diff_runs
+    to the digest join for it.
+
+Each tenant is rebuilt in one transaction holding a SHARE ROW EXCLUSIVE lock
+on run_group_digests, so a concurrent ingest either committed before the
+recompute (and is counted by it) or waits and applies its credit / debit
+after — never both, never neither.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/backfill_run_group_digests.py --audit-only
+    DATABASE_URL=postgresql://... python scripts/backfill_run_group_digests.py --apply
+    DATABASE_URL=postgresql://... python scripts/backfill_run_group_digests.py --apply --tenant <uuid>
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+try:
+    import psycopg2
+except ImportError:
+    print("ERROR: psycopg2 not installed.", file=sys.stderr)
+    sys.exit(1)
+
+
+# Per run: registry coverage flag, triples written vs the run's digest total.
+_AUDIT_SQL = """
+    WITH st AS (
+        SELECT run_id, COUNT(*) AS row_count
+        FROM semantic_triples
+        WHERE tenant_id = %s AND entity_id IS NOT NULL
+        GROUP BY run_id
+    ), g AS (
+        SELECT dcl_ingest_id AS run_id, SUM(row_count) AS row_count
+        FROM run_group_digests
+        WHERE tenant_id = %s AND row_count > 0
+        GROUP BY dcl_ingest_id
+    )
+    SELECT COALESCE(st.run_id, g.run_id), COALESCE(r.group_digests, false),
+           st.row_count, g.row_count
+    FROM st FULL JOIN g ON g.run_id = st.run_id
+    LEFT JOIN ingest_runs r ON r.dcl_ingest_id = COALESCE(st.run_id, g.run_id)
+"""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--audit-only", action="store_true",
+        help="Report runs without / drifted from their digests; do NOT write.",
+    )
+    parser.add_argument(
+        "--apply", action="store_true",
+        help="Rebuild run_group_digests rows. Mutually exclusive with --audit-only.",
+    )
+    parser.add_argument(
+        "--tenant", default=None,
+        help="Limit to one tenant_id (default: every tenant with triples or digests).",
+    )
+    args = parser.parse_args()
+
+    if args.audit_only == args.apply:
+        print("ERROR: pass exactly one of --audit-only or --apply.", file=sys.stderr)
+        return 2
+
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        print("ERROR: DATABASE_URL not set.", file=sys.stderr)
+        return 2
+
+    conn = psycopg2.connect(db_url)
+    conn.autocommit = False
+    try:
+        if args.tenant:
+            tenants = [args.tenant]
+        else:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT tenant_id FROM semantic_triples "
+                    "UNION SELECT tenant_id FROM run_group_digests ORDER BY 1"
+                )
+                tenants = [str(r[0]) for r in cur.fetchall()]
+            conn.rollback()
+
+        for tenant_id in tenants:
+            with conn.cursor() as cur:
+                if args.audit_only:
+                    cur.execute(_AUDIT_SQL, (tenant_id, tenant_id))
+                    rows = cur.fetchall()
+                    uncovered = sum(1 for r in rows if not r[1])
+                    drifted = sum(1 for r in rows if r[1] and r[2] != r[3])
+                    print(f"{tenant_id}: {len(rows)} run(s), "
+                          f"{uncovered} without digests, {drifted} drifted")
+                    conn.rollback()
+                    continue
+                cur.execute("SET LOCAL statement_timeout = 0")
+                cur.execute("LOCK TABLE run_group_digests IN SHARE ROW EXCLUSIVE MODE")
+                cur.execute("SELECT run_group_digests_rebuild(%s)", (tenant_id,))
+                groups = cur.fetchone()[0]
+            conn.commit()
+            print(f"{tenant_id}: {groups} digest group(s) rebuilt")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Backfill triple_rollups (migration 034) from semantic_triples.
+
+Write paths maintain triple_rollups transactionally from migration 034 on;
+triples written before it have no rollup groups, so the overview /
+contextualization / persona / Sankey surfaces would not count them. This
+script rebuilds every rollup row for a tenant from the live triples
+(triple_rollups_rebuild()):
+  - groups are RECOMPUTED (deleted and re-inserted, not incremented), so
+    re-running is idempotent and also repairs drift (e.g. rows changed by
+    hand-written SQL outside TripleStore);
+  - groups with no live triples left simply are not re-inserted.
+
+Each tenant is rebuilt in one transaction holding a SHARE ROW EXCLUSIVE lock
+on triple_rollups, so a concurrent ingest either committed before the
+recompute (and is counted by it) or waits and applies its credit / debit
+after — never both, never neither.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/backfill_triple_rollups.py --audit-only
+    DATABASE_URL=postgresql://... python scripts/backfill_triple_rollups.py --apply
+    DATABASE_URL=postgresql://... python scripts/backfill_triple_rollups.py --apply --tenant <uuid>
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+try:
+    import psycopg2
+except ImportError:
+    print("ERROR: psycopg2 not installed.", file=sys.stderr)
+    sys.exit(1)
+
+
+# Per run: live triples vs the run's rollup total. A run counted in only one
+# of the two shows up with NULL on the other side.
+_AUDIT_SQL = """
+    WITH st AS (
+        SELECT run_id, COUNT(*) AS live_count
+        FROM semantic_triples
+        WHERE tenant_id = %s AND superseded_at IS NULL
+        GROUP BY run_id
+    ), r AS (
+        SELECT dcl_ingest_id AS run_id, SUM(live_count) AS live_count
+        FROM triple_rollups
+        WHERE tenant_id = %s AND live_count > 0
+        GROUP BY dcl_ingest_id
+    )
+    SELECT COALESCE(st.run_id, r.run_id), st.live_count, r.live_count
+    FROM st FULL JOIN r ON r.run_id = st.run_id
+"""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--audit-only", action="store_true",
+        help="Report runs missing from / drifted in triple_rollups; do NOT write.",
+    )
+    parser.add_argument(
+        "--apply", action="store_true",
+        help="Rebuild triple_rollups rows. Mutually exclusive with --audit-only.",
+    )
+    parser.add_argument(
+        "--tenant", default=None,
+        help="Limit to one tenant_id (default: every tenant with triples or rollups).",
+    )
+    args = parser.parse_args()
+
+    if args.audit_only == args.apply:
+        print("ERROR: pass exactly one of --audit-only or --apply.", file=sys.stderr)
+        return 2
+
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        print("ERROR: DATABASE_URL not set.", file=sys.stderr)
+        return 2
+
+    conn = psycopg2.connect(db_url)
+    conn.autocommit = False
+    try:
+        if args.tenant:
+            tenants = [args.tenant]
+        else:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT tenant_id FROM semantic_triples "
+                    "UNION SELECT tenant_id FROM triple_rollups ORDER BY 1"
+                )
+                tenants = [str(r[0]) for r in cur.fetchall()]
+            conn.rollback()
+
+        for tenant_id in tenants:
+            with conn.cursor() as cur:
+                if args.audit_only:
+                    cur.execute(_AUDIT_SQL, (tenant_id, tenant_id))
+                    rows = cur.fetchall()
+                    missing = sum(1 for r in rows if r[2] is None)
+                    drifted = sum(1 for r in rows if r[2] is not None and r[1] != r[2])
+                    print(f"{tenant_id}: {len(rows)} run(s), "
+                          f"{missing} missing, {drifted} drifted")
+                    conn.rollback()
+                    continue
+                cur.execute("SET LOCAL statement_timeout = 0")
+                cur.execute("LOCK TABLE triple_rollups IN SHARE ROW EXCLUSIVE MODE")
+                cur.execute("SELECT triple_rollups_rebuild(%s)", (tenant_id,))
+                groups = cur.fetchone()[0]
+            conn.commit()
+            print(f"{tenant_id}: {groups} rollup group(s) rebuilt")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
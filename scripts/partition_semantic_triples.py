@@ -0,0 +1,100 @@
+"""Convert a populated semantic_triples to the tiered layout (migration 033).
+
+Migration 033 converts only an EMPTY store at migration time; rewriting a
+populated store is a B19-gated operator step, never an ambient boot side
+effect (ledger #70/#85). This script runs that step:
+  1. AUDIT — report whether the table is already partitioned, and its live /
+     superseded row counts and size.
+  2. APPLY — SELECT semantic_triples_partition(N) in one transaction, with no
+     statement timeout. The rebuild holds an ACCESS EXCLUSIVE lock on
+     semantic_triples for its whole duration, so run it in a write freeze.
+     The function is a no-op on a store that is already partitioned.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/partition_semantic_triples.py --audit-only
+    DATABASE_URL=postgresql://... python scripts/partition_semantic_triples.py --apply [--live-partitions 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+try:
+    import psycopg2
+except ImportError:
+    print("ERROR: psycopg2 not installed.", file=sys.stderr)
+    sys.exit(1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--audit-only", action="store_true",
+        help="Report the current layout and row counts; do NOT convert.",
+    )
+    parser.add_argument(
+        "--apply", action="store_true",
+        help="Run the conversion. Mutually exclusive with --audit-only.",
+    )
+    parser.add_argument(
+        "--live-partitions", type=int, default=16,
+        help="Hash partitions for the live tier (default: 16).",
+    )
+    args = parser.parse_args()
+
+    if args.audit_only == args.apply:
+        print("ERROR: pass exactly one of --audit-only or --apply.", file=sys.stderr)
+        return 2
+
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        print("ERROR: DATABASE_URL not set.", file=sys.stderr)
+        return 2
+
+    conn = psycopg2.connect(db_url)
+    conn.autocommit = False
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT relkind, pg_size_pretty(pg_total_relation_size(oid)) "
+                "FROM pg_class WHERE oid = to_regclass('semantic_triples')"
+            )
+            row = cur.fetchone()
+            if row is None:
+                print("ERROR: semantic_triples does not exist.", file=sys.stderr)
+                return 1
+            relkind, size = row
+            if relkind == "p":
+                print("semantic_triples is already partitioned — nothing to do.")
+                return 0
+            cur.execute(
+                "SELECT COUNT(*) FILTER (WHERE superseded_at IS NULL), "
+                "       COUNT(*) FILTER (WHERE superseded_at IS NOT NULL) "
+                "FROM semantic_triples"
+            )
+            live, superseded = cur.fetchone()
+            print(f"semantic_triples: {live} live + {superseded} superseded rows, {size}")
+            conn.rollback()
+
+            if args.audit_only:
+                return 0
+
+            cur.execute("SET statement_timeout = 0")
+            started = time.monotonic()
+            cur.execute("SELECT semantic_triples_partition(%s)", (args.live_partitions,))
+            result = cur.fetchone()[0]
+            conn.commit()
+            print(f"{result} ({time.monotonic() - started:.1f}s)")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
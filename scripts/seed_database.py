@@ -3,9 +3,11 @@ Seed DCL database from Farm-generated JSONL triples.
 
 Reads a Farm JSONL triple file and inserts directly into DCL's
 semantic_triples table using psycopg2 execute_values for performance.
+Multi-entity files can instead be written as concurrent per-entity shards
+through the backend pool (--shard-workers N).
 
 Usage:
-    python scripts/seed_database.py <jsonl_path> [--database-url ...]
+    python scripts/seed_database.py <jsonl_path> [--database-url ...] [--shard-workers N]
 """
 
 import argparse
@@ -76,6 +78,65 @@ def get_valid_concept_roots(conn) -> set[str]:
     return {c["id"] for c in data.get("concepts", []) if c.get("id")}
 
 
+def write_batches(conn, rows: list[tuple], batch_size: int) -> int:
+    """Single-connection path: execute_values batches in one transaction."""
+    col_names = ", ".join(COLUMNS)
+    sql = f"INSERT INTO semantic_triples ({col_names}) VALUES %s"
+
+    total_inserted = 0
+    total_batches = (len(rows) + batch_size - 1) // batch_size
+
+    with conn.cursor() as cur:
+        for batch_num in range(total_batches):
+            start = batch_num * batch_size
+            end = start + batch_size
+            batch = rows[start:end]
+            execute_values(cur, sql, batch, page_size=batch_size)
+            total_inserted += len(batch)
+            print(f"  Batch {batch_num + 1}/{total_batches}: {len(batch)} rows — cumulative: {total_inserted}")
+    return total_inserted
+
+
+def register_run(conn, tenant_id: str, run_id: str) -> None:
+    """Record the seeded run in the ingest_runs registry (migration 031), its
+    triple_rollups groups (migration 034) and its run_group_digests groups
+    (migration 036) — execute_values bypasses TripleStore, which maintains
+    all three on every other write path."""
+    with conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO ingest_runs "
+            "(dcl_ingest_id, tenant_id, entity_ids, triple_count, live_count) "
+            "SELECT run_id, tenant_id, "
+            "       COALESCE(array_agg(DISTINCT entity_id ORDER BY entity_id) "
+            "                FILTER (WHERE entity_id IS NOT NULL), '{}'), "
+            "       COUNT(*), COUNT(*) FILTER (WHERE superseded_at IS NULL) "
+            "FROM semantic_triples WHERE run_id = %s GROUP BY run_id, tenant_id "
+            "ON CONFLICT (dcl_ingest_id) DO UPDATE SET "
+            "  entity_ids = EXCLUDED.entity_ids, triple_count = EXCLUDED.triple_count, "
+            "  live_count = EXCLUDED.live_count, last_write_at = now(), updated_at = now()",
+            (run_id,),
+        )
+        cur.execute("SELECT triple_rollups_rebuild(%s, %s)", (tenant_id, run_id))
+        cur.execute("SELECT run_group_digests_rebuild(%s, %s)", (tenant_id, run_id))
+
+
+def write_sharded(database_url: str, tenant_id: str, rows: list[tuple], workers: int) -> int:
+    """Multi-entity path: one shard per entity group, written concurrently
+    through the backend pool with two-phase commit (migration 032)."""
+    os.environ["DATABASE_URL"] = database_url
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from backend.db.triple_store import TripleStore
+
+    triples = []
+    for r in rows:
+        t = dict(zip(COLUMNS, r))
+        t["value"] = json.loads(t["value"])
+        triples.append(t)
+    entities = len({t["entity_id"] for t in triples})
+    print(f"  Sharded write: {entities} entities across up to {workers} connections")
+    return TripleStore().write_entity_shards(tenant_id, triples, workers=workers)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Seed DCL database from Farm JSONL triples")
     parser.add_argument("jsonl_path", help="Path to Farm-generated JSONL triple file")
@@ -86,6 +147,12 @@ def main():
     )
     parser.add_argument("--batch-size", type=int, default=1000, help="Rows per INSERT batch")
     parser.add_argument("--replace", action="store_true", help="Replace existing run if present")
+    parser.add_argument(
+        "--shard-workers", type=int, default=0,
+        help="Write per-entity shards concurrently on this many pooled connections "
+             "(TripleStore.write_entity_shards; needs max_prepared_transactions). "
+             "0 = single connection.",
+    )
     args = parser.parse_args()
 
     # Load .env if DATABASE_URL not set
@@ -159,6 +226,18 @@ def main():
                     "DELETE FROM semantic_triples WHERE run_id = %s",
                     (run_id,),
                 )
+                cur.execute(
+                    "DELETE FROM ingest_runs WHERE dcl_ingest_id = %s",
+                    (run_id,),
+                )
+                cur.execute(
+                    "DELETE FROM triple_rollups WHERE dcl_ingest_id = %s",
+                    (run_id,),
+                )
+                cur.execute(
+                    "DELETE FROM run_group_digests WHERE dcl_ingest_id = %s",
+                    (run_id,),
+                )
             conn.commit()
 
         # Prepare rows
@@ -189,22 +268,13 @@ def main():
                 t.get("resolution_confidence"),
             ))
 
-        # Batch insert using execute_values for performance
-        col_names = ", ".join(COLUMNS)
-        sql = f"INSERT INTO semantic_triples ({col_names}) VALUES %s"
-
-        total_inserted = 0
-        total_batches = (len(rows) + args.batch_size - 1) // args.batch_size
-
-        with conn.cursor() as cur:
-            for batch_num in range(total_batches):
-                start = batch_num * args.batch_size
-                end = start + args.batch_size
-                batch = rows[start:end]
-                execute_values(cur, sql, batch, page_size=args.batch_size)
-                total_inserted += len(batch)
-                print(f"  Batch {batch_num + 1}/{total_batches}: {len(batch)} rows — cumulative: {total_inserted}")
-
+        if args.shard_workers > 0:
+            total_inserted = write_sharded(
+                args.database_url, tenant_id, rows, args.shard_workers,
+            )
+        else:
+            total_inserted = write_batches(conn, rows, args.batch_size)
+            register_run(conn, tenant_id, run_id)
         conn.commit()
 
         # Verify
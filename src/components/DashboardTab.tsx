@@ -1,4 +1,4 @@
-import { useEffect, useState, useCallback } from 'react';
+import { useEffect, useRef, useState, useCallback } from 'react';
 import { SnapshotSelector, SnapshotState } from './RunSelector';
 
 interface TripleRow {
@@ -22,17 +22,20 @@ interface AggItem {
   count: number;
 }
 
+interface Aggregations {
+  by_domain: AggItem[];
+  by_source: AggItem[];
+  by_period: AggItem[];
+}
+
 interface DashboardData {
   rows: TripleRow[];
   total_count: number;
   page: number;
   page_size: number;
+  next_cursor: string | null;
   filters_applied: Record<string, string>;
-  aggregations: {
-    by_domain: AggItem[];
-    by_source: AggItem[];
-    by_period: AggItem[];
-  };
+  aggregations: Aggregations;
 }
 
 interface Filters {
@@ -55,6 +58,11 @@ export function DashboardTab({ snapshot }: DashboardTabProps) {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const pageSize = 50;
+  // Keyset pagination: cursors.current[i] is the cursor that fetches page
+  // i + 1 (page 1 has none). Page 1 also carries the aggregations and the
+  // total; later pages fetch rows only and keep page 1's sidebar.
+  const cursors = useRef<(string | null)[]>([null]);
+  const firstPage = useRef<{ aggregations: Aggregations; total_count: number } | null>(null);
 
   const fetchData = useCallback(async (f: Filters, p: number, entityId?: string) => {
     setLoading(true);
@@ -67,10 +75,24 @@ export function DashboardTab({ snapshot }: DashboardTabProps) {
       if (f.period) params.set('period', f.period);
       params.set('page', String(p));
       params.set('page_size', String(pageSize));
+      const cursor = p > 1 ? cursors.current[p - 1] : null;
+      if (cursor && firstPage.current) {
+        params.set('cursor', cursor);
+        params.set('aggregations', 'false');
+        params.set('count', 'none');
+      }
 
       const dashRes = await fetch(`/api/dcl/dashboard-data?${params}`);
       if (!dashRes.ok) throw new Error(`Dashboard data: HTTP ${dashRes.status}`);
-      setData(await dashRes.json());
+      const body = await dashRes.json();
+      if (body.aggregations) {
+        firstPage.current = { aggregations: body.aggregations, total_count: body.total_count };
+      } else if (firstPage.current) {
+        body.aggregations = firstPage.current.aggregations;
+        body.total_count = firstPage.current.total_count;
+      }
+      cursors.current[p] = body.next_cursor;
+      setData(body);
     } catch (e) {
       setError(e instanceof Error ? e.message : 'Failed to fetch dashboard data');
     } finally {
@@ -78,15 +100,25 @@ export function DashboardTab({ snapshot }: DashboardTabProps) {
     }
   }, []);
 
+  // Declared before the fetch effect so an entity switch never reuses the
+  // previous entity's cursors (without one, page N falls back to OFFSET).
+  useEffect(() => { cursors.current = [null]; firstPage.current = null; }, [selectedEntityId]);
+
   useEffect(() => { fetchData(filters, page, selectedEntityId || undefined); }, [fetchData, filters, page, selectedEntityId]);
 
-  const applyFilter = (key: keyof Filters, value: string) => {
+  const resetPaging = () => {
+    cursors.current = [null];
+    firstPage.current = null;
     setPage(1);
+  };
+
+  const applyFilter = (key: keyof Filters, value: string) => {
+    resetPaging();
     setFilters((prev) => ({ ...prev, [key]: value }));
   };
 
   const clearFilters = () => {
-    setPage(1);
+    resetPaging();
     setFilters(EMPTY_FILTERS);
   };
 
@@ -223,7 +255,7 @@ export function DashboardTab({ snapshot }: DashboardTabProps) {
                 >Prev</button>
                 <button
                   onClick={() => setPage(Math.min(totalPages, page + 1))}
-                  disabled={page >= totalPages}
+                  disabled={page >= totalPages || !data?.next_cursor}
                   className="px-2 py-0.5 rounded border border-border hover:bg-accent disabled:opacity-30"
                 >Next</button>
               </div>
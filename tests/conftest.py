@@ -18,6 +18,19 @@ from pathlib import Path
 # run-now / explicit awaited fires, never the ambient timer.
 os.environ.setdefault("DCL_SCHEDULER_ENABLED", "false")
 
+# Same guard for the post-ingest queue (migration 030): suites read conflicts,
+# concept_summary and ingest_log straight after an ingest, so ingests without
+# an explicit ?sync run their post-ingest job in-request, and no ambient
+# worker thread drains ingest_jobs mid-test. test_ingest_jobs.py drives the
+# queue explicitly (?sync=false + IngestWorker.run_once).
+os.environ.setdefault("DCL_INGEST_SYNC_DEFAULT", "true")
+os.environ.setdefault("DCL_INGEST_WORKER_ENABLED", "false")
+
+# Triple read cache: several suites mutate semantic_triples / tenant_runs with
+# raw SQL (bypassing the TripleStore invalidation hooks) and read straight
+# back. test_read_cache.py exercises the cache on its own instance.
+os.environ.setdefault("DCL_READ_CACHE_ENABLED", "false")
+
 import httpx
 import pytest
 
@@ -49,6 +49,9 @@ def _cleanup_tenant():
         for sql in ("DELETE FROM conflict_dispositions WHERE tenant_id = %s",
                     "DELETE FROM conflict_register WHERE tenant_id = %s",
                     "DELETE FROM semantic_triples WHERE tenant_id = %s",
+                    "DELETE FROM ingest_runs WHERE tenant_id = %s",
+                    "DELETE FROM triple_rollups WHERE tenant_id = %s",
+                    "DELETE FROM run_group_digests WHERE tenant_id = %s",
                     "DELETE FROM tenant_runs WHERE tenant_id = %s"):
             cur.execute(sql, (TENANT,))
         conn.commit()
@@ -66,7 +69,7 @@ def seeded_conflict():
 
     run_id = str(uuid.uuid4())
     resp = httpx.post(
-        f"{DCL_BACKEND}/api/dcl/ingest-triples",
+        f"{DCL_BACKEND}/api/dcl/ingest-triples?sync=true",
         json={
             "tenant_id": TENANT, "dcl_ingest_id": run_id, "entity_id": ENTITY,
             "snapshot_name": f"{ENTITY}-{run_id.replace('-', '')[:4]}",
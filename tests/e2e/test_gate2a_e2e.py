@@ -142,6 +142,9 @@ def _cleanup():
             "DELETE FROM resolver_hitl_queue WHERE tenant_id = %s",
             "DELETE FROM canonical_registry WHERE tenant_id = %s",
             "DELETE FROM semantic_triples WHERE tenant_id = %s",
+            "DELETE FROM ingest_runs WHERE tenant_id = %s",
+            "DELETE FROM triple_rollups WHERE tenant_id = %s",
+            "DELETE FROM run_group_digests WHERE tenant_id = %s",
             "DELETE FROM tenant_runs WHERE tenant_id = %s",
         ):
             cur.execute(sql, (TENANT,))
@@ -171,7 +174,7 @@ def story():
         # (b) per-run-unique conflicts through the real ingest path.
         run_id = str(uuid.uuid4())
         resp = client.post(
-            f"{DCL_BACKEND}/api/dcl/ingest-triples",
+            f"{DCL_BACKEND}/api/dcl/ingest-triples?sync=true",
             json={"tenant_id": TENANT, "dcl_ingest_id": run_id, "entity_id": ENTITY,
                   "snapshot_name": f"{ENTITY}-{run_id.replace('-', '')[:4]}",
                   "triples": [
@@ -179,6 +179,9 @@ def _esc_cleanup():
             cur.execute("DELETE FROM conflict_dispositions WHERE tenant_id=%s", (_ESC_TENANT,))
             cur.execute("DELETE FROM conflict_register WHERE tenant_id=%s", (_ESC_TENANT,))
             cur.execute("DELETE FROM semantic_triples WHERE tenant_id=%s", (_ESC_TENANT,))
+            cur.execute("DELETE FROM ingest_runs WHERE tenant_id=%s", (_ESC_TENANT,))
+            cur.execute("DELETE FROM triple_rollups WHERE tenant_id=%s", (_ESC_TENANT,))
+            cur.execute("DELETE FROM run_group_digests WHERE tenant_id=%s", (_ESC_TENANT,))
             cur.execute("DELETE FROM tenant_runs WHERE tenant_id=%s", (_ESC_TENANT,))
             cur.execute("DELETE FROM tenant_authority_map WHERE tenant_id=%s", (_ESC_TENANT,))
             conn.commit()
@@ -272,6 +275,9 @@ def _asof_cleanup():
             cur.execute("DELETE FROM conflict_dispositions WHERE tenant_id=%s", (_ASOF_TENANT,))
             cur.execute("DELETE FROM conflict_register WHERE tenant_id=%s", (_ASOF_TENANT,))
             cur.execute("DELETE FROM semantic_triples WHERE tenant_id=%s", (_ASOF_TENANT,))
+            cur.execute("DELETE FROM ingest_runs WHERE tenant_id=%s", (_ASOF_TENANT,))
+            cur.execute("DELETE FROM triple_rollups WHERE tenant_id=%s", (_ASOF_TENANT,))
+            cur.execute("DELETE FROM run_group_digests WHERE tenant_id=%s", (_ASOF_TENANT,))
             cur.execute("DELETE FROM tenant_runs WHERE tenant_id=%s", (_ASOF_TENANT,))
             conn.commit()
 
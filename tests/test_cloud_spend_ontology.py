@@ -74,6 +74,18 @@ def _cleanup():
                 "DELETE FROM semantic_triples WHERE tenant_id = %s",
                 (TEST_TENANT_ID,),
             )
+            cur.execute(
+                "DELETE FROM ingest_runs WHERE tenant_id = %s",
+                (TEST_TENANT_ID,),
+            )
+            cur.execute(
+                "DELETE FROM triple_rollups WHERE tenant_id = %s",
+                (TEST_TENANT_ID,),
+            )
+            cur.execute(
+                "DELETE FROM run_group_digests WHERE tenant_id = %s",
+                (TEST_TENANT_ID,),
+            )
             cur.execute(
                 "DELETE FROM tenant_runs WHERE tenant_id = %s",
                 (TEST_TENANT_ID,),
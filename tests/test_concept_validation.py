@@ -0,0 +1,76 @@
+"""Set-based concept validation at the triple ingest boundary.
+
+Pure unit tests (no database): a batch's concepts are validated as a set —
+each distinct concept is checked against the ConceptRegistry once, however
+many rows carry it — while a bad concept still fails at the exact triple
+index with the same INVALID_CONCEPT / UNMAPPED_DOMAIN detail as before.
+"""
+
+import pytest
+from fastapi import HTTPException
+
+from backend.api.routes import ingest_triples as it
+
+
+def _triple(concept, prop="amount"):
+    return it.TriplePayload(
+        entity_id="ConceptProbe-T1", concept=concept, property=prop, value=1.0,
+        period="2026-03", source_system="netsuite", source_field=prop,
+        pipe_id="22222222-2222-4222-8222-222222222222",
+        fabric_plane="ipaas", confidence_score=0.95, confidence_tier="exact",
+    )
+
+
+def _validate_batch(triples):
+    verdicts = it._concept_verdicts(t.concept for t in triples)
+    for i, t in enumerate(triples):
+        it._validate_triple(t, i, verdicts)
+
+
+def test_registry_checked_once_per_distinct_concept(monkeypatch):
+    seen = []
+    real = it._concept_registry.valid_concepts
+
+    def spy(concepts):
+        concepts = list(concepts)
+        seen.extend(concepts)
+        return real(concepts)
+
+    monkeypatch.setattr(it._concept_registry, "valid_concepts", spy)
+    concepts = ["revenue.total", "cloud_spend.summary", "revenue.by_segment"]
+    triples = [_triple(concepts[i % 3], prop=f"p_{i}") for i in range(1000)]
+    _validate_batch(triples)
+    assert sorted(seen) == sorted(concepts)
+
+
+def test_invalid_concept_reports_exact_triple_index():
+    triples = [_triple("revenue.total", prop=f"p_{i}") for i in range(40)]
+    triples[37] = _triple("not_a_concept.x")
+    with pytest.raises(HTTPException) as exc:
+        _validate_batch(triples)
+    assert exc.value.status_code == 400
+    assert exc.value.detail["error"] == "INVALID_CONCEPT"
+    assert exc.value.detail["message"].startswith("Triple #37:")
+
+
+def test_unmapped_domain_reports_exact_triple_index(monkeypatch):
+    monkeypatch.setattr(
+        it, "_MAPPED_DOMAIN_PREFIXES", it._MAPPED_DOMAIN_PREFIXES - {"cloud_spend"}
+    )
+    triples = [_triple("revenue.total", prop=f"p_{i}") for i in range(10)]
+    triples[6] = _triple("cloud_spend.summary")
+    with pytest.raises(HTTPException) as exc:
+        _validate_batch(triples)
+    assert exc.value.status_code == 422
+    assert exc.value.detail["error"] == "UNMAPPED_DOMAIN"
+    assert exc.value.detail["domain_prefix"] == "cloud_spend"
+    assert exc.value.detail["message"].startswith("Triple #6:")
+
+
+def test_unseen_concept_is_validated_on_first_use():
+    verdicts: dict = {}
+    it._validate_triple(_triple("revenue.total"), 0, verdicts)
+    assert verdicts == {"revenue.total": None}
+    with pytest.raises(HTTPException):
+        it._validate_triple(_triple("bogus.concept"), 1, verdicts)
+    assert verdicts["bogus.concept"] == "INVALID_CONCEPT"
@@ -82,6 +82,9 @@ def _cleanup():
             cur.execute("DELETE FROM conflict_dispositions WHERE tenant_id = %s", (TEST_TENANT_ID,))
             cur.execute("DELETE FROM conflict_register WHERE tenant_id = %s", (TEST_TENANT_ID,))
             cur.execute("DELETE FROM semantic_triples WHERE tenant_id = %s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_runs WHERE tenant_id = %s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM triple_rollups WHERE tenant_id = %s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM run_group_digests WHERE tenant_id = %s", (TEST_TENANT_ID,))
             cur.execute("DELETE FROM tenant_runs WHERE tenant_id = %s", (TEST_TENANT_ID,))
             conn.commit()
 
@@ -306,3 +309,48 @@ class TestDeterminism:
     def test_17_register_reads_twice_identical(self, conflict_flow):
         a, b = _register(), _register()
         assert a == b, "register reads must be deterministic (B14)"
+
+
+class TestSetBasedMateriality:
+    """Group classification, deltas and claim shaping run in the detection
+    SQL — per-record groups arrive summarized per source, scalar groups
+    capped at _CLAIMS_DETAIL_CAP with deltas over ALL claims."""
+
+    def test_18_per_record_summary_and_claims_cap(self, conflict_flow):
+        from backend.db.triple_store import TripleStore
+        from backend.engine.conflict_detection import _CLAIMS_DETAIL_CAP, detect_and_register
+
+        entity, run = "ConflictProbe-T2", str(uuid.uuid4())
+        base = {"tenant_id": TEST_TENANT_ID, "entity_id": entity, "run_id": run,
+                "period": "2025-Q1", "confidence_score": 0.95,
+                "confidence_tier": "exact", "source_table": "conflict_probe"}
+        rows = [  # per-record: sap contributes three ledger rows
+            {**base, "concept": "invoice.billing", "property": "amount",
+             "value": 10.0 * i, "source_system": "sap"} for i in range(1, 4)
+        ]
+        rows.append({**base, "concept": "invoice.billing", "property": "amount",
+                     "value": 60.0, "source_system": "salesforce"})
+        n_sources = _CLAIMS_DETAIL_CAP + 6
+        rows += [
+            {**base, "concept": "revenue.total", "property": "amount",
+             "value": 100.0 + i, "source_system": f"src{i:02d}"}
+            for i in range(n_sources)
+        ]
+        TripleStore().insert_triples(rows)
+
+        out = detect_and_register(TEST_TENANT_ID, entity, run)
+        by_concept = {c["concept"]: c for c in out["conflicts"]}
+
+        per_record = by_concept["invoice.billing"]
+        assert per_record["conflict_type"] == "structural"
+        assert per_record["materiality"]["basis"] == "per_record"
+        assert [(c["source_system"], c["row_count"]) for c in per_record["claims"]] == [
+            ("salesforce", 1), ("sap", 3),
+        ]
+        assert all(c["sample_triple_id"] for c in per_record["claims"])
+
+        capped = by_concept["revenue.total"]
+        assert len(capped["claims"]) == _CLAIMS_DETAIL_CAP
+        assert capped["materiality"]["basis"] == "numeric"
+        assert abs(capped["materiality"]["abs_delta"] - (n_sources - 1)) < 1e-9
+        assert capped["conflict_type"] == "value"
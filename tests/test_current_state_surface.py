@@ -162,6 +162,9 @@ def _cleanup():
             cur.execute("DELETE FROM conflict_dispositions WHERE tenant_id=%s", (TEST_TENANT_ID,))
             cur.execute("DELETE FROM conflict_register WHERE tenant_id=%s", (TEST_TENANT_ID,))
             cur.execute("DELETE FROM semantic_triples WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM triple_rollups WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM run_group_digests WHERE tenant_id=%s", (TEST_TENANT_ID,))
             cur.execute("DELETE FROM tenant_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
             cur.execute("DELETE FROM tenant_normalization_policy WHERE tenant_id=%s", (TEST_TENANT_ID,))
             conn.commit()
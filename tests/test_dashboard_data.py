@@ -0,0 +1,227 @@
+"""GET /api/dcl/dashboard-data — keyset pagination + one-pass aggregations.
+
+Operator-visible outcome under test: walking the Dashboard by next_cursor
+visits every coordinate exactly once, in the same order as OFFSET paging;
+the by_domain / by_source / by_period breakdowns and total_count from the
+GROUPING SETS pass match the per-coordinate truth; ?aggregations=false and
+?count=none|estimate trim the response; a malformed cursor is a readable 400;
+a period-less coordinate and a ''-period one are two rows, on any page size.
+A cursor page plans as an ordered scan of idx_triples_active_coord_key
+(migration 038) — no Sort — once the index exists.
+
+Live-service integration test: TestClient drives the real FastAPI app
+against the aos-dev database. Dedicated tenant + entity so demo data is
+never touched.
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+from fastapi.testclient import TestClient
+from backend.api.main import app
+from backend.api.routes import triple_monitor
+from backend.core.db import get_connection
+from backend.db.triple_store import TripleStore
+
+client = TestClient(app, raise_server_exceptions=False)
+
+TEST_TENANT_ID = str(uuid.uuid5(uuid.NAMESPACE_DNS, "dashboard-data-keyset-test"))
+ENTITY = "DashboardProbe-K1"
+
+# 9 coordinates: 3 concepts x (2 periods + 1 period-less). revenue.total is
+# claimed by two sources, so it counts once per domain/period but under
+# both sources.
+CONCEPTS = ["revenue.total", "cost.opex.total", "workforce.headcount.total"]
+PERIODS = ["2025-01", "2025-02", None]
+
+# Same concept, once with no period and once with period '' — two coordinates.
+ENTITY_BLANK = "DashboardProbe-K2"
+
+
+def _row(entity, concept, period, source, run_id):
+    return {
+        "tenant_id": TEST_TENANT_ID, "entity_id": entity,
+        "concept": concept, "property": "amount", "value": 100.0,
+        "period": period, "currency": "USD", "source_system": source,
+        "source_table": "probe", "source_field": "amount",
+        "run_id": run_id, "confidence_score": 0.95,
+        "confidence_tier": "exact",
+    }
+
+
+def _rows(run_id):
+    rows = []
+    for concept in CONCEPTS:
+        for period in PERIODS:
+            sources = ["sap", "netsuite"] if concept == "revenue.total" else ["sap"]
+            for source in sources:
+                rows.append(_row(ENTITY, concept, period, source, run_id))
+    rows += [_row(ENTITY_BLANK, "revenue.total", period, "sap", run_id) for period in (None, "")]
+    return rows
+
+
+def _cleanup():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM semantic_triples WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM triple_rollups WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM run_group_digests WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            conn.commit()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def seeded():
+    _cleanup()
+    TripleStore().insert_triples(_rows(str(uuid.uuid4())))
+    yield
+    _cleanup()
+
+
+def _get(**params):
+    resp = client.get("/api/dcl/dashboard-data", params={"entity_id": ENTITY, **params})
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+def _coord(row):
+    return (row["concept"], row["period"])
+
+
+def _has_coord_index() -> bool:
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT to_regclass('idx_triples_active_coord_key') IS NOT NULL")
+                return cur.fetchone()[0]
+    except Exception:
+        return False
+
+
+needs_coord_index = pytest.mark.skipif(
+    not _has_coord_index(),
+    reason="idx_triples_active_coord_key missing — run scripts/add_dashboard_coord_index.py --apply",
+)
+
+
+class TestKeysetPagination:
+    def test_cursor_walk_matches_offset_paging(self):
+        by_offset = [_coord(r) for p in (1, 2, 3, 4) for r in _get(page=p, page_size=3)["rows"]]
+
+        walked, cursor, pages = [], None, 0
+        while True:
+            params = {"page_size": 3, "aggregations": "false", "count": "none"}
+            if cursor:
+                params["cursor"] = cursor
+            body = _get(**params)
+            walked += [_coord(r) for r in body["rows"]]
+            pages += 1
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+
+        assert pages == 3
+        assert len(walked) == 9 and len(set(walked)) == 9
+        assert walked == by_offset
+
+    def test_last_page_has_no_next_cursor(self):
+        assert _get(page_size=50)["next_cursor"] is None
+
+    def test_null_and_blank_period_are_two_coordinates(self):
+        body = _get(entity_id=ENTITY_BLANK)
+        assert [r["period"] for r in body["rows"]] == ["", None]
+        assert body["total_count"] == 2
+
+        first = _get(entity_id=ENTITY_BLANK, page_size=1, aggregations="false", count="none")
+        second = _get(entity_id=ENTITY_BLANK, page_size=1, cursor=first["next_cursor"],
+                      aggregations="false", count="none")
+        assert [r["period"] for r in first["rows"] + second["rows"]] == ["", None]
+        assert second["next_cursor"] is None
+
+    def test_malformed_cursor_is_400(self):
+        resp = client.get("/api/dcl/dashboard-data",
+                          params={"entity_id": ENTITY, "cursor": "not-a-cursor"})
+        assert resp.status_code == 400
+        assert "cursor" in resp.json()["detail"]
+
+
+class TestAggregations:
+    def test_grouping_sets_breakdowns_and_exact_total(self):
+        body = _get()
+        assert body["total_count"] == 9
+        aggs = body["aggregations"]
+        assert {d["domain"]: d["count"] for d in aggs["by_domain"]} == {
+            "revenue": 3, "cost": 3, "workforce": 3,
+        }
+        assert {s["system"]: s["count"] for s in aggs["by_source"]} == {"sap": 9, "netsuite": 3}
+        assert aggs["by_source"][0]["system"] == "sap"
+        # period-less coordinates are not a period bucket
+        assert aggs["by_period"] == [
+            {"period": "2025-01", "count": 3}, {"period": "2025-02", "count": 3},
+        ]
+
+    def test_aggregations_and_count_are_optional(self):
+        body = _get(aggregations="false", count="none")
+        assert body["aggregations"] is None
+        assert body["total_count"] is None
+        assert len(body["rows"]) == 9
+
+        estimated = _get(aggregations="false", count="estimate")
+        assert estimated["count_mode"] == "estimate"
+        assert isinstance(estimated["total_count"], int)
+
+    def test_estimate_with_default_aggregations(self):
+        body = _get(count="estimate")
+        assert isinstance(body["total_count"], int)
+        assert {d["domain"] for d in body["aggregations"]["by_domain"]} == {
+            "revenue", "cost", "workforce",
+        }
+
+
+@needs_coord_index
+class TestCursorPlan:
+    def test_deep_cursor_page_is_ordered_index_scan(self, monkeypatch):
+        cursor = _get(page_size=6, aggregations="false", count="none")["next_cursor"]
+        captured = {}
+        real = triple_monitor.read_cache.get_or_load
+
+        def capture(namespace, tenant_id, query_key, loader):
+            captured[namespace] = query_key
+            return real(namespace, tenant_id, query_key, loader)
+
+        monkeypatch.setattr(triple_monitor.read_cache, "get_or_load", capture)
+        body = _get(page_size=2, cursor=cursor, aggregations="false", count="none")
+        assert len(body["rows"]) == 2
+
+        data_sql, params, page_params, page_size, offset_params = captured["dashboard_data"][:5]
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                # On a partitioned store each leaf partition scans its own
+                # attached copy of the index, at any depth of the tree.
+                cur.execute(
+                    "SELECT relid::text FROM "
+                    "pg_partition_tree('idx_triples_active_coord_key'::regclass)"
+                )
+                names = {"idx_triples_active_coord_key"} | {r[0] for r in cur.fetchall()}
+                cur.execute("SET LOCAL enable_seqscan = off")
+                cur.execute("SET LOCAL enable_sort = off")
+                cur.execute("EXPLAIN (FORMAT JSON) " + data_sql,
+                            params + page_params + [page_size + 1] + offset_params)
+                plan = cur.fetchone()[0][0]["Plan"]
+                conn.rollback()
+        nodes, stack = [], [plan]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(node.get("Plans", []))
+        assert "Sort" not in {n["Node Type"] for n in nodes}
+        assert {n.get("Index Name") for n in nodes} & names
@@ -0,0 +1,246 @@
+"""Single-read, incremental Stage-3 edge derivation.
+
+Operator-visible outcome under test: derive_edges reads every input concept
+in ONE query; with incremental=True, a re-ingest that corrected one concept
+re-derives only the rules that concept feeds, re-asserts only the edges whose
+content changed and retires the ones that no longer hold — the rest of the
+derived graph keeps its rows (and versions).
+
+Runs without a database: Stage-2 rows come from a fake connection (current
+rows, plus the superseded rows a run retired), and the edge store is an in-memory stand-in that applies the same coordinate
+supersession as EdgeStore.assert_edges.
+"""
+
+import contextlib
+import json
+import uuid
+
+import pytest
+
+from backend.db.edge_store import EdgeWriteResult
+from backend.engine import edge_derivation as ed
+
+ENTITY = "IncrementalDeriveTest-0001"
+FIRST_RUN = str(uuid.uuid4())
+EXIT_TMPL = "workforce.exit_theme.{reason}.by_department"
+
+
+def _rows(run, exits=None):
+    """Stage-2 current rows: (concept, property, value, source_system, run_id)."""
+    exits = exits or {"comp": {"eng": 5.0, "sales": 1.0},
+                      "growth": {"eng": 2.0, "sales": 4.0}}
+    rows = [
+        (ed._COMP_CONCEPT, "eng", 150000.0, "workday", run),
+        (ed._COMP_CONCEPT, "sales", 100000.0, "workday", run),
+        (ed._MARKET_CONCEPT, "software_eng", 170000.0, "radford", run),
+        (ed._MARKET_CONCEPT, "account_exec", 110000.0, "radford", run),
+        (ed._RESOLUTION_CONCEPT, "eng", "software_eng", "radford", run),
+        (ed._RESOLUTION_CONCEPT, "sales", "account_exec", "radford", run),
+    ]
+    for reason, by_dept in exits.items():
+        for dept, count in by_dept.items():
+            rows.append((EXIT_TMPL.format(reason=reason), dept, count, "lattice", run))
+    return rows
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.conn.executed.append((query, params))
+        if "DISTINCT concept" in query:
+            # The batch read: concepts the run wrote or superseded.
+            run = params[5]
+            touched = [r for r in self.conn.rows if r[4] == run]
+            touched += [r for r, by in self.conn.superseded if by == run]
+            self.result = sorted({(r[0],) for r in touched})
+        else:
+            self.result = [r[:4] for r in self.conn.rows]
+
+    def fetchall(self):
+        return self.result
+
+
+class FakeConn:
+    def __init__(self, rows, superseded):
+        self.rows = rows
+        self.superseded = superseded
+        self.executed = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+class FakeStore:
+    """entity_edges for one entity: live rows by coordinate."""
+
+    live: dict = {}
+    calls: list = []
+
+    def live_edges(self, tenant_id, entity_id):
+        return [dict(e) for e in FakeStore.live.values()]
+
+    def assert_edges(self, tenant_id, entity_id, edges, *, replace=False,
+                     retire=None, scrub=True):
+        FakeStore.calls.append({"edges": edges, "replace": replace,
+                                "retire": retire, "scrub": scrub})
+        superseded = 0
+        if replace:
+            superseded, FakeStore.live = len(FakeStore.live), {}
+        for e in list(retire or ()) + list(edges):
+            superseded += FakeStore.live.pop(ed._edge_coord(e), None) is not None
+        for e in edges:
+            FakeStore.live[ed._edge_coord(e)] = {
+                **e, "properties": json.loads(json.dumps(e["properties"])),
+                "confidence_score": float(e["confidence_score"]),
+            }
+        return EdgeWriteResult(written=len(edges), superseded=superseded)
+
+
+@pytest.fixture()
+def stage2(monkeypatch):
+    """Point the derivation at fake Stage-2 rows and the in-memory store;
+    returns a setter for the rows the next read sees (current rows, and
+    (row, superseding run) pairs), the connections opened and the tenants
+    whose edge types were registered."""
+    state = {"rows": [], "superseded": [], "conns": [], "registered": []}
+
+    @contextlib.contextmanager
+    def fake_get_connection():
+        state["conns"].append(FakeConn(state["rows"], state["superseded"]))
+        yield state["conns"][-1]
+
+    monkeypatch.setattr(ed, "get_connection", fake_get_connection)
+    monkeypatch.setattr(ed, "execute_prepared",
+                        lambda cur, sql, params=None: cur.execute(sql, params))
+    monkeypatch.setattr(ed, "_register_edge_types", state["registered"].append)
+    monkeypatch.setattr(ed, "EdgeStore", FakeStore)
+    monkeypatch.setattr(FakeStore, "live", {})
+    monkeypatch.setattr(FakeStore, "calls", [])
+
+    def set_rows(rows, superseded=()):
+        state["rows"][:] = rows
+        state["superseded"][:] = superseded
+
+    state["set_rows"] = set_rows
+    return state
+
+
+class TestReadInputs:
+    def test_one_query_partitions_inputs(self, stage2):
+        rows = _rows(FIRST_RUN)
+        rows.append(("workforce.exit_theme.a.b.by_department", "eng", 1.0, "lattice", FIRST_RUN))
+        stage2["set_rows"](rows)
+
+        inputs = ed._read_inputs(str(uuid.uuid4()), ENTITY, ed._HEADLINE_PERIOD)
+        assert len(stage2["conns"]) == 1 and len(stage2["conns"][0].executed) == 1
+        assert inputs["comp"]["eng"] == {"value": 150000.0, "source_system": "workday"}
+        assert set(inputs["market"]) == {"software_eng", "account_exec"}
+        assert inputs["resolution"] == {"eng": "software_eng", "sales": "account_exec"}
+        assert set(inputs["exit_by_reason"]) == {"comp", "growth"}
+        assert inputs["team_members"] == {} and inputs["comp_band"] == {}
+
+    def test_batch_counts_written_and_superseded_concepts(self, stage2):
+        other, run = str(uuid.uuid4()), str(uuid.uuid4())
+        rows = _rows(other)
+        rows[-1] = rows[-1][:4] + (run,)                 # one exit-theme row from this run
+        rows.append(("workforce.exit_theme.a.b.by_department", "eng", 1.0, "lattice", run))
+        stage2["set_rows"](rows, superseded=[(_rows(other)[0], run)])
+
+        batch = ed._read_batch_concepts(str(uuid.uuid4()), ENTITY, run)
+        query, params = stage2["conns"][0].executed[0]
+        assert "FROM semantic_triples " in query and "period" not in query
+        assert params[5] == params[8] == run
+        assert batch == {ed._EXIT_CONCEPT_TMPL, ed._COMP_CONCEPT}
+
+    def test_conflicting_resolution_raises(self, stage2):
+        stage2["set_rows"](_rows(FIRST_RUN) + [
+            (ed._RESOLUTION_CONCEPT, "eng", "data_eng", "radford", FIRST_RUN)])
+        with pytest.raises(ed.EdgeDerivationError, match="inconsistent"):
+            ed._read_inputs(str(uuid.uuid4()), ENTITY, ed._HEADLINE_PERIOD)
+
+
+class TestIncremental:
+    def _full(self, stage2, tenant):
+        stage2["set_rows"](_rows(FIRST_RUN))
+        return ed.derive_edges(tenant, ENTITY, FIRST_RUN)
+
+    def test_exit_correction_touches_only_the_driver_edge(self, stage2):
+        tenant = str(uuid.uuid4())
+        full = self._full(stage2, tenant)
+        assert FakeStore.calls[-1]["replace"] is True
+        before = dict(FakeStore.live)
+        assert ("department", "eng", "DRIVEN_BY", "exit_theme", "comp") in before
+
+        fix = str(uuid.uuid4())
+        rows = [r for r in _rows(FIRST_RUN) if not r[0].startswith("workforce.exit_theme.")]
+        rows += [r[:4] + (fix,) for r in _rows(FIRST_RUN, exits={
+            "comp": {"eng": 5.0, "sales": 1.0}, "growth": {"eng": 6.0, "sales": 4.0},
+        }) if r[0].startswith("workforce.exit_theme.")]
+        stage2["set_rows"](rows)
+        out = ed.derive_edges(tenant, ENTITY, fix, incremental=True)
+
+        call = FakeStore.calls[-1]
+        assert call["replace"] is False and call["scrub"] is False
+        assert [ed._edge_coord(e) for e in call["edges"]] == \
+            [("department", "eng", "DRIVEN_BY", "exit_theme", "growth")]
+        assert [ed._edge_coord(c) for c in call["retire"]] == \
+            [("department", "eng", "DRIVEN_BY", "exit_theme", "comp")]
+        assert out["counts"]["rules_affected"] == ["exit_driver"]
+        assert (out["counts"]["retired"], out["counts"]["unchanged"]) == (1, 1)
+        # Every other derived edge keeps its original row.
+        for coord, edge in FakeStore.live.items():
+            if coord[2] != "DRIVEN_BY":
+                assert edge is before[coord]
+        assert out["counts"]["total"] == full["counts"]["total"]
+
+    def test_reingest_of_identical_values_writes_nothing(self, stage2):
+        tenant = str(uuid.uuid4())
+        self._full(stage2, tenant)
+        assert stage2["registered"] == [tenant]
+        before = dict(FakeStore.live)
+
+        again = str(uuid.uuid4())
+        stage2["set_rows"]([r[:4] + (again,) if r[0] == ed._COMP_CONCEPT else r
+                            for r in _rows(FIRST_RUN)])
+        out = ed.derive_edges(tenant, ENTITY, again, incremental=True)
+
+        assert out["counts"]["rules_affected"] == ["comp_gap", "resolution", "membership"]
+        assert out["counts"]["written"] == 0 and out["counts"]["retired"] == 0
+        assert FakeStore.calls[-1]["edges"] == [] and stage2["registered"] == [tenant]
+        assert FakeStore.live == before
+
+    def test_batch_outside_the_inputs_affects_no_rule(self, stage2):
+        tenant = str(uuid.uuid4())
+        self._full(stage2, tenant)
+        out = ed.derive_edges(tenant, ENTITY, str(uuid.uuid4()), incremental=True)
+        assert out["counts"]["rules_affected"] == []
+        assert out["counts"]["unchanged"] == 0
+
+    def test_removed_department_retires_its_edges(self, stage2):
+        tenant = str(uuid.uuid4())
+        self._full(stage2, tenant)
+        gap = ("department", "sales", "BELOW_MARKET", "job_family", "account_exec")
+        assert gap in FakeStore.live
+
+        # The batch drops sales: its rows are superseded, none replaces them,
+        # so no current row carries the run.
+        fix = str(uuid.uuid4())
+        rows = _rows(FIRST_RUN)
+        stage2["set_rows"]([r for r in rows if r[1] != "sales"],
+                           superseded=[(r, fix) for r in rows if r[1] == "sales"])
+        out = ed.derive_edges(tenant, ENTITY, fix, incremental=True)
+
+        retired = {ed._edge_coord(c) for c in FakeStore.calls[-1]["retire"]}
+        assert gap in retired
+        assert ("department", "sales", "RESOLVES_TO", "job_family", "account_exec") in retired
+        assert {"comp_gap", "resolution", "exit_driver"} <= set(out["counts"]["rules_affected"])
+        assert not any(c[1] == "sales" for c in FakeStore.live)
+        assert ("department", "eng", "BELOW_MARKET", "job_family", "software_eng") in FakeStore.live
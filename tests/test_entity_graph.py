@@ -53,6 +53,7 @@ def _scrub_module_tenants():
         with conn.cursor() as cur:
             for table in ("semantic_triples", "entity_edges", "conflict_register",
                           "edge_types", "concept_hierarchy", "resolver_hitl_queue",
+                          "ingest_runs", "triple_rollups", "run_group_digests",
                           "tenant_runs"):
                 # tenant_id is UUID on some tables, TEXT on others — the ::text
                 # cast compares uniformly.
@@ -140,6 +140,9 @@ def _cleanup():
                 "DELETE FROM conflict_dispositions WHERE tenant_id = %s",
                 "DELETE FROM conflict_register WHERE tenant_id = %s",
                 "DELETE FROM semantic_triples WHERE tenant_id = %s",
+                "DELETE FROM ingest_runs WHERE tenant_id = %s",
+                "DELETE FROM triple_rollups WHERE tenant_id = %s",
+                "DELETE FROM run_group_digests WHERE tenant_id = %s",
                 "DELETE FROM tenant_runs WHERE tenant_id = %s",
             ):
                 cur.execute(sql, (TENANT,))
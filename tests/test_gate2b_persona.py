@@ -125,6 +125,9 @@ def _cleanup():
         with conn.cursor() as cur:
             for sql in (
                 "DELETE FROM semantic_triples WHERE tenant_id = %s",
+                "DELETE FROM ingest_runs WHERE tenant_id = %s",
+                "DELETE FROM triple_rollups WHERE tenant_id = %s",
+                "DELETE FROM run_group_digests WHERE tenant_id = %s",
                 "DELETE FROM tenant_runs WHERE tenant_id = %s",
             ):
                 cur.execute(sql, (TENANT,))
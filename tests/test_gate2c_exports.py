@@ -151,6 +151,7 @@ def seeded_tenant():
         with conn.cursor() as cur:
             for table in ("semantic_triples", "entity_edges", "conflict_register",
                           "edge_types", "concept_hierarchy", "resolver_hitl_queue",
+                          "ingest_runs", "triple_rollups", "run_group_digests",
                           "tenant_runs"):
                 cur.execute(
                     f"DELETE FROM {table} WHERE tenant_id::text = %s", [TENANT],
@@ -0,0 +1,292 @@
+"""Multi-hop entity-graph traversal over CSR adjacency snapshots.
+
+Operator-visible outcome under test: "everything within k hops of this
+department" is ONE call — EdgeStore.traverse, GET /api/dcl/graph/neighbors
+?depth=k and the traverse_graph MCP tool — returning each reached node with
+its hop distance, following only the requested edge types and direction,
+capped at max_nodes with truncated=true; and an edge written through
+assert_edges is visible to the very next traversal (the snapshot cache's
+write generation), and one committed by another process — even a retire-only
+write that started before the last one — is visible within the probe TTL.
+
+TestPaths covers the k-shortest-path search behind /api/dcl/graph/paths and
+the find_graph_paths tool. TestSnapshot / TestPaths / TestCache run without a
+database. TestTraverseLive runs
+against the aos-dev database on a fresh tenant, scrubbed afterwards.
+"""
+
+import uuid
+
+import pytest
+
+from backend.db.edge_adjacency import AdjacencyCache, AdjacencySnapshot
+
+ENTITY = "GraphAdjacencyTest-0001"
+
+
+def _e(src_t, src_k, et, dst_t, dst_k):
+    return {"src_type": src_t, "src_key": src_k, "edge_type": et,
+            "dst_type": dst_t, "dst_key": dst_k}
+
+
+# org -HAS-> dept:eng -HAS-> team:api -GENERATES-> svc:auth ; dept:ops -BELONGS_TO-> org
+_CHAIN = [
+    _e("org_unit", "org", "HAS", "department", "eng"),
+    _e("department", "eng", "HAS", "team", "api"),
+    _e("team", "api", "GENERATES", "service", "auth"),
+    _e("department", "ops", "BELONGS_TO", "org_unit", "org"),
+]
+
+
+def _hops(result):
+    return {(n["node_type"], n["node_key"]): n["hop"] for n in result["nodes"]}
+
+
+class TestSnapshot:
+    def test_csr_layout_has_an_out_and_in_slot_per_edge(self):
+        snap = AdjacencySnapshot(_CHAIN)
+        assert len(snap.targets) == 2 * len(_CHAIN)
+        assert snap.offsets[-1] == 2 * len(_CHAIN)
+        assert snap.edge_types == ["HAS", "GENERATES", "BELONGS_TO"]
+
+    def test_depth_bounds_the_search(self):
+        snap = AdjacencySnapshot(_CHAIN)
+        one = snap.bfs("org_unit", "org", depth=1, max_nodes=100)
+        assert _hops(one) == {("org_unit", "org"): 0, ("department", "eng"): 1,
+                              ("department", "ops"): 1}
+        three = snap.bfs("org_unit", "org", depth=3, max_nodes=100)
+        assert _hops(three)[("service", "auth")] == 3
+        assert len(three["edges"]) == 4
+        assert three["truncated"] is False
+
+    def test_direction_and_edge_types(self):
+        snap = AdjacencySnapshot(_CHAIN)
+        out = snap.bfs("org_unit", "org", depth=3, direction="out", max_nodes=100)
+        assert ("department", "ops") not in _hops(out)
+        assert _hops(out)[("service", "auth")] == 3
+        has_only = snap.bfs("org_unit", "org", depth=3, edge_types=["HAS"], max_nodes=100)
+        assert set(_hops(has_only)) == {("org_unit", "org"), ("department", "eng"),
+                                        ("team", "api")}
+        up = snap.bfs("service", "auth", depth=3, direction="in", max_nodes=100)
+        assert _hops(up)[("org_unit", "org")] == 3
+
+    def test_max_nodes_truncates_and_drops_unreached_edges(self):
+        snap = AdjacencySnapshot(_CHAIN)
+        res = snap.bfs("org_unit", "org", depth=3, max_nodes=2)
+        assert len(res["nodes"]) == 2
+        assert res["truncated"] is True
+        reached = set(_hops(res))
+        for e in res["edges"]:
+            assert (e["src_type"], e["src_key"]) in reached
+            assert (e["dst_type"], e["dst_key"]) in reached
+
+    def test_unknown_start_node_is_hop_zero_alone(self):
+        res = AdjacencySnapshot(_CHAIN).bfs("department", "nope", depth=2, max_nodes=10)
+        assert res == {"nodes": [{"node_type": "department", "node_key": "nope", "hop": 0}],
+                       "edges": [], "truncated": False}
+
+
+_DIAMOND = [
+    _e("department", "eng", "HAS", "team", "api"),
+    _e("team", "api", "GENERATES", "service", "auth"),
+    _e("department", "eng", "HAS", "team", "web"),
+    _e("team", "web", "GENERATES", "service", "auth"),
+    _e("department", "eng", "GENERATES", "service", "auth"),
+]
+
+
+class TestPaths:
+    def _keys(self, path):
+        return [n["node_key"] for n in path["nodes"]]
+
+    def test_k_shortest_fewest_hops_first(self):
+        snap = AdjacencySnapshot(_DIAMOND)
+        paths = snap.paths(("department", "eng"), ("service", "auth"), k=5, max_hops=3)
+        assert [p["hops"] for p in paths] == [1, 2, 2]
+        assert self._keys(paths[0]) == ["eng", "auth"]
+        assert sorted(self._keys(p)[1] for p in paths[1:]) == ["api", "web"]
+        assert paths[1]["edges"][0]["direction"] == "out"
+
+    def test_bounds_types_and_direction(self):
+        snap = AdjacencySnapshot(_DIAMOND)
+        src, dst = ("department", "eng"), ("service", "auth")
+        assert len(snap.paths(src, dst, k=1, max_hops=3)) == 1
+        assert [p["hops"] for p in snap.paths(src, dst, k=5, max_hops=1)] == [1]
+        assert snap.paths(src, dst, k=5, max_hops=3, edge_types=["HAS"]) == []
+        assert snap.paths(dst, src, k=5, max_hops=3, direction="out") == []
+        back = snap.paths(dst, src, k=5, max_hops=3, direction="in")
+        assert len(back) == 3
+        assert all(e["direction"] == "in" for p in back for e in p["edges"])
+
+    def test_paths_are_loopless_and_distinct(self):
+        snap = AdjacencySnapshot(_DIAMOND + [_CHAIN[0], _CHAIN[3]])
+        paths = snap.paths(("team", "api"), ("team", "web"), k=10, max_hops=4)
+        assert paths
+        walks = [tuple(self._keys(p)) for p in paths]
+        assert len(set(walks)) == len(walks)
+        for walk in walks:
+            assert len(set(walk)) == len(walk)
+
+    def test_unknown_or_same_node(self):
+        snap = AdjacencySnapshot(_DIAMOND)
+        assert snap.paths(("team", "nope"), ("service", "auth"), k=3, max_hops=3) == []
+        assert snap.paths(("team", "api"), ("team", "api"), k=3, max_hops=3) == []
+
+
+class TestCache:
+    def test_reuses_snapshot_until_invalidated(self):
+        cache = AdjacencyCache(max_entries=4, probe_ttl_s=60)
+        loads = []
+
+        def load():
+            loads.append(1)
+            return list(_CHAIN)
+
+        a = cache.get("t", ENTITY, probe=lambda: (4, "x"), load=load)
+        b = cache.get("t", ENTITY, probe=lambda: (4, "x"), load=load)
+        assert a is b and len(loads) == 1
+        cache.invalidate("t", ENTITY)
+        c = cache.get("t", ENTITY, probe=lambda: (4, "x"), load=load)
+        assert c is not a and len(loads) == 2
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_store_token_change_rebuilds_after_ttl(self):
+        cache = AdjacencyCache(max_entries=4, probe_ttl_s=0)
+        token = [(4, "x")]
+        a = cache.get("t", ENTITY, probe=lambda: token[0], load=lambda: list(_CHAIN))
+        token[0] = (5, "y")  # another process wrote an edge
+        b = cache.get("t", ENTITY, probe=lambda: token[0], load=lambda: list(_CHAIN))
+        assert a is not b
+
+    def test_lru_bound(self):
+        cache = AdjacencyCache(max_entries=2, probe_ttl_s=60)
+        for ent in ("a", "b", "c"):
+            cache.get("t", ent, probe=lambda: 0, load=lambda: [])
+        assert len(cache._entries) == 2
+
+
+@pytest.fixture()
+def tenant_id():
+    from backend.core.db import get_connection
+
+    t = str(uuid.uuid4())
+    yield t
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM entity_edges WHERE tenant_id = %s", (t,))
+            cur.execute("DELETE FROM store_versions WHERE tenant_id = %s", (t,))
+            conn.commit()
+
+
+def _declared(edge, run):
+    return {**edge, "properties": None, "source_system": "workday",
+            "source_table": None, "source_field": "test", "pipe_id": None,
+            "dcl_ingest_id": run, "source_run_tag": None,
+            "confidence_score": 1.0, "confidence_tier": "exact",
+            "fabric_plane": None, "fabric_product": None, "derivation": "declared"}
+
+
+class TestTraverseLive:
+    def test_route_tool_and_write_invalidation(self, tenant_id):
+        from fastapi.testclient import TestClient
+
+        from backend.api.main import app
+        from backend.db.edge_store import get_edge_store
+        from backend.engine.mcp_tools import dispatch
+
+        store = get_edge_store()
+        run = str(uuid.uuid4())
+        store.assert_edges(tenant_id, ENTITY, [_declared(e, run) for e in _CHAIN])
+        r = TestClient(app).get("/api/dcl/graph/neighbors", params={
+            "tenant_id": tenant_id, "entity_id": ENTITY,
+            "node_type": "org_unit", "node_key": "org", "depth": 3, "direction": "out",
+        })
+        assert r.status_code == 200, r.text
+        body = r.json()
+        assert {(n["node_key"], n["hop"]) for n in body["neighbors"]} == \
+            {("eng", 1), ("api", 2), ("auth", 3)}
+        assert body["truncated"] is False
+
+        out = dispatch(tenant_id, "traverse_graph", {
+            "entity_id": ENTITY, "node_type": "org_unit", "node_key": "org",
+            "depth": 2, "edge_types": ["HAS"],
+        })
+        assert {n["node_key"] for n in out["neighbors"]} == {"eng", "api"}
+
+        # A write through assert_edges is visible to the next traversal.
+        store.assert_edges(tenant_id, ENTITY, [_declared(
+            _e("service", "auth", "GENERATES", "service", "db"), str(uuid.uuid4()))])
+        res = store.traverse(tenant_id, ENTITY, "org_unit", "org", depth=4,
+                             direction="out")
+        assert _hops(res)[("service", "db")] == 4
+
+    def test_paths_route_and_tool(self, tenant_id):
+        from fastapi.testclient import TestClient
+
+        from backend.api.main import app
+        from backend.db.edge_store import get_edge_store
+        from backend.engine.mcp_tools import dispatch
+
+        run = str(uuid.uuid4())
+        get_edge_store().assert_edges(tenant_id, ENTITY, [_declared(e, run) for e in _CHAIN])
+        r = TestClient(app).get("/api/dcl/graph/paths", params={
+            "tenant_id": tenant_id, "entity_id": ENTITY,
+            "src_type": "department", "src_key": "ops",
+            "dst_type": "service", "dst_key": "auth", "k": 2,
+        })
+        assert r.status_code == 200, r.text
+        body = r.json()
+        assert body["path_count"] == 1
+        assert [n["node_key"] for n in body["paths"][0]["nodes"]] == \
+            ["ops", "org", "eng", "api", "auth"]
+
+        out = dispatch(tenant_id, "find_graph_paths", {
+            "entity_id": ENTITY, "src_type": "department", "src_key": "ops",
+            "dst_type": "service", "dst_key": "auth", "max_hops": 3,
+        })
+        assert out["paths"] == []
+
+    def test_depth_over_limit_is_422(self, tenant_id):
+        from fastapi.testclient import TestClient
+
+        from backend.api.main import app
+
+        r = TestClient(app).get("/api/dcl/graph/neighbors", params={
+            "tenant_id": tenant_id, "entity_id": ENTITY,
+            "node_type": "org_unit", "node_key": "org", "depth": 99,
+        })
+        assert r.status_code == 422
+
+    def test_other_process_retire_is_seen(self, tenant_id, monkeypatch):
+        """A retire-only write (no row count change) from another process,
+        whose transaction started before a later write: its updated_at sorts
+        below the current MAX, so only a commit-ordered token moves."""
+        from backend.core.db import get_connection
+        from backend.db import edge_store as edge_store_module
+
+        monkeypatch.setattr(edge_store_module._adjacency, "probe_ttl_s", 0)
+        store = edge_store_module.get_edge_store()
+        run = str(uuid.uuid4())
+        store.assert_edges(tenant_id, ENTITY, [_declared(e, run) for e in _CHAIN])
+
+        def reached():
+            res = store.traverse(tenant_id, ENTITY, "org_unit", "org", depth=3,
+                                 direction="out")
+            return set(_hops(res))
+
+        with get_connection() as other:
+            with other.cursor() as cur:
+                cur.execute("SELECT now()")   # the other transaction starts (t1)
+            store.assert_edges(tenant_id, ENTITY, [_declared(
+                _e("service", "auth", "GENERATES", "service", "db"), str(uuid.uuid4()))])
+            assert ("service", "auth") in reached()
+            with other.cursor() as cur:
+                # Retire team:api -> service:auth outside this process's
+                # write path: no in-process invalidation, updated_at = t1.
+                cur.execute(
+                    "UPDATE entity_edges SET superseded_at = now(), updated_at = now() "
+                    "WHERE tenant_id = %s AND entity_id = %s AND is_active "
+                    "AND src_key = 'api' AND dst_key = 'auth'", (tenant_id, ENTITY),
+                )
+            other.commit()
+        assert ("service", "auth") not in reached()
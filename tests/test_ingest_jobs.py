@@ -0,0 +1,194 @@
+"""Post-ingest work queue — ingest_jobs (migration 030) + the ingest worker.
+
+Operator-visible outcome under test: an ingest without ?sync returns as soon
+as its triples are written and the pointer swapped, with post_ingest_status
+"queued"; conflicts, ingest_log and the domain summary appear once a worker
+drains the job, and GET /api/dcl/ingest-triples/status/{run_id} reports the
+job moving queued -> done with its result. ?sync=true runs the same job body
+in-request (read-your-writes conflicts). Workers claim with SKIP LOCKED — a
+job locked by one worker is skipped by the next, never waited on — and a
+failing job is retried up to the attempt cap, then left 'failed' with its
+error on the status surface.
+
+Live-service integration test: TestClient drives the real FastAPI app against
+the aos-dev database. Dedicated test tenant/entity so demo data is never
+touched.
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+from fastapi.testclient import TestClient
+from backend.api.main import app
+from backend.api.ingest_worker import IngestWorker
+from backend.core.constants import INGEST_JOB_MAX_ATTEMPTS
+from backend.core.db import get_connection
+from backend.db.ingest_job_store import IngestJobStore
+
+client = TestClient(app, raise_server_exceptions=False)
+
+TEST_TENANT_ID = str(uuid.uuid5(uuid.NAMESPACE_DNS, "ingest-jobs-queue-test"))
+ENTITY = "QueueProbe-T1"
+PIPE_A = "88888888-8888-4888-8888-888888888881"
+PIPE_B = "88888888-8888-4888-8888-888888888882"
+
+
+def _triple(source, pipe, value):
+    return {
+        "entity_id": ENTITY, "concept": "cloud_spend.summary",
+        "property": "total_cost", "value": value, "period": "2026-03",
+        "unit": "usd", "currency": "USD",
+        "source_system": source, "source_table": "queue_probe",
+        "source_field": "total_cost", "pipe_id": pipe,
+        "confidence_score": 0.95, "confidence_tier": "exact",
+        "fabric_plane": "ipaas",
+    }
+
+
+def _ingest(run_id, *, sync):
+    return client.post(
+        "/api/dcl/ingest-triples",
+        params={"sync": str(sync).lower()},
+        json={"tenant_id": TEST_TENANT_ID, "dcl_ingest_id": run_id,
+              "entity_id": ENTITY,
+              "snapshot_name": f"{ENTITY}-{run_id.replace('-', '')[:4]}",
+              "triples": [
+                  _triple("billing", PIPE_A, 410194.49),
+                  _triple("general_ledger", PIPE_B, 388108.80),
+              ]},
+    )
+
+
+def _status(run_id):
+    return client.get(f"/api/dcl/ingest-triples/status/{run_id}")
+
+
+def _conflicts():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT COUNT(*) FROM conflict_register WHERE tenant_id=%s",
+                (TEST_TENANT_ID,),
+            )
+            return cur.fetchone()[0]
+
+
+def _drain():
+    """Drain the queue (other tenants' jobs on the shared database are drained
+    too — every job body is idempotent)."""
+    worker = IngestWorker(worker_id="test-ingest-jobs")
+    for _ in range(50):
+        if worker.run_once() is None:
+            return
+
+
+def _cleanup():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM ingest_jobs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM conflict_dispositions WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM conflict_register WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM semantic_triples WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM triple_rollups WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM run_group_digests WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM tenant_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_log WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            conn.commit()
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    _cleanup()
+    yield
+    _cleanup()
+
+
+class TestIngestJobQueue:
+    def test_async_ingest_queues_then_worker_completes(self):
+        run = str(uuid.uuid4())
+        resp = _ingest(run, sync=False)
+        assert resp.status_code == 201, resp.text
+        body = resp.json()
+        assert body["post_ingest_status"] == "queued"
+        assert body["triples_written"] == 2
+        assert body["conflicts_detected"] == 0
+
+        status = _status(run).json()
+        assert status["status"] == "queued"
+        assert status["jobs_total"] == 1
+        assert _conflicts() == 0
+
+        _drain()
+
+        status = _status(run).json()
+        assert status["status"] == "done", status
+        assert status["conflicts_detected"] >= 1
+        assert status["concept_summary"].get("cloud_spend") == 2
+        assert _conflicts() >= 1
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT COUNT(*) FROM ingest_log WHERE run_id=%s", (run,))
+                assert cur.fetchone()[0] == 1
+
+    def test_sync_ingest_returns_conflicts_and_done_status(self):
+        run = str(uuid.uuid4())
+        resp = _ingest(run, sync=True)
+        assert resp.status_code == 201, resp.text
+        body = resp.json()
+        assert body["post_ingest_status"] == "done"
+        assert body["conflicts_detected"] >= 1
+        assert body["concept_summary"].get("cloud_spend") == 2
+
+        status = _status(run).json()
+        assert status["status"] == "done"
+        assert status["jobs"][0]["job_id"] == body["post_ingest_job_id"]
+        assert status["jobs"][0]["worker_id"].startswith("sync:")
+
+    def test_claim_skips_rows_locked_by_another_worker(self):
+        store = IngestJobStore()
+        run = str(uuid.uuid4())
+        first = store.enqueue(TEST_TENANT_ID, run, "post_ingest", {"probe": 1})
+        second = store.enqueue(TEST_TENANT_ID, run, "post_ingest", {"probe": 2})
+        with get_connection() as held:
+            with held.cursor() as cur:
+                # Another worker mid-claim on the first job.
+                cur.execute("SELECT id FROM ingest_jobs WHERE id=%s FOR UPDATE", (first,))
+                claimed = store.claim("test-skip-locked", lease_seconds=300)
+            held.rollback()
+        assert claimed is not None
+        assert claimed["job_id"] != first
+        assert claimed["job_id"] <= second
+
+    def test_failing_job_retries_then_fails_loud(self):
+        store = IngestJobStore()
+        run = str(uuid.uuid4())
+        # Payload missing every field the job body needs.
+        store.enqueue(TEST_TENANT_ID, run, "post_ingest", {"tenant_id": TEST_TENANT_ID})
+
+        worker = IngestWorker(worker_id="test-ingest-jobs-fail")
+        for attempt in range(1, INGEST_JOB_MAX_ATTEMPTS + 1):
+            job = None
+            while job is None or job["dcl_ingest_id"] != run:
+                job = worker.run_once()
+                assert job is not None, "job vanished from the queue"
+            assert job["attempts"] == attempt
+
+        status = _status(run).json()
+        assert status["status"] == "failed"
+        assert "KeyError" in status["jobs"][0]["last_error"]
+        assert status["jobs"][0]["attempts"] == INGEST_JOB_MAX_ATTEMPTS
+
+    def test_unknown_run_is_404(self):
+        resp = _status(str(uuid.uuid4()))
+        assert resp.status_code == 404
+        assert resp.json()["detail"]["error"] == "RUN_NOT_FOUND"
@@ -0,0 +1,132 @@
+"""Ingest run registry — ingest_runs (migration 031).
+
+Operator-visible outcome under test: every ingest leaves one ingest_runs row
+whose counts move in the same transaction as the triples — a fresh run is
+'live' with its triple count and entity set, a run displaced by the next
+ingest for the same entity becomes 'superseded', and retention purges make it
+'purged' (run_exists false, so the dcl_ingest_id is writable again).
+GET /api/dcl/ingest-status/{run_id} reports the registry state.
+
+Live-service integration test: TestClient drives the real FastAPI app against
+the aos-dev database. Dedicated test tenant/entity so demo data is never
+touched.
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+from fastapi.testclient import TestClient
+from backend.api.main import app
+from backend.core.db import get_connection
+from backend.db.triple_store import TripleStore
+
+client = TestClient(app, raise_server_exceptions=False)
+
+TEST_TENANT_ID = str(uuid.uuid5(uuid.NAMESPACE_DNS, "ingest-runs-registry-test"))
+ENTITY = "RunRegistryProbe-T1"
+PIPE = "77777777-7777-4777-8777-777777777771"
+
+
+def _triple(prop, value):
+    return {
+        "entity_id": ENTITY, "concept": "cloud_spend.summary",
+        "property": prop, "value": value, "period": "2026-03",
+        "unit": "usd", "currency": "USD",
+        "source_system": "billing", "source_table": "run_registry_probe",
+        "source_field": prop, "pipe_id": PIPE,
+        "confidence_score": 0.95, "confidence_tier": "exact",
+        "fabric_plane": "ipaas",
+    }
+
+
+def _ingest(run_id, **params):
+    return client.post(
+        "/api/dcl/ingest-triples",
+        params={"sync": "true", **params},
+        json={"tenant_id": TEST_TENANT_ID, "dcl_ingest_id": run_id,
+              "entity_id": ENTITY,
+              "snapshot_name": f"{ENTITY}-{run_id.replace('-', '')[:4]}",
+              "triples": [
+                  _triple("total_cost", 410194.49),
+                  _triple("compute_cost", 120000.00),
+                  _triple("storage_cost", 18000.00),
+              ]},
+    )
+
+
+def _registry(run_id):
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT triple_count, live_count, state, entity_ids "
+                "FROM ingest_runs WHERE dcl_ingest_id = %s",
+                (run_id,),
+            )
+            return cur.fetchone()
+
+
+def _cleanup():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM ingest_jobs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM conflict_register WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM semantic_triples WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM triple_rollups WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM run_group_digests WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM tenant_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_log WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            conn.commit()
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    _cleanup()
+    yield
+    _cleanup()
+
+
+class TestIngestRunRegistry:
+    def test_new_run_is_registered_live(self):
+        run = str(uuid.uuid4())
+        assert _ingest(run).status_code == 201
+        assert _registry(run) == (3, 3, "live", [ENTITY])
+
+        status = client.get(f"/api/dcl/ingest-status/{run}").json()
+        assert status["triple_count"] == 3
+        assert status["state"] == "live"
+        assert status["entity_ids"] == [ENTITY]
+
+    def test_next_run_supersedes_previous(self):
+        first, second = str(uuid.uuid4()), str(uuid.uuid4())
+        assert _ingest(first).status_code == 201
+        assert _ingest(second).status_code == 201
+        assert _registry(first) == (3, 0, "superseded", [ENTITY])
+        assert _registry(second) == (3, 3, "live", [ENTITY])
+
+    def test_duplicate_run_is_409_from_registry(self):
+        run = str(uuid.uuid4())
+        assert _ingest(run).status_code == 201
+        resp = _ingest(run)
+        assert resp.status_code == 409
+        assert _registry(run)[0] == 3
+
+    def test_purge_marks_run_purged_and_frees_the_id(self):
+        first, second = str(uuid.uuid4()), str(uuid.uuid4())
+        assert _ingest(first).status_code == 201
+        assert _ingest(second).status_code == 201
+        store = TripleStore()
+        deleted = store.purge_old_runs(TEST_TENANT_ID, keep_runs=1)
+        assert deleted == 3
+        assert _registry(first) == (0, 0, "purged", [ENTITY])
+        assert store.run_exists(first) is False
+        assert store.run_exists(second) is True
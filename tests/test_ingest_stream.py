@@ -0,0 +1,184 @@
+"""NDJSON streaming ingest — POST /api/dcl/ingest-triples/stream.
+
+Operator-visible outcome under test: a run pushed as ONE NDJSON stream lands
+exactly like the same run pushed through the batch endpoint — every triple
+written once under the run, normalized at the same chokepoint, the tenant_runs
+pointer swapped to the run, and cross-source conflicts registered once at end
+of stream. An invalid line anywhere in the stream aborts the whole COPY (zero
+rows from the stream persist — the batch endpoint's atomicity), an empty
+stream writes nothing, and an existing run without ?replace/?append is 409.
+
+Live-service integration test: TestClient drives the real FastAPI app against
+the aos-dev database. Dedicated test tenant/entity so demo data is never
+touched.
+"""
+
+import json
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+from fastapi.testclient import TestClient
+from backend.api.main import app
+from backend.core.db import get_connection
+
+client = TestClient(app, raise_server_exceptions=False)
+
+TEST_TENANT_ID = str(uuid.uuid5(uuid.NAMESPACE_DNS, "ingest-stream-ndjson-test"))
+ENTITY = "StreamProbe-T1"
+PIPE_A = "77777777-7777-4777-8777-777777777771"
+PIPE_B = "77777777-7777-4777-8777-777777777772"
+
+
+def _triple(source, pipe, value, *, concept="cloud_spend.summary",
+            prop="total_cost", period="2026-03", unit="usd"):
+    return {
+        "entity_id": ENTITY, "concept": concept, "property": prop,
+        "value": value, "period": period, "unit": unit, "currency": "USD",
+        "source_system": source, "source_table": "stream_probe",
+        "source_field": prop, "pipe_id": pipe,
+        "confidence_score": 0.95, "confidence_tier": "exact",
+        "fabric_plane": "ipaas",
+    }
+
+
+def _body(run_id, triples, **header):
+    head = {"tenant_id": TEST_TENANT_ID, "dcl_ingest_id": run_id,
+            "entity_id": ENTITY,
+            "snapshot_name": f"{ENTITY}-{run_id.replace('-', '')[:4]}"}
+    head.update(header)
+    lines = [json.dumps(head)] + [
+        t if isinstance(t, str) else json.dumps(t) for t in triples
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _stream(run_id, triples, params=None, **header):
+    return client.post(
+        "/api/dcl/ingest-triples/stream",
+        content=_body(run_id, triples, **header),
+        params=params or {},
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+
+def _count(run_id):
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT COUNT(*) FROM semantic_triples "
+                "WHERE tenant_id=%s AND run_id=%s",
+                (TEST_TENANT_ID, run_id),
+            )
+            return cur.fetchone()[0]
+
+
+def _current_run():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT current_run_id FROM tenant_runs "
+                "WHERE tenant_id=%s AND entity_id=%s",
+                (TEST_TENANT_ID, ENTITY),
+            )
+            row = cur.fetchone()
+    return str(row[0]) if row else None
+
+
+def _cleanup():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM conflict_dispositions WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM conflict_register WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM semantic_triples WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM triple_rollups WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM run_group_digests WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM tenant_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_log WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            conn.commit()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _module_cleanup():
+    _cleanup()
+    yield
+    _cleanup()
+
+
+class TestStreamIngest:
+    def test_stream_writes_run_swaps_pointer_and_detects_conflicts(self):
+        run = str(uuid.uuid4())
+        triples = [
+            _triple("billing", PIPE_A, 410194.49),
+            # thousands-scaled: normalized to 388108.80 at the same chokepoint
+            _triple("general_ledger", PIPE_B, 388.1088, unit="usd_thousands"),
+        ] + [
+            _triple("billing", PIPE_A, float(i), prop=f"line_{i}")
+            for i in range(500)
+        ]
+        resp = _stream(run, triples)
+        assert resp.status_code == 201, resp.text
+        body = resp.json()
+        assert body["triples_written"] == len(triples)
+        assert body["conflicts_detected"] >= 1
+        assert _count(run) == len(triples)
+        assert _current_run() == run
+
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT value, normalization_metadata FROM semantic_triples "
+                    "WHERE tenant_id=%s AND run_id=%s AND source_system=%s "
+                    "AND property='total_cost'",
+                    (TEST_TENANT_ID, run, "general_ledger"),
+                )
+                value, meta = cur.fetchone()
+        assert float(value) == pytest.approx(388108.8)
+        assert meta["scale_factor"] == 1000
+
+    def test_existing_run_without_replace_is_409(self):
+        run = str(uuid.uuid4())
+        assert _stream(run, [_triple("billing", PIPE_A, 1.0)]).status_code == 201
+        resp = _stream(run, [_triple("billing", PIPE_A, 2.0)])
+        assert resp.status_code == 409, resp.text
+        resp = _stream(run, [_triple("billing", PIPE_A, 3.0)], params={"replace": "true"})
+        assert resp.status_code == 201, resp.text
+        assert _count(run) == 1
+
+    def test_invalid_line_mid_stream_writes_nothing(self):
+        run = str(uuid.uuid4())
+        triples = [_triple("billing", PIPE_A, float(i), prop=f"p_{i}") for i in range(300)]
+        triples.insert(250, _triple("billing", PIPE_A, 1.0, concept="not_a_concept.x"))
+        resp = _stream(run, triples)
+        assert resp.status_code == 400, resp.text
+        assert "#250" in resp.json()["detail"]["message"]
+        assert _count(run) == 0
+
+    def test_malformed_json_line_is_400_with_line_number(self):
+        run = str(uuid.uuid4())
+        resp = _stream(run, [_triple("billing", PIPE_A, 1.0), "{not json"])
+        assert resp.status_code == 400, resp.text
+        assert resp.json()["detail"]["line"] == 3
+        assert _count(run) == 0
+
+    def test_entity_mismatch_rejected(self):
+        run = str(uuid.uuid4())
+        other = dict(_triple("billing", PIPE_A, 1.0), entity_id="OtherProbe-T2")
+        resp = _stream(run, [other])
+        assert resp.status_code == 422, resp.text
+        assert resp.json()["detail"]["error"] == "ENTITY_MISMATCH"
+
+    def test_empty_stream_is_400(self):
+        run = str(uuid.uuid4())
+        resp = _stream(run, [])
+        assert resp.status_code == 400, resp.text
+        assert _count(run) == 0
@@ -0,0 +1,174 @@
+"""Precomputed system-level join paths — SemanticGraph.build_join_index.
+
+Contract: find_join_path is a lookup in a table built once per graph
+(rebuild_graph), and returns the SAME JoinPath the per-call BFS returned —
+same hops, fields, via, total confidence and description — for every system
+pair and hop limit; where several equally short paths exist, the one with
+the highest total confidence. Adding nodes or edges after the build marks
+the index stale. Pure in-memory, no database.
+"""
+
+import random
+from collections import defaultdict, deque
+
+from backend.engine.graph_types import JoinHop, JoinPath, SGraphEdge, SGraphNode
+from backend.engine.semantic_graph import SemanticGraph
+
+
+def _legacy_find_join_path(g: SemanticGraph, system_a: str, system_b: str,
+                           max_hops: int = 3):
+    """The per-call BFS find_join_path ran before the index (reference)."""
+    if system_a == system_b:
+        return JoinPath(hops=[], total_confidence=1.0,
+                        description=f"Same system: {system_a}")
+    maps_to = [e for e in g.edges if e.type == "MAPS_TO"]
+    if not maps_to:
+        return None
+    sys_adj = defaultdict(list)
+    for e in maps_to:
+        s, t = g.nodes.get(e.source_id), g.nodes.get(e.target_id)
+        if not s or not t:
+            continue
+        ss, ts = s.metadata.get("system", ""), t.metadata.get("system", "")
+        if ss and ts and ss != ts:
+            sys_adj[ss].append((ts, e))
+            sys_adj[ts].append((ss, e))
+    queue = deque([(system_a, [])])
+    visited = {system_a}
+    while queue:
+        current, path = queue.popleft()
+        if len(path) >= max_hops:
+            continue
+        for nb, edge in sys_adj.get(current, []):
+            if nb in visited:
+                continue
+            new_path = path + [(current, nb, edge)]
+            if nb == system_b:
+                hops, total = [], 1.0
+                for f, t, e in new_path:
+                    sm = g.nodes[e.source_id].metadata
+                    tm = g.nodes[e.target_id].metadata
+                    hops.append(JoinHop(
+                        from_system=f, from_field=f"{sm.get('table','')}.{sm.get('field','')}",
+                        to_system=t, to_field=f"{tm.get('table','')}.{tm.get('field','')}",
+                        via=e.metadata.get("edge_type", "MAPS_TO"), confidence=e.confidence,
+                    ))
+                    total *= e.confidence
+                return JoinPath(hops=hops, total_confidence=total,
+                                description=" → ".join(f"{h.from_system}→{h.to_system}"
+                                                       for h in hops))
+            visited.add(nb)
+            queue.append((nb, new_path))
+    return None
+
+
+def _random_graph(systems: int, links: int, rng: random.Random,
+                  confidence=None) -> SemanticGraph:
+    g = SemanticGraph()
+    for i in range(links):
+        a, b = rng.sample(range(systems), 2)
+        fa, fb = f"field:s{a}.T{i}.f", f"field:s{b}.U{i}.g"
+        g._add_node(SGraphNode(id=fa, type="field", label="f",
+                               metadata={"system": f"s{a}", "table": f"T{i}", "field": "f"}))
+        g._add_node(SGraphNode(id=fb, type="field", label="g",
+                               metadata={"system": f"s{b}", "table": f"U{i}", "field": "g"}))
+        conf = confidence if confidence is not None else round(rng.uniform(0.5, 1.0), 2)
+        g._add_edge(SGraphEdge(source_id=fa, target_id=fb, type="MAPS_TO",
+                               confidence=conf, provenance="aam",
+                               metadata={"edge_type": f"recipe_{i}"}))
+    return g
+
+
+def _all_pairs(systems: int):
+    names = [f"s{i}" for i in range(systems)] + ["unlinked"]
+    return [(a, b) for a in names for b in names]
+
+
+def _shortest_paths(g: SemanticGraph, a: str, b: str):
+    """Every shortest system walk a → b as a list of confidences (brute force)."""
+    g.build_join_index()
+    best, out = None, []
+
+    def walk(node, seen, confs):
+        nonlocal best
+        if best is not None and len(confs) > best:
+            return
+        if node == b:
+            if best is None or len(confs) < best:
+                best, out[:] = len(confs), []
+            out.append(confs)
+            return
+        for nb, e in g._sys_adj.get(node, []):
+            if nb not in seen:
+                walk(nb, seen | {nb}, confs + [e.confidence])
+
+    walk(a, {a}, [])
+    return out
+
+
+class TestIdenticalToBfs:
+    def test_equal_confidence_graphs_match_exactly(self):
+        rng = random.Random(11)
+        for trial in range(20):
+            g = _random_graph(8, 12, rng, confidence=0.9)
+            for a, b in _all_pairs(8):
+                for max_hops in (1, 2, 3, 5):
+                    assert g.find_join_path(a, b, max_hops) == \
+                        _legacy_find_join_path(g, a, b, max_hops), (trial, a, b, max_hops)
+
+    def test_distinct_confidence_hops_match_and_best_confidence_wins(self):
+        rng = random.Random(23)
+        for _ in range(20):
+            g = _random_graph(7, 10, rng)
+            for a, b in _all_pairs(7):
+                new, old = g.find_join_path(a, b, 6), _legacy_find_join_path(g, a, b, 6)
+                assert (new is None) == (old is None)
+                if new is None or a == b:
+                    continue
+                assert len(new.hops) == len(old.hops)
+                assert new.total_confidence >= old.total_confidence
+                best = 0.0
+                for confs in _shortest_paths(g, a, b):
+                    total = 1.0
+                    for c in confs:
+                        total *= c
+                    best = max(best, total)
+                assert abs(new.total_confidence - best) < 1e-12
+
+    def test_tie_break_prefers_higher_confidence_route(self):
+        g = SemanticGraph()
+        for sys_id, table in (("a", "A"), ("b", "B"), ("c", "C"), ("d", "D")):
+            g._add_node(SGraphNode(id=f"field:{sys_id}", type="field", label=table,
+                                   metadata={"system": sys_id, "table": table, "field": "id"}))
+        for src, dst, conf in (("a", "b", 0.6), ("b", "d", 0.6),
+                               ("a", "c", 0.9), ("c", "d", 0.9)):
+            g._add_edge(SGraphEdge(source_id=f"field:{src}", target_id=f"field:{dst}",
+                                   type="MAPS_TO", confidence=conf, provenance="aam"))
+        assert _legacy_find_join_path(g, "a", "d").description == "a→b → b→d"
+        path = g.find_join_path("a", "d")
+        assert path.description == "a→c → c→d"
+        assert abs(path.total_confidence - 0.81) < 1e-9
+
+
+class TestIndexLifecycle:
+    def test_lookup_does_not_rescan_edges(self):
+        g = _random_graph(6, 8, random.Random(3))
+        g.build_join_index()
+        index = g._join_paths
+        g.find_join_path("s0", "s1")
+        assert g._join_paths is index
+
+    def test_added_edge_invalidates(self):
+        g = _random_graph(4, 1, random.Random(5), confidence=0.9)
+        assert g._join_paths is None  # not built until first lookup
+        g.build_join_index()
+        assert g.find_join_path("s0", "unlinked") is None
+        g._add_node(SGraphNode(id="field:unlinked.X.k", type="field", label="k",
+                               metadata={"system": "unlinked", "table": "X", "field": "k"}))
+        assert g._join_paths is None
+        g._add_edge(SGraphEdge(source_id="field:unlinked.X.k",
+                               target_id=g.edges[0].source_id,
+                               type="MAPS_TO", confidence=0.7, provenance="aam"))
+        src = g.nodes[g.edges[0].source_id].metadata["system"]
+        path = g.find_join_path("unlinked", src)
+        assert path is not None and len(path.hops) == 1
@@ -0,0 +1,176 @@
+"""Range-indexed as-of reads — knowledge_range (migration 037).
+
+Operator-visible outcome under test: an as-of read returns exactly the rows
+the two-column predicate (ingested_at <= T AND (superseded_at IS NULL OR
+superseded_at > T)) returns — at every ingest and supersession boundary,
+for live, superseded and same-instant rows — while the builders
+(triple_store.as_of_clause, EdgeStore._temporal_clause, /triples/browse)
+emit `knowledge_range @> T` once the table has the column, and the read
+plans against the tenant/entity GiST index.
+
+TestAsOfClause runs without a database. TestRangeLive runs against the
+aos-dev database and is skipped until semantic_triples has the column
+(migration 037 on an empty store, or scripts/add_knowledge_range.py --apply).
+Dedicated test tenant, cleaned up.
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+from backend.db import triple_store as triple_store_module
+from backend.db.edge_store import EdgeStore
+from backend.db.triple_store import TripleStore, as_of_clause
+
+TEST_TENANT_ID = str(uuid.uuid5(uuid.NAMESPACE_DNS, "knowledge-range-test"))
+ENTITY = "KnowledgeRangeProbe-K1"
+T = "2026-03-01T00:00:00+00:00"
+TWO_COLUMN = "ingested_at <= %s AND (superseded_at IS NULL OR superseded_at > %s)"
+
+
+class TestAsOfClause:
+    def test_range_containment_when_column_ready(self, monkeypatch):
+        seen = []
+        monkeypatch.setattr(triple_store_module, "knowledge_range_ready",
+                            lambda table="semantic_triples": seen.append(table) or True)
+        assert as_of_clause(T) == ("knowledge_range @> %s::timestamptz", [T])
+        params: list = []
+        assert EdgeStore._temporal_clause(T, params) == " AND knowledge_range @> %s::timestamptz"
+        assert params == [T]
+        assert seen == ["semantic_triples", "entity_edges"]
+
+    def test_two_column_form_before_migration(self, monkeypatch):
+        monkeypatch.setattr(triple_store_module, "knowledge_range_ready",
+                            lambda table="semantic_triples": False)
+        assert as_of_clause(T) == (TWO_COLUMN, [T, T])
+        params: list = []
+        assert EdgeStore._temporal_clause(T, params) == f" AND {TWO_COLUMN}"
+        assert params == [T, T]
+        assert EdgeStore._temporal_clause(None, params) == " AND is_active = true"
+
+
+def _has_range_column() -> bool:
+    from backend.core.db import get_connection
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT EXISTS (SELECT 1 FROM pg_attribute "
+                    "WHERE attrelid = 'semantic_triples'::regclass "
+                    "AND attname = 'knowledge_range' AND NOT attisdropped)"
+                )
+                return cur.fetchone()[0]
+    except Exception:
+        return False
+
+
+needs_range_column = pytest.mark.skipif(
+    not _has_range_column(),
+    reason="semantic_triples.knowledge_range missing — run scripts/add_knowledge_range.py --apply",
+)
+
+
+def _rows(run_id, amount):
+    return [
+        {
+            "tenant_id": TEST_TENANT_ID, "entity_id": ENTITY, "concept": concept,
+            "property": "amount", "value": amount, "period": "2026-03",
+            "currency": "USD", "source_system": "netsuite", "source_table": "probe",
+            "source_field": "amount", "run_id": run_id,
+            "confidence_score": 0.95, "confidence_tier": "exact",
+        }
+        for concept in ("revenue.total", "cost.opex.total", "revenue.recurring")
+    ]
+
+
+@pytest.fixture(scope="module")
+def history():
+    from backend.core.db import get_connection
+
+    def cleanup():
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                for table in ("semantic_triples", "ingest_runs", "triple_rollups",
+                              "run_group_digests"):
+                    cur.execute(f"DELETE FROM {table} WHERE tenant_id = %s", (TEST_TENANT_ID,))
+                conn.commit()
+
+    cleanup()
+    store = TripleStore()
+    for amount in (100.0, 110.0, 120.0):  # three versions; each replaces the last
+        store.replace_tenant_triples(TEST_TENANT_ID, _rows(str(uuid.uuid4()), amount))
+    yield store
+    cleanup()
+
+
+@needs_range_column
+class TestRangeLive:
+    def _count(self, cur, predicate, params):
+        cur.execute(
+            f"SELECT COUNT(*), COALESCE(SUM((value #>> '{{}}')::numeric), 0) "
+            f"FROM semantic_triples WHERE tenant_id = %s AND entity_id = %s AND {predicate}",
+            [TEST_TENANT_ID, ENTITY] + params,
+        )
+        return cur.fetchone()
+
+    def test_range_matches_two_column_at_every_boundary(self, history):
+        from backend.core.db import get_connection
+
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT ingested_at FROM semantic_triples WHERE tenant_id = %s "
+                    "UNION SELECT superseded_at FROM semantic_triples "
+                    "WHERE tenant_id = %s AND superseded_at IS NOT NULL",
+                    (TEST_TENANT_ID, TEST_TENANT_ID),
+                )
+                boundaries = sorted(r[0] for r in cur.fetchall())
+                assert len(boundaries) >= 3
+                probes = boundaries + [b.replace(microsecond=max(b.microsecond - 1, 0))
+                                       for b in boundaries]
+                for at in probes:
+                    assert self._count(cur, "knowledge_range @> %s::timestamptz", [at]) == \
+                        self._count(cur, TWO_COLUMN, [at, at])
+                # Latest boundary: exactly the current version is visible.
+                assert self._count(cur, "knowledge_range @> %s::timestamptz",
+                                   [boundaries[-1]]) == (3, 360)
+            conn.rollback()
+
+    def test_mcp_as_of_read_returns_the_version_then_live(self, history):
+        from backend.core.db import get_connection
+
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT min(ingested_at) FROM semantic_triples WHERE tenant_id = %s",
+                    (TEST_TENANT_ID,),
+                )
+                first = cur.fetchone()[0]
+            conn.rollback()
+        rows = history.mcp_query_triples(TEST_TENANT_ID, entity_id=ENTITY,
+                                         as_of=first.isoformat())
+        assert sorted(r["value"] for r in rows) == [100.0, 100.0, 100.0]
+
+    def test_as_of_read_plans_against_gist_index(self, history):
+        from backend.core.db import get_connection
+
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SET LOCAL enable_seqscan = off")
+                cur.execute(
+                    "EXPLAIN (FORMAT JSON) SELECT * FROM semantic_triples "
+                    "WHERE tenant_id = %s AND entity_id = %s "
+                    "AND knowledge_range @> now()",
+                    (TEST_TENANT_ID, ENTITY),
+                )
+                plan = str(cur.fetchone()[0])
+            conn.rollback()
+        assert "idx_triples_knowledge_range" in plan
@@ -86,6 +86,15 @@ def _cleanup():
             cur.execute(
                 "DELETE FROM semantic_triples WHERE tenant_id = %s::uuid", (_TENANT,)
             )
+            cur.execute(
+                "DELETE FROM ingest_runs WHERE tenant_id = %s::uuid", (_TENANT,)
+            )
+            cur.execute(
+                "DELETE FROM triple_rollups WHERE tenant_id = %s::uuid", (_TENANT,)
+            )
+            cur.execute(
+                "DELETE FROM run_group_digests WHERE tenant_id = %s::uuid", (_TENANT,)
+            )
             cur.execute(
                 "DELETE FROM tenant_runs WHERE tenant_id = %s::uuid", (_TENANT,)
             )
@@ -0,0 +1,126 @@
+"""Batched node-value hydration — EdgeStore.node_values.
+
+Operator-visible outcome under test: /api/dcl/graph/subgraph with values on
+costs one semantic_triples query per node TYPE on one pooled connection, not
+one connection + query per node; and each node carries exactly what the
+per-node join rule gives it — property == node_key, concept ending in
+'.by_<node_type>', latest period per concept; org_unit nodes the headline
+trio.
+
+TestBatching uses a fake connection (no database). TestNodeValuesLive runs
+against the aos-dev database on a fresh tenant, scrubbed afterwards.
+"""
+
+import contextlib
+import uuid
+
+import pytest
+
+from backend.db import edge_store as edge_store_module
+from backend.db.edge_store import EdgeIdentityError, EdgeStore
+
+ENTITY = "NodeValuesTest-0001"
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self.conn.executed.append((query, params))
+        if "concept = ANY" in query:
+            self.rows = [("revenue.total", "total", 10.0, "2026-Q1")]
+        else:
+            self.rows = [(key, f"headcount.by_{params[3][5:]}", 1.0, "2026-Q1")
+                         for key in params[2]]
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeConn:
+    def __init__(self):
+        self.executed = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+class TestBatching:
+    def test_one_query_per_node_type_on_one_connection(self, monkeypatch):
+        conns = []
+
+        @contextlib.contextmanager
+        def fake_get_connection():
+            conns.append(FakeConn())
+            yield conns[-1]
+
+        monkeypatch.setattr(edge_store_module, "get_connection", fake_get_connection)
+        nodes = [("department", f"d{i}") for i in range(300)] + \
+                [("service", "auth"), ("org_unit", ENTITY), ("department", "d0")]
+        values = EdgeStore().node_values(str(uuid.uuid4()), ENTITY, nodes)
+
+        assert len(conns) == 1
+        assert len(conns[0].executed) == 3
+        assert len(values) == 302
+        assert values[("department", "d7")] == {
+            "headcount.by_department": {"value": 1.0, "property": "d7", "period": "2026-Q1"},
+        }
+        assert list(values[("org_unit", ENTITY)]) == ["revenue.total"]
+
+    def test_empty_and_identity(self):
+        assert EdgeStore().node_values(str(uuid.uuid4()), ENTITY, []) == {}
+        with pytest.raises(EdgeIdentityError):
+            EdgeStore().node_values("", ENTITY, [("department", "d0")])
+
+
+@pytest.fixture()
+def tenant_id():
+    from backend.core.db import get_connection
+
+    t = str(uuid.uuid4())
+    yield t
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            for table in ("semantic_triples", "ingest_runs", "triple_rollups",
+                          "run_group_digests"):
+                cur.execute(f"DELETE FROM {table} WHERE tenant_id = %s", (t,))
+            conn.commit()
+
+
+class TestNodeValuesLive:
+    def test_latest_period_wins_per_concept(self, tenant_id):
+        from backend.db.triple_store import TripleStore
+
+        run = str(uuid.uuid4())
+        rows = [
+            {"tenant_id": tenant_id, "entity_id": ENTITY, "concept": concept,
+             "property": prop, "value": value, "period": period, "currency": None,
+             "source_system": "workday", "source_table": "probe",
+             "source_field": "value", "run_id": run,
+             "confidence_score": 0.95, "confidence_tier": "exact"}
+            for concept, prop, value, period in (
+                ("workforce.headcount.by_department", "engineering", 40.0, "2026-Q1"),
+                ("workforce.headcount.by_department", "engineering", 42.0, "2026-Q2"),
+                ("workforce.headcount.by_department", "sales", 12.0, "2026-Q2"),
+                ("revenue.total", "total", 900.0, "2026-Q2"),
+            )
+        ]
+        TripleStore().replace_tenant_triples(tenant_id, rows)
+
+        values = EdgeStore().node_values(tenant_id, ENTITY, [
+            ("department", "engineering"), ("department", "sales"),
+            ("department", "legal"), ("org_unit", ENTITY),
+        ])
+        assert values[("department", "engineering")]["workforce.headcount.by_department"] == \
+            {"value": 42.0, "property": "engineering", "period": "2026-Q2"}
+        assert values[("department", "sales")]["workforce.headcount.by_department"]["value"] == 12.0
+        assert values[("department", "legal")] == {}
+        assert values[("org_unit", ENTITY)]["revenue.total"]["value"] == 900.0
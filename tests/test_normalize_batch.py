@@ -0,0 +1,82 @@
+"""Batch value normalizer (backend/resolver/value_normalizer.normalize_batch).
+
+Pure unit tests (no database): normalize_batch resolves each distinct
+(unit, currency, period) once, and its contract is that this memoization is
+invisible — every row's value, unit, currency, period and
+normalization_metadata are identical to calling normalize() row by row, and a
+failing row raises the same ValueError message normalize() would, carrying
+that row's index so the ingest 422 still names the exact triple.
+"""
+
+import itertools
+
+import pytest
+
+from backend.resolver.value_normalizer import (
+    BatchNormalizationError,
+    BatchNormalizer,
+    normalize,
+    normalize_batch,
+)
+
+POLICY = {"canonical_currency": "USD", "fx_rates": {"EUR": 1.08, "GBP": 1}}
+
+VALUES = [410194.49, 388.1088, 100, 0, -12.5, True, "open", {"k": 1}, None]
+UNITS = [None, "", "usd", "USD_Thousands", "millions", "days", "furlongs"]
+CURRENCIES = [None, "USD", "EUR", "GBP", "JPY"]
+PERIODS = [None, "", "2026-03", "Mar-2026", "2026-Q1", "Q1 2026", "2026",
+           "2026-03-15", "not-a-period"]
+
+
+def _single(item):
+    try:
+        return normalize(policy=POLICY, **item)
+    except ValueError as e:
+        return ("error", str(e))
+
+
+def _batched_one(normalizer, item):
+    try:
+        return normalizer.normalize(**item)
+    except ValueError as e:
+        return ("error", str(e))
+
+
+def test_every_combination_matches_row_by_row_normalize():
+    items = [
+        {"value": v, "unit": u, "currency": c, "period": p}
+        for v, u, c, p in itertools.product(VALUES, UNITS, CURRENCIES, PERIODS)
+    ]
+    normalizer = BatchNormalizer(POLICY)
+    for item in items:
+        assert _batched_one(normalizer, item) == _single(item), item
+
+
+def test_normalize_batch_returns_identical_results_in_order():
+    items = [
+        {"value": 388.1088, "unit": "usd_thousands", "currency": "USD", "period": "2026-03"},
+        {"value": 410194.49, "unit": "usd", "currency": "USD", "period": "Mar-2026"},
+        {"value": 100.0, "unit": None, "currency": "EUR", "period": "2026-Q1"},
+        {"value": "note", "unit": "furlongs", "currency": None, "period": None},
+    ] * 50
+    assert normalize_batch(items, policy=POLICY) == [
+        normalize(policy=POLICY, **item) for item in items
+    ]
+
+
+@pytest.mark.parametrize("bad, token", [
+    ({"value": 5.0, "unit": "furlongs", "currency": "USD", "period": "2026-03"}, "furlongs"),
+    ({"value": 5.0, "unit": "usd", "currency": "JPY", "period": "2026-03"}, "JPY"),
+    ({"value": 5.0, "unit": "usd", "currency": "USD", "period": "Smarch-26"}, "Smarch-26"),
+])
+def test_failure_carries_row_index_and_normalize_message(bad, token):
+    good = {"value": 1.0, "unit": "usd", "currency": "USD", "period": "2026-03"}
+    items = [good] * 7 + [bad] + [good] * 3
+    with pytest.raises(BatchNormalizationError) as exc:
+        normalize_batch(items, policy=POLICY)
+    assert exc.value.index == 7
+    assert isinstance(exc.value, ValueError)
+    with pytest.raises(ValueError) as single:
+        normalize(policy=POLICY, **bad)
+    assert str(exc.value) == str(single.value)
+    assert token in str(exc.value)
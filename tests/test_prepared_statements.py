@@ -0,0 +1,184 @@
+"""Per-connection prepared-statement registry (backend/core/db.py execute_prepared).
+
+Contract:
+ - the first call on a connection PREPAREs and EXECUTEs in ONE execute (one
+   round trip); later calls send only EXECUTE — no re-parse, no re-plan;
+ - placeholders become $n, %% escapes survive for psycopg2's mogrify;
+ - the registry is bounded: the least recently used statement is DEALLOCATEd
+   in the same round trip as the PREPARE that would overflow it;
+ - a registry/session mismatch (26000 / 42P05) on a transaction's first
+   statement is resynced from pg_prepared_statements and retried once; later
+   in a transaction it propagates;
+ - disabled mode, named cursors and "auto" behind the :6543 transaction
+   pooler use plain execute().
+
+TestRegistry uses fakes (no database). TestLive runs against the aos-dev
+database and is skipped when prepared statements are disabled for it.
+"""
+
+import psycopg2
+import pytest
+
+from backend.core import db as core_db
+from backend.core.db import execute_prepared, prepared_name
+
+IDLE = psycopg2.extensions.TRANSACTION_STATUS_IDLE
+INTRANS = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+
+SQL = "SELECT * FROM t WHERE tenant_id = %s AND concept LIKE %s LIMIT %s"
+PARAMS = ["t-1", "revenue.%", 10]
+
+
+class _Stale(psycopg2.Error):
+    pgcode = "26000"
+
+
+class FakeInfo:
+    def __init__(self, conn):
+        self._conn = conn
+
+    @property
+    def transaction_status(self):
+        return INTRANS if self._conn.in_txn else IDLE
+
+
+class FakeCursor:
+    name = None
+
+    def __init__(self, conn):
+        self.connection = conn
+
+    def execute(self, query, vars=None):
+        conn = self.connection
+        conn.executed.append((query, vars))
+        conn.in_txn = True
+        if conn.fail_next:
+            conn.fail_next -= 1
+            raise _Stale("prepared statement does not exist")
+
+    def fetchall(self):
+        return [(n,) for n in self.connection.server_prepared]
+
+
+class FakeConn:
+    def __init__(self):
+        self.executed = []
+        self.in_txn = False
+        self.fail_next = 0
+        self.server_prepared = []
+        self.rollbacks = 0
+        self.info = FakeInfo(self)
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_txn = False
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(core_db, "PREPARED_STATEMENTS", "on")
+
+
+class TestRegistry:
+    def test_prepare_once_then_execute(self, enabled):
+        conn = FakeConn()
+        name = prepared_name(SQL)
+        execute_prepared(conn.cursor(), SQL, PARAMS)
+        execute_prepared(conn.cursor(), SQL, PARAMS)
+        first, second = conn.executed
+        assert first == (
+            f"PREPARE {name} AS SELECT * FROM t WHERE tenant_id = $1 "
+            f"AND concept LIKE $2 LIMIT $3; EXECUTE {name}(%s, %s, %s)",
+            PARAMS,
+        )
+        assert second == (f"EXECUTE {name}(%s, %s, %s)", PARAMS)
+
+    def test_percent_escapes_and_no_params(self, enabled):
+        conn = FakeConn()
+        execute_prepared(conn.cursor(), "SELECT 1 WHERE 'a%%' LIKE %s", ["a%"])
+        assert "LIKE $1; EXECUTE" in conn.executed[0][0]
+        assert "'a%%'" in conn.executed[0][0]
+        execute_prepared(conn.cursor(), "SELECT count(*) FROM t")
+        query, vars = conn.executed[1]
+        assert query.endswith(f"EXECUTE {prepared_name('SELECT count(*) FROM t')}")
+        assert vars is None
+        with pytest.raises(ValueError, match="positional"):
+            execute_prepared(conn.cursor(), "SELECT %(x)s", {"x": 1})
+
+    def test_lru_eviction_deallocates_in_same_round_trip(self, enabled, monkeypatch):
+        monkeypatch.setattr(core_db, "PREPARED_STATEMENT_CACHE_SIZE", 2)
+        conn = FakeConn()
+        a, b, c = ("SELECT %s::int AS a", "SELECT %s::int AS b", "SELECT %s::int AS c")
+        for sql in (a, b, a, c):
+            execute_prepared(conn.cursor(), sql, [1])
+        assert conn.executed[2][0] == f"EXECUTE {prepared_name(a)}(%s)"
+        assert conn.executed[3][0].startswith(f"DEALLOCATE {prepared_name(b)}; PREPARE {prepared_name(c)}")
+        assert list(conn._dcl_prepared) == [prepared_name(a), prepared_name(c)]
+
+    def test_stale_registry_resyncs_and_retries_first_statement(self, enabled):
+        conn = FakeConn()
+        name = prepared_name(SQL)
+        execute_prepared(conn.cursor(), SQL, PARAMS)
+        conn.in_txn = False  # next borrow: a fresh transaction
+        conn.fail_next = 1  # ... on a backend that never saw the PREPARE
+        execute_prepared(conn.cursor(), SQL, PARAMS)
+        queries = [q for q, _ in conn.executed]
+        assert conn.rollbacks == 1
+        assert queries[1] == f"EXECUTE {name}(%s, %s, %s)"
+        assert "pg_prepared_statements" in queries[2]
+        assert queries[3].startswith(f"PREPARE {name} AS")
+        assert list(conn._dcl_prepared) == [name]
+
+    def test_stale_registry_mid_transaction_propagates(self, enabled):
+        conn = FakeConn()
+        execute_prepared(conn.cursor(), SQL, PARAMS)
+        conn.fail_next = 1
+        with pytest.raises(psycopg2.Error):
+            execute_prepared(conn.cursor(), SQL, PARAMS)
+        assert conn.rollbacks == 0
+        assert not conn._dcl_prepared
+
+    def test_fallbacks_use_plain_execute(self, monkeypatch):
+        conn = FakeConn()
+        monkeypatch.setattr(core_db, "PREPARED_STATEMENTS", "off")
+        execute_prepared(conn.cursor(), SQL, PARAMS)
+        monkeypatch.setattr(core_db, "PREPARED_STATEMENTS", "on")
+        named = conn.cursor()
+        named.name = "dcl_stream_x"
+        execute_prepared(named, SQL, PARAMS)
+        assert conn.executed == [(SQL, PARAMS), (SQL, PARAMS)]
+
+    def test_auto_mode_follows_the_pooler_port(self):
+        auto = core_db._prepared_enabled_for
+        assert auto("auto", "postgresql://u:p@db.example.supabase.co:5432/postgres")
+        assert not auto("auto", "postgresql://u:p@pooler.supabase.com:6543/postgres")
+        assert auto("on", "postgresql://u:p@pooler.supabase.com:6543/postgres")
+
+
+needs_prepared = pytest.mark.skipif(
+    not core_db.prepared_statements_enabled(),
+    reason="prepared statements disabled for this DATABASE_URL (transaction pooler)",
+)
+
+
+@needs_prepared
+class TestLive:
+    def test_statement_is_prepared_once_per_connection(self):
+        sql = "SELECT %s::int + 1 AS n, current_setting('statement_timeout') AS t"
+        with core_db.get_connection() as conn:
+            with conn.cursor() as cur:
+                for i in range(3):
+                    execute_prepared(cur, sql, [i])
+                    n, timeout = cur.fetchone()
+                    assert n == i + 1
+                    # The #62 ceiling still rides the first statement.
+                    assert timeout == f"{core_db.QUERY_STATEMENT_TIMEOUT_MS // 1000}s"
+                cur.execute(
+                    "SELECT count(*) FROM pg_prepared_statements WHERE name = %s",
+                    [prepared_name(sql)],
+                )
+                assert cur.fetchone()[0] == 1
+            conn.rollback()
@@ -0,0 +1,279 @@
+"""Run-pointer-versioned read cache (backend/core/read_cache.py).
+
+Pure unit tests (no database): each test builds its own ReadCache with the
+tenant_runs pointer probe replaced by an in-memory token, so the contract is
+exercised without the shared singleton (disabled in conftest):
+ - a warm read is served without calling the loader or re-probing the
+   pointer inside the TTL; a moved pointer token is a miss,
+ - invalidate(tenant) is precise — other tenants stay warm, while global
+   (tenant_id=None) reads are invalidated by any tenant's write,
+ - hits return fresh objects with Decimal / datetime / date / UUID intact,
+ - LRU eviction, the entry size cap, loader errors and probe failures,
+ - stats() reports hit rates per namespace.
+
+TestSharedStoreLive runs against the aos-dev database: two ReadCache
+instances (two API processes) share one store, and an ?append=true-style
+write — which never moves tenant_runs — made through one is seen by the
+other within its pointer TTL, and so is a long write that commits after a
+shorter one that started later.
+"""
+
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from backend.core.read_cache import ReadCache
+
+T1 = str(uuid.uuid5(uuid.NAMESPACE_DNS, "read-cache-test-1"))
+T2 = str(uuid.uuid5(uuid.NAMESPACE_DNS, "read-cache-test-2"))
+
+
+class _Loader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+@pytest.fixture
+def pointers():
+    return {}
+
+
+@pytest.fixture
+def cache(monkeypatch, pointers):
+    c = ReadCache(enabled=True, max_entries=4, max_entry_bytes=10_000,
+                  pointer_ttl_s=60.0, use_redis=False)
+    probes = []
+
+    def probe(scope):
+        probes.append(scope)
+        return pointers.get(scope, "p0")
+
+    monkeypatch.setattr(c, "_probe", probe)
+    c.probes = probes
+    return c
+
+
+class TestReadThrough:
+    def test_warm_read_skips_loader_and_probe(self, cache):
+        load = _Loader([{"concept": "revenue.total", "value": 1.5}])
+        first = cache.get_or_load("mcp", T1, ["sql", [T1]], load)
+        second = cache.get_or_load("mcp", T1, ["sql", [T1]], load)
+        assert first == second
+        assert load.calls == 1
+        assert cache.probes == [T1]
+
+    def test_hit_returns_fresh_objects(self, cache):
+        load = _Loader([{"a": [1, 2]}])
+        cache.get_or_load("mcp", T1, "q", load)
+        hit = cache.get_or_load("mcp", T1, "q", load)
+        hit[0]["a"].append(3)
+        assert cache.get_or_load("mcp", T1, "q", load) == [{"a": [1, 2]}]
+
+    def test_codec_round_trips_db_types(self, cache):
+        row = {
+            "amount": Decimal("1234.50"),
+            "ingested_at": datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc),
+            "valid_from": date(2026, 1, 1),
+            "run_id": uuid.UUID(T2),
+            "value": {"$t": "user-data"},
+        }
+        cache.get_or_load("resolver", T1, "q", _Loader([row]))
+        assert cache.get_or_load("resolver", T1, "q", _Loader(None)) == [row]
+
+    def test_moved_pointer_is_a_miss(self, cache, pointers):
+        cache.pointer_ttl_s = 0
+        load = _Loader(1)
+        cache.get_or_load("mcp", T1, "q", load)
+        pointers[T1] = "p1"
+        cache.get_or_load("mcp", T1, "q", load)
+        assert load.calls == 2
+
+
+class TestInvalidation:
+    def test_tenant_invalidation_is_precise(self, cache):
+        l1, l2, lg = _Loader(1), _Loader(2), _Loader(3)
+        for _ in range(2):
+            cache.get_or_load("mcp", T1, "q", l1)
+            cache.get_or_load("mcp", T2, "q", l2)
+            cache.get_or_load("dashboard", None, "q", lg)
+        cache.invalidate(T1)
+        cache.get_or_load("mcp", T1, "q", l1)
+        cache.get_or_load("mcp", T2, "q", l2)
+        cache.get_or_load("dashboard", None, "q", lg)
+        assert (l1.calls, l2.calls, lg.calls) == (2, 1, 2)
+
+    def test_invalidate_all(self, cache):
+        l1, l2 = _Loader(1), _Loader(2)
+        cache.get_or_load("mcp", T1, "q", l1)
+        cache.get_or_load("mcp", T2, "q", l2)
+        cache.invalidate()
+        cache.get_or_load("mcp", T1, "q", l1)
+        cache.get_or_load("mcp", T2, "q", l2)
+        assert (l1.calls, l2.calls) == (2, 2)
+        assert cache.stats()["invalidations"] == 1
+
+
+class TestBounds:
+    def test_lru_eviction(self, cache):
+        loads = {k: _Loader(k) for k in "abcde"}
+        for k in "abcd":
+            cache.get_or_load("mcp", T1, k, loads[k])
+        cache.get_or_load("mcp", T1, "a", loads["a"])  # a is now most recent
+        cache.get_or_load("mcp", T1, "e", loads["e"])  # evicts b
+        cache.get_or_load("mcp", T1, "a", loads["a"])
+        cache.get_or_load("mcp", T1, "b", loads["b"])
+        assert loads["a"].calls == 1
+        assert loads["b"].calls == 2
+        assert cache.stats()["evictions"] >= 1
+
+    def test_oversized_result_not_cached(self, cache):
+        load = _Loader("x" * 20_000)
+        cache.get_or_load("mcp", T1, "q", load)
+        cache.get_or_load("mcp", T1, "q", load)
+        assert load.calls == 2
+
+    def test_loader_error_propagates_uncached(self, cache):
+        def boom():
+            raise RuntimeError("pool exhausted")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load("mcp", T1, "q", boom)
+        load = _Loader(1)
+        assert cache.get_or_load("mcp", T1, "q", load) == 1
+        assert load.calls == 1
+
+    def test_probe_failure_bypasses(self, cache, monkeypatch):
+        def fail(scope):
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(cache, "_probe", fail)
+        load = _Loader(1)
+        cache.get_or_load("mcp", T1, "q", load)
+        cache.get_or_load("mcp", T1, "q", load)
+        assert load.calls == 2
+        assert cache.stats()["namespaces"]["mcp"]["bypassed"] == 2
+
+    def test_disabled_always_loads(self):
+        c = ReadCache(enabled=False)
+        load = _Loader(1)
+        c.get_or_load("mcp", T1, "q", load)
+        c.get_or_load("mcp", T1, "q", load)
+        assert load.calls == 2
+
+
+def test_stats_hit_rate_per_namespace(cache):
+    load = _Loader(1)
+    for _ in range(4):
+        cache.get_or_load("mcp", T1, "q", load)
+    cache.get_or_load("browse", T1, "q", _Loader(2))
+    stats = cache.stats()
+    assert stats["namespaces"]["mcp"] == {
+        "hits": 3, "redis_hits": 0, "misses": 1, "bypassed": 0, "hit_rate": 0.75,
+    }
+    assert stats["namespaces"]["browse"]["hit_rate"] == 0.0
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (3, 2, 0.6)
+    assert stats["entries"] == 2
+
+
+@pytest.fixture()
+def live_tenant():
+    from backend.core.db import get_connection
+
+    t = str(uuid.uuid4())
+    yield t
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            for table in ("semantic_triples", "ingest_runs", "triple_rollups",
+                          "run_group_digests", "store_versions"):
+                cur.execute(f"DELETE FROM {table} WHERE tenant_id = %s", (t,))
+            conn.commit()
+
+
+class TestSharedStoreLive:
+    def test_append_through_one_cache_is_seen_by_another(self, live_tenant):
+        from backend.core.db import get_connection
+        from backend.db.triple_store import TripleStore
+
+        run = str(uuid.uuid4())
+
+        def batch(start):
+            return [{
+                "tenant_id": live_tenant, "entity_id": "ReadCacheProbe",
+                "concept": "revenue.total", "property": f"amount_{i}", "value": 1.0,
+                "period": "2026-03", "currency": "USD", "source_system": "netsuite",
+                "source_table": "probe", "source_field": "amount", "run_id": run,
+                "confidence_score": 0.95, "confidence_tier": "exact",
+            } for i in range(start, start + 3)]
+
+        def live_count():
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT COUNT(*) FROM semantic_triples_current "
+                                "WHERE tenant_id = %s", (live_tenant,))
+                    return cur.fetchone()[0]
+
+        writer = ReadCache(enabled=True, pointer_ttl_s=0.0, use_redis=False)
+        reader = ReadCache(enabled=True, pointer_ttl_s=0.0, use_redis=False)
+        store = TripleStore()
+        store.insert_triples(batch(0))
+        assert writer.get_or_load("count", live_tenant, "q", live_count) == 3
+        assert reader.get_or_load("count", live_tenant, "q", live_count) == 3
+
+        # Append batch: same run, no tenant_runs pointer move. Only the
+        # writer's process-local generation is bumped.
+        store.insert_triples(batch(3))
+        writer.invalidate(live_tenant)
+        assert writer.get_or_load("count", live_tenant, "q", live_count) == 6
+        assert reader.get_or_load("count", live_tenant, "q", live_count) == 6
+
+    def test_long_write_committing_last_is_seen(self, live_tenant):
+        """A write whose transaction STARTED before a shorter write but
+        commits after it: its updated_at = now() sorts below the shorter
+        write's, so only a commit-ordered token moves when it lands."""
+        import time
+
+        from backend.core.db import get_connection
+        from backend.db.triple_store import TripleStore
+
+        store = TripleStore()
+        long_run, short_run = str(uuid.uuid4()), str(uuid.uuid4())
+
+        def triple(run, prop):
+            return {
+                "tenant_id": live_tenant, "entity_id": "ReadCacheProbe",
+                "concept": "revenue.total", "property": prop, "value": 1.0,
+                "period": "2026-03", "currency": "USD", "source_system": "netsuite",
+                "source_table": "probe", "source_field": "amount", "run_id": run,
+                "confidence_score": 0.95, "confidence_tier": "exact",
+            }
+
+        def live_count():
+            with get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SELECT live_count FROM ingest_runs "
+                                "WHERE dcl_ingest_id = %s", (long_run,))
+                    return cur.fetchone()[0]
+
+        store.insert_triples([triple(long_run, "amount_0")])
+        reader = ReadCache(enabled=True, pointer_ttl_s=0.0, use_redis=False)
+        assert reader.get_or_load("count", live_tenant, "q", live_count) == 1
+
+        with get_connection() as long_conn:
+            with long_conn.cursor() as cur:
+                # The long write's registry credit, stamped at its start (t1).
+                cur.execute("UPDATE ingest_runs SET live_count = live_count + 1, "
+                            "updated_at = now() WHERE dcl_ingest_id = %s", (long_run,))
+            time.sleep(0.05)
+            # A shorter write starts after t1 and commits first.
+            store.insert_triples([triple(short_run, "amount_1")])
+            assert reader.get_or_load("count", live_tenant, "q", live_count) == 1
+            long_conn.commit()
+
+        assert reader.get_or_load("count", live_tenant, "q", live_count) == 2
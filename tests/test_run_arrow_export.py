@@ -0,0 +1,183 @@
+"""Columnar run-snapshot exports: /api/dcl/export/run.parquet and run.arrows.
+
+Operator-visible outcome under test: after this run's per-run-unique tenant
+ingests two runs for one entity (the second moves the pointer) and one run
+for a second entity, the operator downloads:
+
+  GET /api/dcl/export/run.parquet — Parquet pyarrow reads back to exactly the
+      current-pointer rows of both entities, with concept / source_system /
+      period / dcl_ingest_id dictionary-encoded and the JSONB value split into
+      value_num (numbers) and value_str (strings; booleans and objects as
+      JSON text); no tenant column, no run_id column (I1/I2);
+  GET /api/dcl/export/run.arrows  — the same rows as an Arrow IPC stream;
+  entity_id / dcl_ingest_id scope the export (the superseded run is
+  reachable only by its dcl_ingest_id).
+
+Bounded memory: iter_record_batches never yields more than batch_rows rows
+per batch, and the Parquet file carries one row group per batch. 422 on a
+malformed tenant_id / dcl_ingest_id, 404 (naming the scope) when nothing
+matches.
+
+Live-service integration tests: TestClient drives the real FastAPI app
+against the aos-dev database; direct DB access is used only for cleanup.
+"""
+
+import io
+import sys
+import uuid
+from operator import itemgetter
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+pa = pytest.importorskip("pyarrow")
+import pyarrow.ipc as pa_ipc
+import pyarrow.parquet as pq
+
+from fastapi.testclient import TestClient
+from backend.api.main import app
+from backend.core.db import get_connection
+from backend.engine import arrow_export
+
+client = TestClient(app, raise_server_exceptions=False)
+
+TENANT = str(uuid.uuid4())
+TAG = uuid.uuid4().hex[:6]
+ENTITY_A = f"ArrowExport-{TAG}-A"
+ENTITY_B = f"ArrowExport-{TAG}-B"
+ROWS_PER_RUN = 25
+
+VALUES = {
+    "amount": 1250.5,
+    "label": "north-america",
+    "flag": True,
+    "detail": {"basis": "gaap"},
+}
+
+
+def _triples(entity_id: str, scale: float) -> list[dict]:
+    triples = []
+    for i in range(ROWS_PER_RUN):
+        prop = list(VALUES)[i % len(VALUES)]
+        value = VALUES[prop] * scale if prop == "amount" else VALUES[prop]
+        triples.append({
+            "entity_id": entity_id, "concept": f"revenue.line_{i}",
+            "property": prop, "value": value, "period": f"2026-Q{1 + i % 4}",
+            "source_system": "netsuite" if i % 2 else "sap",
+            "source_table": "arrow_probe", "source_field": prop,
+            "pipe_id": str(uuid.uuid4()), "fabric_plane": "erp",
+            "confidence_score": 0.9, "confidence_tier": "high",
+        })
+    return triples
+
+
+def _push(entity_id: str, scale: float) -> str:
+    run_id = str(uuid.uuid4())
+    r = client.post("/api/dcl/ingest-triples", json={
+        "tenant_id": TENANT, "dcl_ingest_id": run_id, "entity_id": entity_id,
+        "snapshot_name": f"{entity_id}-{run_id[:4]}",
+        "triples": _triples(entity_id, scale),
+    })
+    assert r.status_code == 201, r.text
+    return run_id
+
+
+@pytest.fixture(scope="module")
+def runs():
+    old_a = _push(ENTITY_A, 1.0)
+    new_a = _push(ENTITY_A, 2.0)
+    b = _push(ENTITY_B, 1.0)
+    yield {"old_a": old_a, "new_a": new_a, "b": b}
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            for table in ("semantic_triples", "conflict_register", "ingest_runs",
+                          "triple_rollups", "run_group_digests", "tenant_runs"):
+                cur.execute(f"DELETE FROM {table} WHERE tenant_id::text = %s", [TENANT])
+            conn.commit()
+
+
+def _parquet(params):
+    r = client.get("/api/dcl/export/run.parquet", params=params)
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"] == "application/vnd.apache.parquet"
+    assert 'filename="run.parquet"' in r.headers["content-disposition"]
+    return pq.read_table(io.BytesIO(r.content))
+
+
+def _arrows(params):
+    r = client.get("/api/dcl/export/run.arrows", params=params)
+    assert r.status_code == 200, r.text
+    assert r.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    return pa_ipc.open_stream(r.content).read_all()
+
+
+@pytest.mark.usefixtures("runs")
+class TestRunSnapshotExport:
+    def test_parquet_is_the_current_snapshot(self, runs):
+        table = _parquet({"tenant_id": TENANT})
+        assert table.num_rows == 2 * ROWS_PER_RUN
+        assert set(table.column("dcl_ingest_id").to_pylist()) == {runs["new_a"], runs["b"]}
+        assert "tenant_id" not in table.schema.names
+        assert "run_id" not in table.schema.names
+        for name in ("concept", "source_system", "period", "dcl_ingest_id"):
+            assert pa.types.is_dictionary(table.schema.field(name).type), name
+
+    def test_value_split_is_typed(self):
+        rows = _parquet({"tenant_id": TENANT, "entity_id": ENTITY_A}).to_pylist()
+        by_prop = {r["property"]: r for r in rows}
+        assert by_prop["amount"]["value_num"] == 2501.0
+        assert by_prop["amount"]["value_str"] is None
+        assert by_prop["amount"]["value_type"] == "number"
+        assert by_prop["label"]["value_str"] == "north-america"
+        assert by_prop["label"]["value_num"] is None
+        assert by_prop["flag"]["value_str"] == "true"
+        assert by_prop["detail"]["value_str"] == '{"basis": "gaap"}'
+        assert by_prop["detail"]["value_type"] == "object"
+
+    def test_arrow_stream_matches_parquet(self):
+        params = {"tenant_id": TENANT}
+        # Sorted in Python: Table.sort_by rejects dictionary-encoded columns.
+        key = itemgetter("entity_id", "concept", "property")
+        parquet = _parquet(params)
+        stream = _arrows(params)
+        assert stream.schema == arrow_export.export_schema()
+        assert sorted(stream.to_pylist(), key=key) == sorted(parquet.to_pylist(), key=key)
+
+    def test_ingest_id_selects_a_superseded_run(self, runs):
+        table = _arrows({"tenant_id": TENANT, "dcl_ingest_id": runs["old_a"]})
+        assert set(table.column("dcl_ingest_id").to_pylist()) == {runs["old_a"]}
+        amounts = {v for v in table.column("value_num").to_pylist() if v is not None}
+        assert amounts == {1250.5}
+
+    def test_batches_are_bounded(self):
+        batches = list(arrow_export.iter_record_batches(TENANT, batch_rows=7))
+        assert sum(b.num_rows for b in batches) == 2 * ROWS_PER_RUN
+        assert max(b.num_rows for b in batches) == 7
+        body = b"".join(arrow_export.stream_parquet(iter(batches)))
+        assert pq.ParquetFile(io.BytesIO(body)).num_row_groups == len(batches)
+
+
+class TestRunExportErrors:
+    @pytest.mark.parametrize("path", ["run.parquet", "run.arrows"])
+    def test_malformed_ids_are_422(self, path):
+        r = client.get(f"/api/dcl/export/{path}", params={"tenant_id": "nope"})
+        assert r.status_code == 422
+        r = client.get(f"/api/dcl/export/{path}", params={
+            "tenant_id": TENANT, "dcl_ingest_id": "nope",
+        })
+        assert r.status_code == 422
+        assert r.json()["detail"]["error"] == "DCL_INGEST_ID_INVALID"
+
+    @pytest.mark.parametrize("path", ["run.parquet", "run.arrows"])
+    def test_empty_scope_is_404(self, path):
+        empty = str(uuid.uuid4())
+        r = client.get(f"/api/dcl/export/{path}", params={"tenant_id": empty})
+        assert r.status_code == 404
+        assert r.json()["detail"]["error"] == "NO_RUN_FOR_TENANT"
+        assert empty in r.json()["detail"]["message"]
@@ -0,0 +1,201 @@
+"""Run group digests — run_group_digests (migration 036).
+
+Operator-visible outcome under test: TripleStore.diff_runs (structural drift
+sweep, GET /api/dcl/triples/diff) reports exactly the same counts, samples
+and single values from the digest join as from the on-the-fly scan it
+replaces, for runs that add, remove and change groups (including a multi-row
+group whose value multiset changes but whose count does not). The
+incrementally maintained digests match a from-scratch
+run_group_digests_rebuild() through appends, same-run replays and deletes,
+and groups deleted to zero are pruned. A digest credit that does not cover
+every row the COPY wrote fails the write instead of committing.
+
+Live-database integration test against aos-dev; dedicated tenant, cleaned up
+(TestCreditGuard runs on a fake cursor, no database).
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+from backend.core.db import get_connection
+from backend.db.triple_store import TripleStore, _credit_group_digests
+
+TEST_TENANT_ID = str(uuid.uuid5(uuid.NAMESPACE_DNS, "run-group-digests-test"))
+ENTITY = "DigestProbe-D1"
+
+
+def _triple(run_id, concept, value, source="netsuite", prop="amount", period="2026-03"):
+    return {
+        "tenant_id": TEST_TENANT_ID, "entity_id": ENTITY, "run_id": run_id,
+        "concept": concept, "property": prop, "value": value, "period": period,
+        "currency": "USD", "source_system": source, "source_table": "digest_probe",
+        "source_field": prop, "confidence_score": 0.95, "confidence_tier": "exact",
+    }
+
+
+def _base(run_id):
+    return [
+        _triple(run_id, "revenue.total", 1000.0),
+        _triple(run_id, "revenue.recurring", 800.0),
+        _triple(run_id, "cost.opex.total", 400.0, period=None),
+        # Multi-row group (per-record ledger rows).
+        _triple(run_id, "cost.ledger", 10.0),
+        _triple(run_id, "cost.ledger", 20.0),
+        _triple(run_id, "headcount.total", {"fte": 12, "contractors": 3}, prop="breakdown"),
+    ]
+
+
+def _compare(run_id):
+    return [
+        _triple(run_id, "revenue.total", 1100.0),                 # changed value
+        _triple(run_id, "revenue.recurring", 800.0),              # unchanged
+        _triple(run_id, "cost.opex.total", 400.0, period=None),   # unchanged
+        _triple(run_id, "cost.ledger", 10.0),                     # same count,
+        _triple(run_id, "cost.ledger", 25.0),                     # other multiset
+        _triple(run_id, "pipeline.total", 5000.0, source="salesforce"),  # added
+    ]                                                              # headcount removed
+
+
+def _digests():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT entity_id, dcl_ingest_id, concept, property, period, "
+                "       source_system, row_count, value_hash "
+                "FROM run_group_digests WHERE tenant_id = %s AND row_count > 0 "
+                "ORDER BY 1, 2, 3, 4, 5, 6",
+                (TEST_TENANT_ID,),
+            )
+            return cur.fetchall()
+
+
+def _set_covered(run_id, covered):
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "UPDATE ingest_runs SET group_digests = %s WHERE dcl_ingest_id = %s",
+                (covered, run_id),
+            )
+            conn.commit()
+
+
+def _cleanup():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            for table in ("semantic_triples", "ingest_runs", "triple_rollups", "run_group_digests"):
+                cur.execute(f"DELETE FROM {table} WHERE tenant_id = %s", (TEST_TENANT_ID,))
+            conn.commit()
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    _cleanup()
+    yield
+    _cleanup()
+
+
+class TestDiffRuns:
+    def test_digest_join_matches_scan(self):
+        store = TripleStore()
+        base, cmp = str(uuid.uuid4()), str(uuid.uuid4())
+        store.insert_triples(_base(base))
+        store.insert_triples(_compare(cmp))
+
+        digest = store.diff_runs(TEST_TENANT_ID, ENTITY, base, cmp)
+        _set_covered(base, False)
+        scan = store.diff_runs(TEST_TENANT_ID, ENTITY, base, cmp)
+        assert digest == scan
+        assert digest["counts"] == {"added": 1, "removed": 1, "changed": 2, "unchanged": 2}
+
+        changed = {s["concept"]: s for s in digest["samples"]["changed"]}
+        assert changed["revenue.total"]["base_value"] == "1000.0"
+        assert changed["revenue.total"]["compare_value"] == "1100.0"
+        assert changed["cost.ledger"]["base_count"] == changed["cost.ledger"]["compare_count"] == 2
+        assert "base_value" not in changed["cost.ledger"]
+        assert digest["samples"]["added"][0]["value"] == "5000.0"
+        assert digest["samples"]["removed"][0]["value"] == '{"fte": 12, "contractors": 3}'
+
+    def test_truncated_samples_match_scan(self):
+        store = TripleStore()
+        base, cmp = str(uuid.uuid4()), str(uuid.uuid4())
+        store.insert_triples(_base(base))
+        store.insert_triples(_compare(cmp))
+        digest = store.diff_runs(TEST_TENANT_ID, ENTITY, base, cmp, limit=1)
+        _set_covered(cmp, False)
+        assert digest == store.diff_runs(TEST_TENANT_ID, ENTITY, base, cmp, limit=1)
+        assert digest["truncated"] == {"added": False, "removed": False, "changed": True}
+
+
+class TestDigestMaintenance:
+    def test_ingest_marks_run_and_matches_rebuild(self):
+        store = TripleStore()
+        run = str(uuid.uuid4())
+        store.insert_triples(_base(run)[:3])
+        store.insert_triples(_base(run)[3:])  # append to the same run
+        store.replace_tenant_triples(TEST_TENANT_ID, _base(run))  # same-run replay
+        incremental = _digests()
+        assert sum(r[6] for r in incremental) == len(_base(run))
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT group_digests FROM ingest_runs WHERE dcl_ingest_id = %s", (run,),
+                )
+                assert cur.fetchone()[0] is True
+                cur.execute("SELECT run_group_digests_rebuild(%s)", (TEST_TENANT_ID,))
+                conn.commit()
+        assert _digests() == incremental
+
+    def test_delete_debits_and_prune(self):
+        store = TripleStore()
+        keep, drop = str(uuid.uuid4()), str(uuid.uuid4())
+        store.insert_triples(_base(keep))
+        store.insert_triples(_compare(drop))
+        store.delete_by_run(drop)
+        assert {str(r[1]) for r in _digests()} == {keep}
+        assert store.prune_rollups() >= 1
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT COUNT(*) FROM run_group_digests "
+                    "WHERE tenant_id = %s AND row_count <= 0",
+                    (TEST_TENANT_ID,),
+                )
+                assert cur.fetchone()[0] == 0
+
+
+class _CreditCursor:
+    def __init__(self, credited):
+        self.credited = credited
+        self.executed = []
+
+    def execute(self, sql, params=None):
+        self.executed.append(params)
+
+    def fetchone(self):
+        return (self.credited,)
+
+
+class TestCreditGuard:
+    @pytest.fixture(autouse=True)
+    def _clean(self):
+        yield
+
+    def test_full_credit_passes(self):
+        run = str(uuid.uuid4())
+        cur = _CreditCursor(3)
+        _credit_group_digests(cur, {(TEST_TENANT_ID, run): [3, {ENTITY}]})
+        assert cur.executed == [(TEST_TENANT_ID, run, [ENTITY])]
+
+    def test_short_credit_raises(self):
+        cur = _CreditCursor(2)
+        with pytest.raises(RuntimeError, match="covered 2 of the 3 rows"):
+            _credit_group_digests(cur, {(TEST_TENANT_ID, str(uuid.uuid4())): [3, {ENTITY}]})
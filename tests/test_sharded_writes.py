@@ -0,0 +1,187 @@
+"""Sharded multi-entity writes — TripleStore.write_entity_shards (migration 032).
+
+Operator-visible outcome under test: a batch spanning several entities,
+written as concurrent per-entity shards, lands exactly like the single-
+transaction path — every row written, each entity's prior live rows
+superseded on replace, one ingest_runs row with the full count and entity
+set — and a shard that fails leaves NOTHING behind (no rows, no registry
+row, no prepared transaction). An orphaned prepared shard is committed by
+recover_shard_transactions when its decision was recorded and rolled back
+when it was not.
+
+Live-DB integration test against the aos-dev database; skipped when the
+server has prepared transactions disabled (max_prepared_transactions = 0).
+Dedicated test tenant so demo data is never touched.
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+from backend.core.db import get_connection
+from backend.db.triple_store import TripleStore, recover_shard_transactions
+
+TEST_TENANT_ID = str(uuid.uuid5(uuid.NAMESPACE_DNS, "sharded-writes-test"))
+ENTITIES = ["ShardProbe-A", "ShardProbe-B", "ShardProbe-C"]
+
+store = TripleStore()
+
+
+def _prepared_xacts_enabled() -> bool:
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SHOW max_prepared_transactions")
+                return int(cur.fetchone()[0]) > 0
+    except Exception:
+        return False
+
+
+pytestmark = pytest.mark.skipif(
+    not _prepared_xacts_enabled(),
+    reason="database unreachable or max_prepared_transactions = 0 — sharded "
+           "writes need two-phase commit",
+)
+
+
+def _rows(run_id, per_entity=5, **overrides):
+    rows = []
+    for entity in ENTITIES:
+        for i in range(per_entity):
+            row = {
+                "tenant_id": TEST_TENANT_ID, "entity_id": entity,
+                "concept": "revenue.total", "property": f"amount_{i}",
+                "value": 1000.0 + i, "period": "2026-03", "currency": "USD",
+                "source_system": "netsuite", "source_table": "gl",
+                "source_field": "amount", "run_id": run_id,
+                "confidence_score": 0.95, "confidence_tier": "exact",
+            }
+            row.update(overrides)
+            rows.append(row)
+    return rows
+
+
+def _counts(run_id):
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT COUNT(*), COUNT(*) FILTER (WHERE is_active) "
+                "FROM semantic_triples WHERE run_id = %s",
+                (run_id,),
+            )
+            return cur.fetchone()
+
+
+def _registry(run_id):
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT triple_count, live_count, entity_ids FROM ingest_runs "
+                "WHERE dcl_ingest_id = %s",
+                (run_id,),
+            )
+            return cur.fetchone()
+
+
+def _prepared_for(run_id):
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT COUNT(*) FROM pg_prepared_xacts WHERE gid LIKE %s",
+                (f"dcl-shard:{run_id}:%",),
+            )
+            return cur.fetchone()[0]
+
+
+def _cleanup():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM semantic_triples WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM triple_rollups WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM run_group_digests WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_shard_decisions WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            conn.commit()
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    _cleanup()
+    yield
+    _cleanup()
+
+
+class TestShardedWrites:
+    def test_sharded_write_lands_whole_and_registers_run(self):
+        run = str(uuid.uuid4())
+        written = store.write_entity_shards(TEST_TENANT_ID, _rows(run), workers=3)
+        assert written == 15
+        assert _counts(run) == (15, 15)
+        assert _registry(run) == (15, 15, sorted(ENTITIES))
+        assert _prepared_for(run) == 0
+
+    def test_sharded_replace_supersedes_each_entity(self):
+        first, second = str(uuid.uuid4()), str(uuid.uuid4())
+        store.write_entity_shards(TEST_TENANT_ID, _rows(first), workers=3)
+        store.write_entity_shards(TEST_TENANT_ID, _rows(second), replace=True, workers=3)
+        assert _counts(first) == (15, 0)
+        assert _counts(second) == (15, 15)
+        assert _registry(first)[:2] == (15, 0)
+        assert _registry(second)[:2] == (15, 15)
+
+    def test_failing_shard_rolls_back_every_shard(self):
+        run = str(uuid.uuid4())
+        rows = _rows(run)
+        # One entity's rows violate NOT NULL on concept — that shard fails at
+        # COPY; the other shards must roll back with it.
+        for r in rows:
+            if r["entity_id"] == ENTITIES[1]:
+                r["concept"] = None
+        with pytest.raises(Exception):
+            store.write_entity_shards(TEST_TENANT_ID, rows, workers=3)
+        assert _counts(run) == (0, 0)
+        assert _registry(run) is None
+        assert _prepared_for(run) == 0
+
+    def test_recovery_resolves_orphans_by_decision(self):
+        decided, undecided = str(uuid.uuid4()), str(uuid.uuid4())
+        for run, record in ((decided, True), (undecided, False)):
+            group = f"dcl-shard:{run}:orphan"
+            with get_connection() as conn:
+                conn.tpc_begin(f"{group}:0/1")
+                with conn.cursor() as cur:
+                    cur.execute(
+                        "INSERT INTO semantic_triples (tenant_id, entity_id, concept, property, "
+                        " value, source_system, run_id, confidence_score, confidence_tier) "
+                        "VALUES (%s, %s, 'revenue.total', 'amount', '1'::jsonb, 'netsuite', "
+                        " %s, 0.9, 'exact')",
+                        (TEST_TENANT_ID, ENTITIES[0], run),
+                    )
+                conn.tpc_prepare()
+                # Simulate a crash after prepare: hand the connection back
+                # with the branch still prepared server-side.
+                conn.reset()
+            if record:
+                with get_connection() as conn:
+                    with conn.cursor() as cur:
+                        cur.execute(
+                            "INSERT INTO ingest_shard_decisions "
+                            "(group_id, dcl_ingest_id, tenant_id, shard_count) "
+                            "VALUES (%s, %s, %s, 1)",
+                            (group, run, TEST_TENANT_ID),
+                        )
+                    conn.commit()
+
+        resolved = recover_shard_transactions(min_age_s=0)
+        assert f"dcl-shard:{decided}:orphan:0/1" in resolved["committed"]
+        assert f"dcl-shard:{undecided}:orphan:0/1" in resolved["rolled_back"]
+        assert _counts(decided) == (1, 1)
+        assert _counts(undecided) == (0, 0)
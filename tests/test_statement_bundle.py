@@ -0,0 +1,206 @@
+"""Multi-period financial statement bundle (TripleQueryResolver.get_statements).
+
+Operator-visible outcome under test:
+  - a three-statement report for N periods (quarters and years mixed) costs
+    ONE resolver query, not 3N;
+  - each period's statements are exactly what get_income_statement /
+    get_balance_sheet / get_cash_flow return for that period — a year sums its
+    quarters for the flow statements and reads the Q4 balance sheet;
+  - an incomplete statement or a failed identity in any period raises the
+    same ValueError the single-statement method raises;
+  - GET /api/dcl/statements and the financial_statements MCP tool serve the
+    bundle with dcl_ingest_id (never run_id), 422 / MCPToolError on failure,
+    and the tool refuses a token whose domain_scope cannot see every
+    statement domain.
+
+TestBundleAssembly runs without a database (the resolver's _query is
+replaced). TestBundleLive seeds a dedicated tenant in the aos-dev database
+through TripleStore.insert_triples and cleans it up.
+"""
+
+import sys
+import uuid
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+from backend.db import triple_store as triple_store_module
+from backend.engine.query_resolver_v2 import STATEMENT_DOMAINS, TripleQueryResolver
+
+ENTITY = "StatementBundle-E1"
+QUARTERS = ["2026-Q1", "2026-Q2", "2026-Q3", "2026-Q4"]
+
+
+def _quarter_facts(q: int) -> dict[str, float]:
+    """One quarter's amounts; every identity holds."""
+    rev, cogs, opex = 1000.0 * q, 400.0 * q, 250.0 * q
+    liab, eq = 3000.0 + 100 * q, 2000.0 + 50 * q
+    op, inv, fin = 500.0 * q, -120.0 * q, -30.0
+    return {
+        "revenue.total": rev, "revenue.subscription": rev * 0.75,
+        "cogs.total": cogs, "opex.total": opex,
+        "pnl.ebitda": rev - cogs - opex, "pnl.gross_profit": rev - cogs,
+        "asset.total": liab + eq, "asset.cash": 900.0 + q,
+        "liability.total": liab, "equity.total": eq,
+        "cash_flow.operating.total": op, "cash_flow.investing.total": inv,
+        "cash_flow.financing.total": fin, "cash_flow.net_change": op + inv + fin,
+    }
+
+
+FACTS = {f"2026-Q{q}": _quarter_facts(q) for q in range(1, 5)}
+
+
+class TestBundleAssembly:
+    @pytest.fixture
+    def resolver(self, monkeypatch):
+        monkeypatch.setattr(triple_store_module, "domain_column_ready", lambda: True)
+        resolver = TripleQueryResolver("t-1", "r-1")
+        calls = []
+
+        def fake_query(sql, params):
+            calls.append((sql, params))
+            periods = params[-1]
+            return [
+                {"concept": c, "period": p, "value": Decimal(str(v))}
+                for p in periods for c, v in FACTS.get(p, {}).items()
+            ]
+
+        monkeypatch.setattr(resolver, "_query", fake_query)
+        resolver.calls = calls
+        return resolver
+
+    def test_many_periods_one_query(self, resolver):
+        bundle = resolver.get_statements(ENTITY, ["2026-Q1", "2026-Q2", "2026", "2026-Q1"])
+        assert len(resolver.calls) == 1
+        sql, params = resolver.calls[0]
+        assert "domain = ANY(%s)" in sql
+        assert params[2] == STATEMENT_DOMAINS
+        assert sorted(params[-1]) == QUARTERS
+        assert bundle["periods"] == ["2026-Q1", "2026-Q2", "2026"]
+        assert set(bundle["statements"]["2026"]) == {"income_statement", "balance_sheet", "cash_flow"}
+
+    def test_year_sums_flows_and_reads_q4_balance_sheet(self, resolver):
+        year = resolver.get_statements(ENTITY, ["2026"])["statements"]["2026"]
+        inc = year["income_statement"]
+        assert inc["revenue"]["total"] == sum(FACTS[q]["revenue.total"] for q in QUARTERS)
+        assert inc["ebitda"] == sum(FACTS[q]["pnl.ebitda"] for q in QUARTERS)
+        assert year["balance_sheet"]["assets"]["total"] == FACTS["2026-Q4"]["asset.total"]
+        assert year["cash_flow"]["operating"]["total"] == sum(
+            FACTS[q]["cash_flow.operating.total"] for q in QUARTERS
+        )
+        assert year["cash_flow"]["net_change"] == sum(
+            FACTS[q]["cash_flow.net_change"] for q in QUARTERS
+        )
+
+    def test_quarter_shape_matches_single_statement_contract(self, resolver):
+        q2 = resolver.get_statements(ENTITY, ["2026-Q2"])["statements"]["2026-Q2"]
+        assert q2["income_statement"] == {
+            "revenue": {"total": 2000.0, "subscription": 1500.0},
+            "cogs": {"total": 800.0}, "opex": {"total": 500.0},
+            "ebitda": 700.0, "gross_profit": 1200.0,
+        }
+        assert q2["balance_sheet"]["equity"] == {"total": 2100.0}
+        assert q2["cash_flow"]["financing"] == {"total": -30.0}
+
+    def test_identity_failure_names_the_period(self, resolver, monkeypatch):
+        monkeypatch.setitem(FACTS["2026-Q3"], "pnl.ebitda", 1.0)
+        with pytest.raises(ValueError, match="P&L identity failed.*period='2026-Q3'"):
+            resolver.get_statements(ENTITY, ["2026-Q1", "2026-Q3"])
+
+    def test_missing_period_is_incomplete(self, resolver):
+        with pytest.raises(ValueError, match="incomplete.*period='2027-Q1'"):
+            resolver.get_statements(ENTITY, ["2026-Q1", "2027-Q1"])
+        with pytest.raises(ValueError, match="at least one period"):
+            resolver.get_statements(ENTITY, [])
+
+    def test_mcp_tool_refuses_partial_domain_scope(self):
+        from backend.engine.mcp_tools import MCPToolError, dispatch
+        with pytest.raises(MCPToolError, match="domain_scope excludes"):
+            dispatch("t-1", "financial_statements",
+                     {"entity_id": ENTITY, "periods": ["2026-Q1"]},
+                     effective_domain_scope=("revenue", "cogs"))
+
+
+@pytest.fixture(scope="module")
+def seeded():
+    from backend.core.db import get_connection
+    from backend.db.triple_store import TripleStore
+
+    tenant = str(uuid.uuid5(uuid.NAMESPACE_DNS, "statement-bundle-test"))
+    run_id = str(uuid.uuid4())
+
+    def cleanup():
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                for table in ("semantic_triples", "ingest_runs", "triple_rollups",
+                              "run_group_digests", "tenant_runs"):
+                    cur.execute(f"DELETE FROM {table} WHERE tenant_id::text = %s", [tenant])
+                conn.commit()
+
+    cleanup()
+    TripleStore().insert_triples([
+        {
+            "tenant_id": tenant, "entity_id": ENTITY, "concept": concept,
+            "property": "amount", "value": value, "period": period,
+            "currency": "USD", "source_system": "netsuite",
+            "source_table": "gl", "source_field": "amount", "run_id": run_id,
+            "confidence_score": 0.95, "confidence_tier": "exact",
+        }
+        for period, facts in FACTS.items() for concept, value in facts.items()
+    ])
+    yield tenant, run_id
+    cleanup()
+
+
+class TestBundleLive:
+    def test_bundle_matches_single_statement_methods(self, seeded):
+        tenant, run_id = seeded
+        resolver = TripleQueryResolver(tenant, run_id)
+        periods = ["2026-Q1", "2026-Q4", "2026"]
+        bundle = resolver.get_statements(ENTITY, periods)
+        for p in periods:
+            got = bundle["statements"][p]
+            assert got["income_statement"] == resolver.get_income_statement(ENTITY, p)
+            assert got["balance_sheet"] == resolver.get_balance_sheet(ENTITY, p)
+            assert got["cash_flow"] == resolver.get_cash_flow(ENTITY, p)
+
+    def test_route_serves_bundle_with_ingest_id(self, seeded):
+        from fastapi.testclient import TestClient
+        from backend.api.main import app
+
+        tenant, run_id = seeded
+        client = TestClient(app, raise_server_exceptions=False)
+        r = client.get("/api/dcl/statements", params={
+            "tenant_id": tenant, "dcl_ingest_id": run_id, "entity_id": ENTITY,
+            "periods": ["2026-Q1,2026-Q2", "2026"],
+        })
+        assert r.status_code == 200, r.text
+        body = r.json()
+        assert body["dcl_ingest_id"] == run_id and "run_id" not in body
+        assert body["periods"] == ["2026-Q1", "2026-Q2", "2026"]
+
+        r = client.get("/api/dcl/statements", params={
+            "tenant_id": tenant, "dcl_ingest_id": run_id, "entity_id": ENTITY,
+            "periods": "2031-Q1",
+        })
+        assert r.status_code == 422
+        assert r.json()["detail"]["error"] == "STATEMENTS_UNRESOLVED"
+
+    def test_mcp_tool_reads_explicit_run(self, seeded):
+        from backend.engine.mcp_tools import dispatch
+
+        tenant, run_id = seeded
+        out = dispatch(tenant, "financial_statements", {
+            "entity_id": ENTITY, "periods": ["2026"], "dcl_ingest_id": run_id,
+        })
+        assert out["dcl_ingest_id"] == run_id
+        assert out["statements"]["2026"]["balance_sheet"]["assets"]["total"] == (
+            FACTS["2026-Q4"]["asset.total"]
+        )
@@ -0,0 +1,147 @@
+"""Server-side cursor streaming reads (backend.core.db.stream_rows).
+
+Operator-visible outcome under test:
+  - a 1M-row result streamed through stream_rows keeps the worker's Python
+    heap flat — tracemalloc peak stays a small multiple of one FETCH, far
+    below what the materialized result costs;
+  - the #62 read ceiling still binds inside a named-cursor transaction (the
+    DECLARE cannot carry the TimeoutBound prefix, so the wrapper issues its
+    own SET LOCAL first);
+  - GET /api/dcl/triples/browse/stream returns exactly the rows
+    /triples/browse pages through, as NDJSON and as one JSON array, and keeps
+    browse's 400 validation; TripleStore.iter_triples_by_run and
+    iter_run_triples match their list-returning siblings.
+
+Live-DB integration test against the aos-dev database. The 1M-row case reads
+generate_series (nothing is written); the endpoint cases use a per-run-unique
+tenant seeded through the ingest API and cleaned up directly.
+"""
+
+import json
+import sys
+import tracemalloc
+import uuid
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+from fastapi.testclient import TestClient
+from backend.api.main import app
+from backend.api.routes.ingest_triples import get_run_triples, iter_run_triples
+from backend.core.constants import QUERY_STATEMENT_TIMEOUT_MS
+from backend.core.db import get_connection, stream_rows
+from backend.db.triple_store import TripleStore
+
+client = TestClient(app, raise_server_exceptions=False)
+
+TENANT = str(uuid.uuid4())
+ENTITY = f"StreamReads-{uuid.uuid4().hex[:6]}"
+N_TRIPLES = 120
+MILLION = 1_000_000
+
+
+@pytest.fixture(scope="module")
+def run_id():
+    rid = str(uuid.uuid4())
+    r = client.post("/api/dcl/ingest-triples", json={
+        "tenant_id": TENANT, "dcl_ingest_id": rid, "entity_id": ENTITY,
+        "snapshot_name": f"{ENTITY}-{rid[:4]}",
+        "triples": [{
+            "entity_id": ENTITY, "concept": f"revenue.line_{i % 30}",
+            "property": f"amount_{i // 30}", "value": 10.0 * i,
+            "period": "2026-Q1", "source_system": "netsuite",
+            "source_table": "stream_probe", "source_field": "amount",
+            "pipe_id": str(uuid.uuid4()), "fabric_plane": "erp",
+            "confidence_score": 0.9, "confidence_tier": "high",
+        } for i in range(N_TRIPLES)],
+    })
+    assert r.status_code == 201, r.text
+    yield rid
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            for table in ("semantic_triples", "conflict_register", "ingest_runs",
+                          "triple_rollups", "run_group_digests", "tenant_runs"):
+                cur.execute(f"DELETE FROM {table} WHERE tenant_id::text = %s", [TENANT])
+            conn.commit()
+
+
+def test_million_row_stream_is_memory_bounded():
+    sql = "SELECT g AS n, md5(g::text) AS label FROM generate_series(1, %s) g"
+    tracemalloc.start()
+    try:
+        count = 0
+        total = 0
+        for row in stream_rows(sql, (MILLION,), itersize=5000):
+            count += 1
+            total += row["n"]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert count == MILLION
+    assert total == MILLION * (MILLION + 1) // 2
+    # One materialized row costs ~250 bytes of Python objects here (a 1M-row
+    # fetchall is ~250 MB); the stream holds one 5000-row FETCH at a time.
+    assert peak < 16 * 1024 * 1024, f"streaming peak {peak / 2**20:.1f} MiB"
+
+
+def test_read_ceiling_binds_in_named_cursor():
+    rows = list(stream_rows("SELECT current_setting('statement_timeout') AS t"))
+    assert rows == [{"t": f"{QUERY_STATEMENT_TIMEOUT_MS // 1000}s"}]
+
+
+def _browse_all(params) -> list[dict]:
+    r = client.get("/api/dcl/triples/browse", params={**params, "limit": 500})
+    assert r.status_code == 200, r.text
+    assert r.json()["total_count"] <= 500
+    return r.json()["triples"]
+
+
+@pytest.mark.usefixtures("run_id")
+class TestBrowseStream:
+    def test_ndjson_matches_browse(self):
+        params = {"tenant_id": TENANT, "entity_id": ENTITY}
+        r = client.get("/api/dcl/triples/browse/stream", params=params)
+        assert r.status_code == 200, r.text
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+        streamed = [json.loads(line) for line in r.text.splitlines()]
+        assert len(streamed) == N_TRIPLES
+        assert streamed == _browse_all(params)
+
+    def test_json_array_matches_browse(self, run_id):
+        params = {"tenant_id": TENANT, "run_id": run_id, "domain": "revenue"}
+        r = client.get("/api/dcl/triples/browse/stream", params={**params, "format": "json"})
+        assert r.status_code == 200, r.text
+        assert r.json() == _browse_all(params)
+
+    def test_empty_scope_is_an_empty_array(self):
+        r = client.get("/api/dcl/triples/browse/stream", params={
+            "tenant_id": str(uuid.uuid4()), "format": "json",
+        })
+        assert r.status_code == 200
+        assert r.json() == []
+
+    def test_validation_matches_browse(self):
+        r = client.get("/api/dcl/triples/browse/stream", params={
+            "tenant_id": TENANT, "run_id": "not-a-uuid",
+        })
+        assert r.status_code == 400
+        assert client.get("/api/dcl/triples/browse/stream").status_code == 422
+
+    def test_store_iterators_match_lists(self, run_id):
+        # One COPY stamps one created_at, so compare order-insensitively.
+        def by_key(rows, key):
+            return sorted(rows, key=lambda r: str(r[key]))
+
+        store = TripleStore()
+        assert (by_key(store.iter_triples_by_run(run_id), "id")
+                == by_key(store.get_triples_by_run(run_id), "id"))
+        assert (by_key(iter_run_triples(TENANT, run_id), "pipe_id")
+                == by_key(get_run_triples(TENANT, run_id), "pipe_id"))
+        assert (by_key(store.iter_triples(TENANT, "revenue.line_0", entity_id=ENTITY), "id")
+                == by_key(store.get_triples(TENANT, "revenue.line_0", entity_id=ENTITY), "id"))
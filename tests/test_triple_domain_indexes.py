@@ -0,0 +1,260 @@
+"""Generated semantic_triples.domain column + covering indexes (migration 035).
+
+Operator-visible outcome under test: the SQL the concept-prefix read paths
+actually build — mcp_query_triples / _expanded, /triples/browse-batch and the
+/dashboard-data aggregation pass — filters on `domain` equality and plans as
+an index scan over the migration 035 indexes, never a sequential scan: the
+MCP read walks idx_triples_tenant_domain_recent in ORDER BY order (no Sort),
+and the Dashboard's GROUPING SETS pass is an index-only or bitmap scan of
+idx_triples_domain_coord. domain_clause keeps the pre-035 LIKE semantics.
+
+Live-DB integration test against the aos-dev database; the plan tests are
+skipped until the store has the column (migration 035 on an empty store, or
+scripts/add_triple_domain_column.py --apply). Sequential scans are disabled
+per EXPLAIN so the assertions hold on a small seeded dataset. Dedicated test
+tenant so demo data is never touched.
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+from fastapi.testclient import TestClient
+from backend.api.main import app
+from backend.api.routes import triple_monitor
+from backend.core.db import get_connection
+from backend.db import triple_store as triple_store_module
+from backend.db.triple_store import TripleStore, domain_clause
+
+client = TestClient(app, raise_server_exceptions=False)
+
+TEST_TENANT_ID = str(uuid.uuid5(uuid.NAMESPACE_DNS, "triple-domain-indexes-test"))
+ENTITY = "DomainIndexProbe-D1"
+DOMAIN_INDEXES = {
+    "idx_triples_tenant_domain_recent",
+    "idx_triples_tenant_domain_coord",
+    "idx_triples_domain_coord",
+}
+
+store = TripleStore()
+
+
+def _has_domain_column() -> bool:
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT EXISTS (SELECT 1 FROM pg_attribute "
+                    "WHERE attrelid = 'semantic_triples'::regclass "
+                    "AND attname = 'domain' AND NOT attisdropped)"
+                )
+                return cur.fetchone()[0]
+    except Exception:
+        return False
+
+
+needs_domain_column = pytest.mark.skipif(
+    not _has_domain_column(),
+    reason="semantic_triples.domain missing — run scripts/add_triple_domain_column.py --apply",
+)
+
+
+def _rows(run_id):
+    """160 probe rows, plus 2000 workforce rows so a domain filter is
+    selective and the planner does not just walk the whole live partition."""
+    rows = []
+    filler = tuple(f"workforce.attrition.cohort_{n}" for n in range(50))
+    for concept in ("revenue.total", "revenue.recurring", "cost.opex.total",
+                    "workforce.headcount.total") + filler:
+        for i in range(40):
+            rows.append({
+                "tenant_id": TEST_TENANT_ID, "entity_id": ENTITY,
+                "concept": concept, "property": f"amount_{i}", "value": 100.0 + i,
+                "period": f"2026-{1 + i % 12:02d}", "currency": "USD",
+                "source_system": "netsuite" if i % 2 else "sap",
+                "source_table": "probe", "source_field": "amount",
+                "run_id": run_id, "confidence_score": 0.95,
+                "confidence_tier": "exact",
+            })
+    return rows
+
+
+def _cleanup():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM semantic_triples WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM triple_rollups WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM run_group_digests WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            conn.commit()
+
+
+def _vacuum_live_partition():
+    """Set the visibility map for the seeded rows so index-only scans are
+    costed as such. Only the tenant's live partition — never the whole
+    unpartitioned table."""
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT DISTINCT tableoid::regclass::text FROM semantic_triples "
+                "WHERE tenant_id = %s", (TEST_TENANT_ID,),
+            )
+            partitions = [r[0] for r in cur.fetchall() if r[0] != "semantic_triples"]
+            conn.commit()
+        prior = conn.autocommit
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                for name in partitions:
+                    # Bytes query: VACUUM cannot run in the timeout-prefixed
+                    # multi-statement string.
+                    cur.execute(f"VACUUM (ANALYZE) {name}".encode())
+        finally:
+            conn.autocommit = prior
+
+
+@pytest.fixture(scope="module")
+def seeded():
+    _cleanup()
+    store.insert_triples(_rows(str(uuid.uuid4())))
+    _vacuum_live_partition()
+    yield
+    _cleanup()
+
+
+def _plan_nodes(sql, params, *, sort=False):
+    """EXPLAIN nodes with sequential scans off, and sorts off unless the
+    query's ORDER BY cannot come from an index (sort=True)."""
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SET LOCAL enable_seqscan = off")
+            if not sort:
+                cur.execute("SET LOCAL enable_sort = off")
+            cur.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+            plan = cur.fetchone()[0][0]["Plan"]
+            conn.rollback()
+    nodes, stack = [], [plan]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(node.get("Plans", []))
+    return nodes
+
+
+def _index_scans(nodes):
+    """(node type, index) per index scan, each partition's attached index
+    named by the parent index it was created from."""
+    scans = [(n["Node Type"], n["Index Name"]) for n in nodes if "Index Name" in n]
+    if not scans:
+        return set()
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT i, COALESCE(pg_partition_root(i::regclass)::text, i) "
+                "FROM unnest(%s::text[]) i", ([i for _, i in scans],),
+            )
+            roots = dict(cur.fetchall())
+    return {(t, roots[i]) for t, i in scans}
+
+
+def _capture_mcp_sql(monkeypatch):
+    captured = {}
+
+    def capture(tenant_id, sql, params):
+        captured.update(sql=sql, params=params)
+        return []
+
+    monkeypatch.setattr(TripleStore, "_mcp_rows", staticmethod(capture))
+    return captured
+
+
+def _capture_route_sql(monkeypatch):
+    captured = {}
+    real = triple_monitor.read_cache.get_or_load
+
+    def capture(namespace, tenant_id, query_key, loader):
+        captured[namespace] = query_key
+        return real(namespace, tenant_id, query_key, loader)
+
+    monkeypatch.setattr(triple_monitor.read_cache, "get_or_load", capture)
+    return captured
+
+
+@needs_domain_column
+@pytest.mark.usefixtures("seeded")
+class TestDomainIndexPlans:
+    def test_mcp_domain_read_is_ordered_index_scan(self, monkeypatch):
+        captured = _capture_mcp_sql(monkeypatch)
+        store.mcp_query_triples(TEST_TENANT_ID, domain="revenue", limit=10)
+        assert "domain = %s" in captured["sql"]
+        nodes = _plan_nodes(captured["sql"], captured["params"])
+        types = {n["Node Type"] for n in nodes}
+        assert "Seq Scan" not in types and "Sort" not in types
+        assert "idx_triples_tenant_domain_recent" in {i for _, i in _index_scans(nodes)}
+
+    def test_persona_scoped_expanded_read_uses_domain_index(self, monkeypatch):
+        captured = _capture_mcp_sql(monkeypatch)
+        store.mcp_query_triples_expanded(
+            TEST_TENANT_ID, exacts=["revenue.total"], prefixes=["revenue.recurring"],
+            domains=["revenue", "cost"],
+        )
+        assert "domain = ANY(%s)" in captured["sql"]
+        nodes = _plan_nodes(captured["sql"], captured["params"])
+        assert "Seq Scan" not in {n["Node Type"] for n in nodes}
+        assert {i for _, i in _index_scans(nodes)} & DOMAIN_INDEXES
+
+    def test_browse_batch_uses_domain_index(self, monkeypatch):
+        captured = _capture_route_sql(monkeypatch)
+        resp = client.post("/api/dcl/triples/browse-batch", json={
+            "tenant_id": TEST_TENANT_ID, "domains": ["revenue", "cost"],
+        })
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["total_count"] == 120
+        assert "domain" not in resp.json()["triples_by_domain"]["revenue"][0]
+        data_sql, params = captured["triples_browse_batch"]
+        # Several domains' DISTINCT ON pages are merged by a sort.
+        nodes = _plan_nodes(data_sql, params, sort=True)
+        assert "Seq Scan" not in {n["Node Type"] for n in nodes}
+        assert {i for _, i in _index_scans(nodes)} & DOMAIN_INDEXES
+
+    def test_dashboard_aggregation_is_covered(self, monkeypatch):
+        captured = _capture_route_sql(monkeypatch)
+        resp = client.get("/api/dcl/dashboard-data", params={
+            "entity_id": ENTITY, "domain": "revenue", "page_size": 5,
+        })
+        assert resp.status_code == 200, resp.text
+        assert resp.json()["total_count"] == 80
+        key = captured["dashboard_data"]
+        params, agg_sql = key[1], key[5]
+        nodes = _plan_nodes(agg_sql, params)
+        assert "Seq Scan" not in {n["Node Type"] for n in nodes}
+        scans = {(t, i) for t, i in _index_scans(nodes) if i == "idx_triples_domain_coord"}
+        assert scans and {t for t, _ in scans} <= {"Index Only Scan", "Bitmap Index Scan"}
+
+
+class TestDomainClause:
+    def test_equality_when_column_ready(self, monkeypatch):
+        monkeypatch.setattr(triple_store_module, "domain_column_ready", lambda: True)
+        assert domain_clause(["revenue"]) == ("domain = %s", ["revenue"])
+        assert domain_clause(["revenue", "cost"], include_root=False) == (
+            "domain = ANY(%s) AND concept <> domain", [["revenue", "cost"]],
+        )
+
+    def test_like_before_migration_and_for_dotted_subtrees(self, monkeypatch):
+        monkeypatch.setattr(triple_store_module, "domain_column_ready", lambda: False)
+        assert domain_clause(["revenue"], include_root=False) == (
+            "concept LIKE %s", ["revenue.%"],
+        )
+        monkeypatch.setattr(triple_store_module, "domain_column_ready", lambda: True)
+        assert domain_clause(["revenue.recurring"]) == (
+            "(concept = %s OR concept LIKE %s)",
+            ["revenue.recurring", "revenue.recurring.%"],
+        )
@@ -0,0 +1,147 @@
+"""Tiered semantic_triples layout (migration 033).
+
+Operator-visible outcome under test: on a partitioned store, current-state
+reads (semantic_triples_current, WHERE is_active = true) plan against live-
+tier partitions only — no semantic_triples_history partition appears in the
+plan — while supersession moves a row into the history tier and the as-of
+predicate still returns it for a time before it was superseded.
+
+Live-DB integration test against the aos-dev database; skipped until the
+store has been converted (migration 033 on an empty store, or
+scripts/partition_semantic_triples.py --apply). Dedicated test tenant so
+demo data is never touched.
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+from backend.core.db import get_connection
+from backend.db.triple_store import TripleStore
+
+TEST_TENANT_ID = str(uuid.uuid5(uuid.NAMESPACE_DNS, "triple-partitions-test"))
+ENTITY = "PartitionProbe"
+
+store = TripleStore()
+
+
+def _partitioned() -> bool:
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass('semantic_triples')")
+                row = cur.fetchone()
+                return row is not None and row[0] == "p"
+    except Exception:
+        return False
+
+
+pytestmark = pytest.mark.skipif(
+    not _partitioned(),
+    reason="semantic_triples not partitioned — run scripts/partition_semantic_triples.py --apply",
+)
+
+
+def _plan(sql, params):
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("EXPLAIN (COSTS OFF) " + sql, params)
+            return "\n".join(r[0] for r in cur.fetchall())
+
+
+def _tier_of(run_id):
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT DISTINCT tableoid::regclass::text FROM semantic_triples WHERE run_id = %s",
+                (run_id,),
+            )
+            return {r[0] for r in cur.fetchall()}
+
+
+def _rows(run_id):
+    return [{
+        "tenant_id": TEST_TENANT_ID, "entity_id": ENTITY,
+        "concept": "revenue.total", "property": f"amount_{i}",
+        "value": 1000.0 + i, "period": "2026-03", "currency": "USD",
+        "source_system": "netsuite", "source_table": "gl",
+        "source_field": "amount", "run_id": run_id,
+        "confidence_score": 0.95, "confidence_tier": "exact",
+    } for i in range(3)]
+
+
+def _cleanup():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM semantic_triples WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM triple_rollups WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM run_group_digests WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            conn.commit()
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    _cleanup()
+    yield
+    _cleanup()
+
+
+class TestCurrentStatePruning:
+    def test_current_view_plans_live_tier_only(self):
+        plan = _plan(
+            "SELECT concept, value FROM semantic_triples_current WHERE tenant_id = %s",
+            (TEST_TENANT_ID,),
+        )
+        assert "semantic_triples_live_p" in plan
+        assert "semantic_triples_history" not in plan
+
+    def test_is_active_predicate_plans_live_tier_only(self):
+        plan = _plan(
+            "SELECT concept, value FROM semantic_triples "
+            "WHERE tenant_id = %s AND is_active = true",
+            (TEST_TENANT_ID,),
+        )
+        assert "semantic_triples_history" not in plan
+
+    def test_tenant_prunes_to_one_live_partition(self):
+        plan = _plan(
+            "SELECT 1 FROM semantic_triples_current WHERE tenant_id = %s",
+            (TEST_TENANT_ID,),
+        )
+        touched = {tok for tok in plan.split() if tok.startswith("semantic_triples_live_p")}
+        assert len(touched) == 1
+
+
+class TestRowMovement:
+    def test_supersession_moves_row_to_history_and_as_of_still_reads_it(self):
+        first, second = str(uuid.uuid4()), str(uuid.uuid4())
+        store.insert_triples(_rows(first))
+        assert all(t.startswith("semantic_triples_live_p") for t in _tier_of(first))
+
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT now()")
+                before_supersede = cur.fetchone()[0]
+
+        store.replace_tenant_triples(TEST_TENANT_ID, _rows(second))
+        assert all(t.startswith("semantic_triples_history_") for t in _tier_of(first))
+
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT COUNT(*) FROM semantic_triples "
+                    "WHERE tenant_id = %s AND run_id = %s "
+                    "  AND ingested_at <= %s "
+                    "  AND (superseded_at IS NULL OR superseded_at > %s)",
+                    (TEST_TENANT_ID, first, before_supersede, before_supersede),
+                )
+                assert cur.fetchone()[0] == 3
@@ -0,0 +1,209 @@
+"""Triple rollups — triple_rollups (migration 034).
+
+Operator-visible outcome under test: the overview, contextualization summary,
+Sankey and count_by_domain numbers — now summed from triple_rollups — equal
+what a scan of the live triples reports, and stay equal as runs are appended,
+displaced by the next ingest (swap_and_deactivate), replayed with
+?replace=true and purged. The incrementally maintained rows match a
+from-scratch triple_rollups_rebuild(), and groups debited to zero are pruned.
+
+Live-service integration test: TestClient drives the real FastAPI app against
+the aos-dev database. Dedicated test tenant/entity so demo data is never
+touched.
+"""
+
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+_repo = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_repo))
+
+from dotenv import load_dotenv
+load_dotenv(_repo / ".env.development")
+
+from fastapi.testclient import TestClient
+from backend.api.main import app
+from backend.core.db import get_connection
+from backend.db.triple_store import TripleStore
+
+client = TestClient(app, raise_server_exceptions=False)
+
+TEST_TENANT_ID = str(uuid.uuid5(uuid.NAMESPACE_DNS, "triple-rollups-test"))
+ENTITY = "RollupProbe-R1"
+PIPE = "77777777-7777-4777-8777-777777777734"
+
+_ROLLUP_COLS = (
+    "entity_id, dcl_ingest_id, domain, source_system, fabric_plane, "
+    "fabric_product, period, live_count, confidence_sum, tier_exact, "
+    "tier_high, tier_medium, tier_low, concept_counts"
+)
+
+
+def _triple(concept, prop, value, source, tier="exact", period="2026-03", plane="ipaas"):
+    return {
+        "entity_id": ENTITY, "concept": concept, "property": prop,
+        "value": value, "period": period, "currency": "USD",
+        "source_system": source, "source_table": "rollup_probe",
+        "source_field": prop, "pipe_id": PIPE,
+        "confidence_score": 0.95 if tier == "exact" else 0.7,
+        "confidence_tier": tier, "fabric_plane": plane,
+    }
+
+
+BATCH = [
+    _triple("revenue.total", "amount", 1000.0, "netsuite"),
+    _triple("revenue.recurring", "amount", 800.0, "netsuite"),
+    _triple("revenue.total", "amount", 1000.0, "salesforce", tier="high", plane="api_gateway"),
+    _triple("cost.opex.total", "amount", 400.0, "netsuite", period=None),
+    _triple("cost.opex.total", "amount", 410.0, "netsuite", tier="medium"),
+]
+
+
+def _ingest(run_id, triples=BATCH, **params):
+    return client.post(
+        "/api/dcl/ingest-triples",
+        params={"sync": "true", **params},
+        json={"tenant_id": TEST_TENANT_ID, "dcl_ingest_id": run_id,
+              "entity_id": ENTITY,
+              "snapshot_name": f"{ENTITY}-{run_id.replace('-', '')[:4]}",
+              "triples": triples},
+    )
+
+
+def _rollups():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"SELECT {_ROLLUP_COLS} FROM triple_rollups "
+                f"WHERE tenant_id = %s AND live_count > 0 ORDER BY 1, 2, 3, 4, 5, 6, 7",
+                (TEST_TENANT_ID,),
+            )
+            return cur.fetchall()
+
+
+def _raw_domain_counts():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT split_part(concept, '.', 1), COUNT(*) FROM semantic_triples "
+                "WHERE tenant_id = %s AND is_active = true "
+                "  AND run_id IN (SELECT current_run_id FROM tenant_runs WHERE tenant_id = %s) "
+                "GROUP BY 1",
+                (TEST_TENANT_ID, TEST_TENANT_ID),
+            )
+            return dict(cur.fetchall())
+
+
+def _cleanup():
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("DELETE FROM ingest_jobs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM conflict_register WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM semantic_triples WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM triple_rollups WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM run_group_digests WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM tenant_runs WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            cur.execute("DELETE FROM ingest_log WHERE tenant_id=%s", (TEST_TENANT_ID,))
+            conn.commit()
+
+
+@pytest.fixture(autouse=True)
+def _clean():
+    _cleanup()
+    yield
+    _cleanup()
+
+
+class TestRollupMaintenance:
+    def test_ingest_credits_groups(self):
+        run = str(uuid.uuid4())
+        assert _ingest(run).status_code == 201
+        rows = {(r[2], r[3], r[4], r[6]): r for r in _rollups()}
+        assert len(rows) == 4
+        opex = rows[("cost", "netsuite", "ipaas", "2026-03")]
+        assert (opex[7], opex[11], opex[13]) == (1, 1, {"cost.opex.total": 1})
+        # period-less triple is its own group, stored as ''
+        assert rows[("cost", "netsuite", "ipaas", "")][7] == 1
+        rev = rows[("revenue", "netsuite", "ipaas", "2026-03")]
+        assert rev[7] == 2
+        assert rev[13] == {"revenue.total": 1, "revenue.recurring": 1}
+        assert float(rev[8]) == pytest.approx(1.90)
+        store = TripleStore()
+        assert store.count_by_domain(TEST_TENANT_ID) == _raw_domain_counts() == {
+            "revenue": 3, "cost": 2,
+        }
+        assert store.count_by_domain(None, run_id=run) == {"revenue": 3, "cost": 2}
+
+    def test_swap_debits_displaced_run(self):
+        first, second = str(uuid.uuid4()), str(uuid.uuid4())
+        assert _ingest(first).status_code == 201
+        assert _ingest(second, triples=BATCH[:2]).status_code == 201
+        live_runs = {str(r[1]) for r in _rollups()}
+        assert live_runs == {second}
+        assert TripleStore().count_by_domain(TEST_TENANT_ID) == _raw_domain_counts() == {
+            "revenue": 2,
+        }
+        sankey = TripleStore().get_sankey_aggregation(TEST_TENANT_ID, ENTITY)
+        assert sankey == [{
+            "fabric_plane": "ipaas", "fabric_product": "unknown",
+            "source_system": "netsuite", "domain": "revenue",
+            "entity_id": ENTITY, "triple_count": 2,
+        }]
+
+    def test_replace_replay_keeps_counts_exact(self):
+        run = str(uuid.uuid4())
+        assert _ingest(run).status_code == 201
+        assert _ingest(run, replace="true").status_code == 201
+        assert sum(r[7] for r in _rollups()) == len(BATCH)
+
+        summary = client.get(
+            "/api/dcl/contextualization-summary",
+            params={"tenant_id": TEST_TENANT_ID},
+        ).json()
+        domains = {d["domain"]: d for d in summary["domain_coverage"]["domains"]}
+        assert domains["revenue"]["triple_count"] == 3
+        assert domains["revenue"]["concepts_used"] == 2
+        assert domains["revenue"]["source_count"] == 2
+        assert domains["cost"]["concepts_used"] == 1
+        assert summary["confidence_distribution"] == {
+            "exact": 3, "high": 1, "medium": 1, "low": 0,
+        }
+
+    def test_overview_reads_rollups(self):
+        run = str(uuid.uuid4())
+        assert _ingest(run).status_code == 201
+        body = client.get(
+            "/api/dcl/triples/overview", params={"tenant_id": TEST_TENANT_ID},
+        ).json()
+        assert body["total_triples"] == len(BATCH)
+        assert body["entities"][0]["entity_id"] == ENTITY
+        assert body["periods"] == ["2026-03"]
+        assert {d["domain"]: d["by_entity"] for d in body["domains"]} == {
+            "revenue": {ENTITY: 3}, "cost": {ENTITY: 2},
+        }
+        assert body["last_ingest"]["dcl_ingest_id"] == run
+        assert body["last_ingest"]["triple_count"] == len(BATCH)
+
+    def test_incremental_matches_rebuild_and_prune(self):
+        first, second = str(uuid.uuid4()), str(uuid.uuid4())
+        assert _ingest(first).status_code == 201
+        assert _ingest(second, triples=BATCH[1:]).status_code == 201
+        incremental = _rollups()
+
+        store = TripleStore()
+        assert store.prune_rollups() >= 1  # the displaced run's zeroed groups
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT COUNT(*) FROM triple_rollups "
+                    "WHERE tenant_id = %s AND live_count <= 0",
+                    (TEST_TENANT_ID,),
+                )
+                assert cur.fetchone()[0] == 0
+                cur.execute("SELECT triple_rollups_rebuild(%s)", (TEST_TENANT_ID,))
+                conn.commit()
+        assert _rollups() == incremental